@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ChatSession, ChatMessage, AIPromptTemplate, QuickAction, AIConfiguration
+from .models import ChatSession, ChatMessage, AIPromptTemplate, QuickAction, AIConfiguration, LLMCacheEntry, LLMUsageCounter, LLMBatchJob, LLMBatchItem
 
 
 @admin.register(ChatSession)
@@ -72,4 +72,39 @@ class AIConfigurationAdmin(admin.ModelAdmin):
         if 'KEY' in obj.key or 'SECRET' in obj.key:
             return '***HIDDEN***'
         return obj.value[:100] + '...' if len(obj.value) > 100 else obj.value
-    get_value_preview.short_description = '값'
\ No newline at end of file
+    get_value_preview.short_description = '값'
+
+
+@admin.register(LLMCacheEntry)
+class LLMCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ['scope', 'get_prompt_preview', 'model_used', 'hit_count', 'last_hit_at', 'expires_at']
+    list_filter = ['scope', 'model_used']
+    search_fields = ['prompt', 'response']
+    readonly_fields = ['key_hash', 'context_hash', 'created_at']
+    
+    def get_prompt_preview(self, obj):
+        return obj.prompt[:80] + '...' if len(obj.prompt) > 80 else obj.prompt
+    get_prompt_preview.short_description = '프롬프트'
+
+
+@admin.register(LLMUsageCounter)
+class LLMUsageCounterAdmin(admin.ModelAdmin):
+    list_display = ['period', 'feature', 'user_key', 'model_used', 'requests', 'prompt_tokens', 'completion_tokens', 'cost']
+    list_filter = ['period', 'feature', 'provider', 'model_used']
+    search_fields = ['feature', 'user_key']
+    readonly_fields = ['requests', 'prompt_tokens', 'completion_tokens', 'cost', 'updated_at']
+
+
+@admin.register(LLMBatchJob)
+class LLMBatchJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'job_type', 'status', 'total', 'completed', 'failed', 'progress', 'created_by', 'created_at', 'finished_at']
+    list_filter = ['job_type', 'status', 'created_at']
+    readonly_fields = ['total', 'completed', 'failed', 'started_at', 'finished_at', 'created_at']
+
+
+@admin.register(LLMBatchItem)
+class LLMBatchItemAdmin(admin.ModelAdmin):
+    list_display = ['job', 'item_key', 'status', 'attempts', 'updated_at']
+    list_filter = ['status', 'job__job_type']
+    search_fields = ['item_key']
+    readonly_fields = ['payload', 'result', 'error', 'attempts', 'updated_at']
@@ -0,0 +1,90 @@
+"""
+Django 관리 명령어 - LLM 일괄 생성 작업 실행
+대기 중인 작업(API 로 등록된 평가 피드백 등)을 실행하거나, 새 작업을 만들어 바로 실행합니다.
+중단된 작업은 같은 명령으로 다시 실행하면 대기 항목만 이어서 처리합니다.
+
+    python manage.py run_llm_batch                                  # 대기/중지 작업 모두 실행
+    python manage.py run_llm_batch evaluation_feedback --param evaluation_period_id=3
+    python manage.py run_llm_batch --job 12 --retry-failed
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ai_chatbot.models import LLMBatchJob
+from ai_services.batch import BatchRunner, create_job, retry_failed
+
+
+class Command(BaseCommand):
+    help = 'LLM 일괄 생성 작업을 실행합니다 (야간 배치용).'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'job_type',
+            nargs='?',
+            help="새로 만들 작업 유형 (LLM_BATCH['HANDLERS'])"
+        )
+        parser.add_argument(
+            '--param',
+            action='append',
+            default=[],
+            metavar='KEY=VALUE',
+            help='작업 파라미터 (값은 JSON 으로 해석, 실패하면 문자열)'
+        )
+        parser.add_argument(
+            '--job',
+            type=int,
+            help='이어서 실행할 작업 ID'
+        )
+        parser.add_argument(
+            '--retry-failed',
+            action='store_true',
+            help='실패 항목도 다시 실행'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='동시 LLM 호출 수'
+        )
+    
+    def _parse_params(self, pairs):
+        params = {}
+        for pair in pairs:
+            key, sep, value = pair.partition('=')
+            if not sep:
+                raise CommandError(f"파라미터 형식 오류: {pair} (KEY=VALUE)")
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                params[key] = value
+        return params
+    
+    def handle(self, *args, **options):
+        if options['job_type']:
+            try:
+                jobs = [create_job(options['job_type'], self._parse_params(options['param']))]
+            except (ValueError, KeyError) as e:
+                raise CommandError(str(e))
+            self.stdout.write(f"작업 생성: #{jobs[0].pk} ({jobs[0].total}건)")
+        elif options['job']:
+            jobs = list(LLMBatchJob.objects.filter(pk=options['job']))
+            if not jobs:
+                raise CommandError(f"작업을 찾을 수 없습니다: {options['job']}")
+        else:
+            jobs = list(LLMBatchJob.objects.filter(status__in=['queued', 'paused']).order_by('created_at'))
+            if not jobs:
+                self.stdout.write('실행할 작업이 없습니다.')
+                return
+        
+        for job in jobs:
+            if options['retry_failed']:
+                retry_failed(job)
+            job = BatchRunner(job, concurrency=options['concurrency']).run()
+            message = (
+                f"#{job.pk} {job.job_type}: {job.get_status_display()} "
+                f"(완료 {job.completed}/{job.total}, 실패 {job.failed})"
+            )
+            if job.status == 'completed':
+                self.stdout.write(self.style.SUCCESS(message))
+            else:
+                self.stdout.write(self.style.WARNING(f"{message} {job.error}".rstrip()))
@@ -0,0 +1,41 @@
+"""
+Django 관리 명령어 - 챗봇 의도 분류 모델 학습
+패턴/LLM 으로 분류되어 로그에 쌓인 대화로 로컬 분류 모델을 다시 학습합니다.
+"""
+from django.core.management.base import BaseCommand
+
+from ai_services.intent_classifier import IntentClassifier
+
+
+class Command(BaseCommand):
+    help = '대화 로그로 챗봇 의도 분류 모델(TF-IDF + 로지스틱 회귀)을 학습합니다.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--name',
+            default='ehr_gpt_chatbot',
+            help='분류기 이름 (로그/모델 파일 이름)'
+        )
+        parser.add_argument(
+            '--min-examples',
+            type=int,
+            default=20,
+            help='학습에 필요한 최소 예시 수'
+        )
+    
+    def handle(self, *args, **options):
+        # 학습에는 로그와 모델 경로만 필요하므로 패턴 없이 생성
+        classifier = IntentClassifier(options['name'], {})
+        result = classifier.train(min_examples=options['min_examples'])
+        
+        if not result['trained']:
+            self.stdout.write(self.style.WARNING(
+                f"학습 데이터 부족: 예시 {result['examples']}건, 의도 {result['labels']}종"
+            ))
+            return
+        
+        accuracy = result['cv_accuracy']
+        accuracy_text = f", 교차검증 정확도 {accuracy:.1%}" if accuracy is not None else ''
+        self.stdout.write(self.style.SUCCESS(
+            f"의도 분류 모델 학습 완료: 예시 {result['examples']}건, 의도 {result['labels']}종{accuracy_text}"
+        ))
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chatbot', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('scope', models.CharField(help_text='기능 단위 캐시 범위 (chatbot, leader_assistant 등)', max_length=50)),
+                ('key_hash', models.CharField(help_text='정규화 프롬프트 + 모델 파라미터 해시', max_length=64)),
+                ('context_hash', models.CharField(help_text='프롬프트를 제외한 시스템 프롬프트/모델 파라미터 해시', max_length=64)),
+                ('prompt', models.TextField(help_text='정규화된 프롬프트')),
+                ('response', models.TextField()),
+                ('model_used', models.CharField(blank=True, max_length=50)),
+                ('hit_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_hit_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'LLM 응답 캐시',
+                'verbose_name_plural': 'LLM 응답 캐시',
+                'indexes': [
+                    models.Index(fields=['scope', 'last_hit_at'], name='ai_chatbot__scope_3bf144_idx'),
+                    models.Index(fields=['expires_at'], name='ai_chatbot__expires_f39d84_idx'),
+                ],
+                'unique_together': {('scope', 'key_hash')},
+            },
+        ),
+    ]
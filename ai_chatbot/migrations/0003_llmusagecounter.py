@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chatbot', '0002_llmcacheentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMUsageCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(help_text='집계 월 (YYYY-MM)', max_length=7)),
+                ('feature', models.CharField(help_text='호출 기능 (캐시 범위와 동일)', max_length=50)),
+                ('user_key', models.CharField(blank=True, default='', help_text='호출 사용자 (없으면 빈 값)', max_length=64)),
+                ('provider', models.CharField(default='openai', max_length=20)),
+                ('model_used', models.CharField(blank=True, max_length=50)),
+                ('requests', models.IntegerField(default=0)),
+                ('prompt_tokens', models.BigIntegerField(default=0)),
+                ('completion_tokens', models.BigIntegerField(default=0)),
+                ('cost', models.FloatField(default=0, help_text='추정 비용 (USD)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'LLM 사용량',
+                'verbose_name_plural': 'LLM 사용량',
+                'indexes': [
+                    models.Index(fields=['period', 'feature'], name='ai_chatbot__period_7f4921_idx'),
+                ],
+                'unique_together': {('period', 'feature', 'user_key', 'provider', 'model_used')},
+            },
+        ),
+    ]
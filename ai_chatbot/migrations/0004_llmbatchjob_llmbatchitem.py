@@ -0,0 +1,62 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chatbot', '0003_llmusagecounter'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMBatchJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_type', models.CharField(help_text="LLM_BATCH['HANDLERS'] 의 작업 유형", max_length=50)),
+                ('params', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('queued', '대기'), ('running', '실행 중'), ('paused', '일시 중지'), ('completed', '완료'), ('failed', '실패')], default='queued', max_length=20)),
+                ('total', models.IntegerField(default=0)),
+                ('completed', models.IntegerField(default=0)),
+                ('failed', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'LLM 일괄 작업',
+                'verbose_name_plural': 'LLM 일괄 작업',
+                'ordering': ['-created_at'],
+                'indexes': [
+                    models.Index(fields=['job_type', 'status'], name='ai_chatbot__job_typ_a2639f_idx'),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name='LLMBatchItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('item_key', models.CharField(help_text='작업 유형 내 대상 식별자 (예: contribution:12)', max_length=100)),
+                ('payload', models.JSONField(default=dict, help_text='LLM 메시지와 결과 반영에 필요한 값')),
+                ('status', models.CharField(choices=[('pending', '대기'), ('done', '완료'), ('failed', '실패')], default='pending', max_length=10)),
+                ('result', models.TextField(blank=True)),
+                ('error', models.TextField(blank=True)),
+                ('attempts', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='ai_chatbot.llmbatchjob')),
+            ],
+            options={
+                'verbose_name': 'LLM 일괄 작업 항목',
+                'verbose_name_plural': 'LLM 일괄 작업 항목',
+                'indexes': [
+                    models.Index(fields=['job', 'status'], name='ai_chatbot__job_id_5a01c9_idx'),
+                    models.Index(fields=['item_key', 'status'], name='ai_chatbot__item_ke_ed6de3_idx'),
+                ],
+                'unique_together': {('job', 'item_key')},
+            },
+        ),
+    ]
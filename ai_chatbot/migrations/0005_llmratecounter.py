@@ -0,0 +1,24 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_chatbot', '0004_llmbatchjob_llmbatchitem'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMRateCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='한도 종류와 윈도우 (예: llm_usage:rate:chat:7:28930411)', max_length=200, unique=True)),
+                ('count', models.BigIntegerField(default=0)),
+                ('expires_at', models.DateTimeField(db_index=True, help_text='윈도우 만료 시각 (지난 행은 새 윈도우 생성 시 정리)')),
+            ],
+            options={
+                'verbose_name': 'LLM 호출 한도 카운터',
+                'verbose_name_plural': 'LLM 호출 한도 카운터',
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db import models
 from django.contrib.auth.models import User
 from employees.models import Employee
@@ -135,4 +136,138 @@ class AIConfiguration(models.Model):
             config = cls.objects.get(key=key, is_active=True)
             return config.value
         except cls.DoesNotExist:
-            return default
\ No newline at end of file
+            return default
+
+class LLMCacheEntry(models.Model):
+    """LLM 응답 캐시 (ai_services.llm_cache)"""
+    scope = models.CharField(max_length=50, help_text="기능 단위 캐시 범위 (chatbot, leader_assistant 등)")
+    key_hash = models.CharField(max_length=64, help_text="정규화 프롬프트 + 모델 파라미터 해시")
+    context_hash = models.CharField(max_length=64, help_text="프롬프트를 제외한 시스템 프롬프트/모델 파라미터 해시")
+    prompt = models.TextField(help_text="정규화된 프롬프트")
+    response = models.TextField()
+    model_used = models.CharField(max_length=50, blank=True)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_hit_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+    
+    class Meta:
+        verbose_name = "LLM 응답 캐시"
+        verbose_name_plural = "LLM 응답 캐시"
+        unique_together = ['scope', 'key_hash']
+        indexes = [
+            models.Index(fields=['scope', 'last_hit_at']),
+            models.Index(fields=['expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"[{self.scope}] {self.prompt[:50]}"
+
+
+class LLMUsageCounter(models.Model):
+    """LLM 사용량 누적 카운터 (ai_services.usage, F() 원자적 증가)"""
+    period = models.CharField(max_length=7, help_text="집계 월 (YYYY-MM)")
+    feature = models.CharField(max_length=50, help_text="호출 기능 (캐시 범위와 동일)")
+    user_key = models.CharField(max_length=64, blank=True, default='', help_text="호출 사용자 (없으면 빈 값)")
+    provider = models.CharField(max_length=20, default='openai')
+    model_used = models.CharField(max_length=50, blank=True)
+    requests = models.IntegerField(default=0)
+    prompt_tokens = models.BigIntegerField(default=0)
+    completion_tokens = models.BigIntegerField(default=0)
+    cost = models.FloatField(default=0, help_text="추정 비용 (USD)")
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "LLM 사용량"
+        verbose_name_plural = "LLM 사용량"
+        unique_together = ['period', 'feature', 'user_key', 'provider', 'model_used']
+        indexes = [
+            models.Index(fields=['period', 'feature']),
+        ]
+    
+    def __str__(self):
+        return f"[{self.period}] {self.feature} {self.user_key or '-'}: ${self.cost:.4f}"
+
+
+class LLMRateCounter(models.Model):
+    """LLM 호출 한도 윈도우 카운터 (ai_services.usage, F() 원자적 증가)"""
+    key = models.CharField(max_length=200, unique=True, help_text="한도 종류와 윈도우 (예: llm_usage:rate:chat:7:28930411)")
+    count = models.BigIntegerField(default=0)
+    expires_at = models.DateTimeField(db_index=True, help_text="윈도우 만료 시각 (지난 행은 새 윈도우 생성 시 정리)")
+
+    class Meta:
+        verbose_name = "LLM 호출 한도 카운터"
+        verbose_name_plural = "LLM 호출 한도 카운터"
+
+    def __str__(self):
+        return f"{self.key}: {self.count}"
+
+
+class LLMBatchJob(models.Model):
+    """오프라인 LLM 일괄 생성 작업 (ai_services.batch)"""
+    STATUS_CHOICES = [
+        ('queued', '대기'),
+        ('running', '실행 중'),
+        ('paused', '일시 중지'),
+        ('completed', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    job_type = models.CharField(max_length=50, help_text="LLM_BATCH['HANDLERS'] 의 작업 유형")
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='queued')
+    total = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    
+    class Meta:
+        verbose_name = "LLM 일괄 작업"
+        verbose_name_plural = "LLM 일괄 작업"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['job_type', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"[{self.job_type}] #{self.pk} {self.get_status_display()}"
+    
+    def progress(self):
+        """진행률 (%)"""
+        if not self.total:
+            return 0.0
+        return round((self.completed + self.failed) * 100 / self.total, 1)
+
+
+class LLMBatchItem(models.Model):
+    """일괄 작업의 개별 프롬프트 (결과는 처리 즉시 체크포인트)"""
+    STATUS_CHOICES = [
+        ('pending', '대기'),
+        ('done', '완료'),
+        ('failed', '실패'),
+    ]
+    
+    job = models.ForeignKey(LLMBatchJob, related_name='items', on_delete=models.CASCADE)
+    item_key = models.CharField(max_length=100, help_text="작업 유형 내 대상 식별자 (예: contribution:12)")
+    payload = models.JSONField(default=dict, help_text="LLM 메시지와 결과 반영에 필요한 값")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    result = models.TextField(blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "LLM 일괄 작업 항목"
+        verbose_name_plural = "LLM 일괄 작업 항목"
+        unique_together = ['job', 'item_key']
+        indexes = [
+            models.Index(fields=['job', 'status']),
+            models.Index(fields=['item_key', 'status']),
+        ]
+    
+    def __str__(self):
+        return f"{self.job_id}:{self.item_key} ({self.status})"
@@ -6,12 +6,15 @@ from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 import json
-import openai
 import os
 from datetime import datetime, timedelta
 
 from .models import ChatSession, ChatMessage, AIPromptTemplate, QuickAction, AIConfiguration
 from employees.models import Employee
+from ai_services.llm_gateway import get_gateway
+from ai_services.conversation_store import ConversationTurn, get_conversation_store
+from ai_services.streaming import sse_event, sse_response, stream_completion
+from asgiref.sync import sync_to_async
 
 
 class AIChatbotView(TemplateView):
@@ -67,6 +70,9 @@ class ChatAPIView(View):
                     title=message[:50] if len(message) > 50 else message
                 )
             
+            # 대화 스냅샷 (최근 턴 + 요약)
+            conversation = self.load_conversation(session)
+            
             # 사용자 메시지 저장
             user_message = ChatMessage.objects.create(
                 session=session,
@@ -75,7 +81,7 @@ class ChatAPIView(View):
             )
             
             # AI 응답 생성
-            ai_response = self.generate_ai_response(message, session)
+            ai_response = self.generate_ai_response(message, session, conversation)
             
             # AI 메시지 저장
             ai_message = ChatMessage.objects.create(
@@ -87,9 +93,11 @@ class ChatAPIView(View):
                 response_time=ai_response.get('response_time', 0)
             )
             
-            # 세션 업데이트
+            # 대화 스냅샷 및 세션 업데이트
+            self.record_turns(session, conversation, message, ai_message.content)
+            get_conversation_store('ai_chatbot').save(conversation)
             session.updated_at = timezone.now()
-            session.save()
+            session.save(update_fields=['updated_at', 'context'])
             
             return JsonResponse({
                 'success': True,
@@ -105,7 +113,7 @@ class ChatAPIView(View):
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
     
-    def generate_ai_response(self, message, session):
+    def generate_ai_response(self, message, session, conversation=None):
         """AI 응답 생성"""
         start_time = timezone.now()
         
@@ -116,23 +124,23 @@ class ChatAPIView(View):
             api_key = os.getenv('OPENAI_API_KEY')
         
         if api_key:
-            # 실제 OpenAI API 호출
+            # 실제 OpenAI API 호출 (공유 게이트웨이)
             try:
-                openai.api_key = api_key
-                
                 # 컨텍스트 준비
-                messages = self.prepare_context(session, message)
+                messages = self.prepare_context(session, message, conversation)
                 
                 # API 호출
-                response = openai.ChatCompletion.create(
+                result = get_gateway(api_key=api_key).chat(
+                    messages,
                     model="gpt-3.5-turbo",
-                    messages=messages,
                     max_tokens=500,
                     temperature=0.7,
+                    cache_scope='ai_chatbot',
+                    user_id=session.employee_id,
                 )
                 
-                content = response.choices[0].message.content
-                tokens = response.usage.total_tokens
+                content = result.content
+                tokens = result.total_tokens
                 
             except Exception as e:
                 # API 오류 시 폴백
@@ -152,10 +160,35 @@ class ChatAPIView(View):
             'response_time': response_time
         }
     
-    def prepare_context(self, session, current_message):
-        """대화 컨텍스트 준비"""
-        messages = []
+    def load_conversation(self, session, current_message=None):
+        """세션 대화 스냅샷 조회
+        
+        캐시에 없으면 최근 메시지와 세션에 저장된 요약(context)으로 복원한다.
+        """
+        store = get_conversation_store('ai_chatbot')
+        conversation = store.load(str(session.id))
+        if conversation is not None:
+            return conversation
         
+        conversation = store.create(str(session.id))
+        conversation.summary = session.context or ''
+        recent_messages = session.messages.order_by('-created_at')
+        if current_message:
+            recent_messages = recent_messages.exclude(role='user', content=current_message)
+        for msg in reversed(recent_messages[:store.window]):
+            conversation.turns.append(ConversationTurn(msg.role, msg.content, msg.created_at.timestamp()))
+        conversation.total_turns = len(conversation.turns)
+        return conversation
+    
+    def record_turns(self, session, conversation, user_message, ai_message):
+        """대화 스냅샷에 이번 턴 추가 (창을 넘은 턴의 요약은 세션 context 에 보관)"""
+        store = get_conversation_store('ai_chatbot')
+        store.append(conversation, 'user', user_message)
+        store.append(conversation, 'assistant', ai_message)
+        session.context = conversation.summary
+    
+    def prepare_context(self, session, current_message, conversation=None):
+        """대화 컨텍스트 준비"""
         # 시스템 프롬프트
         system_prompt = """당신은 OK Financial Group의 HR AI 어시스턴트입니다.
         직원들의 HR 관련 질문에 친절하고 정확하게 답변해주세요.
@@ -169,16 +202,10 @@ class ChatAPIView(View):
         5. 조직 문화 및 가치 설명
         """
         
-        messages.append({"role": "system", "content": system_prompt})
-        
-        # 최근 대화 내역 추가 (최대 10개)
-        recent_messages = session.messages.order_by('-created_at')[:10]
-        for msg in reversed(recent_messages):
-            if msg.content != current_message:  # 현재 메시지 제외
-                messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
+        # 이전 대화 요약 + 최근 대화 내역
+        if conversation is None:
+            conversation = self.load_conversation(session, current_message)
+        messages = conversation.to_messages(system_prompt)
         
         # 현재 메시지 추가
         messages.append({"role": "user", "content": current_message})
@@ -244,6 +271,80 @@ class ChatAPIView(View):
 다른 도움이 필요하시면 말씀해주세요!"""
 
 
+@method_decorator(csrf_exempt, name='dispatch')
+class ChatStreamAPIView(ChatAPIView):
+    """채팅 스트리밍 API (SSE)
+    
+    토큰을 받는 대로 전달하고, 스트림이 끝나면 AI 메시지를 저장합니다.
+    """
+    
+    async def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+        
+        message = data.get('message', '')
+        session_id = data.get('session_id')
+        if not message:
+            return JsonResponse({'error': '메시지가 비어있습니다.'}, status=400)
+        
+        # 세션 가져오기 또는 생성
+        if session_id:
+            try:
+                session = await ChatSession.objects.aget(id=session_id)
+            except (ChatSession.DoesNotExist, ValueError):
+                return JsonResponse({'error': '세션을 찾을 수 없습니다.'}, status=404)
+        else:
+            employee = await Employee.objects.filter(employment_status='active').afirst()
+            session = await ChatSession.objects.acreate(
+                employee=employee,
+                title=message[:50] if len(message) > 50 else message
+            )
+        
+        # 컨텍스트 준비 후 사용자 메시지 저장
+        conversation = await sync_to_async(self.load_conversation)(session)
+        messages = self.prepare_context(session, message, conversation)
+        await ChatMessage.objects.acreate(session=session, role='user', content=message)
+        
+        api_key = await sync_to_async(AIConfiguration.get_config)('OPENAI_API_KEY') or os.getenv('OPENAI_API_KEY')
+        gateway = get_gateway(api_key=api_key) if api_key else None
+        
+        async def save_response(content, meta):
+            ai_message = await ChatMessage.objects.acreate(
+                session=session,
+                role='assistant',
+                content=content,
+                model_used=meta['model'] if meta['streamed'] else 'fallback',
+                response_time=meta['response_time']
+            )
+            self.record_turns(session, conversation, message, content)
+            await get_conversation_store('ai_chatbot').asave(conversation)
+            session.updated_at = timezone.now()
+            await session.asave(update_fields=['updated_at', 'context'])
+            return {
+                'id': str(ai_message.id),
+                'created_at': ai_message.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+                'role': 'assistant'
+            }
+        
+        async def events():
+            yield sse_event({'session_id': str(session.id)}, 'session')
+            async for event in stream_completion(
+                gateway, messages,
+                on_complete=save_response,
+                fallback=lambda: self.get_fallback_response(message),
+                model="gpt-3.5-turbo",
+                max_tokens=500,
+                temperature=0.7,
+                cache_scope='ai_chatbot',
+                user_id=session.employee_id,
+            ):
+                yield event
+        
+        return sse_response(events())
+
+
 class ChatSessionListView(View):
     """채팅 세션 목록 API"""
     
@@ -303,6 +404,7 @@ class ChatSessionDetailView(View):
         """세션 삭제"""
         session = get_object_or_404(ChatSession, id=session_id)
         session.delete()
+        get_conversation_store('ai_chatbot').delete(str(session_id))
         
         return JsonResponse({'success': True})
 
@@ -414,14 +516,7 @@ class LeadershipInsightAPIView(View):
             context = data.get('context', {})
             
             # 분석 유형에 따른 처리
-            if query_type == 'team_analysis':
-                result = self.analyze_team_performance(context)
-            elif query_type == 'talent_risk':
-                result = self.analyze_talent_risk(context)
-            elif query_type == 'decision_support':
-                result = self.provide_decision_support(context)
-            else:
-                result = self.general_leadership_advice(context)
+            result = self.run_analysis(query_type, context)
             
             return JsonResponse({
                 'success': True,
@@ -431,6 +526,18 @@ class LeadershipInsightAPIView(View):
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
     
+    def build_narrative_prompt(self, query_type, context, result):
+        """분석 결과를 리더에게 설명하는 LLM 프롬프트"""
+        return [
+            {"role": "system", "content": "당신은 OK Financial Group 리더를 돕는 리더십 코치입니다. 한국어 존댓말로 간결하게 답변합니다."},
+            {"role": "user", "content": (
+                f"분석 유형: {query_type}\n"
+                f"상황: {json.dumps(context, ensure_ascii=False)}\n"
+                f"분석 결과: {json.dumps(result, ensure_ascii=False)}\n\n"
+                "위 결과를 바탕으로 리더가 이번 주에 실행할 수 있는 조언을 3~5문장으로 정리해주세요."
+            )}
+        ]
+    
     def analyze_team_performance(self, context):
         """팀 성과 분석"""
         # 실제로는 데이터베이스에서 데이터를 가져와 분석
@@ -480,6 +587,16 @@ class LeadershipInsightAPIView(View):
             ]
         }
     
+    def run_analysis(self, query_type, context):
+        """분석 유형별 처리"""
+        if query_type == 'team_analysis':
+            return self.analyze_team_performance(context)
+        elif query_type == 'talent_risk':
+            return self.analyze_talent_risk(context)
+        elif query_type == 'decision_support':
+            return self.provide_decision_support(context)
+        return self.general_leadership_advice(context)
+    
     def general_leadership_advice(self, context):
         """일반 리더십 조언"""
         return {
@@ -489,4 +606,35 @@ class LeadershipInsightAPIView(View):
                 '익명 피드백 채널 구축',
                 '성과 인정 프로그램 도입'
             ]
-        }
\ No newline at end of file
+        }
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class LeadershipInsightStreamAPIView(LeadershipInsightAPIView):
+    """리더십 인사이트 스트리밍 API (SSE)
+    
+    구조화된 분석 결과를 먼저 보내고, 이어서 LLM 코칭 코멘트를 토큰 단위로 전달합니다.
+    """
+    
+    async def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+        
+        query_type = data.get('type', 'general')
+        context = data.get('context', {})
+        result = await sync_to_async(self.run_analysis)(query_type, context)
+        
+        async def events():
+            yield sse_event({'type': query_type, 'analysis': result}, 'analysis')
+            async for event in stream_completion(
+                get_gateway(),
+                self.build_narrative_prompt(query_type, context, result),
+                fallback=lambda: '',
+                max_tokens=400,
+                temperature=0.7,
+            ):
+                yield event
+        
+        return sse_response(events())
@@ -16,16 +16,12 @@ from sklearn.ensemble import RandomForestClassifier
 from employees.models import Employee
 from evaluations.models import ComprehensiveEvaluation
 from compensation.models import EmployeeCompensation
+from airiss.feature_store import feature_store
 from .models import TurnoverRisk, RiskFactor, RetentionPlan, TurnoverAlert
 
 logger = logging.getLogger(__name__)
 
-try:
-    import openai
-    openai.api_key = settings.OPENAI_API_KEY
-except ImportError:
-    logger.warning("OpenAI package not installed")
-    openai = None
+from ai_services.llm_gateway import LLMError, get_gateway
 
 try:
     import anthropic
@@ -200,10 +196,11 @@ class TurnoverRiskAnalyzer:
         return results
     
     def _collect_employee_data(self, employee: Employee) -> Dict[str, Any]:
-        """직원 관련 데이터 수집"""
+        """직원 관련 데이터 수집 (근속/평가/보상 특성은 피처 스토어에서 조회)"""
+        features = feature_store.get(employee.id)
         data = {
             'basic_info': {
-                'tenure_months': self._calculate_tenure_months(employee),
+                'tenure_months': features.get('tenure_months', self._calculate_tenure_months(employee)),
                 'department': employee.department,
                 'position': employee.position,
                 'age': getattr(employee, 'age', None),
@@ -212,33 +209,21 @@ class TurnoverRiskAnalyzer:
         }
         
         # 성과 평가 데이터
-        try:
-            recent_evaluations = ComprehensiveEvaluation.objects.filter(
-                employee=employee
-            ).order_by('-created_at')[:3]
-            
-            data['performance'] = {
-                'recent_ratings': [eval.final_rating_numeric for eval in recent_evaluations if eval.final_rating_numeric],
-                'avg_rating': recent_evaluations.aggregate(avg=Avg('final_rating_numeric'))['avg'] or 0,
-                'evaluation_count': recent_evaluations.count(),
-                'trend': self._calculate_performance_trend(recent_evaluations)
-            }
-        except Exception:
-            data['performance'] = {'recent_ratings': [], 'avg_rating': 0, 'evaluation_count': 0, 'trend': 'stable'}
+        data['performance'] = {
+            'avg_rating': features.get('evaluation_avg_score') or 0,
+            'last_rating': features.get('evaluation_last_score'),
+            'evaluation_count': features.get('evaluation_count', 0),
+            'trend': self._trend_label(features.get('evaluation_trend') or 0)
+        }
         
         # 보상 데이터
-        try:
-            compensation = EmployeeCompensation.objects.filter(employee=employee).first()
-            if compensation:
-                data['compensation'] = {
-                    'total_compensation': float(compensation.total_compensation),
-                    'base_salary': float(compensation.base_salary),
-                    'bonus_amount': float(getattr(compensation, 'bonus_amount', 0)),
-                    'last_increase_date': getattr(compensation, 'last_increase_date', None)
-                }
-            else:
-                data['compensation'] = {'total_compensation': 0}
-        except Exception:
+        if features.get('total_compensation') is not None:
+            data['compensation'] = {
+                'total_compensation': features['total_compensation'],
+                'base_salary': features.get('base_salary') or 0,
+                'position_ratio': features.get('compensation_ratio'),
+            }
+        else:
             data['compensation'] = {'total_compensation': 0}
         
         return data
@@ -333,14 +318,15 @@ class TurnoverRiskAnalyzer:
     
     def _get_ai_analysis(self, employee: Employee, data: Dict[str, Any], risk_factors: Dict[str, List[Dict]]) -> Dict[str, Any]:
         """AI를 활용한 고도화 분석"""
-        if not openai and not anthropic_client:
+        llm = get_gateway()
+        if not llm.is_configured and not anthropic_client:
             return self._get_fallback_ai_analysis(employee, data, risk_factors)
         
         try:
             # AI 분석 프롬프트 생성
             prompt = self._generate_ai_prompt(employee, data, risk_factors)
             
-            if openai and hasattr(settings, 'OPENAI_API_KEY'):
+            if llm.is_configured:
                 return self._get_openai_analysis(prompt)
             elif anthropic_client:
                 return self._get_anthropic_analysis(prompt)
@@ -387,17 +373,16 @@ JSON 형식으로 응답해주세요:
     def _get_openai_analysis(self, prompt: str) -> Dict[str, Any]:
         """OpenAI를 통한 분석"""
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
+            analysis_text = get_gateway().chat(
+                [
                     {"role": "system", "content": "당신은 HR 전문가이자 이직 위험도 분석 전문가입니다."},
                     {"role": "user", "content": prompt}
                 ],
+                model="gpt-3.5-turbo",
                 temperature=0.7,
-                max_tokens=1000
-            )
-            
-            analysis_text = response.choices[0].message.content
+                max_tokens=1000,
+                cache_scope='turnover_analysis'
+            ).content
             
             # JSON 추출 시도
             try:
@@ -419,7 +404,7 @@ JSON 형식으로 응답해주세요:
                 'timeline_prediction': '추가 분석 진행 중'
             }
             
-        except Exception as e:
+        except LLMError as e:
             logger.error(f"OpenAI 분석 오류: {e}")
             raise
     
@@ -520,19 +505,8 @@ JSON 형식으로 응답해주세요:
         months = (today.year - employee.hire_date.year) * 12 + (today.month - employee.hire_date.month)
         return max(0, months)
     
-    def _calculate_performance_trend(self, evaluations) -> str:
-        """성과 트렌드 계산"""
-        if len(evaluations) < 2:
-            return 'stable'
-        
-        ratings = [eval.final_rating_numeric for eval in evaluations if eval.final_rating_numeric]
-        if len(ratings) < 2:
-            return 'stable'
-        
-        recent_avg = sum(ratings[:2]) / len(ratings[:2])
-        older_avg = sum(ratings[2:]) / len(ratings[2:]) if len(ratings) > 2 else recent_avg
-        
-        diff = recent_avg - older_avg
+    def _trend_label(self, diff: float) -> str:
+        """성과 트렌드 (최근 평균 - 이전 평균) 라벨"""
         if diff > 0.3:
             return 'improving'
         elif diff < -0.3:
@@ -7,9 +7,10 @@ from enum import Enum
 from dataclasses import dataclass
 import logging
 from django.conf import settings
-from django.core.cache import cache
 import openai
-from datetime import datetime, timedelta
+
+from ai_services.llm_cache import llm_cache
+from ai_services.usage import usage_meter
 
 logger = logging.getLogger(__name__)
 
@@ -126,27 +127,49 @@ class AIConfigManager:
 class AIServiceClient:
     """AI 서비스 클라이언트 - 실제 AI API 호출"""
     
-    def __init__(self, config: AIModelConfig):
+    def __init__(self, config: AIModelConfig, module_name: Optional[str] = None):
         self.config = config
+        self.cache_scope = module_name or 'quickwin'
         self.cache_enabled = os.getenv('AI_ENABLE_CACHING', 'true').lower() == 'true'
-        self.cache_ttl = int(os.getenv('AI_CACHE_TTL', '3600'))
     
     def generate_completion(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """AI 응답 생성"""
-        # 캐시 확인
+        messages = self._build_messages(prompt, system_prompt)
+        cache_params = self._get_cache_params(**kwargs)
+        
+        # 캐시 확인 (정규화 프롬프트 exact → 유사 질문 순)
         if self.cache_enabled:
-            cache_key = self._get_cache_key(prompt, system_prompt)
-            cached_response = cache.get(cache_key)
-            if cached_response:
-                logger.info(f"캐시에서 응답 반환: {cache_key[:20]}...")
-                return cached_response
+            try:
+                hit = llm_cache.lookup(self.cache_scope, messages, cache_params)
+            except Exception as e:
+                logger.warning(f"AI 캐시 조회 실패: {e}")
+                hit = None
+            if hit:
+                logger.info(f"캐시에서 응답 반환 ({self.cache_scope}, 유사도 {hit.similarity:.2f})")
+                return hit.content
+        
+        # OpenAI 는 게이트웨이에서 한도 확인/사용량 기록, 그 외 프로바이더는 여기서 처리
+        direct = self.config.provider != AIProvider.OPENAI
+        if direct and usage_meter.check(self.cache_scope):
+            return self._get_fallback_response(prompt)
         
         try:
             response = self._call_api(prompt, system_prompt, **kwargs)
             
+            if direct:
+                # 토큰 수를 돌려주지 않는 프로바이더는 문자 수로 추정 (4자 ≈ 1토큰)
+                usage_meter.record(
+                    self.cache_scope, None, self.config.provider.value, self.config.model_name,
+                    prompt_tokens=len((system_prompt or '') + prompt) // 4,
+                    completion_tokens=len(response or '') // 4
+                )
+            
             # 캐시 저장
             if self.cache_enabled and response:
-                cache.set(cache_key, response, self.cache_ttl)
+                try:
+                    llm_cache.store(self.cache_scope, messages, cache_params, response, self.config.model_name)
+                except Exception as e:
+                    logger.warning(f"AI 캐시 저장 실패: {e}")
             
             return response
             
@@ -169,66 +192,30 @@ class AIServiceClient:
         else:
             raise ValueError(f"지원하지 않는 프로바이더: {self.config.provider}")
     
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str] = None) -> list:
+        """채팅 메시지 구성"""
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     def _call_openai(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
-        """OpenAI API 호출 - HTTP 직접 호출 방식"""
-        try:
-            import requests
-            import json
-            import logging
-            logger = logging.getLogger(__name__)
-            
-            logger.info(f"OpenAI API 직접 호출 시작, API 키 존재: {bool(self.config.api_key)}")
-            
-            # 메시지 구성
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-            
-            # API 호출 데이터 구성
-            data = {
-                "model": self.config.model_name,
-                "messages": messages,
-                "temperature": kwargs.get('temperature', self.config.temperature),
-                "max_tokens": kwargs.get('max_tokens', self.config.max_tokens)
-            }
-            
-            # API 키 정리 (공백과 줄바꿈 제거)
-            clean_api_key = self.config.api_key.strip().replace('\n', '').replace('\r', '').replace(' ', '')
-            
-            logger.info(f"정리된 API 키 길이: {len(clean_api_key)}")
-            
-            # 헤더 구성
-            headers = {
-                "Authorization": f"Bearer {clean_api_key}",
-                "Content-Type": "application/json"
-            }
-            
-            logger.info(f"OpenAI API 직접 호출: {self.config.model_name}")
-            
-            # HTTP POST 요청
-            response = requests.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers=headers,
-                data=json.dumps(data),
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                logger.info("OpenAI API 호출 성공")
-                return content
-            else:
-                logger.error(f"OpenAI API 오류: {response.status_code} - {response.text}")
-                raise Exception(f"API 오류: {response.status_code}")
-                
-        except ImportError:
-            logger.error("requests 라이브러리가 필요합니다")
-            return ""
-        except Exception as e:
-            logger.error(f"OpenAI API 호출 실패: {e}")
-            raise
+        """OpenAI API 호출 - 공유 LLM 게이트웨이 (커넥션 풀/재시도/동시성 제한)"""
+        from ai_services.llm_gateway import get_default_api_key, get_gateway
+        
+        messages = self._build_messages(prompt, system_prompt)
+        
+        # LLMError 는 generate_completion 에서 폴백 응답으로 처리
+        gateway = get_gateway(api_key=self.config.api_key or get_default_api_key(), base_url=self.config.endpoint)
+        return gateway.chat(
+            messages,
+            model=self.config.model_name,
+            temperature=kwargs.get('temperature', self.config.temperature),
+            max_tokens=kwargs.get('max_tokens', self.config.max_tokens),
+            feature=self.cache_scope
+        ).content
     
     def _call_anthropic(self, prompt: str, system_prompt: Optional[str] = None, **kwargs) -> str:
         """Anthropic Claude API 호출"""
@@ -329,11 +316,14 @@ class AIServiceClient:
             logger.error(f"Local LLM API 호출 실패: {e}")
             raise
     
-    def _get_cache_key(self, prompt: str, system_prompt: Optional[str]) -> str:
-        """캐시 키 생성"""
-        import hashlib
-        content = f"{self.config.provider}:{self.config.model_name}:{system_prompt}:{prompt}"
-        return f"ai_cache_{hashlib.md5(content.encode()).hexdigest()}"
+    def _get_cache_params(self, **kwargs) -> Dict[str, Any]:
+        """캐시 키에 포함되는 모델 파라미터"""
+        return {
+            'provider': self.config.provider.value,
+            'model': self.config.model_name,
+            'temperature': kwargs.get('temperature', self.config.temperature),
+            'max_tokens': kwargs.get('max_tokens', self.config.max_tokens),
+        }
     
     def _get_fallback_response(self, prompt: str) -> str:
         """폴백 응답 (API 실패 시)"""
@@ -342,54 +332,21 @@ class AIServiceClient:
 
 
 class AIUsageTracker:
-    """AI 사용량 추적"""
+    """AI 사용량 추적 (ai_services.usage 누적 카운터)"""
     
     def __init__(self):
-        self.monthly_budget = float(os.getenv('AI_MONTHLY_BUDGET_USD', '100'))
-        self.alert_threshold = float(os.getenv('AI_ALERT_THRESHOLD', '80'))
+        config = usage_meter.config
+        self.monthly_budget = config['MONTHLY_BUDGET_USD']
+        self.alert_threshold = config['ALERT_THRESHOLD']
     
-    def track_usage(self, provider: str, tokens: int, cost: float):
-        """사용량 기록"""
-        cache_key = f"ai_usage_{datetime.now().strftime('%Y%m')}"
-        current_usage = cache.get(cache_key, {
-            'total_tokens': 0,
-            'total_cost': 0,
-            'by_provider': {}
-        })
-        
-        current_usage['total_tokens'] += tokens
-        current_usage['total_cost'] += cost
-        
-        if provider not in current_usage['by_provider']:
-            current_usage['by_provider'][provider] = {
-                'tokens': 0,
-                'cost': 0,
-                'requests': 0
-            }
-        
-        current_usage['by_provider'][provider]['tokens'] += tokens
-        current_usage['by_provider'][provider]['cost'] += cost
-        current_usage['by_provider'][provider]['requests'] += 1
-        
-        cache.set(cache_key, current_usage, 60 * 60 * 24 * 31)  # 31일 보관
-        
-        # 예산 초과 체크
-        if current_usage['total_cost'] > self.monthly_budget * (self.alert_threshold / 100):
-            self._send_budget_alert(current_usage['total_cost'])
+    def track_usage(self, provider: str, tokens: int, cost: float,
+                    feature: str = 'quickwin', model: str = ''):
+        """사용량 기록 (DB 카운터에 원자적으로 누적, 예산 경고는 usage_meter 에서 처리)"""
+        usage_meter.record(feature, None, provider, model, prompt_tokens=tokens, cost=cost)
     
     def get_current_usage(self) -> Dict[str, Any]:
         """현재 월 사용량 조회"""
-        cache_key = f"ai_usage_{datetime.now().strftime('%Y%m')}"
-        return cache.get(cache_key, {
-            'total_tokens': 0,
-            'total_cost': 0,
-            'by_provider': {}
-        })
-    
-    def _send_budget_alert(self, current_cost: float):
-        """예산 초과 알림"""
-        logger.warning(f"AI 사용 예산 경고: ${current_cost:.2f} / ${self.monthly_budget:.2f}")
-        # TODO: 이메일 또는 슬랙 알림 전송
+        return usage_meter.get_monthly_usage()
 
 
 # 싱글톤 인스턴스
@@ -407,4 +364,4 @@ def get_ai_client(module_name: str) -> Optional[AIServiceClient]:
         logger.error(f"{module_name} 모듈에 대한 AI 구성을 찾을 수 없습니다")
         return None
     
-    return AIServiceClient(config)
\ No newline at end of file
+    return AIServiceClient(config, module_name)
\ No newline at end of file
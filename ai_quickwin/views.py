@@ -689,7 +689,7 @@ class AIChatAPIView(View):
                         max_tokens=500
                     )
                     
-                    client = AIServiceClient(config)
+                    client = AIServiceClient(config, module_name)
                     logger.info(f"세션 기반 클라이언트 생성 성공")
                     return client
                     
@@ -1,7 +1,6 @@
 """
 AI 서비스 기본 클래스 및 공통 유틸리티
 """
-import openai
 import os
 import json
 from typing import Dict, List, Any, Optional, Tuple
@@ -12,16 +11,19 @@ import numpy as np
 from sklearn.preprocessing import StandardScaler
 import logging
 
+from .llm_gateway import get_gateway
+
 logger = logging.getLogger(__name__)
 
 
 class AIServiceBase:
     """AI 서비스 기본 클래스"""
     
+    # LLM 응답 캐시 범위 (None 이면 캐시하지 않음, settings.LLM_CACHE['SCOPES'] 로 범위별 설정)
+    cache_scope: Optional[str] = None
+    
     def __init__(self):
         self.api_key = self.get_api_key()
-        if self.api_key:
-            openai.api_key = self.api_key
         self.model = settings.OPENAI_MODEL if hasattr(settings, 'OPENAI_MODEL') else 'gpt-3.5-turbo'
         self.cache_timeout = 3600  # 1시간
         
@@ -33,45 +35,36 @@ class AIServiceBase:
         # 2. 환경변수에서
         return os.getenv('OPENAI_API_KEY')
     
+    def _completion_params(self, kwargs: Dict) -> Dict:
+        return {
+            'temperature': kwargs.get('temperature', 0.7),
+            'max_tokens': kwargs.get('max_tokens', 500),
+            'top_p': kwargs.get('top_p', 1),
+            'frequency_penalty': kwargs.get('frequency_penalty', 0),
+            'presence_penalty': kwargs.get('presence_penalty', 0),
+        }
+    
     def call_openai(self, messages: List[Dict], **kwargs) -> Optional[str]:
-        """OpenAI API 호출"""
+        """OpenAI API 호출 (공유 LLM 게이트웨이 경유)"""
         if not self.api_key:
             logger.warning("OpenAI API key not found")
             return None
-            
-        try:
-            # 새로운 OpenAI API 버전 (v1.0+)
-            try:
-                from openai import OpenAI
-                client = OpenAI(api_key=self.api_key)
-                
-                response = client.chat.completions.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=kwargs.get('temperature', 0.7),
-                    max_tokens=kwargs.get('max_tokens', 500),
-                    top_p=kwargs.get('top_p', 1),
-                    frequency_penalty=kwargs.get('frequency_penalty', 0),
-                    presence_penalty=kwargs.get('presence_penalty', 0),
-                )
-                return response.choices[0].message.content
-                
-            except ImportError:
-                # 구버전 OpenAI API (v0.x) 폴백
-                response = openai.ChatCompletion.create(
-                    model=self.model,
-                    messages=messages,
-                    temperature=kwargs.get('temperature', 0.7),
-                    max_tokens=kwargs.get('max_tokens', 500),
-                    top_p=kwargs.get('top_p', 1),
-                    frequency_penalty=kwargs.get('frequency_penalty', 0),
-                    presence_penalty=kwargs.get('presence_penalty', 0),
-                )
-                return response.choices[0].message.content
-                
-        except Exception as e:
-            logger.error(f"OpenAI API error: {e}")
+        
+        return get_gateway(api_key=self.api_key).complete(
+            messages, model=self.model, cache_scope=kwargs.get('cache_scope', self.cache_scope),
+            **self._completion_params(kwargs)
+        )
+    
+    async def acall_openai(self, messages: List[Dict], **kwargs) -> Optional[str]:
+        """OpenAI API 비동기 호출"""
+        if not self.api_key:
+            logger.warning("OpenAI API key not found")
             return None
+        
+        return await get_gateway(api_key=self.api_key).acomplete(
+            messages, model=self.model, cache_scope=kwargs.get('cache_scope', self.cache_scope),
+            **self._completion_params(kwargs)
+        )
     
     def get_cached_or_compute(self, cache_key: str, compute_func, *args, **kwargs):
         """캐시에서 가져오거나 계산"""
@@ -0,0 +1,223 @@
+"""
+오프라인 LLM 일괄 생성
+평가 기간 전체의 AI 피드백처럼 대상별 프롬프트를 미리 큐에 쌓아 두고, 야간에 일괄 생성합니다.
+
+- 작업 유형별 BatchHandler 가 대상별 프롬프트(LLMBatchItem)를 만들고 결과를 검증/반영
+- BatchRunner 는 공유 LLM 게이트웨이로 bounded async 동시 호출, 항목마다 결과를 DB 에 체크포인트
+- 중단(예산 차단기, 프로세스 종료)된 작업은 대기 항목만 이어서 실행
+- 요청 처리 측은 get_batch_result 로 미리 생성된 결과를 먼저 사용
+
+    job = create_job('evaluation_feedback', {'evaluation_period_id': 3})
+    BatchRunner(job).run()              # manage.py run_llm_batch
+    feedback = get_batch_result('evaluation_feedback', 'contribution:12')
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .llm_gateway import LLMBudgetExceeded, LLMError, LLMRateLimited, get_gateway
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_BATCH_SETTINGS = {
+    'CONCURRENCY': 4,                 # 작업당 동시 LLM 호출 수
+    'MAX_ATTEMPTS': 3,                # 항목당 최대 시도 횟수 (게이트웨이 재시도와 별개)
+    'RATE_LIMIT_WAIT': 10,            # 분당 호출 한도에 걸렸을 때 대기 시간 (초, 시도 횟수에 포함하지 않음)
+    'CHUNK_SIZE': 500,                # 항목 bulk_create 크기
+    'HANDLERS': {
+        'evaluation_feedback': 'evaluations.ai_feedback.EvaluationFeedbackBatch',
+    },
+}
+
+
+def get_batch_settings() -> Dict[str, Any]:
+    """settings.LLM_BATCH 를 기본값과 병합"""
+    config = dict(DEFAULT_BATCH_SETTINGS)
+    config.update(getattr(settings, 'LLM_BATCH', {}))
+    return config
+
+
+class BatchHandler:
+    """작업 유형별 프롬프트 생성 / 결과 반영
+
+    iter_items 는 (item_key, payload) 를 돌려주며 payload['messages'] 가 LLM 요청 메시지.
+    apply 는 응답을 검증해 저장할 결과를 반환하고, 품질 미달이면 ValueError 로 재시도/실패 처리.
+    """
+    job_type = ''
+    feature = None          # 사용량 집계 단위 (기본값은 job_type)
+    model = None
+    llm_params: Dict[str, Any] = {}
+
+    def iter_items(self, params: Dict[str, Any]) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        raise NotImplementedError
+
+    def apply(self, item_key: str, payload: Dict[str, Any], content: str) -> str:
+        return content
+
+
+def get_handler(job_type: str) -> BatchHandler:
+    path = get_batch_settings()['HANDLERS'].get(job_type)
+    if not path:
+        raise ValueError(f"등록되지 않은 일괄 작업 유형입니다: {job_type}")
+    return import_string(path)()
+
+
+def create_job(job_type: str, params: Optional[Dict[str, Any]] = None, created_by=None):
+    """작업 생성 + 대상별 항목 적재 (실행은 run_llm_batch 또는 BatchRunner)"""
+    from ai_chatbot.models import LLMBatchItem, LLMBatchJob
+
+    params = params or {}
+    handler = get_handler(job_type)
+    with transaction.atomic():
+        job = LLMBatchJob.objects.create(job_type=job_type, params=params, created_by=created_by)
+        items = [
+            LLMBatchItem(job=job, item_key=key, payload=payload)
+            for key, payload in handler.iter_items(params)
+        ]
+        LLMBatchItem.objects.bulk_create(items, batch_size=get_batch_settings()['CHUNK_SIZE'])
+        job.total = len(items)
+        job.save(update_fields=['total'])
+    logger.info(f"LLM 일괄 작업 생성: {job} ({job.total}건)")
+    return job
+
+
+def retry_failed(job) -> int:
+    """실패 항목을 다시 대기 상태로 (시도 횟수 초기화)"""
+    from ai_chatbot.models import LLMBatchItem, LLMBatchJob
+
+    with transaction.atomic():
+        count = LLMBatchItem.objects.filter(job=job, status='failed').update(
+            status='pending', attempts=0, updated_at=timezone.now()
+        )
+        if count:
+            LLMBatchJob.objects.filter(pk=job.pk).update(failed=F('failed') - count, status='queued')
+    job.refresh_from_db()
+    return count
+
+
+def job_status(job) -> Dict[str, Any]:
+    """진행 상황 응답"""
+    return {
+        'id': job.pk,
+        'job_type': job.job_type,
+        'status': job.status,
+        'total': job.total,
+        'completed': job.completed,
+        'failed': job.failed,
+        'progress': job.progress(),
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+        'error': job.error,
+    }
+
+
+def get_batch_result(job_type: str, item_key: str, since=None) -> Optional[str]:
+    """미리 생성된 최신 결과 (since 이후 생성분만, 없으면 None)"""
+    from ai_chatbot.models import LLMBatchItem
+
+    items = LLMBatchItem.objects.filter(job__job_type=job_type, item_key=item_key, status='done')
+    if since is not None:
+        items = items.filter(updated_at__gte=since)
+    return items.order_by('-updated_at').values_list('result', flat=True).first()
+
+
+class BatchRunner:
+    """일괄 작업 실행기 (대기 항목만 처리하므로 재실행하면 이어서 진행)"""
+
+    def __init__(self, job, gateway=None, concurrency: Optional[int] = None,
+                 config: Optional[Dict[str, Any]] = None):
+        self.job = job
+        self.gateway = gateway or get_gateway()
+        self.config = config or get_batch_settings()
+        self.concurrency = concurrency or self.config['CONCURRENCY']
+        self.max_attempts = self.config['MAX_ATTEMPTS']
+        self._stopped: Optional[str] = None
+
+    def run(self):
+        return asyncio.run(self.arun())
+
+    async def arun(self):
+        from ai_chatbot.models import LLMBatchItem, LLMBatchJob
+
+        job = self.job
+        jobs = LLMBatchJob.objects.filter(pk=job.pk)
+        if not self.gateway.is_configured:
+            await jobs.aupdate(status='failed', error='LLM 게이트웨이가 설정되지 않았습니다.')
+            await job.arefresh_from_db()
+            return job
+
+        handler = get_handler(job.job_type)
+        await jobs.aupdate(status='running', error='', started_at=job.started_at or timezone.now())
+
+        pending = [
+            item async for item in LLMBatchItem.objects.filter(job=job, status='pending').only(
+                'pk', 'item_key', 'payload', 'attempts'
+            )
+        ]
+        await self.process_items(handler, pending)
+
+        if self._stopped:
+            await jobs.aupdate(status='paused', error=self._stopped)
+        else:
+            remaining = await LLMBatchItem.objects.filter(job=job, status='pending').aexists()
+            await jobs.aupdate(
+                status='paused' if remaining else 'completed',
+                finished_at=None if remaining else timezone.now(),
+            )
+        await job.arefresh_from_db()
+        logger.info(f"LLM 일괄 작업 종료: {job} ({job.completed}/{job.total}, 실패 {job.failed})")
+        return job
+
+    async def process_items(self, handler: BatchHandler, items):
+        """항목별 LLM 호출 (동시 실행 수 제한, 예산 차단 시 남은 항목은 대기 상태로 둠)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        await asyncio.gather(*(self._process(handler, item, semaphore) for item in items))
+
+    async def _process(self, handler: BatchHandler, item, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            attempts, error = item.attempts, ''
+            while attempts < self.max_attempts and not self._stopped:
+                try:
+                    result = await self.gateway.achat(
+                        item.payload['messages'], model=handler.model,
+                        feature=handler.feature or handler.job_type, **handler.llm_params
+                    )
+                    content = await sync_to_async(handler.apply)(item.item_key, item.payload, result.content)
+                except LLMBudgetExceeded as e:
+                    self._stopped = f"예산 한도로 중지: {e}"
+                    break
+                except LLMRateLimited:
+                    await asyncio.sleep(self.config['RATE_LIMIT_WAIT'])
+                    continue
+                except (LLMError, ValueError, KeyError) as e:
+                    attempts += 1
+                    error = str(e)
+                    logger.warning(f"LLM 일괄 항목 실패 {item.item_key} ({attempts}/{self.max_attempts}): {e}")
+                    continue
+                await self._checkpoint(item, 'done', attempts + 1, result=content)
+                return
+
+            if attempts >= self.max_attempts:
+                await self._checkpoint(item, 'failed', attempts, error=error)
+            elif attempts != item.attempts:
+                # 중지된 경우 시도 횟수만 남기고 대기 상태 유지
+                await self._checkpoint(item, 'pending', attempts, error=error)
+
+    async def _checkpoint(self, item, status: str, attempts: int, result: str = '', error: str = ''):
+        from ai_chatbot.models import LLMBatchItem, LLMBatchJob
+
+        await LLMBatchItem.objects.filter(pk=item.pk).aupdate(
+            status=status, attempts=attempts, result=result, error=error[:1000], updated_at=timezone.now()
+        )
+        counter = {'done': 'completed', 'failed': 'failed'}.get(status)
+        if counter:
+            await LLMBatchJob.objects.filter(pk=self.job.pk).aupdate(**{counter: F(counter) + 1})
@@ -0,0 +1,112 @@
+"""
+챗봇 사용자 데이터 조회
+EHRGPTChatbot 이 매 턴 참조하는 직원/인증/평가/교육/리더 추천/팀 데이터를 한 번에 조회하고 세션별로 캐시합니다.
+
+- 조회: 직원 1건 확인 후 나머지 5개 쿼리를 asyncio.gather 로 동시에 실행 (결과는 모두 평가된 리스트/객체)
+- 캐시: state.user_data → 세션 캐시(chatbot_user_data_{session_id}) → DB 순, current_date 는 매 턴 갱신
+- 챗봇 모듈(src.ehr_gpt_chatbot)은 리더 대시보드/리포트 모듈까지 불러오므로 조회 로직만 분리
+
+    user_data = await collect_user_data(state, ttl=300)
+"""
+import asyncio
+from typing import Any, Dict
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from certifications.models import GrowthLevelCertification
+from employees.models import Employee
+from trainings.models import TrainingEnrollment
+
+try:
+    from evaluations.models import Evaluation
+except ImportError:
+    # 분기 평가 모델이 없는 배포본 (평가 이력 없이 응답)
+    Evaluation = None
+
+try:
+    from job_profiles.models import LeaderRecommendation
+except ImportError:
+    LeaderRecommendation = None
+
+
+def user_data_cache_key(session_id: str) -> str:
+    return f"chatbot_user_data_{session_id}"
+
+
+async def collect_user_data(state, ttl: int) -> Dict[str, Any]:
+    """대화 상태의 사용자 데이터 (세션별로 ttl 초 동안 캐시)"""
+    if state.user_data is None:
+        cache_key = user_data_cache_key(state.session_id)
+        state.user_data = await cache.aget(cache_key)
+        if state.user_data is None:
+            state.user_data = await fetch_user_data(state.user_profile)
+            await cache.aset(cache_key, state.user_data, ttl)
+    return {**state.user_data, 'current_date': timezone.now()}
+
+
+async def _fetch_list(queryset) -> list:
+    return [obj async for obj in queryset]
+
+
+async def _empty() -> list:
+    return []
+
+
+async def fetch_user_data(profile) -> Dict[str, Any]:
+    """사용자 데이터를 한 번에 조회 (비동기 ORM)"""
+    data = {
+        'profile': profile,
+        'employee': None,
+        'growth_level': {'current': 'Lv.1', 'certifications': []},
+        'latest_evaluation': None,
+        'evaluation_history': [],
+        'training_history': [],
+        'leader_recommendations': [],
+        'team_members': [],
+    }
+
+    try:
+        employee = await Employee.objects.aget(id=profile.employee_id)
+    except (Employee.DoesNotExist, ValueError):
+        return data
+
+    certifications, evaluations, trainings, recommendations, team_members = await asyncio.gather(
+        # 성장 레벨 인증
+        _fetch_list(GrowthLevelCertification.objects.filter(
+            employee=employee,
+            status='CERTIFIED'
+        ).order_by('-certified_date')),
+        # 최근 평가 (추이 표시용 4건)
+        _fetch_list(Evaluation.objects.filter(
+            employee=employee
+        ).order_by('-evaluation_year', '-evaluation_quarter')[:4]) if Evaluation is not None else _empty(),
+        # 교육 이력
+        _fetch_list(TrainingEnrollment.objects.filter(
+            employee=employee
+        ).select_related('course').order_by('-enrolled_date')[:5]),
+        # 리더 추천
+        _fetch_list(LeaderRecommendation.objects.filter(
+            employee=employee,
+            is_active=True
+        ).select_related('target_job').order_by('-recommendation_date')) if LeaderRecommendation is not None else _empty(),
+        # 팀 정보 (매니저인 경우)
+        _fetch_list(Employee.objects.filter(
+            manager=employee,
+            employment_status='재직'
+        )) if profile.role in ['manager', 'executive'] else _empty(),
+    )
+
+    data.update({
+        'employee': employee,
+        'growth_level': {
+            'current': getattr(employee, 'growth_level', 'Lv.1'),
+            'certifications': certifications
+        },
+        'latest_evaluation': evaluations[0] if evaluations else None,
+        'evaluation_history': evaluations,
+        'training_history': trainings,
+        'leader_recommendations': recommendations,
+        'team_members': team_members,
+    })
+    return data
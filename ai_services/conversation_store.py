@@ -0,0 +1,226 @@
+"""
+대화 상태 저장소
+챗봇 세션의 대화를 최근 N턴(rolling window) + 누적 요약으로 유지합니다.
+
+- 창을 넘어선 오래된 턴은 요약(summary)에 한 줄씩 합쳐지고, 요약도 최대 길이를 넘지 않음
+- 스냅샷은 msgpack 으로 직렬화해 캐시에 저장 (대화가 길어져도 턴당 읽기/쓰기 크기가 일정)
+- 전체 대화 기록은 저장소가 아닌 append-only 로그(ChatMessage 또는 JSONL)에 남김
+
+    store = ConversationStore('ai_chatbot')
+    snapshot = store.load(session_id) or store.create(session_id)
+    store.append(snapshot, 'user', message)
+    store.save(snapshot)
+    messages = snapshot.to_messages(system_prompt)
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import msgpack
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CONVERSATION_SETTINGS = {
+    'WINDOW': 10,
+    'SUMMARY_MAX_CHARS': 1500,
+    'SUMMARY_LINE_CHARS': 120,
+    'TIMEOUT': 3600,
+    'LOG_DIR': None,
+    'NAMESPACES': {},
+}
+
+_ROLE_LABELS = {'user': '사용자', 'assistant': '어시스턴트'}
+_FIRST_SENTENCE = re.compile(r'(.+?[.?!])(?:\s|$)')
+
+
+def get_conversation_settings(namespace: Optional[str] = None) -> Dict[str, Any]:
+    """settings.CONVERSATION_STORE 를 기본값과 병합 (NAMESPACES[namespace] 가 있으면 덮어씀)"""
+    config = dict(DEFAULT_CONVERSATION_SETTINGS)
+    config.update(getattr(settings, 'CONVERSATION_STORE', {}))
+    if namespace:
+        config.update(config.get('NAMESPACES', {}).get(namespace, {}))
+    return config
+
+
+@dataclass(slots=True)
+class ConversationTurn:
+    """대화 한 턴"""
+    role: str
+    content: str
+    ts: float
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class ConversationSnapshot:
+    """세션 스냅샷 (최근 턴 + 요약 + 호출 측 상태)"""
+    session_id: str
+    turns: List[ConversationTurn] = field(default_factory=list)
+    summary: str = ''
+    total_turns: int = 0
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    def pack(self) -> bytes:
+        return msgpack.packb([
+            self.session_id,
+            [[t.role, t.content, t.ts, t.meta] for t in self.turns],
+            self.summary,
+            self.total_turns,
+            self.state,
+        ], use_bin_type=True)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> 'ConversationSnapshot':
+        session_id, turns, summary, total_turns, state = msgpack.unpackb(data, raw=False)
+        return cls(
+            session_id=session_id,
+            turns=[ConversationTurn(*turn) for turn in turns],
+            summary=summary,
+            total_turns=total_turns,
+            state=state,
+        )
+
+    @property
+    def last_turn(self) -> Optional[ConversationTurn]:
+        return self.turns[-1] if self.turns else None
+
+    def to_messages(self, system_prompt: Optional[str] = None) -> List[Dict[str, str]]:
+        """LLM 메시지 형식 (시스템 프롬프트 → 이전 대화 요약 → 최근 턴)"""
+        messages = []
+        if system_prompt:
+            messages.append({'role': 'system', 'content': system_prompt})
+        if self.summary:
+            messages.append({'role': 'system', 'content': f"이전 대화 요약:\n{self.summary}"})
+        messages.extend({'role': t.role, 'content': t.content} for t in self.turns)
+        return messages
+
+
+def summarize_turn(summary: str, turn: ConversationTurn, line_chars: int = 120) -> str:
+    """기본 요약기: 창에서 밀려난 턴의 첫 문장을 요약에 한 줄로 추가"""
+    first_line = turn.content.strip().split('\n', 1)[0]
+    sentence = _FIRST_SENTENCE.match(first_line)
+    text = ' '.join((sentence.group(1) if sentence else first_line).split())
+    if len(text) > line_chars:
+        text = text[:line_chars - 1] + '…'
+    line = f"- {_ROLE_LABELS.get(turn.role, turn.role)}: {text}"
+    return f"{summary}\n{line}" if summary else line
+
+
+class ConversationStore:
+    """rolling window + 누적 요약 대화 저장소"""
+
+    def __init__(self, namespace: str,
+                 summarizer: Optional[Callable[[str, ConversationTurn], str]] = None,
+                 **overrides):
+        self.namespace = namespace
+        config = get_conversation_settings(namespace)
+        config.update({key.upper(): value for key, value in overrides.items()})
+        self.window = config['WINDOW']
+        self.summary_max_chars = config['SUMMARY_MAX_CHARS']
+        self.timeout = config['TIMEOUT']
+        self.log_path = (
+            os.path.join(config['LOG_DIR'], f'conversation_{namespace}.jsonl') if config['LOG_DIR'] else None
+        )
+        self.summarizer = summarizer or (
+            lambda summary, turn: summarize_turn(summary, turn, config['SUMMARY_LINE_CHARS'])
+        )
+        self._log_lock = threading.Lock()
+
+    def _key(self, session_id: str) -> str:
+        return f"conversation:{self.namespace}:{session_id}"
+
+    # ------------------------------------------------------------------
+    # 스냅샷 조회/저장
+    # ------------------------------------------------------------------
+    def create(self, session_id: str, state: Optional[Dict[str, Any]] = None) -> ConversationSnapshot:
+        return ConversationSnapshot(session_id=session_id, state=state or {})
+
+    def _decode(self, data: Optional[bytes]) -> Optional[ConversationSnapshot]:
+        if not data:
+            return None
+        try:
+            return ConversationSnapshot.unpack(data)
+        except (ValueError, TypeError, msgpack.UnpackException) as e:
+            logger.warning(f"대화 스냅샷 복원 실패 ({self.namespace}): {e}")
+            return None
+
+    def load(self, session_id: str) -> Optional[ConversationSnapshot]:
+        return self._decode(cache.get(self._key(session_id)))
+
+    async def aload(self, session_id: str) -> Optional[ConversationSnapshot]:
+        return self._decode(await cache.aget(self._key(session_id)))
+
+    def save(self, snapshot: ConversationSnapshot):
+        cache.set(self._key(snapshot.session_id), snapshot.pack(), self.timeout)
+
+    async def asave(self, snapshot: ConversationSnapshot):
+        await cache.aset(self._key(snapshot.session_id), snapshot.pack(), self.timeout)
+
+    def delete(self, session_id: str):
+        cache.delete(self._key(session_id))
+
+    # ------------------------------------------------------------------
+    # 턴 추가
+    # ------------------------------------------------------------------
+    def append(self, snapshot: ConversationSnapshot, role: str, content: str,
+               **meta) -> ConversationTurn:
+        """턴 추가 후 창을 넘은 턴은 요약으로 이동 (저장은 호출 측에서 save)"""
+        turn = ConversationTurn(role=role, content=content or '', ts=time.time(), meta=meta)
+        snapshot.turns.append(turn)
+        snapshot.total_turns += 1
+        self._compact(snapshot)
+        self._log(snapshot.session_id, turn)
+        return turn
+
+    def _compact(self, snapshot: ConversationSnapshot):
+        overflow = len(snapshot.turns) - self.window
+        if overflow <= 0:
+            return
+        for turn in snapshot.turns[:overflow]:
+            snapshot.summary = self.summarizer(snapshot.summary, turn)
+        del snapshot.turns[:overflow]
+
+        # 요약 길이 제한 (오래된 줄부터 제거)
+        if len(snapshot.summary) > self.summary_max_chars:
+            summary = snapshot.summary[-self.summary_max_chars:]
+            newline = summary.find('\n')
+            snapshot.summary = summary[newline + 1:] if newline >= 0 else summary
+
+    def _log(self, session_id: str, turn: ConversationTurn):
+        """전체 기록은 append-only JSONL 로그에 남김 (LOG_DIR 설정 시)"""
+        if not self.log_path:
+            return
+        record = json.dumps({
+            'session_id': session_id, 'role': turn.role, 'content': turn.content,
+            'ts': turn.ts, 'meta': turn.meta
+        }, ensure_ascii=False, default=str)
+        try:
+            with self._log_lock:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(record + '\n')
+        except OSError as e:
+            logger.warning(f"대화 로그 기록 실패: {e}")
+
+
+_stores: Dict[str, ConversationStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_conversation_store(namespace: str) -> ConversationStore:
+    """네임스페이스별 공유 저장소"""
+    store = _stores.get(namespace)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(namespace)
+            if store is None:
+                store = _stores[namespace] = ConversationStore(namespace)
+    return store
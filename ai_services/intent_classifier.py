@@ -0,0 +1,182 @@
+"""
+로컬 의도 분류기
+챗봇 메시지의 의도를 LLM 호출 없이 판별합니다.
+
+1. 패턴: 의도별로 컴파일한 정규식을 선언 순서대로 검색해 처음 매칭된 의도로 판별
+2. 모델: 패턴/LLM 으로 분류된 대화 로그(JSONL)로 학습한 TF-IDF + 로지스틱 회귀
+3. 두 단계 모두 신뢰도가 임계값 미만이면 호출 측에서 LLM 으로 분류 (결과는 다시 로그에 적재)
+
+    classifier = get_intent_classifier('ehr_gpt_chatbot', patterns)
+    prediction = classifier.classify('이번 분기 평가 결과 알려줘')
+    classifier.log_example(message, 'EVALUATION_STATUS', 'llm')
+    classifier.train()    # manage.py train_intent_model
+"""
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.conf import settings
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_score
+from sklearn.pipeline import Pipeline
+
+from airiss.model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IntentPrediction:
+    """의도 분류 결과"""
+    label: Optional[str]
+    confidence: float
+    source: str                 # 'pattern' | 'model' | 'none'
+
+
+class IntentPatternMatcher:
+    """의도별 정규식 목록을 의도마다 하나의 정규식으로 컴파일
+
+    선언 순서대로 검색해 처음 매칭된 의도를 돌려준다. 여러 의도를 하나의
+    alternation 으로 합치면 뒤 의도의 매칭이 앞 의도의 매칭 위치를 소비해
+    우선순위가 깨지므로 의도별로 따로 검색한다.
+    """
+
+    def __init__(self, patterns: Dict[str, Sequence[str]]):
+        self.compiled: List[Tuple[str, re.Pattern]] = [
+            (label, re.compile('|'.join(f'(?:{p})' for p in label_patterns)))
+            for label, label_patterns in patterns.items() if label_patterns
+        ]
+
+    def match(self, text: str) -> Optional[str]:
+        for label, regex in self.compiled:
+            if regex.search(text):
+                return label
+        return None
+
+
+class IntentClassifier:
+    """패턴 + 학습 모델 의도 분류기"""
+
+    def __init__(self, name: str, patterns: Dict[str, Sequence[str]],
+                 threshold: Optional[float] = None, base_dir: Optional[str] = None):
+        self.name = name
+        self.matcher = IntentPatternMatcher(patterns)
+        self.threshold = threshold if threshold is not None else getattr(
+            settings, 'CHATBOT_INTENT_THRESHOLD', 0.6
+        )
+        base_dir = base_dir or getattr(
+            settings, 'CHATBOT_INTENT_DIR', os.path.join(settings.BASE_DIR, 'ai_services', 'models')
+        )
+        self.model_path = os.path.join(base_dir, f'intent_{name}.joblib')
+        self.log_path = os.path.join(base_dir, f'intent_{name}.jsonl')
+        self._log_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 분류
+    # ------------------------------------------------------------------
+    def classify(self, message: str) -> IntentPrediction:
+        """패턴 → 모델 순으로 분류 (모델 결과는 임계값과 무관하게 반환, 판단은 호출 측)"""
+        text = (message or '').lower()
+
+        label = self.matcher.match(text)
+        if label is not None:
+            return IntentPrediction(label, 0.9, 'pattern')
+
+        entry = model_registry.get(self.model_path)
+        if entry is None:
+            return IntentPrediction(None, 0.0, 'none')
+
+        with model_registry.track_inference(f'intent_{self.name}'):
+            pipeline = entry.payload['pipeline']
+            probabilities = pipeline.predict_proba([text])[0]
+        best = int(np.argmax(probabilities))
+        return IntentPrediction(str(pipeline.classes_[best]), float(probabilities[best]), 'model')
+
+    def is_confident(self, prediction: IntentPrediction) -> bool:
+        return prediction.label is not None and prediction.confidence >= self.threshold
+
+    # ------------------------------------------------------------------
+    # 학습 데이터 로그
+    # ------------------------------------------------------------------
+    def log_example(self, message: str, label: str, source: str):
+        """분류 결과를 학습 로그에 추가 (append-only JSONL)"""
+        if not message or not label:
+            return
+        record = json.dumps({
+            'text': message.lower(), 'label': label, 'source': source, 'ts': int(time.time())
+        }, ensure_ascii=False)
+        try:
+            with self._log_lock:
+                os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'a', encoding='utf-8') as f:
+                    f.write(record + '\n')
+        except OSError as e:
+            logger.warning(f"의도 로그 기록 실패: {e}")
+
+    def load_examples(self) -> List[Tuple[str, str]]:
+        """학습 로그 로드 (같은 문장은 마지막 라벨 사용)"""
+        examples: Dict[str, str] = {}
+        if not os.path.exists(self.log_path):
+            return []
+        with open(self.log_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                examples[record['text']] = record['label']
+        return list(examples.items())
+
+    # ------------------------------------------------------------------
+    # 학습
+    # ------------------------------------------------------------------
+    def train(self, examples: Optional[List[Tuple[str, str]]] = None, min_examples: int = 20) -> Dict:
+        """TF-IDF + 로지스틱 회귀 학습 후 저장 (모델 레지스트리로 다른 프로세스에도 반영)"""
+        examples = examples if examples is not None else self.load_examples()
+        labels = {label for _, label in examples}
+        if len(examples) < min_examples or len(labels) < 2:
+            return {'trained': False, 'examples': len(examples), 'labels': len(labels)}
+
+        texts = [text for text, _ in examples]
+        targets = [label for _, label in examples]
+        pipeline = Pipeline([
+            ('tfidf', TfidfVectorizer(analyzer='char_wb', ngram_range=(1, 3), sublinear_tf=True, min_df=1)),
+            ('clf', LogisticRegression(max_iter=1000, class_weight='balanced')),
+        ])
+
+        accuracy = None
+        smallest_class = min(targets.count(label) for label in labels)
+        if smallest_class >= 3:
+            accuracy = float(np.mean(cross_val_score(pipeline, texts, targets, cv=min(5, smallest_class))))
+
+        pipeline.fit(texts, targets)
+        model_registry.save(self.model_path, {'pipeline': pipeline, 'trained_at': time.time()})
+        logger.info(f"의도 분류 모델 학습 완료 ({self.name}): {len(examples)}건, 정확도 {accuracy}")
+        return {
+            'trained': True,
+            'examples': len(examples),
+            'labels': len(labels),
+            'cv_accuracy': accuracy,
+        }
+
+
+_classifiers: Dict[str, IntentClassifier] = {}
+_classifiers_lock = threading.Lock()
+
+
+def get_intent_classifier(name: str, patterns: Dict[str, Sequence[str]]) -> IntentClassifier:
+    """이름별 공유 분류기 (패턴 컴파일은 프로세스당 한 번)"""
+    classifier = _classifiers.get(name)
+    if classifier is None:
+        with _classifiers_lock:
+            classifier = _classifiers.get(name)
+            if classifier is None:
+                classifier = _classifiers[name] = IntentClassifier(name, patterns)
+    return classifier
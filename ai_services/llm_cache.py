@@ -0,0 +1,309 @@
+"""
+LLM 응답 캐시 (2단계)
+반복되는 HR 질문에 대해 LLM 을 다시 호출하지 않도록 응답을 DB(LLMCacheEntry)에 저장합니다.
+
+1. exact: 정규화된 프롬프트 + 시스템 프롬프트 + 모델 파라미터 해시가 같으면 그대로 반환
+2. similarity: 같은 컨텍스트(시스템 프롬프트/모델 파라미터) 안에서 프롬프트의
+   char n-gram hashing 벡터 코사인 유사도가 임계값 이상이면 가장 가까운 응답 반환
+
+캐시는 기능(scope) 단위로 분리되며 TTL 만료와 scope 별 최대 개수(LRU) 로 정리됩니다.
+
+    hit = llm_cache.lookup('chatbot', messages, {'model': 'gpt-3.5-turbo'})
+    if hit is None:
+        ...
+        llm_cache.store('chatbot', messages, params, content, model)
+"""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from sklearn.feature_extraction.text import HashingVectorizer
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_SETTINGS = {
+    'ENABLED': True,
+    'TTL': 24 * 3600,
+    'SIMILARITY_THRESHOLD': 0.92,
+    'MAX_ENTRIES_PER_SCOPE': 2000,
+    'INDEX_REFRESH_INTERVAL': 60,
+    'SCOPES': {},
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_TRAILING_PUNCTUATION = re.compile(r'[\s?!.~…]+$')
+
+
+def get_cache_settings(scope: Optional[str] = None) -> Dict[str, Any]:
+    """settings.LLM_CACHE 를 기본값과 병합 (SCOPES[scope] 가 있으면 덮어씀)"""
+    config = dict(DEFAULT_CACHE_SETTINGS)
+    config.update(getattr(settings, 'LLM_CACHE', {}))
+    if scope:
+        config.update(config.get('SCOPES', {}).get(scope, {}))
+    return config
+
+
+def normalize_prompt(text: str) -> str:
+    """캐시 키용 프롬프트 정규화 (유니코드 NFKC, 소문자, 공백 축약, 끝 문장부호 제거)"""
+    text = unicodedata.normalize('NFKC', text or '').lower()
+    text = _WHITESPACE.sub(' ', text).strip()
+    return _TRAILING_PUNCTUATION.sub('', text)
+
+
+def _hash(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def split_messages(messages: List[Dict], params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """(정규화된 마지막 사용자 프롬프트, 컨텍스트 해시)
+
+    이미지 등 문자열이 아닌 메시지가 섞여 있으면 캐시 대상이 아니므로 None.
+    """
+    if not messages or messages[-1].get('role') != 'user':
+        return None
+    if any(not isinstance(message.get('content'), str) for message in messages):
+        return None
+
+    prompt = normalize_prompt(messages[-1]['content'])
+    context = [
+        [message['role'], normalize_prompt(message['content'])]
+        for message in messages[:-1]
+    ]
+    return prompt, _hash({'context': context, 'params': params})
+
+
+@dataclass
+class CacheHit:
+    """캐시 적중 결과"""
+    content: str
+    model: str
+    similarity: float
+    exact: bool
+
+
+class SimilarityIndex:
+    """scope 하나의 프롬프트 벡터 인덱스 (프로세스 메모리)
+
+    HashingVectorizer 는 학습이 필요 없어 항목 추가 시 재학습 없이 행만 덧붙입니다.
+    여러 스레드가 add/search 를 동시에 호출하므로 entries 와 행렬은 잠금 안에서만
+    함께 갱신하고, 검색은 같은 시점의 (행렬, 항목) 스냅샷으로 수행합니다.
+    """
+
+    vectorizer = HashingVectorizer(
+        analyzer='char_wb',
+        ngram_range=(2, 4),
+        n_features=2 ** 18,
+        alternate_sign=False,
+        norm='l2',
+    )
+
+    def __init__(self):
+        self.entries: List[Dict[str, Any]] = []
+        self._matrix = None
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self.loaded_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry: Dict[str, Any]):
+        with self._lock:
+            self.entries.append(entry)
+            self._pending.append(entry['prompt'])
+
+    def _snapshot(self):
+        """대기 중인 항목을 행렬에 반영하고 (행렬, 항목 목록) 반환 - 행 i 는 항목 i"""
+        from scipy.sparse import vstack
+
+        with self._lock:
+            if self._pending:
+                new_rows = self.vectorizer.transform(self._pending)
+                self._matrix = new_rows if self._matrix is None else vstack([self._matrix, new_rows]).tocsr()
+                self._pending = []
+            # vstack 은 새 행렬을 만들므로 반환한 행렬은 이후 add 에 영향받지 않음
+            return self._matrix, list(self.entries)
+
+    def search(self, prompt: str, context_hash: str, threshold: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """같은 컨텍스트 안에서 가장 유사한 항목 (임계값 미만이면 None)"""
+        if not self.entries:
+            return None
+
+        matrix, entries = self._snapshot()
+        query = self.vectorizer.transform([prompt])
+        scores = np.asarray((matrix @ query.T).todense()).ravel()
+
+        now = timezone.now()
+        for index in np.argsort(-scores):
+            score = float(scores[index])
+            if score < threshold:
+                break
+            entry = entries[index]
+            if entry['context_hash'] == context_hash and entry['expires_at'] > now:
+                return entry, score
+        return None
+
+
+class LLMResponseCache:
+    """DB 영속 LLM 응답 캐시"""
+
+    def __init__(self):
+        self._indexes: Dict[str, SimilarityIndex] = {}
+        self._lock = threading.Lock()
+        self.stats = {'exact_hits': 0, 'similar_hits': 0, 'misses': 0, 'stores': 0}
+
+    @staticmethod
+    def _model():
+        from ai_chatbot.models import LLMCacheEntry
+        return LLMCacheEntry
+
+    def is_enabled(self, scope: Optional[str]) -> bool:
+        return bool(scope) and get_cache_settings(scope)['ENABLED']
+
+    # ------------------------------------------------------------------
+    # 유사도 인덱스
+    # ------------------------------------------------------------------
+    def _get_index(self, scope: str, config: Dict[str, Any]) -> SimilarityIndex:
+        index = self._indexes.get(scope)
+        if index is not None and time.monotonic() - index.loaded_at < config['INDEX_REFRESH_INTERVAL']:
+            return index
+
+        # 다른 프로세스가 저장한 항목도 반영되도록 주기적으로 다시 읽음
+        rows = self._model().objects.filter(
+            scope=scope, expires_at__gt=timezone.now()
+        ).order_by('-last_hit_at').values(
+            'id', 'prompt', 'context_hash', 'response', 'model_used', 'expires_at'
+        )[:config['MAX_ENTRIES_PER_SCOPE']]
+
+        index = SimilarityIndex()
+        for row in rows:
+            index.add(row)
+        with self._lock:
+            self._indexes[scope] = index
+        return index
+
+    # ------------------------------------------------------------------
+    # 조회 / 저장
+    # ------------------------------------------------------------------
+    def lookup(self, scope: str, messages: List[Dict], params: Dict[str, Any]) -> Optional[CacheHit]:
+        """캐시 조회 - exact 우선, 없으면 similarity"""
+        if not self.is_enabled(scope):
+            return None
+        keys = split_messages(messages, params)
+        if keys is None:
+            return None
+        prompt, context_hash = keys
+        config = get_cache_settings(scope)
+        Entry = self._model()
+        now = timezone.now()
+
+        entry = Entry.objects.filter(
+            scope=scope, key_hash=_hash([prompt, context_hash]), expires_at__gt=now
+        ).values('id', 'response', 'model_used').first()
+        if entry is not None:
+            self._touch(entry['id'])
+            self.stats['exact_hits'] += 1
+            return CacheHit(entry['response'], entry['model_used'], 1.0, True)
+
+        threshold = config['SIMILARITY_THRESHOLD']
+        if threshold and threshold < 1:
+            match = self._get_index(scope, config).search(prompt, context_hash, threshold)
+            if match is not None:
+                entry, similarity = match
+                self._touch(entry['id'])
+                self.stats['similar_hits'] += 1
+                return CacheHit(entry['response'], entry['model_used'], similarity, False)
+
+        self.stats['misses'] += 1
+        return None
+
+    def _touch(self, entry_id: int):
+        self._model().objects.filter(id=entry_id).update(
+            hit_count=F('hit_count') + 1, last_hit_at=timezone.now()
+        )
+
+    def store(self, scope: str, messages: List[Dict], params: Dict[str, Any], content: str, model: str = ''):
+        """응답 저장 (같은 키가 있으면 갱신) 후 scope 용량 초과분 LRU 정리"""
+        if not content or not self.is_enabled(scope):
+            return
+        keys = split_messages(messages, params)
+        if keys is None:
+            return
+        prompt, context_hash = keys
+        config = get_cache_settings(scope)
+        now = timezone.now()
+        expires_at = now + timedelta(seconds=config['TTL'])
+
+        entry, _ = self._model().objects.update_or_create(
+            scope=scope,
+            key_hash=_hash([prompt, context_hash]),
+            defaults={
+                'context_hash': context_hash,
+                'prompt': prompt,
+                'response': content,
+                'model_used': (model or '')[:50],
+                'last_hit_at': now,
+                'expires_at': expires_at,
+            },
+        )
+        self.stats['stores'] += 1
+
+        index = self._indexes.get(scope)
+        if index is not None:
+            index.add({
+                'id': entry.id, 'prompt': prompt, 'context_hash': context_hash,
+                'response': content, 'model_used': entry.model_used, 'expires_at': expires_at,
+            })
+            if len(index) > config['MAX_ENTRIES_PER_SCOPE']:
+                self.evict(scope)
+
+    def evict(self, scope: Optional[str] = None) -> int:
+        """만료 항목 삭제 + scope 별 MAX_ENTRIES_PER_SCOPE 초과분을 오래 안 쓰인 순으로 삭제"""
+        Entry = self._model()
+        queryset = Entry.objects.all() if scope is None else Entry.objects.filter(scope=scope)
+        deleted, _ = queryset.filter(expires_at__lte=timezone.now()).delete()
+
+        scopes = [scope] if scope else list(
+            Entry.objects.values_list('scope', flat=True).distinct()
+        )
+        for name in scopes:
+            limit = get_cache_settings(name)['MAX_ENTRIES_PER_SCOPE']
+            stale_ids = list(
+                Entry.objects.filter(scope=name).order_by('-last_hit_at').values_list('id', flat=True)[limit:]
+            )
+            if stale_ids:
+                deleted += Entry.objects.filter(id__in=stale_ids).delete()[0]
+
+        with self._lock:
+            if scope is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(scope, None)
+        return deleted
+
+    def clear(self, scope: Optional[str] = None) -> int:
+        Entry = self._model()
+        queryset = Entry.objects.all() if scope is None else Entry.objects.filter(scope=scope)
+        deleted, _ = queryset.delete()
+        with self._lock:
+            if scope is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop(scope, None)
+        return deleted
+
+
+llm_cache = LLMResponseCache()
@@ -0,0 +1,559 @@
+"""
+LLM 게이트웨이
+모든 AI 모듈이 공유하는 LLM 호출 경로입니다.
+
+- 프로바이더별로 커넥션 풀을 유지하는 동기 OpenAI / 비동기 AsyncOpenAI 클라이언트를 재사용
+- 프로바이더별 동시 호출 수 제한 (semaphore)
+- 요청 타임아웃, 지수 백오프 + jitter 재시도
+- 동일한 요청이 이미 진행 중이면 새로 호출하지 않고 결과를 공유 (single-flight)
+- cache_scope 를 주면 기능 단위 응답 캐시(ai_services.llm_cache) 사용
+- 호출 전 기능/사용자별 호출 한도와 예산 차단기 확인, 호출 후 사용량 누적 (ai_services.usage)
+- astream() 으로 토큰 단위 스트리밍 (SSE 응답은 ai_services.streaming)
+
+    gateway = get_gateway()
+    result = gateway.chat([{'role': 'user', 'content': '안녕하세요'}], max_tokens=200)
+    result = await gateway.achat(messages, cache_scope='chatbot', user_id=employee.id)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .llm_cache import llm_cache
+from .usage import BUDGET_EXCEEDED, UsageMeter, usage_meter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import openai
+    from openai import AsyncOpenAI, OpenAI
+except ImportError:
+    openai = None
+    OpenAI = AsyncOpenAI = None
+
+
+DEFAULT_GATEWAY_SETTINGS = {
+    'BASE_URL': None,
+    'MAX_CONCURRENCY': 8,
+    'TIMEOUT': 30.0,
+    'CONNECT_TIMEOUT': 5.0,
+    'MAX_RETRIES': 2,
+    'BACKOFF_BASE': 0.5,
+    'BACKOFF_MAX': 8.0,
+    'MAX_CONNECTIONS': 20,
+}
+
+
+def get_gateway_settings(provider: str = 'openai') -> Dict[str, Any]:
+    """settings.LLM_GATEWAY[provider] 를 기본값과 병합"""
+    config = dict(DEFAULT_GATEWAY_SETTINGS)
+    config.update(getattr(settings, 'LLM_GATEWAY', {}).get(provider, {}))
+    return config
+
+
+def _clean_api_key(api_key: Optional[str]) -> Optional[str]:
+    # 환경변수에 섞여 들어온 공백/줄바꿈 제거
+    if not api_key:
+        return None
+    return api_key.strip().replace('\n', '').replace('\r', '').replace(' ', '') or None
+
+
+def get_default_api_key() -> Optional[str]:
+    """settings.OPENAI_API_KEY 또는 환경변수"""
+    return _clean_api_key(getattr(settings, 'OPENAI_API_KEY', None) or os.getenv('OPENAI_API_KEY'))
+
+
+class LLMError(Exception):
+    """LLM 호출 실패 (재시도 후에도 실패했거나 재시도 불가능한 오류)"""
+
+
+class LLMRateLimited(LLMError):
+    """기능/사용자별 분당 호출 한도 초과"""
+
+
+class LLMBudgetExceeded(LLMError):
+    """예산 차단기가 열려 호출하지 않음"""
+
+
+@dataclass
+class LLMResult:
+    """LLM 응답"""
+    content: str
+    model: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    latency: float = 0.0
+    attempts: int = 1
+    coalesced: bool = False
+    cached: bool = False
+    similarity: float = 0.0
+
+
+class _InFlight:
+    """동기 single-flight 항목"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[LLMResult] = None
+        self.error: Optional[BaseException] = None
+
+
+class _LoopState:
+    """이벤트 루프별 비동기 자원 (AsyncOpenAI, semaphore, 진행 중 요청)"""
+
+    def __init__(self, client, max_concurrency: int):
+        self.client = client
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.inflight: Dict[str, asyncio.Future] = {}
+
+
+class LLMGateway:
+    """프로바이더 하나에 대한 공유 LLM 클라이언트"""
+
+    def __init__(
+        self,
+        api_key: Optional[str],
+        provider: str = 'openai',
+        base_url: Optional[str] = None,
+        default_model: Optional[str] = None,
+        config: Optional[Dict[str, Any]] = None,
+        usage: Optional[UsageMeter] = None,
+    ):
+        self.provider = provider
+        self.usage = usage
+        self.api_key = api_key
+        self.config = config or get_gateway_settings(provider)
+        self.base_url = base_url or self.config.get('BASE_URL')
+        self.default_model = default_model or getattr(settings, 'OPENAI_MODEL', None) or 'gpt-3.5-turbo'
+
+        self._client = None
+        self._client_lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(self.config['MAX_CONCURRENCY'])
+        self._inflight: Dict[str, _InFlight] = {}
+        self._inflight_lock = threading.Lock()
+        self._loop_states: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]' = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {'requests': 0, 'coalesced': 0, 'retries': 0, 'failures': 0, 'cache_hits': 0, 'rejected': 0}
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.api_key) and OpenAI is not None
+
+    # ------------------------------------------------------------------
+    # 클라이언트
+    # ------------------------------------------------------------------
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.config['TIMEOUT'], connect=self.config['CONNECT_TIMEOUT'])
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config['MAX_CONNECTIONS'],
+            max_keepalive_connections=self.config['MAX_CONNECTIONS'],
+        )
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        # 재시도는 게이트웨이에서 jitter 와 함께 처리하므로 SDK 재시도는 끈다
+        return {
+            'api_key': self.api_key,
+            'base_url': self.base_url,
+            'timeout': self._timeout(),
+            'max_retries': 0,
+        }
+
+    @property
+    def client(self):
+        """커넥션 풀을 공유하는 동기 클라이언트 (최초 사용 시 생성)"""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(
+                        http_client=httpx.Client(limits=self._limits(), timeout=self._timeout()),
+                        **self._client_kwargs()
+                    )
+        return self._client
+
+    def _loop_state(self) -> _LoopState:
+        """현재 이벤트 루프에 묶인 AsyncOpenAI/semaphore
+
+        httpx.AsyncClient 와 asyncio.Semaphore 는 생성된 루프에서만 쓸 수 있으므로 루프마다 따로 둔다.
+        """
+        loop = asyncio.get_running_loop()
+        state = self._loop_states.get(loop)
+        if state is None:
+            client = AsyncOpenAI(
+                http_client=httpx.AsyncClient(limits=self._limits(), timeout=self._timeout()),
+                **self._client_kwargs()
+            )
+            state = _LoopState(client, self.config['MAX_CONCURRENCY'])
+            self._loop_states[loop] = state
+        return state
+
+    # ------------------------------------------------------------------
+    # 요청 구성 / 재시도
+    # ------------------------------------------------------------------
+    def _build_request(self, messages: List[Dict], model: Optional[str], params: Dict[str, Any]) -> Dict[str, Any]:
+        request = {'model': model or self.default_model, 'messages': messages}
+        request.update({key: value for key, value in params.items() if value is not None})
+        return request
+
+    @staticmethod
+    def request_key(request: Dict[str, Any]) -> str:
+        """동일 요청 판별용 키"""
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _is_retryable(error: BaseException) -> bool:
+        if openai is None:
+            return False
+        if isinstance(error, (openai.APIConnectionError, openai.RateLimitError)):
+            return True  # APITimeoutError 는 APIConnectionError 의 하위 클래스
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code >= 500
+        return False
+
+    def _backoff(self, attempt: int) -> float:
+        """지수 백오프 상한 내에서 full jitter"""
+        cap = min(self.config['BACKOFF_MAX'], self.config['BACKOFF_BASE'] * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def _to_result(self, response, started: float, attempts: int) -> LLMResult:
+        usage = getattr(response, 'usage', None)
+        return LLMResult(
+            content=response.choices[0].message.content or '',
+            model=response.model,
+            prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+            completion_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+            total_tokens=getattr(usage, 'total_tokens', 0) or 0,
+            latency=time.perf_counter() - started,
+            attempts=attempts,
+        )
+
+    def _check_configured(self):
+        if OpenAI is None:
+            raise LLMError("openai 패키지가 설치되어 있지 않습니다")
+        if not self.api_key:
+            raise LLMError(f"{self.provider} API 키가 설정되지 않았습니다")
+
+    # ------------------------------------------------------------------
+    # 응답 캐시
+    # ------------------------------------------------------------------
+    def _cache_lookup(self, scope: str, request: Dict[str, Any]) -> Optional[LLMResult]:
+        params = {key: value for key, value in request.items() if key != 'messages'}
+        try:
+            hit = llm_cache.lookup(scope, request['messages'], params)
+        except Exception as e:
+            logger.warning(f"LLM 캐시 조회 실패 ({scope}): {e}")
+            return None
+        if hit is None:
+            return None
+        self.stats['cache_hits'] += 1
+        return LLMResult(
+            content=hit.content,
+            model=hit.model or request['model'],
+            attempts=0,
+            cached=True,
+            similarity=hit.similarity,
+        )
+
+    def _cache_store(self, scope: str, request: Dict[str, Any], result: LLMResult):
+        params = {key: value for key, value in request.items() if key != 'messages'}
+        try:
+            llm_cache.store(scope, request['messages'], params, result.content, result.model)
+        except Exception as e:
+            logger.warning(f"LLM 캐시 저장 실패 ({scope}): {e}")
+
+    # ------------------------------------------------------------------
+    # 사용량 / 호출 한도
+    # ------------------------------------------------------------------
+    def _admit(self, feature: str, user_id: Optional[Any]):
+        """호출 한도/예산 확인 (초과 시 LLMRateLimited / LLMBudgetExceeded)"""
+        if self.usage is None:
+            return
+        reason = self.usage.check(feature, user_id)
+        if reason is None:
+            return
+        self.stats['rejected'] += 1
+        if reason == BUDGET_EXCEEDED:
+            raise LLMBudgetExceeded(f"LLM 예산 한도로 호출이 차단되었습니다 ({feature})")
+        raise LLMRateLimited(f"LLM 호출 한도를 초과했습니다 ({feature}, {reason})")
+
+    def _record(self, feature: str, user_id: Optional[Any], result: LLMResult):
+        if self.usage is None or result.coalesced or result.cached:
+            return
+        self.usage.record(
+            feature, user_id, self.provider, result.model, result.prompt_tokens, result.completion_tokens
+        )
+
+    # ------------------------------------------------------------------
+    # 동기 호출
+    # ------------------------------------------------------------------
+    def chat(self, messages: List[Dict], model: Optional[str] = None,
+             cache_scope: Optional[str] = None, feature: Optional[str] = None,
+             user_id: Optional[Any] = None, **params) -> LLMResult:
+        """채팅 완성 요청 (실패 시 LLMError)
+
+        feature 는 사용량 집계/호출 한도 단위이며 기본값은 cache_scope.
+        """
+        self._check_configured()
+        request = self._build_request(messages, model, params)
+        feature = feature or cache_scope or 'default'
+
+        if cache_scope:
+            cached = self._cache_lookup(cache_scope, request)
+            if cached is not None:
+                return cached
+
+        self._admit(feature, user_id)
+        result = self._chat_once(request)
+        self._record(feature, user_id, result)
+        if cache_scope and not result.coalesced:
+            self._cache_store(cache_scope, request, result)
+        return result
+
+    def _chat_once(self, request: Dict[str, Any]) -> LLMResult:
+        key = self.request_key(request)
+
+        with self._inflight_lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self._inflight[key] = _InFlight()
+
+        if not leader:
+            self.stats['coalesced'] += 1
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return _coalesced(call.result)
+
+        try:
+            call.result = self._execute(request)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def _execute(self, request: Dict[str, Any]) -> LLMResult:
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                with self._semaphore:
+                    self.stats['requests'] += 1
+                    response = self.client.chat.completions.create(**request)
+                return self._to_result(response, started, attempt)
+            except Exception as e:
+                if attempt > self.config['MAX_RETRIES'] or not self._is_retryable(e):
+                    self.stats['failures'] += 1
+                    logger.error(f"LLM 호출 실패 ({self.provider}, {attempt}회 시도): {e}")
+                    raise LLMError(str(e)) from e
+                self.stats['retries'] += 1
+                delay = self._backoff(attempt - 1)
+                logger.warning(f"LLM 호출 재시도 {attempt}/{self.config['MAX_RETRIES']} ({delay:.2f}s 후): {e}")
+                time.sleep(delay)
+
+    def complete(self, messages: List[Dict], model: Optional[str] = None, **params) -> Optional[str]:
+        """응답 텍스트만 반환, 실패 시 None"""
+        try:
+            return self.chat(messages, model=model, **params).content
+        except LLMError:
+            return None
+
+    # ------------------------------------------------------------------
+    # 비동기 호출
+    # ------------------------------------------------------------------
+    async def achat(self, messages: List[Dict], model: Optional[str] = None,
+                    cache_scope: Optional[str] = None, feature: Optional[str] = None,
+                    user_id: Optional[Any] = None, **params) -> LLMResult:
+        """채팅 완성 요청 (비동기, 실패 시 LLMError)"""
+        self._check_configured()
+        request = self._build_request(messages, model, params)
+        feature = feature or cache_scope or 'default'
+
+        if cache_scope:
+            cached = await sync_to_async(self._cache_lookup)(cache_scope, request)
+            if cached is not None:
+                return cached
+
+        if self.usage is not None:
+            await sync_to_async(self._admit)(feature, user_id)
+        result = await self._achat_once(request)
+        if self.usage is not None:
+            await sync_to_async(self._record)(feature, user_id, result)
+        if cache_scope and not result.coalesced:
+            await sync_to_async(self._cache_store)(cache_scope, request, result)
+        return result
+
+    async def _achat_once(self, request: Dict[str, Any]) -> LLMResult:
+        key = self.request_key(request)
+        state = self._loop_state()
+
+        future = state.inflight.get(key)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return _coalesced(await asyncio.shield(future))
+
+        future = asyncio.get_running_loop().create_future()
+        state.inflight[key] = future
+        try:
+            result = await self._aexecute(state, request)
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # 대기자가 없을 때 "never retrieved" 경고 방지
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            state.inflight.pop(key, None)
+
+    async def _aexecute(self, state: _LoopState, request: Dict[str, Any]) -> LLMResult:
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                async with state.semaphore:
+                    self.stats['requests'] += 1
+                    response = await state.client.chat.completions.create(**request)
+                return self._to_result(response, started, attempt)
+            except Exception as e:
+                if attempt > self.config['MAX_RETRIES'] or not self._is_retryable(e):
+                    self.stats['failures'] += 1
+                    logger.error(f"LLM 호출 실패 ({self.provider}, {attempt}회 시도): {e}")
+                    raise LLMError(str(e)) from e
+                self.stats['retries'] += 1
+                delay = self._backoff(attempt - 1)
+                logger.warning(f"LLM 호출 재시도 {attempt}/{self.config['MAX_RETRIES']} ({delay:.2f}s 후): {e}")
+                await asyncio.sleep(delay)
+
+    async def astream(self, messages: List[Dict], model: Optional[str] = None,
+                      cache_scope: Optional[str] = None, feature: Optional[str] = None,
+                      user_id: Optional[Any] = None, **params) -> AsyncIterator[str]:
+        """응답을 토큰(delta) 단위로 전달 (실패 시 LLMError)
+
+        첫 토큰을 받기 전까지만 재시도하며, 스트림 요청은 병합하지 않는다.
+        """
+        self._check_configured()
+        request = self._build_request(messages, model, params)
+        feature = feature or cache_scope or 'default'
+
+        if cache_scope:
+            cached = await sync_to_async(self._cache_lookup)(cache_scope, request)
+            if cached is not None:
+                yield cached.content
+                return
+
+        if self.usage is not None:
+            await sync_to_async(self._admit)(feature, user_id)
+        state = self._loop_state()
+        usage = None
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            chunks = []
+            try:
+                async with state.semaphore:
+                    self.stats['requests'] += 1
+                    stream = await state.client.chat.completions.create(
+                        stream=True, stream_options={'include_usage': True}, **request
+                    )
+                    async for chunk in stream:
+                        usage = getattr(chunk, 'usage', None) or usage
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            chunks.append(delta)
+                            yield delta
+                break
+            except Exception as e:
+                if chunks or attempt > self.config['MAX_RETRIES'] or not self._is_retryable(e):
+                    self.stats['failures'] += 1
+                    logger.error(f"LLM 스트리밍 실패 ({self.provider}, {attempt}회 시도): {e}")
+                    raise LLMError(str(e)) from e
+                self.stats['retries'] += 1
+                delay = self._backoff(attempt - 1)
+                logger.warning(f"LLM 스트리밍 재시도 {attempt}/{self.config['MAX_RETRIES']} ({delay:.2f}s 후): {e}")
+                await asyncio.sleep(delay)
+
+        result = LLMResult(
+            content=''.join(chunks), model=request['model'],
+            prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+            completion_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+            total_tokens=getattr(usage, 'total_tokens', 0) or 0,
+            latency=time.perf_counter() - started, attempts=attempt,
+        )
+        if self.usage is not None:
+            await sync_to_async(self._record)(feature, user_id, result)
+        if cache_scope:
+            await sync_to_async(self._cache_store)(cache_scope, request, result)
+
+    async def acomplete(self, messages: List[Dict], model: Optional[str] = None, **params) -> Optional[str]:
+        """응답 텍스트만 반환 (비동기), 실패 시 None"""
+        try:
+            return (await self.achat(messages, model=model, **params)).content
+        except LLMError:
+            return None
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+def _coalesced(result: LLMResult) -> LLMResult:
+    """공유된 결과 사본 (토큰은 실제로 소비되지 않았으므로 0)"""
+    return LLMResult(
+        content=result.content,
+        model=result.model,
+        latency=result.latency,
+        attempts=0,
+        coalesced=True,
+    )
+
+
+_gateways: Dict[tuple, LLMGateway] = {}
+_gateways_lock = threading.Lock()
+
+
+def get_gateway(provider: str = 'openai', api_key: Optional[str] = None, base_url: Optional[str] = None) -> LLMGateway:
+    """프로세스 단위 공유 게이트웨이 (provider, api_key, base_url 별 1개)"""
+    api_key = _clean_api_key(api_key) or get_default_api_key()
+    key = (provider, api_key, base_url)
+    gateway = _gateways.get(key)
+    if gateway is None:
+        with _gateways_lock:
+            gateway = _gateways.get(key)
+            if gateway is None:
+                gateway = _gateways[key] = LLMGateway(
+                    api_key, provider=provider, base_url=base_url, usage=usage_meter
+                )
+    return gateway
+
+
+def reset_gateways():
+    """공유 게이트웨이 정리 (설정 변경/테스트용)"""
+    with _gateways_lock:
+        for gateway in _gateways.values():
+            gateway.close()
+        _gateways.clear()
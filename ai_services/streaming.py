@@ -0,0 +1,89 @@
+"""
+Server-Sent Events 스트리밍 응답
+LLM 토큰을 도착하는 대로 클라이언트에 전달하고, 스트림이 끝난 뒤 최종 결과를 저장합니다.
+ASGI 에서 비동기 이터레이터로 동작하므로 응답을 기다리는 동안 워커를 점유하지 않습니다.
+
+이벤트 형식 (text/event-stream):
+    event: token   data: {"content": "..."}
+    event: done    data: {...저장 결과...}
+    event: error   data: {"error": "..."}
+"""
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from django.http import StreamingHttpResponse
+
+from .llm_gateway import LLMError, LLMGateway
+
+logger = logging.getLogger(__name__)
+
+
+def sse_event(data: Any, event: Optional[str] = None) -> str:
+    """SSE 이벤트 한 건 직렬화"""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    lines = [f"event: {event}"] if event else []
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [''])
+    return '\n'.join(lines) + '\n\n'
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingHttpResponse:
+    """SSE 스트리밍 응답 (프록시 버퍼링 비활성화)"""
+    response = StreamingHttpResponse(events, content_type='text/event-stream; charset=utf-8')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+async def stream_completion(
+    gateway: Optional[LLMGateway],
+    messages: List[Dict],
+    on_complete: Optional[Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict]]]] = None,
+    fallback: Optional[Callable[[], str]] = None,
+    **params,
+) -> AsyncIterator[str]:
+    """LLM 응답을 token 이벤트로 전달한 뒤 on_complete 결과를 done 이벤트로 전달
+
+    게이트웨이가 없거나 첫 토큰 전에 실패하면 fallback() 문자열을 한 번에 보낸다.
+
+    Args:
+        on_complete: (전체 응답, {'model', 'response_time', 'streamed'}) 를 받아
+                     done 이벤트에 실을 dict 를 반환하는 코루틴 (저장 등)
+    """
+    started = time.perf_counter()
+    chunks = []
+    streamed = False
+
+    if gateway is not None and gateway.is_configured:
+        try:
+            async for delta in gateway.astream(messages, **params):
+                chunks.append(delta)
+                yield sse_event({'content': delta}, 'token')
+            streamed = True
+        except LLMError as e:
+            if chunks:
+                yield sse_event({'error': '응답 생성 중 오류가 발생했습니다.'}, 'error')
+                logger.error(f"스트리밍 중단: {e}")
+                return
+
+    if not streamed:
+        text = fallback() if fallback else ''
+        chunks = [text]
+        if text:
+            yield sse_event({'content': text}, 'token')
+
+    meta = {
+        'model': params.get('model') or (gateway.default_model if gateway else ''),
+        'response_time': time.perf_counter() - started,
+        'streamed': streamed,
+    }
+    done = {}
+    if on_complete is not None:
+        try:
+            done = await on_complete(''.join(chunks), meta) or {}
+        except Exception as e:
+            logger.error(f"스트리밍 응답 저장 실패: {e}")
+            yield sse_event({'error': '응답 저장에 실패했습니다.'}, 'error')
+            return
+    yield sse_event(done, 'done')
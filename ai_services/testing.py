@@ -0,0 +1,200 @@
+"""
+LLM 게이트웨이 테스트용 가짜 프로바이더 서버와 사용량 미터
+OpenAI 호환 /v1/chat/completions 엔드포인트를 로컬에서 흉내 냅니다.
+
+    with FakeLLMServer(delay=0.2, fail_next=1) as server:
+        gateway = LLMGateway('test-key', base_url=server.base_url, usage=make_meter())
+"""
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .usage import UsageMeter, get_usage_settings
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        stub = self.server.stub
+        with stub.lock:
+            stub.connection_count += 1
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def _send_stream(self, body: dict, content: str):
+        """stream=True 요청 - 단어 단위 SSE 청크 (chunked 전송)"""
+        stub = self.server.stub
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        words = content.split(' ')
+        for index, word in enumerate(words):
+            delta = word if index == 0 else f' {word}'
+            chunk = {
+                'id': f'chatcmpl-{stub.request_count}',
+                'object': 'chat.completion.chunk',
+                'created': int(time.time()),
+                'model': body.get('model', 'fake-model'),
+                'choices': [{'index': 0, 'delta': {'content': delta}, 'finish_reason': None}],
+            }
+            self._write_chunk(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode('utf-8'))
+            if stub.stream_delay:
+                time.sleep(stub.stream_delay)
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        with stub.lock:
+            stub.request_count += 1
+            stub.requests.append(body)
+            stub.active += 1
+            stub.max_active = max(stub.max_active, stub.active)
+            failing = stub.fail_next > 0
+            if failing:
+                stub.fail_next -= 1
+
+        try:
+            if stub.delay:
+                time.sleep(stub.delay)
+
+            if failing:
+                self._send_json(stub.fail_status, {'error': {'message': 'stub failure', 'type': 'server_error'}})
+                return
+
+            prompt = body.get('messages', [{}])[-1].get('content', '')
+            content = stub.reply(prompt) if callable(stub.reply) else stub.reply
+            if body.get('stream'):
+                self._send_stream(body, content)
+                return
+            self._send_json(200, {
+                'id': f'chatcmpl-{stub.request_count}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': body.get('model', 'fake-model'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {'prompt_tokens': 10, 'completion_tokens': 5, 'total_tokens': 15},
+            })
+        finally:
+            with stub.lock:
+                stub.active -= 1
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # 타임아웃 테스트에서 클라이언트가 먼저 끊는 경우는 무시
+        pass
+
+
+class FakeLLMServer:
+    """OpenAI 호환 가짜 서버
+
+    Args:
+        reply: 응답 문자열 또는 프롬프트를 받아 응답을 만드는 함수
+        delay: 응답 지연 (초) - 동시성 제한/요청 병합 검증용
+        fail_next: 처음 N 건은 fail_status 로 실패 - 재시도 검증용
+        stream_delay: stream=True 요청에서 청크 사이 지연 (초)
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, reply='fake response',
+                 delay: float = 0.0, fail_next: int = 0, fail_status: int = 503,
+                 stream_delay: float = 0.0):
+        self.server = _QuietHTTPServer((host, port), _ChatHandler)
+        self.server.stub = self
+        self.host, self.port = self.server.server_address
+        self.base_url = f"http://{self.host}:{self.port}/v1"
+        self.reply = reply
+        self.delay = delay
+        self.fail_next = fail_next
+        self.fail_status = fail_status
+        self.stream_delay = stream_delay
+        self.requests = []
+        self.request_count = 0
+        self.connection_count = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class MemoryUsageStore:
+    """DatabaseUsageStore 와 같은 인터페이스의 프로세스 내 카운터 저장소"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rows = defaultdict(lambda: {'requests': 0, 'prompt_tokens': 0, 'completion_tokens': 0, 'cost': 0.0})
+        self.counters = defaultdict(int)
+
+    def increment(self, period, feature, user_key, provider, model,
+                  prompt_tokens, completion_tokens, cost, requests=1):
+        with self.lock:
+            row = self.rows[(period, feature, user_key, provider, model)]
+            row['requests'] += requests
+            row['prompt_tokens'] += prompt_tokens
+            row['completion_tokens'] += completion_tokens
+            row['cost'] += cost
+
+    def hit(self, key, amount, ttl):
+        with self.lock:
+            self.counters[key] += amount
+            return self.counters[key]
+
+    def counter(self, key):
+        return self.counters.get(key, 0)
+
+    def total_cost(self, period):
+        return sum(row['cost'] for key, row in self.rows.items() if key[0] == period)
+
+
+def make_meter(**overrides):
+    """한도/예산을 끈 설정 + 메모리 저장소의 UsageMeter (overrides 로 설정 덮어쓰기)"""
+    config = get_usage_settings()
+    config.update({
+        'ENABLED': True, 'MONTHLY_BUDGET_USD': 10.0, 'HOURLY_BUDGET_USD': None, 'BUDGET_REFRESH_INTERVAL': 0,
+        'RATE_LIMITS': {'USER_PER_MINUTE': None, 'FEATURE_PER_MINUTE': None, 'FEATURES': {}},
+    })
+    config.update(overrides)
+    return UsageMeter(store=MemoryUsageStore(), config=config)
@@ -0,0 +1,301 @@
+"""
+LLM 사용량 집계 / 호출 한도
+LLM 호출 전 한도를 확인하고, 호출 후 토큰과 추정 비용을 원자적으로 누적합니다.
+
+- 누적: LLMUsageCounter 행을 F() 로 증가 (월 x 기능 x 사용자 x 모델), 프로세스 간 유실 없음
+- 호출 한도: 기능/사용자별 분당 요청 수 (LLMRateCounter 행을 F() 로 증가하는 고정 윈도우)
+- 예산 차단기: 월 예산 소진 또는 시간당 지출(LLMRateCounter) 급증 시 COOLDOWN 동안 호출을 막고 폴백 응답 사용
+- 차단기는 모든 워커가 같은 값을 봐야 하므로 default 캐시가 공유 캐시여야 함
+  (settings_railway: REDIS_URL 이 있으면 Redis, 없으면 DB 캐시), 카운터는 캐시 백엔드와 무관하게 DB 에서 원자적
+
+    reason = usage_meter.check('ai_chatbot', user_id)      # None 이면 호출 가능
+    usage_meter.record('ai_chatbot', user_id, 'openai', 'gpt-3.5-turbo', 120, 80)
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_USAGE_SETTINGS = {
+    'ENABLED': True,
+    'MONTHLY_BUDGET_USD': 100.0,
+    'ALERT_THRESHOLD': 80,            # 월 예산 대비 경고 비율 (%)
+    'HOURLY_BUDGET_USD': None,        # 시간당 지출 상한 (None 이면 미사용)
+    'BREAKER_COOLDOWN': 300,          # 차단기 열림 유지 시간 (초)
+    'BUDGET_REFRESH_INTERVAL': 30,    # 월 누적 비용 재조회 주기 (초)
+    'RATE_LIMITS': {
+        # 분당 요청 수 (None 이면 미사용), FEATURES[feature] 가 있으면 덮어씀
+        'USER_PER_MINUTE': 20,
+        'FEATURE_PER_MINUTE': 300,
+        'FEATURES': {},
+    },
+    # 1K 토큰당 USD (입력, 출력), 모델명 접두사 중 가장 긴 항목 사용
+    'PRICES': {
+        'gpt-3.5-turbo': (0.0005, 0.0015),
+        'gpt-4o-mini': (0.00015, 0.0006),
+        'gpt-4o': (0.0025, 0.01),
+        'gpt-4-turbo': (0.01, 0.03),
+        'gpt-4': (0.03, 0.06),
+    },
+    'DEFAULT_PRICE': (0.0005, 0.0015),
+}
+
+RATE_LIMITED_USER = 'rate_limit_user'
+RATE_LIMITED_FEATURE = 'rate_limit_feature'
+BUDGET_EXCEEDED = 'budget'
+
+
+def get_usage_settings() -> Dict[str, Any]:
+    """settings.LLM_USAGE 를 기본값과 병합"""
+    config = dict(DEFAULT_USAGE_SETTINGS)
+    config.update(getattr(settings, 'LLM_USAGE', {}))
+    return config
+
+
+def current_period(now: Optional[datetime] = None) -> str:
+    return (now or datetime.now()).strftime('%Y-%m')
+
+
+class DatabaseUsageStore:
+    """LLMUsageCounter 기반 누적 저장소"""
+
+    def increment(self, period: str, feature: str, user_key: str, provider: str, model: str,
+                  prompt_tokens: int, completion_tokens: int, cost: float, requests: int = 1):
+        from ai_chatbot.models import LLMUsageCounter
+
+        lookup = dict(period=period, feature=feature, user_key=user_key, provider=provider, model_used=model)
+        changes = dict(
+            requests=F('requests') + requests,
+            prompt_tokens=F('prompt_tokens') + prompt_tokens,
+            completion_tokens=F('completion_tokens') + completion_tokens,
+            cost=F('cost') + cost,
+        )
+        if LLMUsageCounter.objects.filter(**lookup).update(**changes):
+            return
+        try:
+            with transaction.atomic():
+                LLMUsageCounter.objects.create(
+                    **lookup, requests=requests, prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens, cost=cost,
+                )
+        except IntegrityError:
+            # 다른 워커가 먼저 행을 만든 경우
+            LLMUsageCounter.objects.filter(**lookup).update(**changes)
+
+    def hit(self, key: str, amount: int, ttl: int) -> int:
+        """윈도우 카운터를 amount 만큼 증가시키고 증가 후 값을 반환"""
+        from ai_chatbot.models import LLMRateCounter
+
+        counters = LLMRateCounter.objects.filter(key=key)
+        if not counters.update(count=F('count') + amount):
+            now = timezone.now()
+            try:
+                with transaction.atomic():
+                    LLMRateCounter.objects.create(key=key, count=amount, expires_at=now + timedelta(seconds=ttl))
+                # 새 윈도우가 열릴 때 만료된 윈도우 정리
+                LLMRateCounter.objects.filter(expires_at__lt=now).delete()
+                return amount
+            except IntegrityError:
+                # 다른 워커가 먼저 행을 만든 경우
+                counters.update(count=F('count') + amount)
+        return self.counter(key)
+
+    def counter(self, key: str) -> int:
+        from ai_chatbot.models import LLMRateCounter
+
+        return LLMRateCounter.objects.filter(key=key).values_list('count', flat=True).first() or 0
+
+    def total_cost(self, period: str) -> float:
+        from ai_chatbot.models import LLMUsageCounter
+
+        return LLMUsageCounter.objects.filter(period=period).aggregate(total=Sum('cost'))['total'] or 0.0
+
+    def summary(self, period: str) -> Dict[str, Any]:
+        from ai_chatbot.models import LLMUsageCounter
+
+        usage = {'total_tokens': 0, 'total_cost': 0.0, 'total_requests': 0, 'by_provider': {}, 'by_feature': {}}
+        rows = LLMUsageCounter.objects.filter(period=period).values('provider', 'feature').annotate(
+            requests_sum=Sum('requests'),
+            prompt_sum=Sum('prompt_tokens'),
+            completion_sum=Sum('completion_tokens'),
+            cost_sum=Sum('cost'),
+        )
+        for row in rows:
+            tokens = (row['prompt_sum'] or 0) + (row['completion_sum'] or 0)
+            for group, name in (('by_provider', row['provider']), ('by_feature', row['feature'])):
+                bucket = usage[group].setdefault(name, {'tokens': 0, 'cost': 0.0, 'requests': 0})
+                bucket['tokens'] += tokens
+                bucket['cost'] += row['cost_sum'] or 0.0
+                bucket['requests'] += row['requests_sum'] or 0
+            usage['total_tokens'] += tokens
+            usage['total_cost'] += row['cost_sum'] or 0.0
+            usage['total_requests'] += row['requests_sum'] or 0
+        return usage
+
+
+class UsageMeter:
+    """LLM 호출 한도 확인 및 사용량 누적"""
+
+    def __init__(self, store=None, config: Optional[Dict[str, Any]] = None):
+        self.store = store or DatabaseUsageStore()
+        self._config = config
+        self._lock = threading.Lock()
+        self._month = {'period': None, 'cost': 0.0, 'refreshed': 0.0}
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self._config or get_usage_settings()
+
+    # ------------------------------------------------------------------
+    # 비용
+    # ------------------------------------------------------------------
+    def estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        prices = self.config['PRICES']
+        matches = [name for name in prices if (model or '').startswith(name)]
+        input_price, output_price = prices[max(matches, key=len)] if matches else self.config['DEFAULT_PRICE']
+        return (prompt_tokens * input_price + completion_tokens * output_price) / 1000
+
+    def month_cost(self) -> float:
+        """이번 달 누적 비용 (REFRESH_INTERVAL 동안 프로세스 내 값 재사용 + 이후 기록분 가산)"""
+        period = current_period()
+        with self._lock:
+            stale = (
+                self._month['period'] != period
+                or time.monotonic() - self._month['refreshed'] > self.config['BUDGET_REFRESH_INTERVAL']
+            )
+        if stale:
+            try:
+                cost = self.store.total_cost(period)
+            except Exception as e:
+                logger.warning(f"LLM 사용량 조회 실패: {e}")
+                cost = self._month['cost'] if self._month['period'] == period else 0.0
+            with self._lock:
+                self._month = {'period': period, 'cost': cost, 'refreshed': time.monotonic()}
+        return self._month['cost']
+
+    # ------------------------------------------------------------------
+    # 호출 전 확인
+    # ------------------------------------------------------------------
+    def _breaker_key(self) -> str:
+        return 'llm_usage:breaker'
+
+    def breaker_open(self) -> bool:
+        return bool(cache.get(self._breaker_key()))
+
+    def open_breaker(self, reason: str):
+        cooldown = self.config['BREAKER_COOLDOWN']
+        if cache.add(self._breaker_key(), reason, cooldown):
+            logger.error(f"LLM 예산 차단기 열림 ({reason}), {cooldown}초 동안 폴백 응답 사용")
+
+    def reset_breaker(self):
+        cache.delete(self._breaker_key())
+
+    def _hour_key(self) -> str:
+        return f"llm_usage:hour:{datetime.now().strftime('%Y%m%d%H')}"
+
+    def _hit(self, key: str, limit: Optional[int]) -> bool:
+        """고정 윈도우 카운터 증가, 한도를 넘으면 True (카운터 저장소 장애 시 호출 허용)"""
+        if not limit:
+            return False
+        try:
+            count = self.store.hit(key, 1, 120)
+        except Exception as e:
+            logger.warning(f"LLM 호출 한도 카운터 갱신 실패 ({key}): {e}")
+            return False
+        return count > limit
+
+    def _hour_spend(self) -> float:
+        try:
+            return self.store.counter(self._hour_key()) / 1e6
+        except Exception as e:
+            logger.warning(f"LLM 시간당 지출 조회 실패: {e}")
+            return 0.0
+
+    def _limits(self, feature: str) -> Dict[str, Optional[int]]:
+        limits = dict(self.config['RATE_LIMITS'])
+        limits.update(limits.get('FEATURES', {}).get(feature, {}))
+        return limits
+
+    def check(self, feature: str, user_id: Optional[Any] = None) -> Optional[str]:
+        """호출 가능 여부 (가능하면 None, 아니면 차단 사유)"""
+        config = self.config
+        if not config['ENABLED']:
+            return None
+
+        # 예산 차단기
+        if self.breaker_open():
+            return BUDGET_EXCEEDED
+        budget = config['MONTHLY_BUDGET_USD']
+        if budget and self.month_cost() >= budget:
+            self.open_breaker('monthly budget')
+            return BUDGET_EXCEEDED
+        hourly_budget = config['HOURLY_BUDGET_USD']
+        if hourly_budget and self._hour_spend() >= hourly_budget:
+            self.open_breaker('hourly spend')
+            return BUDGET_EXCEEDED
+
+        # 분당 호출 한도
+        minute = int(time.time() // 60)
+        limits = self._limits(feature)
+        if user_id is not None and self._hit(f"llm_usage:rate:{feature}:{user_id}:{minute}", limits['USER_PER_MINUTE']):
+            return RATE_LIMITED_USER
+        if self._hit(f"llm_usage:rate:{feature}:{minute}", limits['FEATURE_PER_MINUTE']):
+            return RATE_LIMITED_FEATURE
+        return None
+
+    # ------------------------------------------------------------------
+    # 호출 후 기록
+    # ------------------------------------------------------------------
+    def record(self, feature: str, user_id: Optional[Any], provider: str, model: str,
+               prompt_tokens: int = 0, completion_tokens: int = 0, cost: Optional[float] = None) -> float:
+        """사용량 누적 (실패해도 호출 흐름에는 영향 없음), 추정 비용 반환"""
+        if cost is None:
+            cost = self.estimate_cost(model, prompt_tokens, completion_tokens)
+        period = current_period()
+        try:
+            self.store.increment(
+                period, feature, str(user_id) if user_id is not None else '', provider, model or '',
+                prompt_tokens, completion_tokens, cost,
+            )
+        except Exception as e:
+            logger.warning(f"LLM 사용량 기록 실패 ({feature}): {e}")
+
+        # 프로세스 내 월 누적값과 시간당 지출(마이크로 달러) 갱신
+        with self._lock:
+            if self._month['period'] == period:
+                self._month['cost'] += cost
+        if cost:
+            try:
+                self.store.hit(self._hour_key(), int(cost * 1e6), 7200)
+            except Exception as e:
+                logger.warning(f"LLM 시간당 지출 기록 실패: {e}")
+        self._check_alert(period)
+        return cost
+
+    def _check_alert(self, period: str):
+        config = self.config
+        budget = config['MONTHLY_BUDGET_USD']
+        if not budget:
+            return
+        spent = self._month['cost'] if self._month['period'] == period else 0.0
+        if spent >= budget * config['ALERT_THRESHOLD'] / 100 and cache.add(f"llm_usage:alert:{period}", 1, 31 * 24 * 3600):
+            logger.warning(f"AI 사용 예산 경고: ${spent:.2f} / ${budget:.2f}")
+
+    def get_monthly_usage(self, period: Optional[str] = None) -> Dict[str, Any]:
+        usage = self.store.summary(period or current_period())
+        usage['monthly_budget'] = self.config['MONTHLY_BUDGET_USD']
+        usage['breaker_open'] = self.breaker_open()
+        return usage
+
+
+usage_meter = UsageMeter()
@@ -17,6 +17,7 @@ from .models import (
     TeamAnalytics, TeamRecommendation
 )
 from employees.models import Employee
+from airiss.feature_store import feature_store, evaluation_percent
 from ai_services.base import AIServiceBase, AIAnalyzer
 
 logger = logging.getLogger(__name__)
@@ -139,13 +140,28 @@ class TeamOptimizationService:
         if not talent_pool:
             return []
         
+        # 근속/평가 특성과 진행 중 프로젝트 수를 한 번에 조회
+        employee_ids = [employee.id for employee in talent_pool]
+        features = feature_store.get_many(employee_ids)
+        active_projects = dict(
+            TeamMember.objects.filter(
+                employee_id__in=employee_ids,
+                team_composition__project__status='ACTIVE'
+            ).values('employee_id').annotate(count=Count('id')).values_list('employee_id', 'count')
+        )
+        
         # 각 직원의 적합도 점수 계산
         scored_employees = []
         
         for employee in talent_pool:
-            score = self._calculate_employee_fit_score(employee, project, requirements)
+            score = self._calculate_employee_fit_score(
+                employee, project, requirements,
+                features=features.get(employee.id, {}),
+                current_projects=active_projects.get(employee.id, 0)
+            )
             scored_employees.append({
                 'employee': employee,
+                'tenure_years': features.get(employee.id, {}).get('tenure_years') or 0,
                 'fit_score': score['total'],
                 'skill_match': score['skill_match'],
                 'experience_match': score['experience_match'],
@@ -186,10 +202,14 @@ class TeamOptimizationService:
         return optimal_team
     
     def _calculate_employee_fit_score(
-        self, employee: Employee, project: Project, requirements: Dict
+        self, employee: Employee, project: Project, requirements: Dict,
+        features: Optional[Dict] = None, current_projects: Optional[int] = None
     ) -> Dict[str, float]:
         """직원 적합도 점수 계산"""
         
+        if features is None:
+            features = feature_store.get(employee.id)
+        
         scores = {
             'skill_match': 0,
             'experience_match': 0,
@@ -204,7 +224,7 @@ class TeamOptimizationService:
         
         # 경력 매칭
         if requirements['experience_level'] == 'senior':
-            if employee.years_of_service > 5:
+            if (features.get('tenure_years') or 0) > 5:
                 scores['experience_match'] = 0.9
             else:
                 scores['experience_match'] = 0.4
@@ -212,10 +232,11 @@ class TeamOptimizationService:
             scores['experience_match'] = 0.7
         
         # 가용성 (현재 프로젝트 참여 수 기반)
-        current_projects = TeamMember.objects.filter(
-            employee=employee,
-            team_composition__project__status='ACTIVE'
-        ).count()
+        if current_projects is None:
+            current_projects = TeamMember.objects.filter(
+                employee=employee,
+                team_composition__project__status='ACTIVE'
+            ).count()
         
         if current_projects == 0:
             scores['availability'] = 1.0
@@ -224,8 +245,11 @@ class TeamOptimizationService:
         else:
             scores['availability'] = 0.3
         
-        # 성과 점수 (더미)
-        scores['performance'] = random.uniform(0.6, 0.95)
+        # 성과 점수 (최근 종합평가 평균, 평가 이력이 없으면 중간값)
+        if features.get('evaluation_count'):
+            scores['performance'] = evaluation_percent(features['evaluation_avg_score']) / 100
+        else:
+            scores['performance'] = 0.6
         
         # 가중 평균
         weights = {
@@ -320,7 +344,7 @@ class TeamOptimizationService:
             dept_synergy = 0.8 if candidate['employee'].department != member['employee'].department else 0.5
             
             # 경력 보완성
-            exp_diff = abs(candidate['employee'].years_of_service - member['employee'].years_of_service)
+            exp_diff = abs(candidate.get('tenure_years', 0) - member.get('tenure_years', 0))
             exp_synergy = min(1.0, exp_diff / 10)  # 경력 차이가 클수록 좋음
             
             # 스킬 보완성 (더미)
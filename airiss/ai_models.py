@@ -15,23 +15,42 @@ from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.metrics import accuracy_score, mean_squared_error, classification_report
+from sklearn.base import clone
+from sklearn.exceptions import NotFittedError
+from sklearn.utils.validation import check_is_fitted
 import warnings
 warnings.filterwarnings('ignore')
 
 from employees.models import Employee
 from evaluations.models import ComprehensiveEvaluation
 from compensation.models import EmployeeCompensation
+from .models import AIAnalysisType, AIAnalysisResult
+from .model_registry import model_registry
+from .feature_store import feature_store
+
+
+def years_since(dates: pd.Series) -> pd.Series:
+    """날짜 컬럼을 오늘 기준 경과 연수로 변환 (누락값은 NaN)"""
+    today = pd.Timestamp(datetime.now().date())
+    return (today - pd.to_datetime(dates, errors='coerce')).dt.days / 365.25
 
 
 class BaseHRModel:
     """HR 모델 기본 클래스"""
     
+    # predict_batch 에서 values() 로 읽어올 직원 필드 (범주형)
+    batch_fields: List[str] = []
+    
+    # predict_batch 에서 피처 스토어로 읽어올 수치 특성
+    store_features: List[str] = ['age', 'tenure_years', 'growth_level']
+    
     def __init__(self, model_name: str):
         self.model_name = model_name
         self.model = None
         self.scaler = StandardScaler()
         self.label_encoders = {}
         self.feature_names = []
+        self.model_version = None
         self.model_path = os.path.join(settings.BASE_DIR, 'airiss', 'models', f'{model_name}.joblib')
         self.scaler_path = os.path.join(settings.BASE_DIR, 'airiss', 'models', f'{model_name}_scaler.joblib')
         
@@ -39,33 +58,134 @@ class BaseHRModel:
         os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
     
     def save_model(self):
-        """모델 저장"""
+        """모델 저장 (레지스트리에 새 버전으로 등록)"""
         if self.model is not None:
-            joblib.dump({
+            entry = model_registry.save(self.model_path, {
                 'model': self.model,
                 'scaler': self.scaler,
                 'label_encoders': self.label_encoders,
                 'feature_names': self.feature_names
-            }, self.model_path)
+            })
+            if entry is not None:
+                self._apply_version(entry)
     
     def load_model(self) -> bool:
-        """모델 로드"""
+        """모델 로드 (프로세스 공용 레지스트리에서 가져오며, 파일이 바뀌었으면 재로드)"""
         try:
-            if os.path.exists(self.model_path):
-                data = joblib.load(self.model_path)
-                self.model = data['model']
-                self.scaler = data['scaler']
-                self.label_encoders = data['label_encoders']
-                self.feature_names = data['feature_names']
+            entry = model_registry.get(self.model_path)
+            if entry is not None:
+                if entry.version != self.model_version:
+                    self._apply_version(entry)
                 return True
         except Exception as e:
             print(f"모델 로드 실패: {e}")
         return False
+    
+    def _apply_version(self, entry):
+        data = entry.payload
+        self.model = data['model']
+        self.scaler = data['scaler']
+        # 인코더는 예측 중 새 항목이 추가될 수 있으므로 인스턴스별 사본 사용
+        self.label_encoders = dict(data['label_encoders'])
+        self.feature_names = data['feature_names']
+        self.model_version = entry.version
+    
+    def reset_estimators(self):
+        """재학습 전 공유 객체를 건드리지 않도록 미학습 사본으로 교체"""
+        self.model = clone(self.model)
+        self.scaler = StandardScaler()
+        self.label_encoders = {}
+        self.model_version = None
+    
+    def is_fitted(self) -> bool:
+        """모델이 학습(또는 로드)된 상태인지 확인"""
+        if self.model is None:
+            return False
+        try:
+            check_is_fitted(self.model)
+            return True
+        except NotFittedError:
+            return False
+    
+    def ensure_fitted(self) -> bool:
+        """저장된 최신 모델을 사용하고, 저장본이 없으면 현재 학습 상태 확인"""
+        return self.load_model() or self.is_fitted()
+    
+    def encode_labels(self, name: str, values: pd.Series) -> np.ndarray:
+        """범주형 값 인코딩 (학습에 없던 값은 -1)"""
+        values = values.fillna('Unknown').astype(str)
+        if name not in self.label_encoders:
+            self.label_encoders[name] = LabelEncoder()
+            return self.label_encoders[name].fit_transform(values)
+        
+        mapping = {label: index for index, label in enumerate(self.label_encoders[name].classes_)}
+        return values.map(mapping).fillna(-1).astype(int).to_numpy()
+    
+    @staticmethod
+    def years_column(frame: pd.DataFrame, column: str, date_column: str) -> pd.Series:
+        """피처 스토어 값이 있으면 그대로, 없으면 날짜 컬럼에서 경과 연수 계산"""
+        if column in frame.columns:
+            return frame[column].astype(float)
+        return years_since(frame[date_column])
+    
+    def load_employee_frame(self, queryset) -> pd.DataFrame:
+        """
+        배치 예측용 직원 DataFrame 구성
+        
+        범주형 필드는 values() 한 번으로, 연령/근속/성장레벨은
+        feature_store.get_matrix 로 읽어 직원 ID 기준으로 합칩니다.
+        """
+        records = list(queryset.values('id', *self.batch_fields))
+        frame = pd.DataFrame.from_records(records, columns=['id', *self.batch_fields])
+        for column in ('department', 'new_position'):
+            if column in frame.columns:
+                frame[column] = frame[column].fillna('Unknown').replace('', 'Unknown')
+        
+        if frame.empty or not self.store_features:
+            return frame
+        
+        ids, matrix, columns = feature_store.get_matrix(frame['id'].tolist(), self.store_features)
+        stored = pd.DataFrame(matrix, columns=columns)
+        stored['id'] = ids
+        return frame.merge(stored, on='id', how='left')
+    
+    @staticmethod
+    def get_analysis_type(type_code: str, name: str) -> AIAnalysisType:
+        """분석 유형 조회 (없으면 생성)"""
+        analysis_type, _ = AIAnalysisType.objects.get_or_create(
+            type_code=type_code,
+            defaults={'name': name, 'description': f'{name} (배치 예측)'}
+        )
+        return analysis_type
+    
+    def save_batch_results(self, type_code: str, name: str, results: List[Dict],
+                           departments: Dict[int, str], created_by=None,
+                           valid_days: int = 1) -> List[AIAnalysisResult]:
+        """배치 예측 결과를 bulk_create 로 저장"""
+        analysis_type = self.get_analysis_type(type_code, name)
+        valid_until = timezone.now() + timedelta(days=valid_days)
+        
+        rows = [
+            AIAnalysisResult(
+                analysis_type=analysis_type,
+                employee_id=result['employee_id'],
+                department=(departments.get(result['employee_id']) or '')[:20] or None,
+                score=result['score'],
+                confidence=result['confidence'],
+                result_data=result['details'],
+                valid_until=valid_until,
+                created_by=created_by,
+            )
+            for result in results
+        ]
+        return AIAnalysisResult.objects.bulk_create(rows, batch_size=1000)
 
 
 class TurnoverPredictionModel(BaseHRModel):
     """퇴사 위험도 예측 모델"""
     
+    batch_fields = ['department', 'new_position', 'gender']
+    
     def __init__(self):
         super().__init__('turnover_prediction')
         self.model = RandomForestClassifier(
@@ -80,23 +200,15 @@ class TurnoverPredictionModel(BaseHRModel):
         features = pd.DataFrame()
         
         # 기본 정보
-        features['age'] = (datetime.now().date() - pd.to_datetime(employees_df['birth_date']).dt.date).dt.days / 365.25
-        features['tenure_years'] = (datetime.now().date() - pd.to_datetime(employees_df['hire_date']).dt.date).dt.days / 365.25
+        features['age'] = self.years_column(employees_df, 'age', 'birth_date')
+        features['tenure_years'] = self.years_column(employees_df, 'tenure_years', 'hire_date')
         features['growth_level'] = employees_df['growth_level']
         
         # 부서 인코딩
-        if 'department' not in self.label_encoders:
-            self.label_encoders['department'] = LabelEncoder()
-            features['department_encoded'] = self.label_encoders['department'].fit_transform(employees_df['department'].fillna('Unknown'))
-        else:
-            features['department_encoded'] = self.label_encoders['department'].transform(employees_df['department'].fillna('Unknown'))
+        features['department_encoded'] = self.encode_labels('department', employees_df['department'])
         
         # 직위 인코딩
-        if 'position' not in self.label_encoders:
-            self.label_encoders['position'] = LabelEncoder()
-            features['position_encoded'] = self.label_encoders['position'].fit_transform(employees_df['new_position'].fillna('Unknown'))
-        else:
-            features['position_encoded'] = self.label_encoders['position'].transform(employees_df['new_position'].fillna('Unknown'))
+        features['position_encoded'] = self.encode_labels('position', employees_df['new_position'])
         
         # 성별 인코딩
         features['gender_encoded'] = (employees_df['gender'] == 'M').astype(int)
@@ -148,6 +260,7 @@ class TurnoverPredictionModel(BaseHRModel):
     
     def train(self) -> Dict[str, float]:
         """모델 훈련"""
+        self.reset_estimators()
         X, y = self.prepare_training_data()
         
         if len(X) < 10:
@@ -182,9 +295,8 @@ class TurnoverPredictionModel(BaseHRModel):
     
     def predict_employee_turnover(self, employee: Employee) -> Dict[str, float]:
         """개별 직원의 퇴사 위험도 예측"""
-        if self.model is None:
-            if not self.load_model():
-                return {'risk_score': 50.0, 'confidence': 0.5}
+        if not self.ensure_fitted():
+            return {'risk_score': 50.0, 'confidence': 0.5}
         
         # 직원 데이터를 DataFrame으로 변환
         emp_data = pd.DataFrame([{
@@ -200,8 +312,9 @@ class TurnoverPredictionModel(BaseHRModel):
         features = self.extract_features(emp_data)
         
         # 예측
-        features_scaled = self.scaler.transform(features)
-        risk_prob = self.model.predict_proba(features_scaled)[0][1]  # 퇴사할 확률
+        with model_registry.track_inference(self.model_name):
+            features_scaled = self.scaler.transform(features)
+            risk_prob = self.model.predict_proba(features_scaled)[0][1]  # 퇴사할 확률
         risk_score = risk_prob * 100
         
         # 신뢰도 계산 (특성 중요도 기반)
@@ -214,6 +327,49 @@ class TurnoverPredictionModel(BaseHRModel):
             'factors': self._get_risk_factors(features.iloc[0], feature_importance)
         }
     
+    def predict_batch(self, queryset, save: bool = True, created_by=None) -> List[Dict]:
+        """
+        직원 다수의 퇴사 위험도 일괄 예측
+        
+        values() 조회와 피처 스토어 행렬 조회, 특성 추출 1회, predict_proba 1회로
+        전체를 처리하고 save=True 이면 AIAnalysisResult 에 bulk_create 로 저장합니다.
+        """
+        frame = self.load_employee_frame(queryset)
+        if frame.empty:
+            return []
+        
+        if not self.ensure_fitted():
+            results = [
+                {'employee_id': int(employee_id), 'score': 50.0, 'confidence': 0.5, 'details': {}}
+                for employee_id in frame['id']
+            ]
+        else:
+            features = self.extract_features(frame)
+            # 피처 스토어에 없는 값(생년월일 누락 등)은 전체 중앙값으로 보정
+            features = features.fillna(features.median(numeric_only=True)).fillna(0)
+            
+            with model_registry.track_inference(f'{self.model_name}_batch'):
+                risk_scores = self.model.predict_proba(self.scaler.transform(features))[:, 1] * 100
+            feature_importance = self.model.feature_importances_
+            confidence = float(np.mean(feature_importance) * 0.8 + 0.2)
+            contributions = features.to_numpy() * feature_importance[:features.shape[1]]
+            
+            results = [
+                {
+                    'employee_id': int(employee_id),
+                    'score': float(score),
+                    'confidence': confidence,
+                    'details': {'factors': dict(zip(self.feature_names, map(float, factor_row)))},
+                }
+                for employee_id, score, factor_row in zip(frame['id'], risk_scores, contributions)
+            ]
+        
+        if save:
+            departments = dict(zip(frame['id'], frame['department']))
+            self.save_batch_results('TURNOVER_RISK', '퇴사 위험도 예측', results, departments, created_by)
+        
+        return results
+    
     def _generate_synthetic_data(self) -> Tuple[pd.DataFrame, pd.Series]:
         """합성 데이터 생성 (실제 데이터가 부족할 때)"""
         np.random.seed(42)
@@ -263,6 +419,8 @@ class TurnoverPredictionModel(BaseHRModel):
 class PromotionPredictionModel(BaseHRModel):
     """승진 가능성 예측 모델"""
     
+    batch_fields = ['department']
+    
     def __init__(self):
         super().__init__('promotion_prediction')
         self.model = RandomForestRegressor(
@@ -276,8 +434,8 @@ class PromotionPredictionModel(BaseHRModel):
         features = pd.DataFrame()
         
         # 기본 정보
-        features['age'] = (datetime.now().date() - pd.to_datetime(employees_df['birth_date']).dt.date).dt.days / 365.25
-        features['tenure_years'] = (datetime.now().date() - pd.to_datetime(employees_df['hire_date']).dt.date).dt.days / 365.25
+        features['age'] = self.years_column(employees_df, 'age', 'birth_date')
+        features['tenure_years'] = self.years_column(employees_df, 'tenure_years', 'hire_date')
         features['current_level'] = employees_df['growth_level']
         
         # 현재 직급에서의 경력
@@ -334,6 +492,7 @@ class PromotionPredictionModel(BaseHRModel):
     
     def train(self) -> Dict[str, float]:
         """모델 훈련"""
+        self.reset_estimators()
         X, y = self.prepare_training_data()
         
         if len(X) < 10:
@@ -362,9 +521,8 @@ class PromotionPredictionModel(BaseHRModel):
     
     def predict_promotion_potential(self, employee: Employee) -> Dict[str, float]:
         """승진 가능성 예측"""
-        if self.model is None:
-            if not self.load_model():
-                return {'promotion_score': 50.0, 'confidence': 0.5}
+        if not self.ensure_fitted():
+            return {'promotion_score': 50.0, 'confidence': 0.5}
         
         emp_data = pd.DataFrame([{
             'birth_date': employee.birth_date,
@@ -374,9 +532,9 @@ class PromotionPredictionModel(BaseHRModel):
         }])
         
         features = self.extract_features(emp_data)
-        features_scaled = self.scaler.transform(features)
-        
-        promotion_score = self.model.predict(features_scaled)[0]
+        with model_registry.track_inference(self.model_name):
+            features_scaled = self.scaler.transform(features)
+            promotion_score = self.model.predict(features_scaled)[0]
         promotion_score = np.clip(promotion_score, 0, 100)
         
         # 예측 신뢰도
@@ -388,6 +546,53 @@ class PromotionPredictionModel(BaseHRModel):
             'readiness_factors': self._get_promotion_factors(features.iloc[0])
         }
     
+    def predict_batch(self, queryset, save: bool = True, created_by=None) -> List[Dict]:
+        """
+        직원 다수의 승진 가능성 일괄 예측
+        
+        values() 조회와 피처 스토어 행렬 조회, 특성 추출 1회, predict 1회로
+        전체를 처리하고 save=True 이면 AIAnalysisResult 에 bulk_create 로 저장합니다.
+        """
+        frame = self.load_employee_frame(queryset)
+        if frame.empty:
+            return []
+        
+        if not self.ensure_fitted():
+            results = [
+                {'employee_id': int(employee_id), 'score': 50.0, 'confidence': 0.5, 'details': {}}
+                for employee_id in frame['id']
+            ]
+        else:
+            features = self.extract_features(frame)
+            features = features.fillna(features.median(numeric_only=True)).fillna(0)
+            
+            with model_registry.track_inference(f'{self.model_name}_batch'):
+                scores = np.clip(self.model.predict(self.scaler.transform(features)), 0, 100)
+            confidences = np.minimum(0.9, 0.5 + features['experience_score'].to_numpy() * 0.3)
+            factors = pd.DataFrame({
+                'age_readiness': features['optimal_age_score'],
+                'experience_level': features['experience_score'],
+                'department_opportunity': features['dept_promotion_opportunity'],
+                'leadership_potential': features['leadership_potential'],
+                'tenure_adequacy': np.minimum(1.0, features['tenure_years'] / 3),
+            }).astype(float).to_dict('records')
+            
+            results = [
+                {
+                    'employee_id': int(employee_id),
+                    'score': float(score),
+                    'confidence': float(confidence),
+                    'details': {'readiness_factors': readiness},
+                }
+                for employee_id, score, confidence, readiness in zip(frame['id'], scores, confidences, factors)
+            ]
+        
+        if save:
+            departments = dict(zip(frame['id'], frame['department']))
+            self.save_batch_results('PROMOTION_POTENTIAL', '승진 가능성 분석', results, departments, created_by)
+        
+        return results
+    
     def _generate_synthetic_promotion_data(self) -> Tuple[pd.DataFrame, pd.Series]:
         """합성 승진 데이터 생성"""
         np.random.seed(42)
@@ -610,6 +815,20 @@ class AIModelManager:
         
         return results
     
+    def refresh_predictions(self, queryset=None, created_by=None) -> Dict[str, int]:
+        """전사 퇴사 위험도/승진 가능성 일괄 갱신 (야간 배치용)"""
+        if queryset is None:
+            queryset = Employee.objects.filter(employment_status='재직')
+        
+        return {
+            'turnover': len(self.turnover_model.predict_batch(queryset, created_by=created_by)),
+            'promotion': len(self.promotion_model.predict_batch(queryset, created_by=created_by)),
+        }
+    
+    def get_model_metrics(self) -> Dict:
+        """모델 로드 시간 및 추론 지연 지표"""
+        return model_registry.get_metrics()
+    
     def get_model_status(self) -> Dict[str, bool]:
         """모델 상태 확인"""
         return {
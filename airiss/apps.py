@@ -5,3 +5,6 @@ class AirissConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'airiss'
     verbose_name = 'AIRISS - AI 기반 HR 지원'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,279 @@
+"""
+AIRISS 피처 스토어
+AI 모듈들이 공통으로 쓰는 직원 특성(근속, 연령, 평가 이력, 보상 비율)을
+EmployeeFeature 테이블에 미리 계산해 두고 조회/행렬 변환을 제공합니다.
+
+갱신 경로:
+    - 시그널: 직원/평가/보상 저장 시 해당 직원 행을 stale 로 표시
+    - 조회 시: stale 이거나 없는 행만 다시 계산 (incremental)
+    - 야간 배치: manage.py refresh_features 로 전체 재계산
+"""
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.db.models import Avg
+
+from employees.models import Employee
+from .models import EmployeeFeature
+
+logger = logging.getLogger(__name__)
+
+try:
+    from evaluations.models import ComprehensiveEvaluation
+except ImportError:
+    ComprehensiveEvaluation = None
+
+try:
+    from compensation.models import EmployeeCompensation
+except ImportError:
+    EmployeeCompensation = None
+
+
+FEATURE_VERSION = 1
+
+NUMERIC_FEATURES = [
+    'age',
+    'tenure_years',
+    'tenure_months',
+    'growth_level',
+    'evaluation_count',
+    'evaluation_avg_score',
+    'evaluation_last_score',
+    'evaluation_trend',
+    'base_salary',
+    'total_compensation',
+    'compensation_ratio',
+]
+
+# 종합평가 점수(overall_score) 만점 - 100점 환산용
+EVALUATION_SCALE = 4.0
+
+STORED_FIELDS = ['version', 'department', 'position', *NUMERIC_FEATURES, 'is_stale', 'computed_at']
+
+
+def evaluation_percent(score: Optional[float]) -> float:
+    """평가 점수를 100점 만점으로 환산"""
+    if score is None:
+        return 0.0
+    return min(100.0, float(score) / EVALUATION_SCALE * 100)
+
+
+class FeatureStore:
+    """직원 ML 특성 저장소"""
+
+    def __init__(self, evaluation_window: int = 3, batch_size: int = 1000):
+        self.evaluation_window = evaluation_window
+        self.batch_size = batch_size
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+    def compute(self, employee_ids: Optional[Iterable[int]] = None) -> List[EmployeeFeature]:
+        """직원 특성 계산 (저장하지 않음) - 대상 규모와 무관하게 쿼리 4회"""
+        employees = Employee.objects.all()
+        if employee_ids is not None:
+            employees = employees.filter(id__in=list(employee_ids))
+
+        rows = list(employees.values(
+            'id', 'department', 'position', 'birth_date', 'hire_date', 'growth_level'
+        ))
+        if not rows:
+            return []
+
+        ids = [row['id'] for row in rows]
+        evaluations = self._load_evaluations(ids)
+        compensations = self._load_compensations(ids)
+        position_avg = self._load_position_salary_averages()
+
+        today = date.today()
+        features = []
+        for row in rows:
+            employee_id = row['id']
+            hire_date = row['hire_date']
+            birth_date = row['birth_date']
+
+            tenure_days = (today - hire_date).days if hire_date else 0
+            tenure_months = 0
+            if hire_date:
+                tenure_months = max(0, (today.year - hire_date.year) * 12 + (today.month - hire_date.month))
+
+            scores = evaluations.get(employee_id, [])
+            recent, older = scores[:2], scores[2:]
+            trend = 0.0
+            if len(scores) >= 2:
+                trend = float(np.mean(recent) - np.mean(older if older else recent))
+
+            base_salary, total_compensation = compensations.get(employee_id, (None, None))
+            average = position_avg.get(row['position'])
+            ratio = base_salary / average if base_salary and average else None
+
+            features.append(EmployeeFeature(
+                employee_id=employee_id,
+                version=FEATURE_VERSION,
+                department=row['department'] or '',
+                position=row['position'] or '',
+                age=(today - birth_date).days / 365.25 if birth_date else None,
+                tenure_years=max(0, tenure_days) / 365.25,
+                tenure_months=tenure_months,
+                growth_level=row['growth_level'] or 1,
+                evaluation_count=len(scores),
+                evaluation_avg_score=float(np.mean(scores)) if scores else None,
+                evaluation_last_score=scores[0] if scores else None,
+                evaluation_trend=trend,
+                base_salary=base_salary,
+                total_compensation=total_compensation,
+                compensation_ratio=ratio,
+                is_stale=False,
+            ))
+        return features
+
+    def _load_evaluations(self, employee_ids: Sequence[int]) -> Dict[int, List[float]]:
+        """직원별 최근 평가 점수 (최신순, evaluation_window 개)"""
+        result = defaultdict(list)
+        if ComprehensiveEvaluation is None:
+            return result
+
+        records = ComprehensiveEvaluation.objects.filter(
+            employee_id__in=employee_ids,
+            overall_score__isnull=False
+        ).order_by('employee_id', '-evaluation_period__end_date', '-created_at').values_list(
+            'employee_id', 'overall_score'
+        )
+        for employee_id, score in records:
+            if len(result[employee_id]) < self.evaluation_window:
+                result[employee_id].append(float(score))
+        return result
+
+    def _load_compensations(self, employee_ids: Sequence[int]) -> Dict[int, Tuple[float, float]]:
+        """직원별 최신 보상 (기본급, 총보상)"""
+        result = {}
+        if EmployeeCompensation is None:
+            return result
+
+        records = EmployeeCompensation.objects.filter(
+            employee_id__in=employee_ids
+        ).order_by('employee_id', '-year', '-month').values_list(
+            'employee_id', 'base_salary', 'total_compensation'
+        )
+        for employee_id, base_salary, total_compensation in records:
+            if employee_id not in result:
+                result[employee_id] = (
+                    float(base_salary) if base_salary is not None else None,
+                    float(total_compensation) if total_compensation is not None else None,
+                )
+        return result
+
+    def _load_position_salary_averages(self) -> Dict[str, float]:
+        """직급별 평균 기본급 (보상 비율 계산용)"""
+        if EmployeeCompensation is None:
+            return {}
+        return {
+            row['employee__position']: float(row['avg'])
+            for row in EmployeeCompensation.objects.values('employee__position').annotate(avg=Avg('base_salary'))
+            if row['avg']
+        }
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def refresh(self, employee_ids: Optional[Iterable[int]] = None) -> int:
+        """특성 재계산 후 upsert. employee_ids 가 없으면 전체 직원"""
+        features = self.compute(employee_ids)
+        if not features:
+            return 0
+
+        EmployeeFeature.objects.bulk_create(
+            features,
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=['employee'],
+            update_fields=STORED_FIELDS,
+        )
+        return len(features)
+
+    def refresh_stale(self) -> int:
+        """stale 표시되었거나 아직 계산되지 않은 직원만 갱신"""
+        stale_ids = set(
+            EmployeeFeature.objects.filter(is_stale=True).values_list('employee_id', flat=True)
+        )
+        stale_ids.update(
+            EmployeeFeature.objects.exclude(version=FEATURE_VERSION).values_list('employee_id', flat=True)
+        )
+        stale_ids.update(
+            Employee.objects.filter(ml_features__isnull=True).values_list('id', flat=True)
+        )
+        if not stale_ids:
+            return 0
+        return self.refresh(stale_ids)
+
+    def mark_stale(self, employee_ids: Iterable[int]) -> int:
+        """특성 재계산 대상으로 표시"""
+        return EmployeeFeature.objects.filter(employee_id__in=list(employee_ids)).update(is_stale=True)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def _ensure_fresh(self, employee_ids: Optional[Sequence[int]]):
+        if employee_ids is None:
+            self.refresh_stale()
+            return
+
+        fresh_ids = set(
+            EmployeeFeature.objects.filter(
+                employee_id__in=employee_ids, is_stale=False, version=FEATURE_VERSION
+            ).values_list('employee_id', flat=True)
+        )
+        missing = [employee_id for employee_id in employee_ids if employee_id not in fresh_ids]
+        if missing:
+            self.refresh(missing)
+
+    def get_many(self, employee_ids: Sequence[int]) -> Dict[int, Dict]:
+        """직원 ID -> 특성 dict"""
+        employee_ids = list(employee_ids)
+        if not employee_ids:
+            return {}
+        self._ensure_fresh(employee_ids)
+        rows = EmployeeFeature.objects.filter(employee_id__in=employee_ids).values(
+            'employee_id', 'department', 'position', *NUMERIC_FEATURES
+        )
+        return {row.pop('employee_id'): row for row in rows}
+
+    def get(self, employee_id: int) -> Dict:
+        """직원 한 명의 특성 dict (없으면 빈 dict)"""
+        return self.get_many([employee_id]).get(employee_id, {})
+
+    def get_matrix(
+        self,
+        employee_ids: Optional[Sequence[int]] = None,
+        features: Optional[Sequence[str]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """
+        특성을 NumPy 행렬로 반환
+
+        Returns:
+            (직원 ID 배열, float 행렬 [n_employees x n_features], 컬럼 이름)
+            값이 없는 특성은 NaN
+        """
+        columns = list(features or NUMERIC_FEATURES)
+        if employee_ids is not None:
+            employee_ids = list(employee_ids)
+        self._ensure_fresh(employee_ids)
+
+        queryset = EmployeeFeature.objects.order_by('employee_id')
+        if employee_ids is not None:
+            queryset = queryset.filter(employee_id__in=employee_ids)
+        rows = list(queryset.values_list('employee_id', *columns))
+
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(columns))), columns
+
+        data = np.array(rows, dtype=object)
+        ids = data[:, 0].astype(np.int64)
+        matrix = np.array(data[:, 1:], dtype=float)  # None -> nan
+        return ids, matrix, columns
+
+
+feature_store = FeatureStore()
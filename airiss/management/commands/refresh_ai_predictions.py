@@ -0,0 +1,33 @@
+"""
+Django 관리 명령어 - AIRISS 예측 결과 일괄 갱신 (야간 배치)
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from airiss.ai_models import AIModelManager
+from employees.models import Employee
+
+
+class Command(BaseCommand):
+    help = '재직자 전체의 퇴사 위험도/승진 가능성을 일괄 예측하여 저장합니다.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--department',
+            type=str,
+            help='특정 부서만 갱신'
+        )
+    
+    def handle(self, *args, **options):
+        queryset = Employee.objects.filter(employment_status='재직')
+        if options.get('department'):
+            queryset = queryset.filter(department=options['department'])
+        
+        started = time.monotonic()
+        counts = AIModelManager().refresh_predictions(queryset)
+        elapsed = time.monotonic() - started
+        
+        self.stdout.write(self.style.SUCCESS(
+            f"퇴사 위험도 {counts['turnover']}건, 승진 가능성 {counts['promotion']}건 저장 ({elapsed:.1f}초)"
+        ))
@@ -0,0 +1,29 @@
+"""
+Django 관리 명령어 - 피처 스토어 갱신 (야간 배치)
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from airiss.feature_store import feature_store
+
+
+class Command(BaseCommand):
+    help = '직원 ML 특성(EmployeeFeature)을 다시 계산합니다.'
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--stale-only',
+            action='store_true',
+            help='변경되었거나 아직 계산되지 않은 직원만 갱신'
+        )
+    
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        if options['stale_only']:
+            count = feature_store.refresh_stale()
+        else:
+            count = feature_store.refresh()
+        elapsed = time.monotonic() - started
+        
+        self.stdout.write(self.style.SUCCESS(f"직원 특성 {count}건 갱신 ({elapsed:.1f}초)"))
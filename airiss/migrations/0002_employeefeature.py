@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-19 09:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('airiss', '0001_initial'),
+        ('employees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmployeeFeature',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.IntegerField(default=1, help_text='특성 정의 버전')),
+                ('department', models.CharField(blank=True, max_length=100)),
+                ('position', models.CharField(blank=True, max_length=100)),
+                ('age', models.FloatField(blank=True, null=True)),
+                ('tenure_years', models.FloatField(default=0)),
+                ('tenure_months', models.IntegerField(default=0)),
+                ('growth_level', models.IntegerField(default=1)),
+                ('evaluation_count', models.IntegerField(default=0)),
+                ('evaluation_avg_score', models.FloatField(blank=True, null=True)),
+                ('evaluation_last_score', models.FloatField(blank=True, null=True)),
+                ('evaluation_trend', models.FloatField(default=0, help_text='최근 평가 - 이전 평가 평균')),
+                ('base_salary', models.FloatField(blank=True, null=True)),
+                ('total_compensation', models.FloatField(blank=True, null=True)),
+                ('compensation_ratio', models.FloatField(blank=True, help_text='동일 직급 평균 대비 비율', null=True)),
+                ('is_stale', models.BooleanField(default=False)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='ml_features', to='employees.employee')),
+            ],
+            options={
+                'verbose_name': '직원 ML 특성',
+                'verbose_name_plural': '직원 ML 특성',
+                'indexes': [models.Index(fields=['is_stale'], name='airiss_empl_is_stal_28ce69_idx'), models.Index(fields=['department'], name='airiss_empl_departm_fd4d33_idx')],
+            },
+        ),
+    ]
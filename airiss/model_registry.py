@@ -0,0 +1,176 @@
+"""
+AIRISS 모델 레지스트리
+프로세스 단위로 학습된 모델 파일을 한 번만 로드해 공유하고,
+재학습으로 파일이 바뀌면 자동으로 다시 로드합니다.
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelVersion:
+    """로드된 모델 파일 한 버전"""
+    version: Tuple[int, int]          # (mtime_ns, size)
+    payload: Dict[str, Any]
+    loaded_at: float
+    load_seconds: float
+
+
+@dataclass
+class InferenceStats:
+    """모델별 추론 지연 통계"""
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    recent: deque = field(default_factory=lambda: deque(maxlen=200))
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def to_dict(self) -> Dict[str, float]:
+        recent = sorted(self.recent)
+        p95 = recent[int(len(recent) * 0.95) - 1] if recent else 0.0
+        return {
+            'count': self.count,
+            'avg_ms': (self.total_seconds / self.count * 1000) if self.count else 0.0,
+            'max_ms': self.max_seconds * 1000,
+            'p95_ms': p95 * 1000,
+        }
+
+
+class ModelRegistry:
+    """경로별 모델 캐시
+
+    - 파일당 한 번만 joblib.load (큰 numpy 배열은 mmap_mode 로 메모리 매핑)
+    - reload_interval 초마다 파일의 mtime/size 를 확인해 변경 시 재로드 (hot reload)
+    - 최근 버전 이력과 로드 시간/추론 지연 지표 제공
+    """
+
+    def __init__(self, reload_interval: float = 5.0, mmap_mode: Optional[str] = 'r', history_size: int = 3):
+        self.reload_interval = reload_interval
+        self.mmap_mode = mmap_mode
+        self.history_size = history_size
+        self._current: Dict[str, ModelVersion] = {}
+        self._history: Dict[str, deque] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._inference: Dict[str, InferenceStats] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _file_version(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: str) -> Optional[ModelVersion]:
+        """현재 모델 버전 반환 (파일이 없으면 None)"""
+        now = time.monotonic()
+        current = self._current.get(path)
+        if current is not None and now - self._checked_at.get(path, 0) < self.reload_interval:
+            return current
+
+        with self._lock:
+            current = self._current.get(path)
+            self._checked_at[path] = now
+            version = self._file_version(path)
+            if version is None:
+                return current
+            if current is not None and current.version == version:
+                return current
+            return self._load(path, version)
+
+    def _load(self, path: str, version: Tuple[int, int]) -> Optional[ModelVersion]:
+        started = time.perf_counter()
+        try:
+            payload = joblib.load(path, mmap_mode=self.mmap_mode)
+        except Exception as e:
+            logger.error(f"모델 로드 실패 ({path}): {e}")
+            return self._current.get(path)
+
+        entry = ModelVersion(
+            version=version,
+            payload=payload,
+            loaded_at=time.time(),
+            load_seconds=time.perf_counter() - started,
+        )
+        previous = self._current.get(path)
+        if previous is not None:
+            logger.info(f"모델 재로드: {os.path.basename(path)}")
+        self._current[path] = entry
+        self._history.setdefault(path, deque(maxlen=self.history_size)).append(entry)
+        return entry
+
+    def save(self, path: str, payload: Dict[str, Any]) -> Optional[ModelVersion]:
+        """모델 파일을 원자적으로 교체하고 즉시 새 버전으로 등록
+
+        기존 파일을 덮어쓰면 메모리 매핑 중인 배열이 깨지므로 임시 파일에 쓴 뒤 rename 합니다.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        joblib.dump(payload, tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._checked_at[path] = time.monotonic()
+            return self._load(path, self._file_version(path))
+
+    def invalidate(self, path: Optional[str] = None):
+        with self._lock:
+            if path is None:
+                self._current.clear()
+                self._checked_at.clear()
+            else:
+                self._current.pop(path, None)
+                self._checked_at.pop(path, None)
+
+    @contextmanager
+    def track_inference(self, name: str):
+        """추론 지연 시간 측정"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self._inference.setdefault(name, InferenceStats()).record(elapsed)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """로드 시간, 버전 이력, 추론 지연 지표"""
+        with self._lock:
+            models = {}
+            for path, entry in self._current.items():
+                models[os.path.basename(path)] = {
+                    'version': entry.version[0],
+                    'loaded_at': entry.loaded_at,
+                    'load_ms': entry.load_seconds * 1000,
+                    'history': [
+                        {'version': item.version[0], 'load_ms': item.load_seconds * 1000}
+                        for item in self._history.get(path, [])
+                    ],
+                }
+            return {
+                'models': models,
+                'inference': {name: stats.to_dict() for name, stats in self._inference.items()},
+            }
+
+
+model_registry = ModelRegistry(
+    reload_interval=getattr(settings, 'AIRISS_MODEL_RELOAD_INTERVAL', 5.0),
+    mmap_mode=getattr(settings, 'AIRISS_MODEL_MMAP_MODE', 'r'),
+)
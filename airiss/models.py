@@ -191,3 +191,49 @@ class AIModelConfig(models.Model):
     
     def __str__(self):
         return f"{self.model_name} v{self.version}"
+
+
+class EmployeeFeature(models.Model):
+    """직원별 ML 특성 (피처 스토어)
+
+    AI 모듈들이 공통으로 사용하는 근속/연령/평가/보상 특성을 미리 계산해 둔 테이블.
+    airiss.feature_store.FeatureStore 가 시그널과 야간 배치로 갱신합니다.
+    """
+    employee = models.OneToOneField(
+        Employee, on_delete=models.CASCADE, related_name='ml_features'
+    )
+    version = models.IntegerField(default=1, help_text="특성 정의 버전")
+    
+    # 기본 정보
+    department = models.CharField(max_length=100, blank=True)
+    position = models.CharField(max_length=100, blank=True)
+    age = models.FloatField(null=True, blank=True)
+    tenure_years = models.FloatField(default=0)
+    tenure_months = models.IntegerField(default=0)
+    growth_level = models.IntegerField(default=1)
+    
+    # 평가 이력
+    evaluation_count = models.IntegerField(default=0)
+    evaluation_avg_score = models.FloatField(null=True, blank=True)
+    evaluation_last_score = models.FloatField(null=True, blank=True)
+    evaluation_trend = models.FloatField(default=0, help_text="최근 평가 - 이전 평가 평균")
+    
+    # 보상
+    base_salary = models.FloatField(null=True, blank=True)
+    total_compensation = models.FloatField(null=True, blank=True)
+    compensation_ratio = models.FloatField(null=True, blank=True, help_text="동일 직급 평균 대비 비율")
+    
+    # 상태
+    is_stale = models.BooleanField(default=False)
+    computed_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = '직원 ML 특성'
+        verbose_name_plural = '직원 ML 특성'
+        indexes = [
+            models.Index(fields=['is_stale']),
+            models.Index(fields=['department']),
+        ]
+    
+    def __str__(self):
+        return f"{self.employee_id} 특성 v{self.version}"
@@ -28,6 +28,7 @@ from .models import (
     AIAnalysisType, AIAnalysisResult, AIInsight,
     HRChatbotConversation, AIModelConfig
 )
+from .feature_store import feature_store, evaluation_percent
 
 
 class AIAnalysisService:
@@ -35,6 +36,13 @@ class AIAnalysisService:
     
     def __init__(self):
         self.confidence_threshold = 0.7
+        self._feature_cache = {}
+    
+    def _get_features(self, employee: Employee) -> Dict[str, Any]:
+        """피처 스토어에서 직원 특성 조회 (서비스 인스턴스 내 재사용)"""
+        if employee.id not in self._feature_cache:
+            self._feature_cache[employee.id] = feature_store.get(employee.id)
+        return self._feature_cache[employee.id]
         
     def analyze_turnover_risk(self, employee: Employee) -> Dict[str, Any]:
         """직원의 퇴사 위험도 분석"""
@@ -221,7 +229,7 @@ class AIAnalysisService:
     # Private helper methods
     def _calculate_tenure_risk(self, employee: Employee) -> float:
         """근속 기간 기반 위험도"""
-        tenure_years = (timezone.now().date() - employee.hire_date).days / 365
+        tenure_years = self._get_features(employee).get('tenure_years') or 0
         
         if tenure_years < 1:
             return 70  # 1년 미만 높은 위험
@@ -234,15 +242,12 @@ class AIAnalysisService:
     
     def _calculate_performance_risk(self, employee: Employee) -> float:
         """성과 기반 위험도"""
-        # 최근 평가 조회
-        recent_evaluations = PerformanceEvaluation.objects.filter(
-            employee=employee
-        ).order_by('-evaluation_period__end_date')[:3]
-        
-        if not recent_evaluations:
+        # 최근 평가 (피처 스토어)
+        features = self._get_features(employee)
+        if not features.get('evaluation_count'):
             return 50  # 평가 없음 - 중간 위험
         
-        avg_score = sum(e.overall_score for e in recent_evaluations) / len(recent_evaluations)
+        avg_score = evaluation_percent(features['evaluation_avg_score'])
         
         if avg_score >= 90:
             return 10  # 우수 성과 - 낮은 위험
@@ -253,23 +258,17 @@ class AIAnalysisService:
     
     def _calculate_compensation_risk(self, employee: Employee) -> float:
         """보상 기반 위험도"""
-        try:
-            comp = EmployeeCompensation.objects.get(employee=employee)
-            # 동일 직급 평균과 비교 (시뮬레이션)
-            position_avg = EmployeeCompensation.objects.filter(
-                employee__position=employee.position
-            ).aggregate(avg=Avg('base_salary'))['avg'] or comp.base_salary
-            
-            ratio = comp.base_salary / position_avg
-            
-            if ratio >= 1.1:
-                return 10  # 평균 이상 - 낮은 위험
-            elif ratio >= 0.9:
-                return 30  # 평균 수준 - 중간 위험
-            else:
-                return 60  # 평균 이하 - 높은 위험
-        except EmployeeCompensation.DoesNotExist:
+        # 동일 직급 평균 대비 기본급 비율 (피처 스토어)
+        ratio = self._get_features(employee).get('compensation_ratio')
+        if ratio is None:
             return 50  # 보상 정보 없음
+        
+        if ratio >= 1.1:
+            return 10  # 평균 이상 - 낮은 위험
+        elif ratio >= 0.9:
+            return 30  # 평균 수준 - 중간 위험
+        else:
+            return 60  # 평균 이하 - 높은 위험
     
     def _calculate_engagement_risk(self, employee: Employee) -> float:
         """참여도 기반 위험도 (시뮬레이션)"""
@@ -360,19 +359,14 @@ class AIAnalysisService:
     
     def _evaluate_performance_history(self, employee: Employee) -> float:
         """성과 이력 평가"""
-        evaluations = PerformanceEvaluation.objects.filter(
-            employee=employee
-        ).order_by('-evaluation_period__end_date')[:5]
-        
-        if not evaluations:
+        features = self._get_features(employee)
+        if not features.get('evaluation_count'):
             return 50
         
-        # 성과 추세 분석
-        scores = [e.overall_score for e in evaluations]
-        avg_score = sum(scores) / len(scores)
+        avg_score = evaluation_percent(features['evaluation_avg_score'])
         
         # 상승 추세 가산점
-        if len(scores) >= 2 and scores[0] > scores[-1]:
+        if features.get('evaluation_trend', 0) > 0:
             trend_bonus = 10
         else:
             trend_bonus = 0
@@ -391,7 +385,7 @@ class AIAnalysisService:
     
     def _evaluate_tenure_readiness(self, employee: Employee) -> float:
         """근속 기간 기반 준비도"""
-        tenure_years = (timezone.now().date() - employee.hire_date).days / 365
+        tenure_years = self._get_features(employee).get('tenure_years') or 0
         
         if tenure_years < 2:
             return 30
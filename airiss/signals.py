@@ -0,0 +1,41 @@
+"""
+AIRISS 시그널 - 원천 데이터 변경 시 피처 스토어 행을 stale 로 표시
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from employees.models import Employee
+from .feature_store import feature_store
+
+try:
+    from evaluations.models import ComprehensiveEvaluation
+except ImportError:
+    ComprehensiveEvaluation = None
+
+try:
+    from compensation.models import EmployeeCompensation
+except ImportError:
+    EmployeeCompensation = None
+
+
+def _mark_stale_on_commit(employee_id):
+    if employee_id:
+        transaction.on_commit(lambda: feature_store.mark_stale([employee_id]))
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, **kwargs):
+    _mark_stale_on_commit(instance.pk)
+
+
+if ComprehensiveEvaluation is not None:
+    @receiver([post_save, post_delete], sender=ComprehensiveEvaluation)
+    def evaluation_changed(sender, instance, **kwargs):
+        _mark_stale_on_commit(instance.employee_id)
+
+
+if EmployeeCompensation is not None:
+    @receiver([post_save, post_delete], sender=EmployeeCompensation)
+    def compensation_changed(sender, instance, **kwargs):
+        _mark_stale_on_commit(instance.employee_id)
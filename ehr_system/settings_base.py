@@ -166,6 +166,77 @@ CHANNEL_LAYERS = {
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
 
+# Shared LLM gateway (ai_services.llm_gateway)
+LLM_GATEWAY = {
+    'openai': {
+        'BASE_URL': os.getenv('OPENAI_BASE_URL') or None,
+        'MAX_CONCURRENCY': int(os.getenv('LLM_MAX_CONCURRENCY', '8')),
+        'TIMEOUT': float(os.getenv('LLM_TIMEOUT', '30')),
+        'MAX_RETRIES': int(os.getenv('LLM_MAX_RETRIES', '2')),
+    },
+}
+
+# LLM response cache (ai_services.llm_cache)
+LLM_CACHE = {
+    'ENABLED': os.getenv('AI_ENABLE_CACHING', 'true').lower() == 'true',
+    'TTL': int(os.getenv('AI_CACHE_TTL', str(24 * 3600))),
+    'SIMILARITY_THRESHOLD': float(os.getenv('LLM_CACHE_SIMILARITY_THRESHOLD', '0.92')),
+    'MAX_ENTRIES_PER_SCOPE': int(os.getenv('LLM_CACHE_MAX_ENTRIES', '2000')),
+    # Prompts that embed employee data only use the exact tier
+    'SCOPES': {
+        'turnover_analysis': {'SIMILARITY_THRESHOLD': 0, 'TTL': 6 * 3600},
+        'chatbot_intent': {'TTL': 7 * 24 * 3600},
+    },
+}
+
+# LLM usage accounting, rate limits and budget breaker (ai_services.usage)
+LLM_USAGE = {
+    'ENABLED': os.getenv('LLM_USAGE_LIMITS_ENABLED', 'true').lower() == 'true',
+    'MONTHLY_BUDGET_USD': float(os.getenv('AI_MONTHLY_BUDGET_USD', '100')),
+    'ALERT_THRESHOLD': float(os.getenv('AI_ALERT_THRESHOLD', '80')),
+    'HOURLY_BUDGET_USD': float(os.getenv('AI_HOURLY_BUDGET_USD', '0')) or None,
+    'BREAKER_COOLDOWN': int(os.getenv('AI_BUDGET_BREAKER_COOLDOWN', '300')),
+    'RATE_LIMITS': {
+        'USER_PER_MINUTE': int(os.getenv('LLM_USER_RATE_LIMIT', '20')),
+        'FEATURE_PER_MINUTE': int(os.getenv('LLM_FEATURE_RATE_LIMIT', '300')),
+        'FEATURES': {
+            'chatbot_intent': {'USER_PER_MINUTE': 60},
+        },
+    },
+}
+
+# Offline batch LLM generation (ai_services.batch, manage.py run_llm_batch)
+LLM_BATCH = {
+    'CONCURRENCY': int(os.getenv('LLM_BATCH_CONCURRENCY', '4')),
+    'MAX_ATTEMPTS': int(os.getenv('LLM_BATCH_MAX_ATTEMPTS', '3')),
+}
+
+# Chatbot conversation store (ai_services.conversation_store)
+CONVERSATION_STORE = {
+    'WINDOW': int(os.getenv('CHATBOT_CONTEXT_WINDOW', '10')),
+    'SUMMARY_MAX_CHARS': int(os.getenv('CHATBOT_SUMMARY_MAX_CHARS', '1500')),
+    'TIMEOUT': int(os.getenv('CHATBOT_SESSION_TIMEOUT', '3600')),
+    # ai_chatbot keeps the full transcript in ChatMessage
+    'NAMESPACES': {
+        'ehr_gpt_chatbot': {'LOG_DIR': os.getenv('CHATBOT_CONVERSATION_LOG_DIR', str(BASE_DIR / 'logs'))},
+    },
+}
+
+# Notification delivery settings
+NOTIFICATION_DELIVERY = {
+    'ASYNC': os.getenv('NOTIFICATION_ASYNC_DELIVERY', 'True').lower() == 'true',
+    'WORKERS': {
+        'PUSH': int(os.getenv('NOTIFICATION_PUSH_WORKERS', '2')),
+        'EMAIL': int(os.getenv('NOTIFICATION_EMAIL_WORKERS', '4')),
+        'SMS': int(os.getenv('NOTIFICATION_SMS_WORKERS', '2')),
+    },
+    'BATCH_SIZE': int(os.getenv('NOTIFICATION_BATCH_SIZE', '50')),
+    'MAX_RETRIES': int(os.getenv('NOTIFICATION_MAX_RETRIES', '3')),
+    'SUBMIT_TIMEOUT': float(os.getenv('NOTIFICATION_SUBMIT_TIMEOUT', '2')),
+    'SHUTDOWN_TIMEOUT': float(os.getenv('NOTIFICATION_SHUTDOWN_TIMEOUT', '10')),
+    'SMS_GATEWAY_URL': os.getenv('SMS_GATEWAY_URL', ''),
+}
+
 # AIRISS service settings
 AIRISS_INTERNAL_URL = os.getenv('AIRISS_INTERNAL_URL', 'http://airiss.railway.internal')
 AIRISS_SERVICE_URL = os.getenv('AIRISS_SERVICE_URL', 'https://web-production-4066.up.railway.app')
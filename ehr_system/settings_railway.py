@@ -95,7 +95,7 @@ EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
 EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@ehrv10.com')
 
-# Redis configuration for Channels (if available)
+# Redis configuration for Channels and cache (if available)
 REDIS_URL = os.getenv('REDIS_URL')
 if REDIS_URL:
     CHANNEL_LAYERS = {
@@ -106,6 +106,13 @@ if REDIS_URL:
             },
         },
     }
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'ehr',
+        }
+    }
 else:
     # Fallback to in-memory (not recommended for production)
     CHANNEL_LAYERS = {
@@ -113,6 +120,14 @@ else:
             'BACKEND': 'channels.layers.InMemoryChannelLayer'
         }
     }
+    # 워커 프로세스가 여러 개이므로 호출 한도/예산 차단기 등 공유 카운터는 DB 캐시 사용
+    # (manage.py createcachetable 필요, incr 는 Redis 와 달리 원자적이지 않음)
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
 
 # Logging configuration for Railway
 LOGGING = {
@@ -1,91 +1,93 @@
 """
 인재 관리 API 뷰
+직원별 인재 현황 요약(TalentSummary)에서 통계, 상위 목록, 상세 카드를 각각 쿼리 한 번으로 조회합니다.
+(카테고리 필터 목록은 직원이 여러 카테고리에 속할 수 있어 TalentPool 에서 조회)
 """
 
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 from django.contrib.auth.decorators import login_required
 from django.db.models import Count, Q
-from .models_talent import TalentPool, TalentCategory, PromotionCandidate, RetentionRisk
+from .models_talent import TalentCategory, TalentPool, TalentSummary
 
 
 @require_GET
 def talent_pool_api(request):
     """인재풀 데이터 API"""
     try:
-        # 통계 데이터
-        statistics = {
-            'core_talent': TalentPool.objects.filter(
-                category__category_code='CORE_TALENT',
-                status='ACTIVE'
-            ).count(),
-            'promotion_candidate': PromotionCandidate.objects.filter(
-                is_active=True
-            ).count(),
-            'retention_risk': RetentionRisk.objects.filter(
-                risk_level__in=['CRITICAL', 'HIGH'],
-                action_status__in=['PENDING', 'IN_PROGRESS']
-            ).count(),
-            'needs_attention': TalentPool.objects.filter(
-                category__category_code='NEEDS_ATTENTION',
-                status__in=['ACTIVE', 'MONITORING']
-            ).count()
-        }
+        # 통계 데이터 (직원 기준 집계 한 번)
+        statistics = TalentSummary.objects.aggregate(
+            core_talent=Count('pk', filter=Q(is_core_talent=True)),
+            promotion_candidate=Count('pk', filter=Q(is_promotion_candidate=True)),
+            retention_risk=Count('pk', filter=Q(is_open_risk=True)),
+            needs_attention=Count('pk', filter=Q(needs_attention=True)),
+        )
         
         # 카테고리 필터
         category_filter = request.GET.get('category', '')
         
         # 인재풀 데이터
-        talent_pool_qs = TalentPool.objects.select_related(
-            'employee', 'category'
-        ).filter(status__in=['ACTIVE', 'MONITORING'])
-        
-        if category_filter:
-            talent_pool_qs = talent_pool_qs.filter(category__category_code=category_filter)
-        
         talent_pool_data = []
-        for tp in talent_pool_qs[:20]:  # 최대 20개
-            talent_pool_data.append({
-                'id': tp.id,
-                'name': tp.employee.name if tp.employee else 'Unknown',
-                'department': tp.employee.department if tp.employee else '-',
-                'position': tp.employee.position if tp.employee else '-',
-                'category': tp.category.get_category_code_display(),
-                'ai_score': round(tp.ai_score, 1),
-                'confidence': round(tp.confidence_level * 100, 0),
-                'status': tp.status,
-                'analyzed_date': tp.added_at.strftime('%Y-%m-%d')
-            })
+        if category_filter:
+            # 직원이 여러 카테고리에 속할 수 있어 요약의 대표 카테고리가 아니라 인재풀 행으로 필터
+            talent_pool_qs = TalentPool.objects.select_related('employee', 'category').filter(
+                status__in=TalentSummary.TALENT_STATUSES,
+                category__category_code=category_filter
+            ).order_by('-ai_score', '-added_at')
+            for tp in talent_pool_qs[:20]:  # 최대 20개
+                talent_pool_data.append({
+                    'id': tp.id,
+                    'name': tp.employee.name if tp.employee else 'Unknown',
+                    'department': tp.employee.department if tp.employee else '-',
+                    'position': tp.employee.position if tp.employee else '-',
+                    'category': tp.category.get_category_code_display(),
+                    'ai_score': round(tp.ai_score, 1),
+                    'confidence': round(tp.confidence_level * 100, 0),
+                    'status': tp.status,
+                    'analyzed_date': tp.added_at.strftime('%Y-%m-%d')
+                })
+        else:
+            talent_pool_qs = TalentSummary.objects.filter(in_talent_pool=True)
+            for ts in talent_pool_qs.order_by('-ai_score', '-talent_added_at')[:20]:  # 최대 20개
+                talent_pool_data.append({
+                    'id': ts.talent_pool_id,
+                    'name': ts.name,
+                    'department': ts.department,
+                    'position': ts.position,
+                    'category': ts.get_talent_category_display(),
+                    'ai_score': round(ts.ai_score, 1),
+                    'confidence': round(ts.confidence_level * 100, 0),
+                    'status': ts.talent_status,
+                    'analyzed_date': ts.talent_added_at.strftime('%Y-%m-%d')
+                })
         
         # 승진 후보자 데이터
         promotion_candidates = []
-        for pc in PromotionCandidate.objects.filter(is_active=True).select_related('employee')[:10]:
+        for ts in TalentSummary.objects.filter(is_promotion_candidate=True).order_by('-promotion_score', '-performance_score')[:10]:
             promotion_candidates.append({
-                'id': pc.id,
-                'name': pc.employee.name,
-                'current_position': pc.current_position,
-                'target_position': pc.target_position,
-                'readiness': pc.get_readiness_level_display(),
-                'ai_score': round(pc.ai_recommendation_score, 1),
-                'expected_date': pc.expected_promotion_date.strftime('%Y-%m-%d') if pc.expected_promotion_date else '-',
-                'plan': pc.development_plan.get('summary', '개발 계획 수립 중') if isinstance(pc.development_plan, dict) else '개발 계획 수립 중'
+                'id': ts.promotion_id,
+                'name': ts.name,
+                'current_position': ts.promotion_current_position,
+                'target_position': ts.target_position,
+                'readiness': ts.get_readiness_level_display(),
+                'ai_score': round(ts.promotion_score, 1),
+                'expected_date': ts.expected_promotion_date.strftime('%Y-%m-%d') if ts.expected_promotion_date else '-',
+                'plan': ts.development_plan.get('summary', '개발 계획 수립 중') if isinstance(ts.development_plan, dict) else '개발 계획 수립 중'
             })
         
         # 이직 위험 데이터
         retention_risks = []
-        for rr in RetentionRisk.objects.filter(
-            risk_level__in=['CRITICAL', 'HIGH']
-        ).select_related('employee', 'assigned_to')[:10]:
+        for ts in TalentSummary.objects.filter(is_high_risk=True).order_by('-risk_score')[:10]:
             retention_risks.append({
-                'id': rr.id,
-                'name': rr.employee.name,
-                'department': rr.employee.department or '-',
-                'risk_level': rr.get_risk_level_display(),
-                'risk_score': round(rr.risk_score, 1),
-                'factors': ', '.join(rr.risk_factors[:2]) if rr.risk_factors else '분석 중',
-                'strategy': rr.retention_strategy[:50] + '...' if len(rr.retention_strategy) > 50 else rr.retention_strategy,
-                'status': rr.get_action_status_display(),
-                'assigned': rr.assigned_to.username if rr.assigned_to else '미지정'
+                'id': ts.retention_id,
+                'name': ts.name,
+                'department': ts.department or '-',
+                'risk_level': ts.get_risk_level_display(),
+                'risk_score': round(ts.risk_score, 1),
+                'factors': ', '.join(ts.risk_factors[:2]) if ts.risk_factors else '분석 중',
+                'strategy': ts.retention_strategy[:50] + '...' if len(ts.retention_strategy) > 50 else ts.retention_strategy,
+                'status': ts.get_action_status_display(),
+                'assigned': ts.assigned_to_name or '미지정'
             })
         
         return JsonResponse({
@@ -119,21 +121,13 @@ def talent_detail_api(request, employee_id):
     try:
         from employees.models import Employee
         
-        employee = Employee.objects.get(id=employee_id)
-        
-        # 인재풀 정보
-        talent_pool = TalentPool.objects.filter(employee=employee).first()
-        
-        # 승진 후보 정보
-        promotion = PromotionCandidate.objects.filter(employee=employee, is_active=True).first()
-        
-        # 이직 위험 정보
-        retention = RetentionRisk.objects.filter(employee=employee).first()
+        summary = TalentSummary.objects.filter(pk=employee_id).first()
+        employee = summary or Employee.objects.only('id', 'name', 'department', 'position', 'hire_date').get(id=employee_id)
         
         data = {
             'success': True,
             'employee': {
-                'id': employee.id,
+                'id': employee.pk,
                 'name': employee.name,
                 'department': employee.department,
                 'position': employee.position,
@@ -144,41 +138,44 @@ def talent_detail_api(request, employee_id):
             'retention_risk': None
         }
         
-        if talent_pool:
+        if summary is None:
+            return JsonResponse(data)
+        
+        if summary.talent_pool_id:
             data['talent_pool'] = {
-                'category': talent_pool.category.get_category_code_display(),
-                'ai_score': round(talent_pool.ai_score, 1),
-                'confidence': round(talent_pool.confidence_level * 100, 0),
-                'strengths': talent_pool.strengths,
-                'development_areas': talent_pool.development_areas,
-                'recommendations': talent_pool.recommendations,
-                'status': talent_pool.status,
-                'analyzed_date': talent_pool.added_at.strftime('%Y-%m-%d')
+                'category': summary.get_talent_category_display(),
+                'ai_score': round(summary.ai_score, 1),
+                'confidence': round(summary.confidence_level * 100, 0),
+                'strengths': summary.strengths,
+                'development_areas': summary.development_areas,
+                'recommendations': summary.recommendations,
+                'status': summary.talent_status,
+                'analyzed_date': summary.talent_added_at.strftime('%Y-%m-%d')
             }
         
-        if promotion:
+        if summary.promotion_id:
             data['promotion'] = {
-                'current_position': promotion.current_position,
-                'target_position': promotion.target_position,
-                'readiness': promotion.get_readiness_level_display(),
-                'performance_score': round(promotion.performance_score, 1),
-                'potential_score': round(promotion.potential_score, 1),
-                'ai_score': round(promotion.ai_recommendation_score, 1),
-                'expected_date': promotion.expected_promotion_date.strftime('%Y-%m-%d') if promotion.expected_promotion_date else None,
-                'development_plan': promotion.development_plan,
-                'completed_requirements': promotion.completed_requirements,
-                'pending_requirements': promotion.pending_requirements
+                'current_position': summary.promotion_current_position,
+                'target_position': summary.target_position,
+                'readiness': summary.get_readiness_level_display(),
+                'performance_score': round(summary.performance_score, 1),
+                'potential_score': round(summary.potential_score, 1),
+                'ai_score': round(summary.promotion_score, 1),
+                'expected_date': summary.expected_promotion_date.strftime('%Y-%m-%d') if summary.expected_promotion_date else None,
+                'development_plan': summary.development_plan,
+                'completed_requirements': summary.completed_requirements,
+                'pending_requirements': summary.pending_requirements
             }
         
-        if retention:
+        if summary.retention_id:
             data['retention_risk'] = {
-                'risk_level': retention.get_risk_level_display(),
-                'risk_score': round(retention.risk_score, 1),
-                'risk_factors': retention.risk_factors,
-                'strategy': retention.retention_strategy,
-                'action_items': retention.action_items,
-                'status': retention.get_action_status_display(),
-                'assigned_to': retention.assigned_to.username if retention.assigned_to else None
+                'risk_level': summary.get_risk_level_display(),
+                'risk_score': round(summary.risk_score, 1),
+                'risk_factors': summary.risk_factors,
+                'strategy': summary.retention_strategy,
+                'action_items': summary.action_items,
+                'status': summary.get_action_status_display(),
+                'assigned_to': summary.assigned_to_name or None
             }
         
         return JsonResponse(data)
@@ -7,7 +7,9 @@ class EmployeesConfig(AppConfig):
     name = "employees"
     
     def ready(self):
-        """앱 시작 시 필요한 테이블 자동 생성"""
+        """앱 시작 시 시그널 등록 + 필요한 테이블 자동 생성"""
+        from . import signals  # noqa: F401
+        
         # Railway 환경에서만 실행
         if os.getenv('RAILWAY_ENVIRONMENT') or os.getenv('DATABASE_URL'):
             from django.db import connection
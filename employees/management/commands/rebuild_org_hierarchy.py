@@ -0,0 +1,17 @@
+"""
+Django 관리 명령어 - 조직 계층(closure) 테이블과 재직 인원 재계산
+조직/직원을 queryset.update 나 bulk 적재로 변경한 뒤 실행합니다.
+"""
+from django.core.management.base import BaseCommand
+
+from employees.models import OrganizationStructure
+
+
+class Command(BaseCommand):
+    help = '조직 계층(closure) 테이블과 조직별 재직 인원을 재계산합니다.'
+    
+    def handle(self, *args, **options):
+        paths = OrganizationStructure.rebuild_hierarchy()
+        self.stdout.write(self.style.SUCCESS(
+            f"조직 계층 재계산 완료: 조직 {OrganizationStructure.objects.count()}개, 계층 경로 {paths}건"
+        ))
@@ -0,0 +1,15 @@
+"""
+Django 관리 명령어 - 직원별 인재 현황 요약(TalentSummary) 재계산
+인재풀/승진 후보/이직 위험을 queryset.update 나 bulk 적재로 변경한 뒤 실행합니다.
+"""
+from django.core.management.base import BaseCommand
+
+from employees.models_talent import TalentSummary
+
+
+class Command(BaseCommand):
+    help = '직원별 인재 현황 요약(인재풀/승진 후보/이직 위험)을 재계산합니다.'
+    
+    def handle(self, *args, **options):
+        count = TalentSummary.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"인재 현황 요약 재계산 완료: 직원 {count}명"))
@@ -0,0 +1,69 @@
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def build_hierarchy(apps, schema_editor):
+    """기존 조직으로 closure 테이블과 하위 포함 재직 인원 채우기"""
+    OrganizationStructure = apps.get_model('employees', 'OrganizationStructure')
+    OrganizationClosure = apps.get_model('employees', 'OrganizationClosure')
+    Employee = apps.get_model('employees', 'Employee')
+
+    parents = dict(OrganizationStructure.objects.values_list('id', 'parent_id'))
+    direct = defaultdict(int)
+    for organization_id in Employee.objects.filter(
+        employment_status='재직', organization__isnull=False
+    ).values_list('organization_id', flat=True):
+        direct[organization_id] += 1
+
+    rows = []
+    rollup = defaultdict(int)
+    for org_id in parents:
+        node, depth, seen = org_id, 0, set()
+        while node is not None and node not in seen:
+            seen.add(node)
+            rows.append(OrganizationClosure(ancestor_id=node, descendant_id=org_id, depth=depth))
+            rollup[node] += direct[org_id]
+            node = parents.get(node)
+            depth += 1
+    OrganizationClosure.objects.bulk_create(rows, batch_size=1000)
+
+    orgs = list(OrganizationStructure.objects.only('id'))
+    for org in orgs:
+        org.headcount = rollup[org.id]
+    OrganizationStructure.objects.bulk_update(orgs, ['headcount'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0005_talentcategory_talentpool_talentdevelopment_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organizationstructure',
+            name='headcount',
+            field=models.IntegerField(default=0, help_text='하위 조직 포함 재직 직원 수', verbose_name='재직인원'),
+        ),
+        migrations.CreateModel(
+            name='OrganizationClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField(default=0, verbose_name='거리')),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='employees.organizationstructure', verbose_name='상위조직')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='employees.organizationstructure', verbose_name='하위조직')),
+            ],
+            options={
+                'verbose_name': '조직계층',
+                'verbose_name_plural': '조직계층',
+                'indexes': [
+                    models.Index(fields=['ancestor', 'depth'], name='employees_o_ancesto_ba0d56_idx'),
+                    models.Index(fields=['descendant', 'depth'], name='employees_o_descend_456b37_idx'),
+                ],
+                'unique_together': {('ancestor', 'descendant')},
+            },
+        ),
+        migrations.RunPython(build_hierarchy, migrations.RunPython.noop),
+    ]
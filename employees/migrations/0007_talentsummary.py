@@ -0,0 +1,167 @@
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+TALENT_STATUSES = ('ACTIVE', 'MONITORING')
+HIGH_RISK_LEVELS = ('CRITICAL', 'HIGH')
+OPEN_ACTIONS = ('PENDING', 'IN_PROGRESS')
+
+
+def summarize(employee, talent_pools, promotions, risks):
+    """직원 한 명의 원본 행들로 TalentSummary 필드 계산 (대표 이직 위험 = 최고 점수 행)"""
+    if not (talent_pools or promotions or risks):
+        return None
+
+    summary = {
+        'name': employee.name,
+        'department': employee.department or '',
+        'position': employee.position or '',
+        'hire_date': employee.hire_date,
+    }
+
+    pools = [tp for tp in talent_pools if tp.status in TALENT_STATUSES]
+    codes = {(tp.category.category_code, tp.status) for tp in talent_pools}
+    summary['in_talent_pool'] = bool(pools)
+    summary['is_core_talent'] = ('CORE_TALENT', 'ACTIVE') in codes
+    summary['needs_attention'] = any(('NEEDS_ATTENTION', status) in codes for status in TALENT_STATUSES)
+    if talent_pools:
+        tp = max(pools or talent_pools, key=lambda p: (p.ai_score, p.added_at.timestamp() if p.added_at else 0))
+        summary.update(
+            talent_pool_id=tp.pk,
+            talent_category=tp.category.category_code,
+            talent_status=tp.status,
+            ai_score=tp.ai_score,
+            confidence_level=tp.confidence_level,
+            strengths=tp.strengths,
+            development_areas=tp.development_areas,
+            recommendations=tp.recommendations,
+            talent_added_at=tp.added_at,
+        )
+
+    active = [pc for pc in promotions if pc.is_active]
+    summary['is_promotion_candidate'] = bool(active)
+    if active:
+        pc = max(active, key=lambda p: (p.ai_recommendation_score, p.performance_score))
+        summary.update(
+            promotion_id=pc.pk,
+            promotion_current_position=pc.current_position,
+            target_position=pc.target_position,
+            readiness_level=pc.readiness_level,
+            performance_score=pc.performance_score,
+            potential_score=pc.potential_score,
+            promotion_score=pc.ai_recommendation_score,
+            expected_promotion_date=pc.expected_promotion_date,
+            development_plan=pc.development_plan,
+            completed_requirements=pc.completed_requirements,
+            pending_requirements=pc.pending_requirements,
+        )
+
+    if risks:
+        rr = max(risks, key=lambda r: (r.risk_score, r.identified_date.timestamp() if r.identified_date else 0))
+        summary.update(
+            retention_id=rr.pk,
+            risk_level=rr.risk_level,
+            risk_score=rr.risk_score,
+            risk_factors=rr.risk_factors,
+            retention_strategy=rr.retention_strategy,
+            action_items=rr.action_items,
+            action_status=rr.action_status,
+            assigned_to_name=rr.assigned_to.username if rr.assigned_to else '',
+            is_high_risk=rr.risk_level in HIGH_RISK_LEVELS,
+        )
+    summary['is_open_risk'] = any(
+        r.risk_level in HIGH_RISK_LEVELS and r.action_status in OPEN_ACTIONS for r in risks
+    )
+    return summary
+
+
+def build_talent_summary(apps, schema_editor):
+    """기존 인재풀/승진 후보/이직 위험으로 직원별 인재 현황 요약 채우기"""
+    Employee = apps.get_model('employees', 'Employee')
+    TalentPool = apps.get_model('employees', 'TalentPool')
+    PromotionCandidate = apps.get_model('employees', 'PromotionCandidate')
+    RetentionRisk = apps.get_model('employees', 'RetentionRisk')
+    TalentSummary = apps.get_model('employees', 'TalentSummary')
+
+    grouped = defaultdict(lambda: ([], [], []))
+    for tp in TalentPool.objects.select_related('category'):
+        grouped[tp.employee_id][0].append(tp)
+    for pc in PromotionCandidate.objects.all():
+        grouped[pc.employee_id][1].append(pc)
+    for rr in RetentionRisk.objects.select_related('assigned_to'):
+        grouped[rr.employee_id][2].append(rr)
+
+    summaries = []
+    for employee in Employee.objects.filter(pk__in=list(grouped)):
+        fields = summarize(employee, *grouped[employee.pk])
+        if fields is not None:
+            summaries.append(TalentSummary(employee_id=employee.pk, **fields))
+    TalentSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0006_organizationclosure_headcount'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TalentSummary',
+            fields=[
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='talent_summary', serialize=False, to='employees.employee', verbose_name='직원')),
+                ('name', models.CharField(max_length=100, verbose_name='이름')),
+                ('department', models.CharField(blank=True, max_length=100, verbose_name='부서')),
+                ('position', models.CharField(blank=True, max_length=50, verbose_name='직급')),
+                ('hire_date', models.DateField(blank=True, null=True, verbose_name='입사일')),
+                ('talent_pool_id', models.BigIntegerField(blank=True, null=True, verbose_name='인재풀 ID')),
+                ('talent_category', models.CharField(blank=True, choices=[('CORE_TALENT', '핵심인재'), ('HIGH_POTENTIAL', '고잠재인력'), ('PROMOTION_CANDIDATE', '승진후보자'), ('NEEDS_ATTENTION', '관리필요인력'), ('RETENTION_RISK', '이직위험군'), ('STAR_PERFORMER', '우수성과자'), ('FUTURE_LEADER', '미래리더'), ('SPECIALIST', '전문가그룹')], max_length=50, verbose_name='인재 카테고리')),
+                ('talent_status', models.CharField(blank=True, choices=[('ACTIVE', '활성'), ('MONITORING', '모니터링'), ('PENDING', '검토중'), ('EXCLUDED', '제외')], max_length=20, verbose_name='인재풀 상태')),
+                ('ai_score', models.FloatField(blank=True, null=True, verbose_name='AI 평가 점수')),
+                ('confidence_level', models.FloatField(blank=True, null=True, verbose_name='신뢰도')),
+                ('strengths', models.JSONField(default=list, verbose_name='강점')),
+                ('development_areas', models.JSONField(default=list, verbose_name='개발영역')),
+                ('recommendations', models.JSONField(default=list, verbose_name='추천사항')),
+                ('talent_added_at', models.DateTimeField(blank=True, null=True, verbose_name='인재풀 추가일')),
+                ('promotion_id', models.BigIntegerField(blank=True, null=True, verbose_name='승진 후보 ID')),
+                ('promotion_current_position', models.CharField(blank=True, max_length=50, verbose_name='현재 직급')),
+                ('target_position', models.CharField(blank=True, max_length=50, verbose_name='목표 직급')),
+                ('readiness_level', models.CharField(blank=True, choices=[('READY', '준비됨'), ('NEAR_READY', '곧 준비됨'), ('DEVELOPING', '개발중'), ('NOT_READY', '준비안됨')], max_length=20, verbose_name='준비도')),
+                ('performance_score', models.FloatField(blank=True, null=True, verbose_name='성과 점수')),
+                ('potential_score', models.FloatField(blank=True, null=True, verbose_name='잠재력 점수')),
+                ('promotion_score', models.FloatField(blank=True, null=True, verbose_name='AI 추천 점수')),
+                ('expected_promotion_date', models.DateField(blank=True, null=True, verbose_name='예상 승진일')),
+                ('development_plan', models.JSONField(default=dict, verbose_name='개발 계획')),
+                ('completed_requirements', models.JSONField(default=list, verbose_name='완료된 요구사항')),
+                ('pending_requirements', models.JSONField(default=list, verbose_name='대기중인 요구사항')),
+                ('retention_id', models.BigIntegerField(blank=True, null=True, verbose_name='이직 위험 ID')),
+                ('risk_level', models.CharField(blank=True, choices=[('CRITICAL', '매우높음'), ('HIGH', '높음'), ('MEDIUM', '중간'), ('LOW', '낮음')], max_length=20, verbose_name='위험 수준')),
+                ('risk_score', models.FloatField(blank=True, null=True, verbose_name='위험 점수')),
+                ('risk_factors', models.JSONField(default=list, verbose_name='위험 요인')),
+                ('retention_strategy', models.TextField(blank=True, verbose_name='유지 전략')),
+                ('action_items', models.JSONField(default=list, verbose_name='조치 항목')),
+                ('action_status', models.CharField(blank=True, choices=[('PENDING', '대기중'), ('IN_PROGRESS', '진행중'), ('COMPLETED', '완료'), ('FAILED', '실패')], max_length=20, verbose_name='조치 상태')),
+                ('assigned_to_name', models.CharField(blank=True, max_length=150, verbose_name='담당자')),
+                ('in_talent_pool', models.BooleanField(default=False, verbose_name='인재풀 활성/모니터링')),
+                ('is_core_talent', models.BooleanField(default=False, verbose_name='핵심인재')),
+                ('needs_attention', models.BooleanField(default=False, verbose_name='관리필요인력')),
+                ('is_promotion_candidate', models.BooleanField(default=False, verbose_name='승진 후보')),
+                ('is_high_risk', models.BooleanField(default=False, verbose_name='이직 고위험')),
+                ('is_open_risk', models.BooleanField(default=False, verbose_name='이직 고위험 조치 대기/진행')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='갱신일')),
+            ],
+            options={
+                'verbose_name': '인재 현황 요약',
+                'verbose_name_plural': '인재 현황 요약',
+                'indexes': [
+                    models.Index(fields=['in_talent_pool', '-ai_score'], name='talent_summary_pool_idx'),
+                    models.Index(fields=['talent_category', '-ai_score'], name='talent_summary_category_idx'),
+                    models.Index(fields=['is_promotion_candidate', '-promotion_score'], name='talent_summary_promotion_idx'),
+                    models.Index(fields=['is_high_risk', '-risk_score'], name='talent_summary_risk_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(build_talent_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,117 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+
+TALENT_STATUSES = ('ACTIVE', 'MONITORING')
+HIGH_RISK_LEVELS = ('CRITICAL', 'HIGH')
+OPEN_ACTIONS = ('PENDING', 'IN_PROGRESS')
+
+
+def summarize(employee, talent_pools, promotions, risks):
+    """직원 한 명의 원본 행들로 TalentSummary 필드 계산 (고위험 = 고위험 행이 하나라도 있으면, 대표 이직 위험은 고위험 행 우선)"""
+    if not (talent_pools or promotions or risks):
+        return None
+
+    summary = {
+        'name': employee.name,
+        'department': employee.department or '',
+        'position': employee.position or '',
+        'hire_date': employee.hire_date,
+    }
+
+    pools = [tp for tp in talent_pools if tp.status in TALENT_STATUSES]
+    codes = {(tp.category.category_code, tp.status) for tp in talent_pools}
+    summary['in_talent_pool'] = bool(pools)
+    summary['is_core_talent'] = ('CORE_TALENT', 'ACTIVE') in codes
+    summary['needs_attention'] = any(('NEEDS_ATTENTION', status) in codes for status in TALENT_STATUSES)
+    if talent_pools:
+        tp = max(pools or talent_pools, key=lambda p: (p.ai_score, p.added_at.timestamp() if p.added_at else 0))
+        summary.update(
+            talent_pool_id=tp.pk,
+            talent_category=tp.category.category_code,
+            talent_status=tp.status,
+            ai_score=tp.ai_score,
+            confidence_level=tp.confidence_level,
+            strengths=tp.strengths,
+            development_areas=tp.development_areas,
+            recommendations=tp.recommendations,
+            talent_added_at=tp.added_at,
+        )
+
+    active = [pc for pc in promotions if pc.is_active]
+    summary['is_promotion_candidate'] = bool(active)
+    if active:
+        pc = max(active, key=lambda p: (p.ai_recommendation_score, p.performance_score))
+        summary.update(
+            promotion_id=pc.pk,
+            promotion_current_position=pc.current_position,
+            target_position=pc.target_position,
+            readiness_level=pc.readiness_level,
+            performance_score=pc.performance_score,
+            potential_score=pc.potential_score,
+            promotion_score=pc.ai_recommendation_score,
+            expected_promotion_date=pc.expected_promotion_date,
+            development_plan=pc.development_plan,
+            completed_requirements=pc.completed_requirements,
+            pending_requirements=pc.pending_requirements,
+        )
+
+    high_risks = [r for r in risks if r.risk_level in HIGH_RISK_LEVELS]
+    summary['is_high_risk'] = bool(high_risks)
+    if risks:
+        rr = max(high_risks or risks, key=lambda r: (r.risk_score, r.identified_date.timestamp() if r.identified_date else 0))
+        summary.update(
+            retention_id=rr.pk,
+            risk_level=rr.risk_level,
+            risk_score=rr.risk_score,
+            risk_factors=rr.risk_factors,
+            retention_strategy=rr.retention_strategy,
+            action_items=rr.action_items,
+            action_status=rr.action_status,
+            assigned_to_name=rr.assigned_to.username if rr.assigned_to else '',
+        )
+    summary['is_open_risk'] = any(
+        r.risk_level in HIGH_RISK_LEVELS and r.action_status in OPEN_ACTIONS for r in risks
+    )
+    return summary
+
+
+def rebuild_talent_summary(apps, schema_editor):
+    """고위험 플래그/대표 이직 위험 행 기준이 바뀌어 요약 전체 재계산"""
+    Employee = apps.get_model('employees', 'Employee')
+    TalentPool = apps.get_model('employees', 'TalentPool')
+    PromotionCandidate = apps.get_model('employees', 'PromotionCandidate')
+    RetentionRisk = apps.get_model('employees', 'RetentionRisk')
+    TalentSummary = apps.get_model('employees', 'TalentSummary')
+
+    grouped = defaultdict(lambda: ([], [], []))
+    for tp in TalentPool.objects.select_related('category'):
+        grouped[tp.employee_id][0].append(tp)
+    for pc in PromotionCandidate.objects.all():
+        grouped[pc.employee_id][1].append(pc)
+    for rr in RetentionRisk.objects.select_related('assigned_to'):
+        grouped[rr.employee_id][2].append(rr)
+
+    summaries = []
+    for employee in Employee.objects.filter(pk__in=list(grouped)):
+        fields = summarize(employee, *grouped[employee.pk])
+        if fields is not None:
+            summaries.append(TalentSummary(employee_id=employee.pk, **fields))
+    TalentSummary.objects.all().delete()
+    TalentSummary.objects.bulk_create(summaries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0007_talentsummary'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='talentsummary',
+            name='talent_summary_category_idx',
+        ),
+        migrations.RunPython(rebuild_talent_summary, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0008_talentsummary_multi_category'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='organizationstructure',
+            name='headcount',
+            field=models.IntegerField(default=0, editable=False, help_text='하위 조직 포함 재직 직원 수', verbose_name='재직인원'),
+        ),
+    ]
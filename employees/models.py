@@ -9,7 +9,7 @@ from .models_hr import HREmployee, HRMonthlySnapshot, HRContractor, HRFileUpload
 from .models_workforce import WeeklyWorkforceSnapshot, WeeklyJoinLeave, WeeklyWorkforceChange
 
 # Organization Structure models import
-from .models_organization import OrganizationStructure, OrganizationUploadHistory, EmployeeOrganizationMapping
+from .models_organization import OrganizationStructure, OrganizationClosure, OrganizationUploadHistory, EmployeeOrganizationMapping
 
 # Create your models here.
 
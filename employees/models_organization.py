@@ -1,8 +1,30 @@
-from django.db import models
+from collections import defaultdict
+from django.db import models, transaction
+from django.db.models import F
 from django.contrib.auth.models import User
 from datetime import datetime
 
 
+def hierarchy_rollup(parents, direct_headcount):
+    """조직 계층 closure 경로와 하위 포함 인원 계산
+
+    parents: {조직 ID: 상위 조직 ID 또는 None}
+    direct_headcount: {조직 ID: 직접 소속 재직 인원}
+    반환: ([(ancestor_id, descendant_id, depth), ...], {조직 ID: 하위 포함 인원})
+    """
+    paths = []
+    rollup = defaultdict(int)
+    for org_id in parents:
+        node, depth, seen = org_id, 0, set()
+        while node is not None and node not in seen:
+            seen.add(node)
+            paths.append((node, org_id, depth))
+            rollup[node] += direct_headcount.get(org_id, 0)
+            node = parents.get(node)
+            depth += 1
+    return paths, dict(rollup)
+
+
 class OrganizationStructure(models.Model):
     """
     조직 구조 마스터 테이블
@@ -81,6 +103,9 @@ class OrganizationStructure(models.Model):
     # 정렬 순서
     sort_order = models.IntegerField(default=0, verbose_name='정렬순서')
     
+    # 재직 인원 (하위 조직 포함, 직원 소속/재직상태 변경 시 employees/signals.py 에서 증분 갱신)
+    headcount = models.IntegerField(default=0, editable=False, verbose_name='재직인원', help_text='하위 조직 포함 재직 직원 수')
+    
     # 메타데이터
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
@@ -106,7 +131,19 @@ class OrganizationStructure(models.Model):
         return f"[{self.get_org_level_display()}] {self.org_name}"
     
     def save(self, *args, **kwargs):
-        """저장 시 full_path 자동 생성"""
+        """저장 시 full_path 자동 생성 + 계층(closure) 테이블 유지"""
+        is_new = self._state.adding
+        update_fields = kwargs.get('update_fields')
+        old_parent_id = None
+        parent_changed = False
+        if not is_new and (update_fields is None or 'parent' in update_fields):
+            old_parent_id = OrganizationStructure.objects.filter(pk=self.pk).values_list('parent_id', flat=True).first()
+            parent_changed = old_parent_id != self.parent_id
+            if parent_changed and self.parent_id and OrganizationClosure.objects.filter(
+                ancestor_id=self.pk, descendant_id=self.parent_id
+            ).exists():
+                raise ValueError(f"하위 조직을 상위 조직으로 지정할 수 없습니다: {self.org_code}")
+        
         # 전체 경로 생성
         path_parts = []
         current = self
@@ -118,7 +155,103 @@ class OrganizationStructure(models.Model):
         # 각 레벨별 명칭 저장
         self._set_level_names(path_parts)
         
-        super().save(*args, **kwargs)
+        # 재직 인원은 adjust_headcount/_move_subtree/rebuild_hierarchy 가 F() 로만 갱신
+        # (메모리에 읽어 둔 값으로 덮어쓰면 그 사이의 증감이 사라짐)
+        if not is_new:
+            if update_fields is None:
+                update_fields = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name != 'headcount'
+                ]
+            kwargs['update_fields'] = [name for name in update_fields if name != 'headcount']
+        
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if is_new:
+                self._insert_closure()
+            elif parent_changed:
+                self._move_subtree(old_parent_id)
+    
+    def delete(self, *args, **kwargs):
+        """삭제 시 상위 조직 재직 인원 차감 (하위 조직/closure 행은 CASCADE)"""
+        with transaction.atomic():
+            headcount = OrganizationStructure.objects.filter(pk=self.pk).values_list('headcount', flat=True).first()
+            if headcount and self.parent_id:
+                OrganizationStructure.adjust_headcount(self.parent_id, -headcount)
+            return super().delete(*args, **kwargs)
+    
+    def _insert_closure(self):
+        """신규 조직: 자기 자신 + 상위 조직 경로 행 추가"""
+        rows = [OrganizationClosure(ancestor_id=self.pk, descendant_id=self.pk, depth=0)]
+        if self.parent_id:
+            rows.extend(
+                OrganizationClosure(ancestor_id=ancestor_id, descendant_id=self.pk, depth=depth + 1)
+                for ancestor_id, depth in OrganizationClosure.objects.filter(
+                    descendant_id=self.parent_id
+                ).values_list('ancestor_id', 'depth')
+            )
+        OrganizationClosure.objects.bulk_create(rows)
+    
+    def _move_subtree(self, old_parent_id):
+        """상위 조직 변경: 하위 트리 전체의 상위 경로 교체 + 재직 인원 이동"""
+        subtree = list(OrganizationClosure.objects.filter(ancestor_id=self.pk).values_list('descendant_id', 'depth'))
+        headcount = OrganizationStructure.objects.filter(pk=self.pk).values_list('headcount', flat=True).first() or 0
+        
+        if old_parent_id:
+            old_ancestor_ids = list(
+                OrganizationClosure.objects.filter(descendant_id=old_parent_id).values_list('ancestor_id', flat=True)
+            )
+            OrganizationClosure.objects.filter(
+                ancestor_id__in=old_ancestor_ids, descendant_id__in=[descendant_id for descendant_id, _ in subtree]
+            ).delete()
+            if headcount:
+                OrganizationStructure.objects.filter(pk__in=old_ancestor_ids).update(headcount=F('headcount') - headcount)
+        
+        if self.parent_id:
+            new_ancestors = list(
+                OrganizationClosure.objects.filter(descendant_id=self.parent_id).values_list('ancestor_id', 'depth')
+            )
+            OrganizationClosure.objects.bulk_create([
+                OrganizationClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth + sub_depth + 1)
+                for ancestor_id, depth in new_ancestors
+                for descendant_id, sub_depth in subtree
+            ], batch_size=1000)
+            if headcount:
+                OrganizationStructure.objects.filter(
+                    pk__in=[ancestor_id for ancestor_id, _ in new_ancestors]
+                ).update(headcount=F('headcount') + headcount)
+    
+    @classmethod
+    def adjust_headcount(cls, org_id, delta):
+        """조직과 모든 상위 조직의 재직 인원 증감 (closure 서브쿼리 UPDATE 한 번)"""
+        return cls.objects.filter(
+            pk__in=OrganizationClosure.objects.filter(descendant_id=org_id).values('ancestor_id')
+        ).update(headcount=F('headcount') + delta)
+    
+    @classmethod
+    def rebuild_hierarchy(cls):
+        """closure 테이블과 재직 인원 전체 재계산 (queryset.update/bulk 적재 등 시그널을 거치지 않은 변경 후)"""
+        from django.db.models import Count
+        from .models import Employee
+        
+        parents = dict(cls.objects.values_list('id', 'parent_id'))
+        direct = dict(
+            Employee.objects.filter(employment_status='재직', organization__isnull=False)
+            .values_list('organization').annotate(count=Count('id')).values_list('organization', 'count')
+        )
+        paths, rollup = hierarchy_rollup(parents, direct)
+        
+        with transaction.atomic():
+            OrganizationClosure.objects.all().delete()
+            OrganizationClosure.objects.bulk_create([
+                OrganizationClosure(ancestor_id=ancestor_id, descendant_id=descendant_id, depth=depth)
+                for ancestor_id, descendant_id, depth in paths
+            ], batch_size=1000)
+            orgs = list(cls.objects.only('id', 'headcount'))
+            for org in orgs:
+                org.headcount = rollup.get(org.id, 0)
+            cls.objects.bulk_update(orgs, ['headcount'], batch_size=1000)
+        return len(paths)
     
     def _set_level_names(self, path_parts):
         """레벨별 명칭 설정"""
@@ -142,38 +275,59 @@ class OrganizationStructure(models.Model):
             current = current.parent
     
     def get_descendants(self, include_self=False):
-        """하위 조직 전체 조회"""
-        descendants = []
-        if include_self:
-            descendants.append(self)
-        
-        for child in self.children.all():
-            descendants.append(child)
-            descendants.extend(child.get_descendants())
-        
-        return descendants
+        """하위 조직 전체 조회 (closure 조회 한 번, 상위 조직이 먼저 오도록 깊이순)"""
+        return list(
+            OrganizationStructure.objects.filter(
+                ancestor_links__ancestor=self,
+                ancestor_links__depth__gte=0 if include_self else 1,
+            ).order_by('ancestor_links__depth', 'sort_order', 'org_code')
+        )
     
     def get_ancestors(self, include_self=False):
-        """상위 조직 전체 조회"""
-        ancestors = []
-        if include_self:
-            ancestors.append(self)
-        
-        current = self.parent
-        while current:
-            ancestors.append(current)
-            current = current.parent
-        
-        return ancestors
+        """상위 조직 전체 조회 (가까운 상위 조직부터)"""
+        return list(
+            OrganizationStructure.objects.filter(
+                descendant_links__descendant=self,
+                descendant_links__depth__gte=0 if include_self else 1,
+            ).order_by('descendant_links__depth')
+        )
     
     def get_employee_count(self):
-        """소속 직원 수 (하위 조직 포함)"""
-        from .models import Employee
-        org_ids = [org.id for org in self.get_descendants(include_self=True)]
-        return Employee.objects.filter(
-            organization__in=org_ids,
-            employment_status='재직'
-        ).count()
+        """소속 직원 수 (하위 조직 포함, 재직 인원 집계 컬럼)"""
+        return self.headcount
+
+
+class OrganizationClosure(models.Model):
+    """
+    조직 계층 closure 테이블
+    (상위 조직, 하위 조직, 거리) 쌍을 모두 저장해 하위 트리/상위 경로를 인덱스 조회 한 번으로 읽습니다.
+    OrganizationStructure.save() 에서 유지, 전체 재계산은 manage.py rebuild_org_hierarchy
+    """
+    ancestor = models.ForeignKey(
+        OrganizationStructure,
+        on_delete=models.CASCADE,
+        related_name='descendant_links',
+        verbose_name='상위조직'
+    )
+    descendant = models.ForeignKey(
+        OrganizationStructure,
+        on_delete=models.CASCADE,
+        related_name='ancestor_links',
+        verbose_name='하위조직'
+    )
+    depth = models.PositiveSmallIntegerField(default=0, verbose_name='거리')
+    
+    class Meta:
+        verbose_name = '조직계층'
+        verbose_name_plural = '조직계층'
+        unique_together = [['ancestor', 'descendant']]
+        indexes = [
+            models.Index(fields=['ancestor', 'depth']),
+            models.Index(fields=['descendant', 'depth']),
+        ]
+    
+    def __str__(self):
+        return f"{self.ancestor_id} > {self.descendant_id} ({self.depth})"
 
 
 class OrganizationUploadHistory(models.Model):
@@ -293,4 +293,208 @@ class TalentDevelopment(models.Model):
         ordering = ['-priority', '-created_at']
     
     def __str__(self):
-        return f"{self.employee.name} - {self.development_goal}"
\ No newline at end of file
+        return f"{self.employee.name} - {self.development_goal}"
+
+class TalentSummary(models.Model):
+    """직원별 인재 현황 요약 (읽기 모델)
+    
+    인재풀/승진 후보/이직 위험을 직원당 한 행으로 비정규화해 대시보드 통계, 상위 목록, 상세 카드를
+    각각 인덱스 쿼리 한 번으로 조회합니다.
+    - 대표 행: 인재풀은 활성/모니터링 중 AI 점수 최고 (없으면 전체 중 최고), 승진 후보는 활성 중 추천 점수 최고,
+      이직 위험은 고위험(HIGH/CRITICAL) 중 위험 점수 최고 (없으면 전체 중 최고)
+    - 한 직원이 여러 카테고리에 속할 수 있으므로 카테고리별 목록은 요약이 아니라 TalentPool 에서 조회
+    - 갱신: 원본 저장/삭제 시그널이 해당 직원만, AIRISS 일괄 동기화는 refresh() 로 대상 직원만 다시 계산
+    """
+    TALENT_STATUSES = ('ACTIVE', 'MONITORING')
+    HIGH_RISK_LEVELS = ('CRITICAL', 'HIGH')
+    OPEN_ACTIONS = ('PENDING', 'IN_PROGRESS')
+    
+    employee = models.OneToOneField(
+        Employee, on_delete=models.CASCADE, primary_key=True,
+        related_name='talent_summary', verbose_name='직원'
+    )
+    
+    # 직원 정보
+    name = models.CharField(max_length=100, verbose_name='이름')
+    department = models.CharField(max_length=100, blank=True, verbose_name='부서')
+    position = models.CharField(max_length=50, blank=True, verbose_name='직급')
+    hire_date = models.DateField(null=True, blank=True, verbose_name='입사일')
+    
+    # 인재풀
+    talent_pool_id = models.BigIntegerField(null=True, blank=True, verbose_name='인재풀 ID')
+    talent_category = models.CharField(max_length=50, blank=True, choices=TalentCategory.CATEGORY_TYPES, verbose_name='인재 카테고리')
+    talent_status = models.CharField(max_length=20, blank=True, choices=TalentPool.STATUS_CHOICES, verbose_name='인재풀 상태')
+    ai_score = models.FloatField(null=True, blank=True, verbose_name='AI 평가 점수')
+    confidence_level = models.FloatField(null=True, blank=True, verbose_name='신뢰도')
+    strengths = models.JSONField(default=list, verbose_name='강점')
+    development_areas = models.JSONField(default=list, verbose_name='개발영역')
+    recommendations = models.JSONField(default=list, verbose_name='추천사항')
+    talent_added_at = models.DateTimeField(null=True, blank=True, verbose_name='인재풀 추가일')
+    
+    # 승진 후보
+    promotion_id = models.BigIntegerField(null=True, blank=True, verbose_name='승진 후보 ID')
+    promotion_current_position = models.CharField(max_length=50, blank=True, verbose_name='현재 직급')
+    target_position = models.CharField(max_length=50, blank=True, verbose_name='목표 직급')
+    readiness_level = models.CharField(max_length=20, blank=True, choices=PromotionCandidate.READINESS_LEVELS, verbose_name='준비도')
+    performance_score = models.FloatField(null=True, blank=True, verbose_name='성과 점수')
+    potential_score = models.FloatField(null=True, blank=True, verbose_name='잠재력 점수')
+    promotion_score = models.FloatField(null=True, blank=True, verbose_name='AI 추천 점수')
+    expected_promotion_date = models.DateField(null=True, blank=True, verbose_name='예상 승진일')
+    development_plan = models.JSONField(default=dict, verbose_name='개발 계획')
+    completed_requirements = models.JSONField(default=list, verbose_name='완료된 요구사항')
+    pending_requirements = models.JSONField(default=list, verbose_name='대기중인 요구사항')
+    
+    # 이직 위험
+    retention_id = models.BigIntegerField(null=True, blank=True, verbose_name='이직 위험 ID')
+    risk_level = models.CharField(max_length=20, blank=True, choices=RetentionRisk.RISK_LEVELS, verbose_name='위험 수준')
+    risk_score = models.FloatField(null=True, blank=True, verbose_name='위험 점수')
+    risk_factors = models.JSONField(default=list, verbose_name='위험 요인')
+    retention_strategy = models.TextField(blank=True, verbose_name='유지 전략')
+    action_items = models.JSONField(default=list, verbose_name='조치 항목')
+    action_status = models.CharField(max_length=20, blank=True, choices=RetentionRisk.ACTION_STATUS, verbose_name='조치 상태')
+    assigned_to_name = models.CharField(max_length=150, blank=True, verbose_name='담당자')
+    
+    # 대시보드 집계 플래그
+    in_talent_pool = models.BooleanField(default=False, verbose_name='인재풀 활성/모니터링')
+    is_core_talent = models.BooleanField(default=False, verbose_name='핵심인재')
+    needs_attention = models.BooleanField(default=False, verbose_name='관리필요인력')
+    is_promotion_candidate = models.BooleanField(default=False, verbose_name='승진 후보')
+    is_high_risk = models.BooleanField(default=False, verbose_name='이직 고위험')
+    is_open_risk = models.BooleanField(default=False, verbose_name='이직 고위험 조치 대기/진행')
+    
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='갱신일')
+    
+    class Meta:
+        verbose_name = '인재 현황 요약'
+        verbose_name_plural = '인재 현황 요약'
+        indexes = [
+            models.Index(fields=['in_talent_pool', '-ai_score'], name='talent_summary_pool_idx'),
+            models.Index(fields=['is_promotion_candidate', '-promotion_score'], name='talent_summary_promotion_idx'),
+            models.Index(fields=['is_high_risk', '-risk_score'], name='talent_summary_risk_idx'),
+        ]
+    
+    def __str__(self):
+        return f"{self.name} - 인재 현황"
+    
+    @classmethod
+    def build(cls, employee, talent_pools, promotions, risks) -> 'TalentSummary':
+        """직원 한 명의 원본 행들로 요약 생성 (저장하지 않음, 원본이 없으면 None)"""
+        fields = summarize_talent(employee, talent_pools, promotions, risks)
+        return cls(employee_id=employee.pk, **fields) if fields is not None else None
+    
+    @classmethod
+    def refresh(cls, employee_ids) -> int:
+        """직원들의 요약 다시 계산 (원본 조회 4회 + upsert/삭제, 원본이 없는 직원은 요약 삭제)"""
+        employee_ids = set(employee_ids)
+        if not employee_ids:
+            return 0
+        
+        grouped = {employee_id: ([], [], []) for employee_id in employee_ids}
+        for tp in TalentPool.objects.filter(employee_id__in=employee_ids).select_related('category'):
+            grouped[tp.employee_id][0].append(tp)
+        for pc in PromotionCandidate.objects.filter(employee_id__in=employee_ids):
+            grouped[pc.employee_id][1].append(pc)
+        for rr in RetentionRisk.objects.filter(employee_id__in=employee_ids).select_related('assigned_to'):
+            grouped[rr.employee_id][2].append(rr)
+        
+        summaries = []
+        for employee in Employee.objects.filter(pk__in=employee_ids).only('id', 'name', 'department', 'position', 'hire_date'):
+            summary = cls.build(employee, *grouped[employee.pk])
+            if summary is not None:
+                summaries.append(summary)
+        
+        cls.objects.filter(employee_id__in=employee_ids).exclude(
+            employee_id__in=[summary.employee_id for summary in summaries]
+        ).delete()
+        if summaries:
+            cls.objects.bulk_create(
+                summaries,
+                batch_size=500,
+                update_conflicts=True,
+                unique_fields=['employee'],
+                update_fields=[
+                    field.name for field in cls._meta.concrete_fields if not field.primary_key
+                ],
+            )
+        return len(summaries)
+    
+    @classmethod
+    def rebuild(cls, chunk_size=1000) -> int:
+        """전체 요약 재계산 (queryset.update / bulk 적재로 원본을 바꾼 뒤 사용)"""
+        employee_ids = set(cls.objects.values_list('employee_id', flat=True))
+        for model in (TalentPool, PromotionCandidate, RetentionRisk):
+            employee_ids.update(model.objects.values_list('employee_id', flat=True).distinct())
+        employee_ids = sorted(employee_ids)
+        return sum(
+            cls.refresh(employee_ids[start:start + chunk_size])
+            for start in range(0, len(employee_ids), chunk_size)
+        )
+
+
+def summarize_talent(employee, talent_pools, promotions, risks):
+    """직원 한 명의 인재풀/승진 후보/이직 위험 행들로 TalentSummary 필드 계산 (원본이 없으면 None)"""
+    if not (talent_pools or promotions or risks):
+        return None
+    
+    summary = {
+        'name': employee.name,
+        'department': employee.department or '',
+        'position': employee.position or '',
+        'hire_date': employee.hire_date,
+    }
+    
+    pools = [tp for tp in talent_pools if tp.status in TalentSummary.TALENT_STATUSES]
+    codes = {(tp.category.category_code, tp.status) for tp in talent_pools}
+    summary['in_talent_pool'] = bool(pools)
+    summary['is_core_talent'] = ('CORE_TALENT', 'ACTIVE') in codes
+    summary['needs_attention'] = any(('NEEDS_ATTENTION', status) in codes for status in TalentSummary.TALENT_STATUSES)
+    if talent_pools:
+        tp = max(pools or talent_pools, key=lambda p: (p.ai_score, p.added_at.timestamp() if p.added_at else 0))
+        summary.update(
+            talent_pool_id=tp.pk,
+            talent_category=tp.category.category_code,
+            talent_status=tp.status,
+            ai_score=tp.ai_score,
+            confidence_level=tp.confidence_level,
+            strengths=tp.strengths,
+            development_areas=tp.development_areas,
+            recommendations=tp.recommendations,
+            talent_added_at=tp.added_at,
+        )
+    
+    active = [pc for pc in promotions if pc.is_active]
+    summary['is_promotion_candidate'] = bool(active)
+    if active:
+        pc = max(active, key=lambda p: (p.ai_recommendation_score, p.performance_score))
+        summary.update(
+            promotion_id=pc.pk,
+            promotion_current_position=pc.current_position,
+            target_position=pc.target_position,
+            readiness_level=pc.readiness_level,
+            performance_score=pc.performance_score,
+            potential_score=pc.potential_score,
+            promotion_score=pc.ai_recommendation_score,
+            expected_promotion_date=pc.expected_promotion_date,
+            development_plan=pc.development_plan,
+            completed_requirements=pc.completed_requirements,
+            pending_requirements=pc.pending_requirements,
+        )
+    
+    high_risks = [r for r in risks if r.risk_level in TalentSummary.HIGH_RISK_LEVELS]
+    summary['is_high_risk'] = bool(high_risks)
+    if risks:
+        rr = max(high_risks or risks, key=lambda r: (r.risk_score, r.identified_date.timestamp() if r.identified_date else 0))
+        summary.update(
+            retention_id=rr.pk,
+            risk_level=rr.risk_level,
+            risk_score=rr.risk_score,
+            risk_factors=rr.risk_factors,
+            retention_strategy=rr.retention_strategy,
+            action_items=rr.action_items,
+            action_status=rr.action_status,
+            assigned_to_name=rr.assigned_to.username if rr.assigned_to else '',
+        )
+    summary['is_open_risk'] = any(
+        r.risk_level in TalentSummary.HIGH_RISK_LEVELS and r.action_status in TalentSummary.OPEN_ACTIONS for r in risks
+    )
+    return summary
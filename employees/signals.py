@@ -0,0 +1,78 @@
+"""
+직원 시그널
+- 소속 조직/재직상태 변경 시 조직 재직 인원(headcount) 증분 갱신
+  조직과 모든 상위 조직의 인원을 closure 서브쿼리 UPDATE 한 번으로 증감합니다.
+- 인재풀/승진 후보/이직 위험 저장·삭제 시 해당 직원의 인재 현황 요약(TalentSummary)을 커밋 후 재계산
+(queryset.update / bulk_create 는 시그널을 거치지 않으므로 manage.py rebuild_org_hierarchy,
+ rebuild_talent_summary 로 재계산)
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Employee, OrganizationStructure
+from .models_talent import PromotionCandidate, RetentionRisk, TalentPool, TalentSummary
+
+TRACKED_FIELDS = {'organization', 'organization_id', 'employment_status'}
+SUMMARY_FIELDS = ('name', 'department', 'position', 'hire_date')
+
+
+def counted_organization(organization_id, employment_status):
+    """재직 인원에 포함되는 조직 ID (재직 중이 아니거나 조직이 없으면 None)"""
+    return organization_id if organization_id and employment_status == '재직' else None
+
+
+@receiver(pre_save, sender=Employee)
+def employee_pre_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._counted_organization = None
+    instance._track_headcount = not raw and (update_fields is None or bool(TRACKED_FIELDS & set(update_fields)))
+    if instance._track_headcount and not instance._state.adding:
+        previous = Employee.objects.filter(pk=instance.pk).values_list('organization_id', 'employment_status').first()
+        if previous:
+            instance._counted_organization = counted_organization(*previous)
+
+
+@receiver(post_save, sender=Employee)
+def employee_post_save(sender, instance, created, **kwargs):
+    if not getattr(instance, '_track_headcount', False):
+        return
+    old = instance._counted_organization
+    new = counted_organization(instance.organization_id, instance.employment_status)
+    if old != new:
+        if old:
+            OrganizationStructure.adjust_headcount(old, -1)
+        if new:
+            OrganizationStructure.adjust_headcount(new, 1)
+
+
+@receiver(post_delete, sender=Employee)
+def employee_post_delete(sender, instance, **kwargs):
+    organization_id = counted_organization(instance.organization_id, instance.employment_status)
+    if organization_id:
+        OrganizationStructure.adjust_headcount(organization_id, -1)
+
+
+@receiver(post_save, sender=Employee)
+def employee_talent_summary(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """요약에 복사된 직원 정보 갱신 (요약이 없으면 UPDATE 0건)"""
+    if created or raw or (update_fields is not None and not set(SUMMARY_FIELDS) & set(update_fields)):
+        return
+    TalentSummary.objects.filter(pk=instance.pk).update(
+        name=instance.name,
+        department=instance.department or '',
+        position=instance.position or '',
+        hire_date=instance.hire_date,
+    )
+
+
+@receiver(post_save, sender=TalentPool)
+@receiver(post_save, sender=PromotionCandidate)
+@receiver(post_save, sender=RetentionRisk)
+@receiver(post_delete, sender=TalentPool)
+@receiver(post_delete, sender=PromotionCandidate)
+@receiver(post_delete, sender=RetentionRisk)
+def talent_summary_source_changed(sender, instance, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(partial(TalentSummary.refresh, [instance.employee_id]))
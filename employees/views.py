@@ -11,6 +11,7 @@ from django.views import View
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
+from django.utils import timezone
 from django.urls import reverse
 import pandas as pd
 from django.core.files.storage import default_storage
@@ -529,8 +530,57 @@ def advanced_organization_chart(request):
     """차세대 조직도 - 대규모 조직 최적화 버전"""
     return render(request, 'employees/advanced_organization_chart.html')
 
+ORG_TYPE_MAP = {
+    1: 'company',    # 그룹
+    2: 'company',    # 계열사
+    3: 'division',   # 본부
+    4: 'department', # 부
+    5: 'team'        # 팀
+}
+
+def build_org_tree(orgs, parent_id, depth):
+    """조직 목록(한 번 조회)을 메모리에서 트리로 구성
+
+    parent_id 의 활성 하위 조직부터 depth 단계까지 펼치며, 마지막 단계 노드의 childrenCount 는
+    depth + 1 단계까지 조회된 조직으로 계산합니다. 재직 인원은 headcount 집계 컬럼을 사용합니다.
+    """
+    children = {}
+    for org in orgs:
+        children.setdefault(org.parent_id, []).append(org)
+    for siblings in children.values():
+        siblings.sort(key=lambda org: (org.sort_order, org.org_code))
+
+    def build(current_id, current_depth):
+        nodes = []
+        for org in children.get(current_id, []):
+            children_count = len(children.get(org.id, []))
+            nodes.append({
+                'id': str(org.id),
+                'name': org.org_name,
+                'type': ORG_TYPE_MAP.get(org.org_level, 'department'),
+                'title': f'{org.get_org_level_display()}',
+                'code': org.org_code,
+                'level': org.org_level,
+                'headcount': org.headcount,
+                'childrenCount': children_count,
+                'hasChildren': children_count > 0,
+                'parentId': str(org.parent_id) if org.parent_id else None,
+                'path': org.full_path.split(' > ') if org.full_path else [org.org_name],
+                'leader': org.leader.name if org.leader else None,
+                'leaderPosition': org.leader.new_position if org.leader else None,
+                'description': org.description or '',
+                'establishmentDate': org.establishment_date.isoformat() if org.establishment_date else None,
+                'children': build(org.id, current_depth + 1) if current_depth + 1 < depth else []
+            })
+        return nodes
+
+    return build(parent_id, 0)
+
 def org_tree_api(request, node_id=None):
-    """조직 트리 데이터 API - 실제 조직구조 데이터 사용"""
+    """조직 트리 데이터 API - 실제 조직구조 데이터 사용
+
+    전체 트리는 활성 조직 조회 한 번, 하위 트리는 closure 테이블로 depth 단계까지의 하위 조직 조회 한 번으로 구성합니다.
+    """
     from django.http import JsonResponse
     
     try:
@@ -538,7 +588,7 @@ def org_tree_api(request, node_id=None):
         
         # 테이블 존재 여부 확인
         try:
-            OrganizationStructure.objects.count()
+            OrganizationStructure.objects.exists()
         except Exception as db_error:
             print(f"OrganizationStructure table not accessible: {db_error}")
             # 테이블이 없거나 접근할 수 없으면 샘플 데이터 사용
@@ -548,122 +598,30 @@ def org_tree_api(request, node_id=None):
                 return JsonResponse(get_sample_org_data())
         
         depth = int(request.GET.get('depth', 10))  # 기본 depth를 10으로 증가
-        
-        def build_tree_from_org_structure(parent_id=None, current_depth=0):
-            """실제 OrganizationStructure에서 트리 구조 생성"""
-            if current_depth >= depth:
-                print(f"Depth limit reached: {current_depth} >= {depth}")
-                return []
-                
-            try:
-                if parent_id:
-                    orgs = OrganizationStructure.objects.filter(
-                        parent_id=parent_id, 
-                        status='active'
-                    ).order_by('sort_order', 'org_code')
-                else:
-                    # 루트 노드들 (parent가 없는 최상위 조직)
-                    orgs = OrganizationStructure.objects.filter(
-                        parent__isnull=True, 
-                        status='active'
-                    ).order_by('sort_order', 'org_code')
-                
-                print(f"Found {orgs.count()} orgs at depth {current_depth} with parent_id={parent_id}")
-                
-                nodes = []
-                for org in orgs:
-                    # 조직 타입 매핑
-                    org_type_map = {
-                        1: 'company',    # 그룹
-                        2: 'company',    # 계열사  
-                        3: 'division',   # 본부
-                        4: 'department', # 부
-                        5: 'team'        # 팀
-                    }
-                    
-                    org_type = org_type_map.get(org.org_level, 'department')
-                    
-                    # 하위 조직 개수 확인
-                    children_count = OrganizationStructure.objects.filter(
-                        parent=org, 
-                        status='active'
-                    ).count()
-                    
-                    # 직원 수 계산
-                    try:
-                        employee_count = org.get_employee_count()
-                    except:
-                        employee_count = 0
-                    
-                    node = {
-                        'id': str(org.id),
-                        'name': org.org_name,
-                        'type': org_type,
-                        'title': f'{org.get_org_level_display()}',
-                        'code': org.org_code,
-                        'level': org.org_level,
-                        'headcount': employee_count,
-                        'childrenCount': children_count,
-                        'hasChildren': children_count > 0,
-                        'parentId': str(org.parent.id) if org.parent else None,
-                        'path': org.full_path.split(' > ') if org.full_path else [org.org_name],
-                        'leader': org.leader.name if org.leader else None,
-                        'leaderPosition': org.leader.new_position if org.leader else None,
-                        'description': org.description or '',
-                        'establishmentDate': org.establishment_date.isoformat() if org.establishment_date else None,
-                        'children': build_tree_from_org_structure(org.id, current_depth + 1) if current_depth + 1 < depth else []
-                    }
-                    
-                    nodes.append(node)
-                
-                return nodes
-                
-            except Exception as e:
-                print(f"Error building org tree: {e}")
-                return []
-        
-        # 디버깅 정보 추가
-        print(f"depth setting: {depth}")
-        print(f"node_id: {node_id}")
+        if depth < 1:
+            return JsonResponse({'children': []} if node_id and node_id != 'root' else get_sample_org_data())
+        active_orgs = OrganizationStructure.objects.filter(status='active').select_related('leader')
         
         # 특정 노드 요청인지 전체 트리 요청인지 확인
         if node_id and node_id != 'root':
-            print(f"Loading children for node_id: {node_id}, type: {type(node_id)}")
             # 특정 노드의 자식들만 반환
             try:
-                # node_id를 정수로 변환 시도
-                try:
-                    node_id_int = int(node_id)
-                    print(f"Converted node_id to int: {node_id_int}")
-                except ValueError as ve:
-                    print(f"ValueError converting node_id: {node_id}, error: {ve}")
-                    return JsonResponse({'error': f'Invalid node ID format: {node_id}'}, status=400)
-                
-                # 조직 존재 확인
-                try:
-                    parent_org = OrganizationStructure.objects.get(id=node_id_int, status='active')
-                    print(f"Found parent org: {parent_org.org_name}")
-                except OrganizationStructure.DoesNotExist:
-                    print(f"OrganizationStructure with id={node_id_int} and status='active' not found")
-                    # status 상관없이 다시 시도
-                    try:
-                        parent_org = OrganizationStructure.objects.get(id=node_id_int)
-                        print(f"Found parent org (any status): {parent_org.org_name}, status: {parent_org.status}")
-                    except OrganizationStructure.DoesNotExist:
-                        print(f"OrganizationStructure with id={node_id_int} not found at all")
-                        return JsonResponse({'error': f'Node not found: {node_id}'}, status=404)
-                
-                tree_data = build_tree_from_org_structure(node_id_int, 0)
-                print(f"Built tree data with {len(tree_data)} children")
-                return JsonResponse({'children': tree_data})
-            except Exception as e:
-                print(f"Error loading node children for node_id {node_id}: {e}")
-                import traceback
-                traceback.print_exc()
-                return JsonResponse({'error': f'Failed to load node children: {str(e)}'}, status=500)
+                node_id_int = int(node_id)
+            except ValueError:
+                return JsonResponse({'error': f'Invalid node ID format: {node_id}'}, status=400)
+            
+            if not OrganizationStructure.objects.filter(id=node_id_int).exists():
+                return JsonResponse({'error': f'Node not found: {node_id}'}, status=404)
+            
+            # 마지막 단계의 하위 조직 수를 위해 depth + 1 단계까지 조회
+            orgs = active_orgs.filter(
+                ancestor_links__ancestor_id=node_id_int,
+                ancestor_links__depth__range=(1, depth + 1),
+            )
+            return JsonResponse({'children': build_org_tree(orgs, node_id_int, depth)})
         else:
             # 전체 트리 구조 반환
-            tree_data = build_tree_from_org_structure(None, 0)
+            tree_data = build_org_tree(active_orgs, None, depth)
             
             # 루트가 하나면 그것을 반환, 여러 개면 첫 번째를 반환
             if tree_data:
@@ -1444,10 +1402,6 @@ def upload_organization_structure(request):
                 'message': '서버 설정 오류'
             }, status=500)
         
-        created_count = 0
-        updated_count = 0
-        errors = []
-        
         # 업로드 기록 생성 (선택사항)
         try:
             upload_history = OrganizationUploadHistory.objects.create(
@@ -1460,87 +1414,28 @@ def upload_organization_structure(request):
             print(f"[WARNING] 업로드 기록 생성 실패: {e}")
             upload_history = None
         
-        # 데이터 처리
-        for idx, row in enumerate(data):
-            try:
-                # 필수 필드 확인 (A,B,C,D 컬럼 또는 한글 컬럼명 지원)
-                org_code = (row.get('조직코드') or row.get('A', '')).strip() if (row.get('조직코드') or row.get('A')) else ''
-                org_name = (row.get('조직명') or row.get('B', '')).strip() if (row.get('조직명') or row.get('B')) else ''
-                
-                if not org_code:
-                    errors.append({
-                        'row': idx + 1,
-                        'error': '조직코드 없음',
-                        'data': row
-                    })
-                    continue
-                
-                if not org_name:
-                    errors.append({
-                        'row': idx + 1,
-                        'error': '조직명 없음',
-                        'data': row
-                    })
-                    continue
-                
-                # 조직 레벨 처리 (C 컬럼 또는 한글 컬럼명 지원)
+        # 데이터 처리 (메모리에서 계층 계산 후 일괄 저장)
+        from employees.org_import import import_organization_rows
+        import_result = None
+        try:
+            import_result = import_organization_rows(data)
+        finally:
+            # 업로드 기록 마무리 (일괄 반영이 실패해도 처리중 상태로 남지 않도록)
+            if upload_history:
                 try:
-                    org_level = int(row.get('조직레벨') or row.get('C', 1))
-                except (ValueError, TypeError):
-                    org_level = 1
-                
-                # 조직 생성 또는 업데이트
-                org, created = OrganizationStructure.objects.get_or_create(
-                    org_code=org_code,
-                    defaults={
-                        'org_name': org_name,
-                        'org_level': org_level,
-                        'status': row.get('상태') or row.get('F', 'active'),
-                        'sort_order': int(row.get('정렬순서') or row.get('G', 0)) if (row.get('정렬순서') or row.get('G')) else 0,
-                        'description': row.get('설명') or row.get('H', ''),
-                    }
-                )
-                
-                if not created:
-                    # 기존 조직 업데이트
-                    org.org_name = org_name
-                    org.org_level = org_level
-                    if row.get('상태') or row.get('F'):
-                        org.status = row.get('상태') or row.get('F')
-                    if row.get('설명') or row.get('H'):
-                        org.description = row.get('설명') or row.get('H')
-                    org.save()
-                    updated_count += 1
-                else:
-                    created_count += 1
-                
-                # 상위 조직 설정 (D 컬럼 또는 한글 컬럼명 지원)
-                parent_code = (row.get('상위조직코드') or row.get('D', '')).strip() if (row.get('상위조직코드') or row.get('D')) else ''
-                if parent_code:
-                    try:
-                        parent = OrganizationStructure.objects.get(org_code=parent_code)
-                        org.parent = parent
-                        org.save()
-                    except OrganizationStructure.DoesNotExist:
-                        print(f"[WARNING] 상위조직 {parent_code} 찾을 수 없음")
-                
-            except Exception as e:
-                print(f"[ERROR] 행 {idx + 1} 처리 오류: {e}")
-                errors.append({
-                    'row': idx + 1,
-                    'error': str(e),
-                    'data': row
-                })
-        
-        # 업로드 기록 업데이트
-        if upload_history:
-            try:
-                upload_history.status = 'completed'
-                upload_history.success_count = created_count + updated_count
-                upload_history.error_count = len(errors)
-                upload_history.save()
-            except:
-                pass
+                    if import_result is None:
+                        upload_history.status = 'failed'
+                    else:
+                        upload_history.status = 'completed'
+                        upload_history.success_count = import_result['created'] + import_result['updated']
+                        upload_history.error_count = len(import_result['errors'])
+                    upload_history.processed_at = timezone.now()
+                    upload_history.save()
+                except Exception as e:
+                    print(f"[WARNING] 업로드 기록 갱신 실패: {e}")
+        created_count = import_result['created']
+        updated_count = import_result['updated']
+        errors = import_result['errors']
         
         # 결과 반환
         result = {
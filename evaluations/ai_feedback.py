@@ -1,173 +1,78 @@
 """
 AI 피드백 생성 시스템
-OpenAI API를 활용한 평가 피드백 자동 생성
+공유 LLM 게이트웨이를 활용한 평가 피드백 자동 생성
+(평가 기간 단위 일괄 생성은 EvaluationFeedbackBatch, manage.py run_llm_batch)
 """
 import os
-import json
-from typing import Dict, List, Optional
-from django.conf import settings
 import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ai_services.batch import BatchHandler
+from ai_services.llm_gateway import LLMError, get_gateway
 
 logger = logging.getLogger(__name__)
 
-# OpenAI API 설정
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-    api_key = os.getenv('OPENAI_API_KEY')
-    
-    # HTTP(S)_PROXY 환경변수 임시 제거
-    old_http_proxy = os.environ.pop('HTTP_PROXY', None)
-    old_https_proxy = os.environ.pop('HTTPS_PROXY', None)
-    old_http_proxy_lower = os.environ.pop('http_proxy', None)
-    old_https_proxy_lower = os.environ.pop('https_proxy', None)
-    
-    if api_key:
-        try:
-            # OpenAI 클라이언트 생성 - proxies 관련 환경변수 제거 후
-            client = OpenAI(api_key=api_key)
-            logger.info("OpenAI 클라이언트 초기화 성공")
-            OPENAI_AVAILABLE = True
-        except TypeError as e:
-            if 'proxies' in str(e):
-                # proxies 인자 문제면 다른 방법 시도
-                logger.warning(f"OpenAI proxies 문제: {str(e)}")
-                try:
-                    # 기본 설정만으로 초기화
-                    import openai
-                    client = OpenAI(api_key=api_key)
-                    OPENAI_AVAILABLE = True
-                except:
-                    client = None
-                    OPENAI_AVAILABLE = False
-            else:
-                logger.error(f"OpenAI 클라이언트 초기화 실패: {str(e)}")
-                client = None
-                OPENAI_AVAILABLE = False
-        except Exception as e:
-            logger.error(f"OpenAI 클라이언트 초기화 실패: {str(e)}")
-            client = None
-            OPENAI_AVAILABLE = False
-    else:
-        client = None
-        logger.warning("OpenAI API 키가 설정되지 않았습니다.")
-        OPENAI_AVAILABLE = False
-    
-    # 환경변수 복원
-    if old_http_proxy:
-        os.environ['HTTP_PROXY'] = old_http_proxy
-    if old_https_proxy:
-        os.environ['HTTPS_PROXY'] = old_https_proxy
-    if old_http_proxy_lower:
-        os.environ['http_proxy'] = old_http_proxy_lower
-    if old_https_proxy_lower:
-        os.environ['https_proxy'] = old_https_proxy_lower
-        
-except ImportError:
-    OPENAI_AVAILABLE = False
-    client = None
-    logger.warning("OpenAI 패키지가 설치되지 않았습니다. pip install openai를 실행하세요.")
-except Exception as e:
-    OPENAI_AVAILABLE = False
-    client = None
-    logger.error(f"OpenAI 초기화 중 예상치 못한 오류: {str(e)}")
+# 평가 유형별 시스템 프롬프트
+SYSTEM_PROMPTS = {
+    'contribution': "당신은 전문적인 HR 평가자입니다. 건설적이고 구체적인 피드백을 한국어로 제공하세요.",
+    'expertise': "당신은 전문성 개발 컨설턴트입니다. 역량 개발을 위한 구체적인 조언을 한국어로 제공하세요.",
+    'impact': "당신은 리더십 코치입니다. 영향력과 리더십 향상을 위한 피드백을 한국어로 제공하세요.",
+}
 
 
 class AIFeedbackGenerator:
-    """AI 기반 평가 피드백 생성기"""
+    """AI 기반 평가 피드백 생성기 (공유 LLM 게이트웨이 사용)"""
     
     def __init__(self):
         self.model = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
         self.max_tokens = 500
         self.temperature = 0.7
-        self.client = client
-        
-    def generate_contribution_feedback(self, evaluation_data: Dict) -> str:
-        """기여도 평가에 대한 AI 피드백 생성"""
-        
-        if not OPENAI_AVAILABLE:
-            return self._generate_fallback_feedback(evaluation_data, "contribution")
-            
-        try:
-            # 프롬프트 구성
-            prompt = self._build_contribution_prompt(evaluation_data)
-            
-            if self.client:
-                # 새로운 버전 API 사용
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "당신은 전문적인 HR 평가자입니다. 건설적이고 구체적인 피드백을 한국어로 제공하세요."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature
-                )
-                feedback = response.choices[0].message.content.strip()
-            else:
-                # 클라이언트가 없으면 폴백 메시지 반환
-                logger.warning("OpenAI 클라이언트를 사용할 수 없습니다.")
-                return self._generate_fallback_feedback(evaluation_data, "contribution")
-            
-            return feedback
-            
-        except Exception as e:
-            logger.error(f"AI 피드백 생성 오류: {str(e)}")
-            return self._generate_fallback_feedback(evaluation_data, "contribution")
     
-    def generate_expertise_feedback(self, evaluation_data: Dict) -> str:
-        """전문성 평가에 대한 AI 피드백 생성"""
+    def build_messages(self, eval_type: str, evaluation_data: Dict) -> List[Dict]:
+        """평가 유형별 LLM 요청 메시지"""
+        builders = {
+            'contribution': self._build_contribution_prompt,
+            'expertise': self._build_expertise_prompt,
+            'impact': self._build_impact_prompt,
+        }
+        if eval_type not in builders:
+            raise ValueError(f"지원하지 않는 평가 타입입니다: {eval_type}")
+        return [
+            {"role": "system", "content": SYSTEM_PROMPTS[eval_type]},
+            {"role": "user", "content": builders[eval_type](evaluation_data)},
+        ]
+    
+    def generate_feedback(self, eval_type: str, evaluation_data: Dict) -> str:
+        """AI 피드백 생성 (LLM 을 사용할 수 없으면 대체 피드백)"""
+        gateway = get_gateway()
+        if not gateway.is_configured:
+            return self._generate_fallback_feedback(evaluation_data, eval_type)
         
-        if not OPENAI_AVAILABLE:
-            return self._generate_fallback_feedback(evaluation_data, "expertise")
-            
         try:
-            prompt = self._build_expertise_prompt(evaluation_data)
-            
-            if self.client:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 전문성 개발 컨설턴트입니다. 역량 개발을 위한 구체적인 조언을 한국어로 제공하세요."},
-                    {"role": "user", "content": prompt}
-                ],
+            result = gateway.chat(
+                self.build_messages(eval_type, evaluation_data),
+                model=self.model,
+                feature='evaluation_feedback',
                 max_tokens=self.max_tokens,
                 temperature=self.temperature
             )
-            
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
+            return result.content.strip()
+        except LLMError as e:
             logger.error(f"AI 피드백 생성 오류: {str(e)}")
-            return self._generate_fallback_feedback(evaluation_data, "expertise")
+            return self._generate_fallback_feedback(evaluation_data, eval_type)
+    
+    def generate_contribution_feedback(self, evaluation_data: Dict) -> str:
+        """기여도 평가에 대한 AI 피드백 생성"""
+        return self.generate_feedback('contribution', evaluation_data)
+    
+    def generate_expertise_feedback(self, evaluation_data: Dict) -> str:
+        """전문성 평가에 대한 AI 피드백 생성"""
+        return self.generate_feedback('expertise', evaluation_data)
     
     def generate_impact_feedback(self, evaluation_data: Dict) -> str:
         """영향력 평가에 대한 AI 피드백 생성"""
-        
-        if not OPENAI_AVAILABLE:
-            return self._generate_fallback_feedback(evaluation_data, "impact")
-            
-        if not self.client:
-            return self._generate_fallback_feedback(evaluation_data, "impact")
-        
-        try:
-            prompt = self._build_impact_prompt(evaluation_data)
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "당신은 리더십 코치입니다. 영향력과 리더십 향상을 위한 피드백을 한국어로 제공하세요."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature
-            )
-            
-            return response.choices[0].message.content.strip()
-            
-        except Exception as e:
-            logger.error(f"AI 피드백 생성 오류: {str(e)}")
-            return self._generate_fallback_feedback(evaluation_data, "impact")
+        return self.generate_feedback('impact', evaluation_data)
     
     def _build_contribution_prompt(self, data: Dict) -> str:
         """기여도 평가 프롬프트 생성"""
@@ -258,7 +163,7 @@ class AIFeedbackGenerator:
         return "\n".join(formatted)
     
     def _generate_fallback_feedback(self, data: Dict, eval_type: str) -> str:
-        """OpenAI API를 사용할 수 없을 때의 대체 피드백"""
+        """LLM 을 사용할 수 없을 때의 대체 피드백"""
         
         employee_name = data.get('employee_name', '직원')
         
@@ -348,6 +253,117 @@ class AIFeedbackValidator:
         return validation_result
 
 
+def build_evaluation_data(evaluation_type: str, evaluation, tasks: Optional[List] = None) -> Dict:
+    """평가 객체 → 프롬프트 데이터 (tasks 는 기여도 평가의 해당 기간 업무, 없으면 조회)"""
+    employee = evaluation.employee
+    
+    if evaluation_type == 'contribution':
+        if tasks is None:
+            from .models import Task
+            tasks = list(Task.objects.filter(
+                employee=employee,
+                evaluation_period_id=evaluation.evaluation_period_id
+            ))
+        return {
+            'employee_name': employee.name,
+            'department': employee.department,
+            'position': employee.position,
+            'contribution_score': float(evaluation.contribution_score or 0),
+            'completed_tasks': sum(1 for task in tasks if task.status == 'COMPLETED'),
+            'achievement_rate': float(evaluation.total_achievement_rate or 0),
+            'tasks': [
+                {
+                    'title': task.title,
+                    'achievement': float(task.achievement_rate or 0)
+                }
+                for task in tasks[:5]
+            ]
+        }
+    
+    if evaluation_type == 'expertise':
+        return {
+            'employee_name': employee.name,
+            'expertise_score': float(getattr(evaluation, 'expertise_score', 3.0)),
+            'strengths': ['전문 지식', '문제 해결'],  # 실제 데이터로 교체 필요
+            'improvements': ['커뮤니케이션', '리더십'],
+            'checklist': {
+                '요구 레벨': evaluation.required_level,
+                '전문성 초점': evaluation.expertise_focus,
+            }
+        }
+    
+    if evaluation_type == 'impact':
+        return {
+            'employee_name': employee.name,
+            'impact_score': float(getattr(evaluation, 'impact_score', 3.0)),
+            'leadership_style': getattr(evaluation, 'leadership_style', '협력적'),
+            'value_practice': float(getattr(evaluation, 'value_practice_score', 85)),
+            'team_impact': float(getattr(evaluation, 'team_impact', 4)),
+            'org_impact': float(getattr(evaluation, 'org_impact', 3)),
+            'external_impact': float(getattr(evaluation, 'external_impact', 2)),
+        }
+    
+    raise ValueError(f"지원하지 않는 평가 타입입니다: {evaluation_type}")
+
+
+def batch_item_key(evaluation_type: str, evaluation_id) -> str:
+    return f"{evaluation_type}:{evaluation_id}"
+
+
+class EvaluationFeedbackBatch(BatchHandler):
+    """평가 기간 전체 AI 피드백 일괄 생성
+    
+    params: evaluation_period_id, types (기본값: 기여도/전문성/영향력 모두)
+    """
+    job_type = 'evaluation_feedback'
+    
+    def __init__(self):
+        self.generator = ai_feedback_generator
+        self.model = self.generator.model
+        self.llm_params = {
+            'max_tokens': self.generator.max_tokens,
+            'temperature': self.generator.temperature,
+        }
+    
+    def iter_items(self, params: Dict) -> Iterable[Tuple[str, Dict]]:
+        from .models import ContributionEvaluation, ExpertiseEvaluation, ImpactEvaluation, Task
+        
+        evaluation_models = {
+            'contribution': ContributionEvaluation,
+            'expertise': ExpertiseEvaluation,
+            'impact': ImpactEvaluation,
+        }
+        period_id = params['evaluation_period_id']
+        types = params.get('types') or list(evaluation_models)
+        
+        # 기여도 평가용 업무는 기간 전체를 한 번에 조회해 직원별로 묶음
+        tasks_by_employee = defaultdict(list)
+        if 'contribution' in types:
+            for task in Task.objects.filter(evaluation_period_id=period_id):
+                tasks_by_employee[task.employee_id].append(task)
+        
+        for evaluation_type in types:
+            evaluations = evaluation_models[evaluation_type].objects.filter(
+                evaluation_period_id=period_id
+            ).select_related('employee')
+            for evaluation in evaluations.iterator(chunk_size=500):
+                data = build_evaluation_data(
+                    evaluation_type, evaluation, tasks_by_employee.get(evaluation.employee_id, [])
+                )
+                yield batch_item_key(evaluation_type, evaluation.pk), {
+                    'messages': self.generator.build_messages(evaluation_type, data),
+                    'employee': evaluation.employee.name,
+                }
+    
+    def apply(self, item_key: str, payload: Dict, content: str) -> str:
+        """품질 기준 미달이면 재시도"""
+        feedback = content.strip()
+        validation = ai_feedback_validator.validate_feedback(feedback)
+        if not validation['is_valid']:
+            raise ValueError(f"품질 기준 미달: {', '.join(validation['issues'])}")
+        return feedback
+
+
 # 싱글톤 인스턴스
 ai_feedback_generator = AIFeedbackGenerator()
 ai_feedback_validator = AIFeedbackValidator()
\ No newline at end of file
@@ -4,7 +4,7 @@ AI 피드백 생성 및 실시간 기능 API
 """
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import IsAuthenticated, AllowAny
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.decorators import login_required
@@ -21,25 +21,8 @@ from .models import (
     ContributionEvaluation, ExpertiseEvaluation, 
     ImpactEvaluation, Task, Employee
 )
-try:
-    from .ai_feedback import ai_feedback_generator, ai_feedback_validator
-except Exception as e:
-    logger.error(f"AI feedback import failed: {str(e)}")
-    # Fallback 객체 생성
-    class FallbackFeedbackGenerator:
-        def generate_contribution_feedback(self, data):
-            return "AI 피드백 서비스가 일시적으로 사용 불가능합니다. 수동으로 피드백을 작성해주세요."
-        def generate_expertise_feedback(self, data):
-            return "AI 피드백 서비스가 일시적으로 사용 불가능합니다. 수동으로 피드백을 작성해주세요."
-        def generate_impact_feedback(self, data):
-            return "AI 피드백 서비스가 일시적으로 사용 불가능합니다. 수동으로 피드백을 작성해주세요."
-    
-    class FallbackValidator:
-        def validate_feedback(self, feedback):
-            return {'is_valid': True, 'score': 100, 'issues': []}
-    
-    ai_feedback_generator = FallbackFeedbackGenerator()
-    ai_feedback_validator = FallbackValidator()
+from ai_services.batch import create_job, get_batch_result, job_status
+from .ai_feedback import ai_feedback_generator, ai_feedback_validator, build_evaluation_data, batch_item_key
 
 from notifications.models import Notification
 
@@ -87,67 +70,25 @@ def generate_ai_feedback(request):
     
         # 정상적인 평가 처리
         # 평가 데이터 조회
-        if evaluation_type == 'contribution':
-            evaluation = ContributionEvaluation.objects.get(id=evaluation_id)
-            tasks = Task.objects.filter(
-                employee=evaluation.employee,
-                evaluation_period=evaluation.evaluation_period
-            )
-            
-            evaluation_data = {
-                'employee_name': evaluation.employee.name,
-                'department': evaluation.employee.department,
-                'position': evaluation.employee.position,
-                'contribution_score': float(evaluation.contribution_score or 0),
-                'completed_tasks': tasks.filter(status='COMPLETED').count(),
-                'achievement_rate': float(evaluation.total_achievement_rate or 0),
-                'tasks': [
-                    {
-                        'title': task.title,
-                        'achievement': float(task.achievement_rate or 0)
-                    }
-                    for task in tasks[:5]
-                ]
-            }
-            
-            feedback = ai_feedback_generator.generate_contribution_feedback(evaluation_data)
-            
-        elif evaluation_type == 'expertise':
-            evaluation = ExpertiseEvaluation.objects.get(id=evaluation_id)
-            
-            evaluation_data = {
-                'employee_name': evaluation.employee.name,
-                'expertise_score': float(getattr(evaluation, 'expertise_score', 3.0)),
-                'strengths': ['전문 지식', '문제 해결'],  # 실제 데이터로 교체 필요
-                'improvements': ['커뮤니케이션', '리더십'],
-                'checklist': {
-                    '요구 레벨': evaluation.required_level,
-                    '전문성 초점': evaluation.expertise_focus,
-                }
-            }
-            
-            feedback = ai_feedback_generator.generate_expertise_feedback(evaluation_data)
-            
-        elif evaluation_type == 'impact':
-            evaluation = ImpactEvaluation.objects.get(id=evaluation_id)
-            
-            evaluation_data = {
-                'employee_name': evaluation.employee.name,
-                'impact_score': float(getattr(evaluation, 'impact_score', 3.0)),
-                'leadership_style': getattr(evaluation, 'leadership_style', '협력적'),
-                'value_practice': float(getattr(evaluation, 'value_practice_score', 85)),
-                'team_impact': float(getattr(evaluation, 'team_impact', 4)),
-                'org_impact': float(getattr(evaluation, 'org_impact', 3)),
-                'external_impact': float(getattr(evaluation, 'external_impact', 2)),
-            }
-            
-            feedback = ai_feedback_generator.generate_impact_feedback(evaluation_data)
-            
-        else:
+        evaluation_models = {
+            'contribution': ContributionEvaluation,
+            'expertise': ExpertiseEvaluation,
+            'impact': ImpactEvaluation,
+        }
+        if evaluation_type not in evaluation_models:
             return Response(
                 {'error': '지원하지 않는 평가 타입입니다.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        evaluation = evaluation_models[evaluation_type].objects.select_related('employee').get(id=evaluation_id)
+        
+        # 일괄 작업으로 미리 생성된 피드백이 있으면 사용 (평가 수정 이후 생성분만)
+        feedback = get_batch_result(
+            'evaluation_feedback', batch_item_key(evaluation_type, evaluation.id), since=evaluation.updated_at
+        )
+        if feedback is None:
+            evaluation_data = build_evaluation_data(evaluation_type, evaluation)
+            feedback = ai_feedback_generator.generate_feedback(evaluation_type, evaluation_data)
         
         # 피드백 검증
         validation = ai_feedback_validator.validate_feedback(feedback)
@@ -161,11 +102,6 @@ def generate_ai_feedback(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # 피드백 저장 (선택적)
-        if evaluation_type == 'contribution':
-            evaluation.ai_feedback = feedback
-            evaluation.save()
-        
         return Response({
             'feedback': feedback,
             'validation_score': validation['score'],
@@ -210,6 +146,45 @@ def generate_ai_feedback(request):
         }, status=status.HTTP_200_OK)  # 200으로 반환하여 UI에서 처리 가능하도록
 
 
+@api_view(['POST'])
+@permission_classes([IsAdminUser])
+def start_feedback_batch(request):
+    """평가 기간 AI 피드백 일괄 생성 작업 등록 (실행은 manage.py run_llm_batch)"""
+    
+    period_id = request.data.get('evaluation_period_id')
+    if not period_id:
+        return Response(
+            {'error': '평가 기간이 필요합니다.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    types = request.data.get('types') or ['contribution', 'expertise', 'impact']
+    invalid = [t for t in types if t not in ('contribution', 'expertise', 'impact')]
+    if invalid:
+        return Response(
+            {'error': f"지원하지 않는 평가 타입입니다: {', '.join(invalid)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    job = create_job(
+        'evaluation_feedback',
+        {'evaluation_period_id': int(period_id), 'types': types},
+        created_by=request.user
+    )
+    return Response(job_status(job), status=status.HTTP_201_CREATED)
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def feedback_batch_status(request, job_id):
+    """일괄 생성 작업 진행 상황"""
+    
+    from ai_chatbot.models import LLMBatchJob
+    
+    job = get_object_or_404(LLMBatchJob, pk=job_id, job_type='evaluation_feedback')
+    return Response(job_status(job))
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_evaluation_summary(request, employee_id):
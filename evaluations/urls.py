@@ -114,6 +114,8 @@ urlpatterns = [
         path('process/<int:period_id>/', views_advanced.ProcessEvaluationView.as_view(), name='process_evaluation'),
         # AI 피드백 및 분석 API
         path('generate-feedback/', api_views.generate_ai_feedback, name='generate_ai_feedback'),
+        path('feedback-batch/', api_views.start_feedback_batch, name='start_feedback_batch'),
+        path('feedback-batch/<int:job_id>/', api_views.feedback_batch_status, name='feedback_batch_status'),
         path('employee/<int:employee_id>/summary/', api_views.get_evaluation_summary, name='evaluation_summary'),
         path('create-notification/', api_views.create_evaluation_notification, name='create_notification'),
         path('analytics/', api_views.get_evaluation_analytics, name='evaluation_analytics_data'),
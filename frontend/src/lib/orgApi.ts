@@ -2,10 +2,22 @@
  * Organization API Helper
  */
 import axios from 'axios';
-import { OrgUnit, OrgScenario, OrgSnapshot } from '../types/organization';
+import { OrgUnit, OrgScenario, OrgSnapshot, MatrixColumnar, MatrixData } from '../types/organization';
 
 const API_BASE_URL = process.env.REACT_APP_API_URL || 'http://localhost:8000/api';
 
+// 열 형식 매트릭스 → 기능별 행 x 리더별 칸 (빈 칸 채움)
+export const expandMatrix = ({ functions, headers, rows }: MatrixColumnar): MatrixData => {
+  const grid = functions.map((fn) => ({
+    function: fn,
+    cells: headers.map((leader) => ({ leader, headcount: 0, units: [] as string[] })),
+  }));
+  rows.forEach(([fnIndex, leaderIndex, headcount, units]) => {
+    grid[fnIndex].cells[leaderIndex] = { leader: headers[leaderIndex], headcount, units };
+  });
+  return { headers, rows: grid };
+};
+
 const api = axios.create({
   baseURL: `${API_BASE_URL}/organization`,
   headers: {
@@ -68,9 +80,9 @@ export const orgApi = {
   },
 
   // Matrix
-  async getMatrix(params?: { company?: string }): Promise<any> {
-    const response = await api.get('/units/group/matrix/', { params });
-    return response.data;
+  async getMatrix(params?: { company?: string }): Promise<MatrixData> {
+    const response = await api.get<MatrixColumnar>('/units/group/matrix/', { params });
+    return expandMatrix(response.data);
   },
 
   // Scenarios
@@ -71,6 +71,15 @@ export interface MatrixData {
   rows: MatrixRow[];
 }
 
+// 서버 응답 (열 형식): rows = [functions 번호, headers 번호, 인원, 조직 ID 목록]
+export interface MatrixColumnar {
+  version: number;
+  functions: string[];
+  headers: string[];
+  columns: string[];
+  rows: [number, number, number, string[]][];
+}
+
 export interface OrgChangeLog {
   action: string;
   action_display?: string;
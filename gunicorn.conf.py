@@ -1,7 +1,13 @@
 import os
 
 bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
-workers = 2
+# SSE 스트리밍 응답과 알림 웹소켓(Channels)을 처리하려면 ASGI 워커 필요
+worker_class = 'uvicorn.workers.UvicornWorker'
+# uvicorn 워커는 이벤트 루프 하나로 동작하고 sync 뷰/ORM 호출은 asgiref 스레드에서 실행된다.
+# 기존 sync 워커(2 workers x 4 threads = 동시 8 요청) 이상의 처리량이 나오도록
+# 워커 수와 sync_to_async 기본 스레드 풀 크기를 명시 (워커 fork 전에 환경변수로 전달)
+workers = int(os.environ.get('WEB_CONCURRENCY', '4'))
+os.environ.setdefault('ASGI_THREADS', '8')
 timeout = 120
 accesslog = '-'
 errorlog = '-'
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class JobProfilesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job_profiles'
+    
+    def ready(self):
+        from . import signals  # noqa: F401
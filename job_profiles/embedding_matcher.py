@@ -1,14 +1,20 @@
 """
 임베딩 기반 직무-직원 프로파일 매칭 엔진
 텍스트 임베딩을 활용한 의미적 유사도 계산
+(TF-IDF 스킬 벡터는 전체 직무 코퍼스로 학습한 skill_index 의 어휘를 공유)
 """
 
+import hashlib
+
 import numpy as np
+import scipy.sparse as sp
 from typing import List, Dict, Tuple, Optional
+from django.core.cache import cache
+from sklearn.cluster import AgglomerativeClustering
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import pickle
-import os
+from sklearn.preprocessing import normalize
+
+from .skill_index import skill_index
 
 
 class EmbeddingMatcher:
@@ -20,34 +26,18 @@ class EmbeddingMatcher:
             embedding_model: 사용할 임베딩 모델 ('tfidf', 'word2vec', 'bert' 등)
         """
         self.embedding_model = embedding_model
-        self.vectorizer = None
         self.skill_embeddings = {}
-        
-        if embedding_model == 'tfidf':
-            self.vectorizer = TfidfVectorizer(
-                ngram_range=(1, 2),
-                max_features=1000,
-                stop_words=None  # 한국어는 별도 처리 필요
-            )
     
     def create_skill_embedding(self, skills: List[str]) -> np.ndarray:
         """스킬 리스트를 임베딩 벡터로 변환"""
+        if self.embedding_model == 'tfidf':
+            # 직무 코퍼스 전체로 학습된 어휘로 변환 (호출마다 같은 벡터 공간, L2 정규화)
+            return skill_index.vectorize(skills or []).toarray()[0]
+        
         if not skills:
             return np.zeros(100)  # 기본 차원
         
-        # 텍스트 결합
-        skill_text = ' '.join(skills)
-        
-        if self.embedding_model == 'tfidf':
-            # TF-IDF 벡터화
-            if hasattr(self.vectorizer, 'vocabulary_'):
-                vector = self.vectorizer.transform([skill_text]).toarray()[0]
-            else:
-                # 첫 호출시 fit 필요
-                vector = self.vectorizer.fit_transform([skill_text]).toarray()[0]
-            return vector
-        
-        elif self.embedding_model == 'average':
+        if self.embedding_model == 'average':
             # 간단한 평균 임베딩 (실제로는 사전 학습된 임베딩 사용)
             embeddings = []
             for skill in skills:
@@ -76,11 +66,16 @@ class EmbeddingMatcher:
             return 0.0
         
         # 코사인 유사도 계산
-        similarity = cosine_similarity([vec1], [vec2])[0][0]
+        similarity = np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
         
         # 0-100 스케일로 변환
         return float(max(0, similarity) * 100)
     
+    def top_job_matches(self, employee_profile: dict, k: int = 5, exclude: Optional[List[str]] = None) -> List[Tuple[str, float]]:
+        """직원 스킬과 유사한 직무 상위 k개 [(job_id, 0-100 유사도)] - 인덱스 희소 행렬 곱 한 번"""
+        skills = employee_profile.get('skills', []) + employee_profile.get('certifications', [])
+        return skill_index.top_jobs_for_skills(skills, k=k, exclude=exclude or ())
+    
     def create_profile_embedding(self, profile: dict) -> Dict[str, np.ndarray]:
         """프로파일 전체를 임베딩으로 변환"""
         embeddings = {}
@@ -228,64 +223,102 @@ class HybridMatcher:
 
 
 class SkillClusterAnalyzer:
-    """스킬 클러스터 분석기"""
+    """스킬 클러스터 분석기
     
-    def __init__(self):
-        self.embedding_matcher = EmbeddingMatcher()
+    스킬 벡터 = 직무 동시 출현(같은 직무에 함께 요구되는 스킬) + 스킬명 문자 n-gram,
+    유사도 행렬을 한 번 계산해 평균 연결 계층적 군집으로 묶고, 결과는 코퍼스 버전별로 캐시
+    """
+    
+    CACHE_TIMEOUT = 24 * 3600
+    
+    def __init__(self, cooccurrence_weight: float = 0.6):
+        self.cooccurrence_weight = cooccurrence_weight
         self.skill_clusters = {}
     
-    def analyze_skill_clusters(self, all_job_profiles: List[dict]) -> Dict[str, List[str]]:
-        """모든 직무의 스킬을 분석하여 클러스터 생성"""
-        
-        # 모든 스킬 수집
-        all_skills = set()
+    @staticmethod
+    def _collect_skills(all_job_profiles: List[dict]) -> List[List[str]]:
+        """직무별 스킬 목록 (정규화, 중복 제거)"""
+        profile_skills = []
         for profile in all_job_profiles:
-            all_skills.update(profile.get('basic_skills', []))
-            all_skills.update(profile.get('applied_skills', []))
-        
-        # 스킬 임베딩 생성
-        skill_embeddings = {}
-        for skill in all_skills:
-            skill_embeddings[skill] = self.embedding_matcher._get_dummy_embedding(skill)
-        
-        # 간단한 클러스터링 (실제로는 K-means, DBSCAN 등 사용)
-        # 여기서는 유사도 기반 그룹핑
-        clusters = self._simple_clustering(skill_embeddings, threshold=0.7)
-        
+            skills = profile.get('basic_skills', []) + profile.get('applied_skills', [])
+            profile_skills.append(sorted({' '.join(str(skill).split()) for skill in skills} - {''}))
+        return profile_skills
+    
+    @staticmethod
+    def corpus_version(profile_skills: List[List[str]]) -> str:
+        """직무 스킬 코퍼스 지문 (직무 순서와 무관)"""
+        digest = hashlib.sha1()
+        for skills in sorted(profile_skills):
+            digest.update('\x1f'.join(skills).encode('utf-8'))
+            digest.update(b'\x1e')
+        return digest.hexdigest()
+    
+    def analyze_skill_clusters(self, all_job_profiles: List[dict], threshold: float = 0.7) -> Dict[str, List[str]]:
+        """모든 직무의 스킬을 분석하여 클러스터 생성"""
+        profile_skills = self._collect_skills(all_job_profiles)
+        cache_key = f"skill_clusters:{self.corpus_version(profile_skills)}:{threshold}:{self.cooccurrence_weight}"
+        clusters = cache.get(cache_key)
+        if clusters is None:
+            skills, vectors = self._skill_vectors(profile_skills)
+            clusters = self._cluster(skills, vectors, threshold)
+            cache.set(cache_key, clusters, self.CACHE_TIMEOUT)
+        self.skill_clusters = clusters
         return clusters
     
+    def _skill_vectors(self, profile_skills: List[List[str]]) -> Tuple[List[str], sp.csr_matrix]:
+        """스킬 x (직무 동시 출현 | 문자 n-gram) 행렬, 각 부분을 L2 정규화 후 가중 결합"""
+        skills = sorted({skill for skills in profile_skills for skill in skills})
+        if not skills:
+            return [], sp.csr_matrix((0, 0))
+        position = {skill: i for i, skill in enumerate(skills)}
+        
+        rows, cols = [], []
+        for column, job_skill_list in enumerate(profile_skills):
+            for skill in job_skill_list:
+                rows.append(position[skill])
+                cols.append(column)
+        occurrence = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(skills), len(profile_skills))
+        )
+        names = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 3), lowercase=True).fit_transform(skills)
+        
+        weight = self.cooccurrence_weight
+        vectors = sp.hstack([
+            normalize(occurrence) * np.sqrt(weight),
+            normalize(names) * np.sqrt(1 - weight),
+        ], format='csr')
+        return skills, normalize(vectors)
+    
+    def _cluster(self, skills: List[str], vectors, threshold: float) -> Dict[str, List[str]]:
+        """코사인 유사도 행렬 기반 평균 연결 군집 (클러스터 내 평균 유사도 >= threshold), 큰 클러스터 순"""
+        if len(skills) < 2:
+            return {'cluster_0': list(skills)} if skills else {}
+        
+        similarity = vectors @ vectors.T
+        similarity = similarity.toarray() if sp.issparse(similarity) else np.asarray(similarity)
+        distance = np.clip(1.0 - similarity, 0.0, None)
+        np.fill_diagonal(distance, 0.0)
+        labels = AgglomerativeClustering(
+            n_clusters=None,
+            metric='precomputed',
+            linkage='average',
+            distance_threshold=1.0 - threshold,
+        ).fit_predict(distance)
+        
+        groups: Dict[int, List[str]] = {}
+        for skill, label in zip(skills, labels):
+            groups.setdefault(int(label), []).append(skill)
+        ordered = sorted(groups.values(), key=lambda members: (-len(members), members[0]))
+        return {f"cluster_{i}": members for i, members in enumerate(ordered)}
+    
     def _simple_clustering(self, embeddings: Dict[str, np.ndarray], 
                           threshold: float = 0.7) -> Dict[str, List[str]]:
-        """간단한 유사도 기반 클러스터링"""
-        clusters = {}
-        clustered = set()
-        
+        """임베딩 사전 → 클러스터 (유사도 행렬 한 번 계산)"""
         skills = list(embeddings.keys())
-        
-        for i, skill1 in enumerate(skills):
-            if skill1 in clustered:
-                continue
-                
-            cluster = [skill1]
-            clustered.add(skill1)
-            
-            for skill2 in skills[i+1:]:
-                if skill2 in clustered:
-                    continue
-                    
-                similarity = self.embedding_matcher.calculate_embedding_similarity(
-                    embeddings[skill1],
-                    embeddings[skill2]
-                )
-                
-                if similarity >= threshold * 100:
-                    cluster.append(skill2)
-                    clustered.add(skill2)
-            
-            cluster_name = f"cluster_{len(clusters)}"
-            clusters[cluster_name] = cluster
-        
-        return clusters
+        if not skills:
+            return {}
+        return self._cluster(skills, normalize(np.vstack([embeddings[s] for s in skills])), threshold)
 
 
 # 사용 예시
@@ -21,6 +21,7 @@ from .evaluation_matcher import (
     EvaluationGradeConverter
 )
 from .services import JobProfileService
+from .talent_pool import professionalism_grade
 
 
 class EvaluationIntegratedService:
@@ -32,9 +33,23 @@ class EvaluationIntegratedService:
         evaluation_period: Optional[EvaluationPeriod] = None
     ) -> dict:
         """평가 결과가 포함된 직원 프로파일 생성"""
-        
-        # 기본 프로파일 가져오기
-        profile = JobProfileService.get_employee_profile_dict(employee)
+        return EvaluationIntegratedService.get_employee_profiles_with_evaluation(
+            [employee], evaluation_period
+        )[employee.id]
+    
+    @staticmethod
+    def get_employee_profiles_with_evaluation(
+        employees: List[Employee],
+        evaluation_period: Optional[EvaluationPeriod] = None
+    ) -> Dict[int, dict]:
+        """평가 결과가 포함된 직원 프로파일 일괄 생성 {직원 ID: 프로파일}
+        
+        평가 기간은 한 번만 결정하고, 종합평가/평가 이력은 직원 수와 관계없이 한 번씩 조회합니다.
+        """
+        profiles = {
+            employee.id: JobProfileService.get_employee_profile_dict(employee)
+            for employee in employees
+        }
         
         # 평가 기간 설정 (없으면 최신 활성 기간)
         if not evaluation_period:
@@ -48,37 +63,52 @@ class EvaluationIntegratedService:
                 status='COMPLETED'
             ).order_by('-end_date').first()
         
-        if evaluation_period:
-            # 종합평가 조회
-            comprehensive_eval = ComprehensiveEvaluation.objects.filter(
-                employee=employee,
-                evaluation_period=evaluation_period
-            ).first()
+        if not evaluation_period or not profiles:
+            return profiles
+        
+        # 종합평가 조회 (직원별 첫 건)
+        comprehensive_evals = {}
+        for comprehensive_eval in ComprehensiveEvaluation.objects.filter(
+            employee_id__in=profiles,
+            evaluation_period=evaluation_period
+        ).select_related('contribution_evaluation', 'impact_evaluation').order_by('id'):
+            comprehensive_evals.setdefault(comprehensive_eval.employee_id, comprehensive_eval)
+        
+        if not comprehensive_evals:
+            return profiles
+        
+        # 평가 이력 (전체 건수, 등급 목록)
+        history = {}
+        for employee_id, grade in ComprehensiveEvaluation.objects.filter(
+            employee_id__in=comprehensive_evals
+        ).values_list('employee_id', 'final_grade'):
+            history.setdefault(employee_id, []).append(grade)
+        
+        for employee_id, comprehensive_eval in comprehensive_evals.items():
+            profile = profiles[employee_id]
             
-            if comprehensive_eval:
-                # 평가 결과 추가
-                profile['recent_evaluation'] = {
-                    'period': str(evaluation_period),
-                    'professionalism': comprehensive_eval.expertise_grade or 'B',
-                    'contribution': _get_contribution_level(
-                        comprehensive_eval.contribution_evaluation
-                    ),
-                    'impact': _get_impact_level(
-                        comprehensive_eval.impact_evaluation
-                    ),
-                    'overall_grade': comprehensive_eval.final_grade or 'B+',
-                    'evaluation_date': comprehensive_eval.created_at.isoformat()
-                }
-                
-                # 추가 평가 정보
-                profile['evaluation_history'] = {
-                    'total_evaluations': ComprehensiveEvaluation.objects.filter(
-                        employee=employee
-                    ).count(),
-                    'average_grade': _calculate_average_grade(employee)
-                }
-        
-        return profile
+            # 평가 결과 추가
+            profile['recent_evaluation'] = {
+                'period': str(evaluation_period),
+                'professionalism': professionalism_grade(comprehensive_eval) or 'B',
+                'contribution': _get_contribution_level(
+                    comprehensive_eval.contribution_evaluation
+                ),
+                'impact': _get_impact_level(
+                    comprehensive_eval.impact_evaluation
+                ),
+                'overall_grade': comprehensive_eval.final_grade or 'B+',
+                'evaluation_date': comprehensive_eval.created_at.isoformat()
+            }
+            
+            # 추가 평가 정보
+            grades = history.get(employee_id, [])
+            profile['evaluation_history'] = {
+                'total_evaluations': len(grades),
+                'average_grade': _average_grade([grade for grade in grades if grade is not None])
+            }
+        
+        return profiles
     
     @staticmethod
     def find_suitable_jobs_with_evaluation(
@@ -389,11 +419,14 @@ def _get_impact_level(impact_eval: Optional[ImpactEvaluation]) -> str:
 
 def _calculate_average_grade(employee: Employee) -> str:
     """직원의 평균 평가 등급 계산"""
-    evaluations = ComprehensiveEvaluation.objects.filter(
+    return _average_grade(ComprehensiveEvaluation.objects.filter(
         employee=employee,
         final_grade__isnull=False
-    ).values_list('final_grade', flat=True)
-    
+    ).values_list('final_grade', flat=True))
+
+
+def _average_grade(evaluations: List[str]) -> str:
+    """평가 등급 목록의 평균 등급"""
     if not evaluations:
         return "N/A"
     
@@ -10,6 +10,8 @@ import networkx as nx
 from collections import defaultdict, Counter
 import numpy as np
 
+from .transition_table import TransitionTable
+
 
 @dataclass
 class GrowthStage:
@@ -42,31 +44,38 @@ class GrowthPath:
 class GrowthPathRecommender:
     """성장 경로 추천 엔진"""
     
-    def __init__(self):
+    def __init__(self, transition_table: Optional[TransitionTable] = None):
         self.transition_graph = nx.DiGraph()
+        self.transition_table = TransitionTable({})
         self.transition_patterns = defaultdict(list)
         self.skill_progression = defaultdict(set)
+        self._reverse_paths = {}
+        if transition_table is not None:
+            self.use_transition_table(transition_table)
         
     def build_transition_graph(self, historical_transitions: Dict[str, List[str]]):
-        """역사적 전환 데이터로 전환 그래프 구축"""
-        for from_job, to_jobs in historical_transitions.items():
-            job_counter = Counter(to_jobs)
-            for to_job, count in job_counter.items():
-                # 전환 확률 = 해당 전환 횟수 / 전체 전환 횟수
-                probability = count / len(to_jobs)
-                self.transition_graph.add_edge(
-                    from_job, 
-                    to_job, 
-                    weight=probability,
-                    count=count
-                )
+        """역사적 전환 데이터로 전환 그래프 구축 (전환 확률 = 해당 전환 횟수 / 전체 전환 횟수)"""
+        self.use_transition_table(TransitionTable(historical_transitions))
+    
+    def use_transition_table(self, transition_table: TransitionTable):
+        """미리 계산된 전환 테이블 사용 (그래프와 모든 쌍 최고 경로 확률 공유)"""
+        self.transition_table = transition_table
+        self.transition_graph = transition_table.graph
+        self._reverse_paths = {}
                 
+    def _job_key(self, job_profile: dict) -> str:
+        """전환 그래프의 직무 키 (전환 이력은 직무명 기준이므로 ID 가 그래프에 없으면 직무명)"""
+        job_id = job_profile.get('job_id', job_profile.get('job_name'))
+        if job_id not in self.transition_table.index and job_profile.get('job_name') in self.transition_table.index:
+            return job_profile['job_name']
+        return job_id
+    
     def analyze_skill_progression(self, job_profiles: List[dict]):
         """직무 간 스킬 진화 패턴 분석"""
         # 직무별 스킬셋 저장
         job_skills = {}
         for profile in job_profiles:
-            job_id = profile.get('job_id', profile.get('job_name'))
+            job_id = self._job_key(profile)
             all_skills = set(
                 profile.get('basic_skills', []) + 
                 profile.get('applied_skills', [])
@@ -148,28 +157,13 @@ class GrowthPathRecommender:
         
         reachable_jobs = []
         
-        for job_profile in job_profiles:
-            job_id = job_profile.get('job_id', job_profile.get('job_name'))
-            
-            # 직접 전환 가능성 확인
-            if self.transition_graph.has_edge(current_job, job_id):
-                transition_prob = self.transition_graph[current_job][job_id]['weight']
-            else:
-                # 간접 경로 확인
-                try:
-                    # 최단 경로 찾기
-                    path = nx.shortest_path(self.transition_graph, current_job, job_id)
-                    # 경로상의 전환 확률 곱
-                    transition_prob = 1.0
-                    for i in range(len(path)-1):
-                        if self.transition_graph.has_edge(path[i], path[i+1]):
-                            transition_prob *= self.transition_graph[path[i]][path[i+1]]['weight']
-                        else:
-                            transition_prob = 0
-                            break
-                except nx.NetworkXNoPath:
-                    transition_prob = 0
-            
+        # 최고 확률 경로(전환 확률 곱 최대)의 확률 - 미리 계산된 테이블에서 조회
+        transition_probs = self.transition_table.probabilities(
+            current_job,
+            [self._job_key(job_profile) for job_profile in job_profiles]
+        )
+        
+        for job_profile, transition_prob in zip(job_profiles, transition_probs.tolist()):
             if transition_prob >= min_probability:
                 # 난이도 계산
                 difficulty = self.calculate_transition_difficulty(
@@ -206,24 +200,16 @@ class GrowthPathRecommender:
     ) -> GrowthPath:
         """성장 경로 시뮬레이션"""
         current_job = employee_profile.get('current_job', 'Unknown')
-        target_job = target_job_profile.get('job_id', target_job_profile.get('job_name'))
+        target_job = self._job_key(target_job_profile)
         
         # 경로 찾기
-        try:
-            if intermediate_jobs:
-                # 제공된 중간 직무 사용
-                path_jobs = [current_job] + [j.get('job_id', j.get('job_name')) 
-                            for j in intermediate_jobs] + [target_job]
-            else:
-                # 최적 경로 자동 탐색
-                path_jobs = nx.shortest_path(
-                    self.transition_graph, 
-                    current_job, 
-                    target_job
-                )
-        except nx.NetworkXNoPath:
-            # 직접 경로가 없는 경우 가상 경로 생성
-            path_jobs = [current_job, target_job]
+        if intermediate_jobs:
+            # 제공된 중간 직무 사용
+            path_jobs = [current_job] + [self._job_key(j) 
+                        for j in intermediate_jobs] + [target_job]
+        else:
+            # 최고 확률 경로 (없으면 직접 전환하는 가상 경로)
+            path_jobs = self.transition_table.path(current_job, target_job) or [current_job, target_job]
         
         # 각 단계별 성장 스테이지 생성
         stages = []
@@ -240,7 +226,7 @@ class GrowthPathRecommender:
                 to_profile = target_job_profile
             elif intermediate_jobs:
                 to_profile = next((j for j in intermediate_jobs 
-                                 if j.get('job_id', j.get('job_name')) == to_job), None)
+                                 if self._job_key(j) == to_job), None)
             
             if not to_profile:
                 # 기본 프로파일 생성
@@ -384,7 +370,11 @@ class GrowthPathRecommender:
         max_depth: int = 3
     ) -> List[List[str]]:
         """목표 직무로부터 역방향 경로 탐색"""
-        target_job = target_job_profile.get('job_id', target_job_profile.get('job_name'))
+        target_job = self._job_key(target_job_profile)
+        
+        # 직원과 무관하므로 목표 직무별로 한 번만 탐색
+        if (target_job, max_depth) in self._reverse_paths:
+            return self._reverse_paths[(target_job, max_depth)]
         
         # 목표 직무로 전환 가능한 이전 직무들 찾기
         reverse_paths = []
@@ -422,14 +412,67 @@ class GrowthPathRecommender:
         # 확률 높은 순으로 정렬
         path_with_probs.sort(key=lambda x: x[1], reverse=True)
         
-        return [path for path, _ in path_with_probs[:5]]  # 상위 5개 경로
+        top_paths = [path for path, _ in path_with_probs[:5]]  # 상위 5개 경로
+        self._reverse_paths[(target_job, max_depth)] = top_paths
+        return top_paths
+
+    def recommend(
+        self,
+        employee_profile: dict,
+        job_profiles: List[dict],
+        top_n: int = 3
+    ) -> List[dict]:
+        """도달 가능한 직무 상위 N개의 성장 경로 (전환 그래프/스킬 진화 분석 후 직원마다 호출)"""
+        # 도달 가능한 직무 찾기
+        reachable_jobs = self.find_reachable_jobs(
+            employee_profile, 
+            job_profiles,
+            max_years=10,
+            min_probability=0.2
+        )
+        
+        # 상위 N개 직무에 대한 성장 경로 생성
+        growth_paths = []
+        for job_info in reachable_jobs[:top_n]:
+            job_profile = job_info['job_profile']
+        
+            # 성장 경로 시뮬레이션
+            growth_path = self.simulate_growth_path(
+                employee_profile,
+                job_profile
+            )
+        
+            # 역방향 경로 탐색 (어떤 경로로 왔는지)
+            reverse_paths = self.find_reverse_path(
+                job_profile,
+                job_profiles,
+                max_depth=3
+            )
+        
+            growth_paths.append({
+                'target_job': job_profile.get('job_name'),
+                'match_info': job_info,
+                'growth_path': growth_path,
+                'alternative_paths': reverse_paths[:3],  # 대안 경로
+                'priority_score': (
+                    job_info['probability'] * 0.4 +
+                    (100 - job_info['difficulty']) / 100 * 0.3 +
+                    (10 - min(10, job_info['expected_years'])) / 10 * 0.3
+                )
+            })
+        
+        # 우선순위 점수로 정렬
+        growth_paths.sort(key=lambda x: x['priority_score'], reverse=True)
+        
+        return growth_paths
 
 
 def recommend_growth_path(
     employee_profile: dict,
     job_profiles: List[dict],
     historical_transitions: Dict[str, List[str]],
-    top_n: int = 3
+    top_n: int = 3,
+    transition_table: Optional[TransitionTable] = None
 ) -> List[dict]:
     """
     직무 성장경로 추천 메인 함수
@@ -439,60 +482,21 @@ def recommend_growth_path(
         job_profiles: 전체 직무 프로파일 리스트
         historical_transitions: 과거 직무 전환 이력
         top_n: 추천할 경로 수
+        transition_table: 미리 계산된 전환 테이블 (없으면 historical_transitions 로 구축)
     
     Returns:
         추천 성장 경로 리스트
     """
-    recommender = GrowthPathRecommender()
+    recommender = GrowthPathRecommender(transition_table)
     
     # 전환 그래프 구축
-    recommender.build_transition_graph(historical_transitions)
+    if transition_table is None:
+        recommender.build_transition_graph(historical_transitions)
     
     # 스킬 진화 패턴 분석
     recommender.analyze_skill_progression(job_profiles)
     
-    # 도달 가능한 직무 찾기
-    reachable_jobs = recommender.find_reachable_jobs(
-        employee_profile, 
-        job_profiles,
-        max_years=10,
-        min_probability=0.2
-    )
-    
-    # 상위 N개 직무에 대한 성장 경로 생성
-    growth_paths = []
-    for job_info in reachable_jobs[:top_n]:
-        job_profile = job_info['job_profile']
-        
-        # 성장 경로 시뮬레이션
-        growth_path = recommender.simulate_growth_path(
-            employee_profile,
-            job_profile
-        )
-        
-        # 역방향 경로 탐색 (어떤 경로로 왔는지)
-        reverse_paths = recommender.find_reverse_path(
-            job_profile,
-            job_profiles,
-            max_depth=3
-        )
-        
-        growth_paths.append({
-            'target_job': job_profile.get('job_name'),
-            'match_info': job_info,
-            'growth_path': growth_path,
-            'alternative_paths': reverse_paths[:3],  # 대안 경로
-            'priority_score': (
-                job_info['probability'] * 0.4 +
-                (100 - job_info['difficulty']) / 100 * 0.3 +
-                (10 - min(10, job_info['expected_years'])) / 10 * 0.3
-            )
-        })
-    
-    # 우선순위 점수로 정렬
-    growth_paths.sort(key=lambda x: x['priority_score'], reverse=True)
-    
-    return growth_paths
+    return recommender.recommend(employee_profile, job_profiles, top_n=top_n)
 
 
 # 사용 예시
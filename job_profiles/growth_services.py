@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from django.db.models import Q, Count, Avg
 from django.contrib.auth.models import User
 from collections import defaultdict, Counter
+from dataclasses import dataclass, field
 import json
 
 from employees.models import Employee
@@ -23,6 +24,27 @@ from .growth_path_recommender import (
 )
 from .services import JobProfileService
 from .evaluation_services import EvaluationIntegratedService
+from .transition_table import transition_tables
+
+
+@dataclass
+class GrowthPathContext:
+    """성장 경로 계산 공유 데이터 (부서 일괄 분석 시 직원 간 재사용)"""
+    recommender: GrowthPathRecommender
+    job_profile_dicts: List[dict]
+    job_profiles_by_name: Dict[str, JobProfile]
+    headcounts: List[Tuple[str, int]]
+    _current_employees: Dict[str, int] = field(default_factory=dict)
+    
+    def current_employees(self, job_name: str) -> int:
+        """직급명에 직무명이 포함된 인원 수 (position__icontains 와 동일 기준)"""
+        if job_name not in self._current_employees:
+            keyword = job_name.lower()
+            self._current_employees[job_name] = sum(
+                count for position, count in self.headcounts
+                if keyword in (position or '').lower()
+            )
+        return self._current_employees[job_name]
 
 
 class CareerTransitionAnalyzer:
@@ -40,47 +62,31 @@ class CareerTransitionAnalyzer:
         """
         transitions = defaultdict(list)
         
-        # Employee 모델에 job_history 필드가 있다고 가정
-        # 실제로는 별도의 JobHistory 모델이 필요할 수 있음
-        employees = Employee.objects.filter(
+        # 직무 이력 모델이 없으므로 position 기반 추정 (직급 목록만 조회)
+        positions = Employee.objects.filter(
             employment_status='재직'
-        ).prefetch_related('job_history')
-        
-        for employee in employees:
-            # 간단한 시뮬레이션 - 실제로는 JobHistory 모델 사용
-            # position 변경 이력을 기반으로 추정
-            if hasattr(employee, 'job_history'):
-                history = employee.job_history.order_by('start_date')
-                for i in range(len(history) - 1):
-                    from_job = history[i].job_title
-                    to_job = history[i + 1].job_title
-                    transitions[from_job].append(to_job)
-            else:
-                # 데이터가 없는 경우 position 기반 추정
-                current_position = employee.position
-                if '시니어' in current_position and '주니어' not in current_position:
-                    transitions['주니어 개발자'].append(current_position)
-                elif '매니저' in current_position:
-                    transitions['시니어 개발자'].append(current_position)
-                elif '팀장' in current_position or '리드' in current_position:
-                    transitions['매니저'].append(current_position)
-        
-        # 직무 프로파일 기반 추가 데이터
-        job_roles = JobRole.objects.all().select_related('job_type')
-        
-        # 카테고리와 타입 기반 전환 패턴 추가
-        for role in job_roles:
-            role_name = role.name
-            type_name = role.job_type.name
-            
-            # 같은 타입 내 상위 역할로의 전환
-            senior_roles = JobRole.objects.filter(
-                job_type=role.job_type,
-                level__gt=getattr(role, 'level', 1)  # level 필드가 있다고 가정
-            )
-            
-            for senior_role in senior_roles:
-                transitions[role_name].append(senior_role.name)
+        ).values_list('position', flat=True)
+        
+        for current_position in positions:
+            current_position = current_position or ''
+            if '시니어' in current_position and '주니어' not in current_position:
+                transitions['주니어 개발자'].append(current_position)
+            elif '매니저' in current_position:
+                transitions['시니어 개발자'].append(current_position)
+            elif '팀장' in current_position or '리드' in current_position:
+                transitions['매니저'].append(current_position)
+        
+        # 직무 프로파일 기반 추가 데이터 (직종별로 한 번에 묶어 비교)
+        roles_by_type = defaultdict(list)
+        for role in JobRole.objects.all():
+            roles_by_type[role.job_type_id].append(role)
+        
+        # 같은 타입 내 상위 역할로의 전환 (level 이 있는 직무만 해당)
+        for roles in roles_by_type.values():
+            for role in roles:
+                for senior_role in roles:
+                    if getattr(senior_role, 'level', 1) > getattr(role, 'level', 1):
+                        transitions[role.name].append(senior_role.name)
         
         # 기본 전환 패턴 추가 (도메인 지식 기반)
         default_transitions = {
@@ -133,45 +139,64 @@ class GrowthPathService:
         else:
             employee_profile = JobProfileService.get_employee_profile_dict(employee)
         
-        # 현재 직무 설정
-        current_job = self._get_current_job_name(employee)
-        employee_profile['current_job'] = current_job
-        
         # 대상 직무 프로파일
         if target_job_ids:
-            job_profiles = JobProfile.objects.filter(
+            job_profiles = list(JobProfile.objects.filter(
                 id__in=target_job_ids,
                 is_active=True
-            ).select_related('job_role__job_type__category')
+            ).select_related('job_role__job_type__category'))
         else:
             # 자동 추천: 같은 카테고리 또는 인접 카테고리의 상위 직무
             job_profiles = self._find_relevant_job_profiles(employee)
         
-        # 직무 프로파일 변환
+        return self._build_growth_paths(
+            employee, employee_profile, self._growth_context(job_profiles), top_n
+        )
+    
+    def _growth_context(self, job_profiles: List[JobProfile]) -> GrowthPathContext:
+        """여러 직원이 공유하는 성장 경로 계산 준비 (직무 변환, 전환 테이블, 직급별 인원)"""
         job_profile_dicts = [
             JobProfileService.get_job_profile_dict(jp)
             for jp in job_profiles
         ]
         
-        # 역사적 전환 데이터
-        historical_transitions = self.transition_analyzer.extract_historical_transitions()
+        # 전환 그래프/최고 경로 확률 테이블은 전환 이력이 바뀔 때만 재계산
+        recommender = GrowthPathRecommender(transition_tables.load())
+        recommender.analyze_skill_progression(job_profile_dicts)
+        
+        job_profiles_by_name = {}
+        for jp in job_profiles:
+            job_profiles_by_name.setdefault(jp.job_role.name, jp)
+        
+        # 직급별 인원 (그룹 쿼리 한 번)
+        headcounts = list(
+            Employee.objects.values('position').annotate(count=Count('id')).values_list('position', 'count')
+        )
+        
+        return GrowthPathContext(recommender, job_profile_dicts, job_profiles_by_name, headcounts)
+    
+    def _build_growth_paths(
+        self,
+        employee: Employee,
+        employee_profile: dict,
+        context: GrowthPathContext,
+        top_n: int = 3
+    ) -> List[Dict]:
+        """공유 컨텍스트로 직원 한 명의 성장 경로 추천 (추가 쿼리 없음)"""
+        # 현재 직무 설정
+        employee_profile['current_job'] = self._get_current_job_name(employee)
         
         # 성장 경로 추천
-        growth_paths = recommend_growth_path(
+        growth_paths = context.recommender.recommend(
             employee_profile,
-            job_profile_dicts,
-            historical_transitions,
+            context.job_profile_dicts,
             top_n=top_n
         )
         
         # Django 모델과 연결
         for path_info in growth_paths:
             # 대상 직무 객체 연결
-            target_job_name = path_info['target_job']
-            target_profile = next(
-                (jp for jp in job_profiles if jp.job_role.name == target_job_name),
-                None
-            )
+            target_profile = context.job_profiles_by_name.get(path_info['target_job'])
             if target_profile:
                 path_info['target_job_profile'] = target_profile
                 path_info['target_job_category'] = target_profile.job_role.job_type.category.name
@@ -179,10 +204,8 @@ class GrowthPathService:
             # 성장 단계별 추가 정보
             growth_path = path_info['growth_path']
             for stage in growth_path.stages:
-                # 해당 직무의 현재 인원 수
-                stage.current_employees = Employee.objects.filter(
-                    position__icontains=stage.job_name
-                ).count()
+                # 해당 직무의 현재 인원 수 (직급명에 직무명이 포함된 인원)
+                stage.current_employees = context.current_employees(stage.job_name)
                 
                 # 평균 연봉 정보 (있다면)
                 stage.avg_salary = self._get_average_salary(stage.job_name)
@@ -193,15 +216,21 @@ class GrowthPathService:
         self,
         department: str
     ) -> Dict:
-        """부서별 성장 잠재력 분석"""
-        employees = Employee.objects.filter(
+        """부서별 성장 잠재력 분석
+        
+        직원 프로파일/평가, 관련 직무, 직급별 인원, 전환 테이블을 부서 단위로 한 번씩 준비하고
+        직원별 경로는 메모리에서 계산합니다.
+        """
+        employees = list(Employee.objects.filter(
             department=department,
             employment_status='재직'
-        )
+        ))
+        employee_profiles = EvaluationIntegratedService.get_employee_profiles_with_evaluation(employees)
+        context = self._growth_context(self._find_department_job_profiles(department))
         
         department_analysis = {
             'department': department,
-            'total_employees': employees.count(),
+            'total_employees': len(employees),
             'growth_ready': 0,
             'need_development': 0,
             'blocked': 0,
@@ -213,9 +242,10 @@ class GrowthPathService:
         
         for employee in employees:
             # 각 직원의 성장 경로 분석
-            growth_paths = self.get_employee_growth_paths(
+            growth_paths = self._build_growth_paths(
                 employee,
-                include_evaluation=True,
+                employee_profiles[employee.id],
+                context,
                 top_n=1
             )
             
@@ -401,6 +431,14 @@ class GrowthPathService:
         max_count: int = 10
     ) -> List[JobProfile]:
         """직원에게 관련성 높은 직무 프로파일 찾기"""
+        return self._find_department_job_profiles(employee.department, max_count)
+    
+    def _find_department_job_profiles(
+        self,
+        department: str,
+        max_count: int = 10
+    ) -> List[JobProfile]:
+        """부서와 관련성 높은 직무 프로파일 찾기"""
         # 같은 부서 또는 관련 카테고리
         relevant_categories = []
         
@@ -413,20 +451,20 @@ class GrowthPathService:
         }
         
         relevant_categories = dept_category_mapping.get(
-            employee.department, 
+            department, 
             ['General']
         )
         
-        # 관련 직무 프로파일 조회
+        # 관련 직무 프로파일 조회 (직종에 level 필드가 없으므로 직무 기본 순서)
         job_profiles = JobProfile.objects.filter(
             Q(job_role__job_type__category__name__in=relevant_categories) |
-            Q(job_role__description__icontains=employee.department),
+            Q(job_role__description__icontains=department),
             is_active=True
         ).select_related(
             'job_role__job_type__category'
-        ).order_by('-job_role__job_type__level')[:max_count]
+        ).order_by('job_role__job_type', 'job_role__code')[:max_count]
         
-        return job_profiles
+        return list(job_profiles)
     
     def _get_average_salary(self, job_name: str) -> Optional[float]:
         """직무별 평균 연봉 조회"""
@@ -23,6 +23,7 @@ from .leader_recommender import (
 from .services import JobProfileService
 from .evaluation_services import EvaluationIntegratedService
 from .recommendation_comment_generator import generate_recommendation_comment
+from .talent_pool import professionalism_grade, target_requirements, talent_pool_engine
 
 
 class LeaderRecommendationService:
@@ -54,25 +55,21 @@ class LeaderRecommendationService:
         # 대상 직무 정보 변환
         target_job = self._convert_job_profile_to_dict(target_job_profile)
         
-        # 후보 직원 조회
-        employee_query = Employee.objects.filter(
-            employment_status='재직'
+        # 재직 직원 전체를 일괄 평가해 적격자 상위 top_n 명만 선별 (평가 기간별 메모)
+        pool = talent_pool_engine.load(self._convert_employee_to_dict)
+        scores = talent_pool_engine.score(
+            pool, [target_requirements(target_job, min_evaluation_grade, min_growth_level)]
+        )
+        rows = talent_pool_engine.top_rows(
+            pool, scores, 0, top_n,
+            department=department,
+            exclude_low_performers=exclude_low_performers
         )
         
-        if department:
-            employee_query = employee_query.filter(department=department)
-        
-        # 직원 정보 변환
-        all_employees = []
-        for employee in employee_query:
-            emp_dict = self._convert_employee_to_dict(employee)
-            if emp_dict:
-                all_employees.append(emp_dict)
-        
-        # 리더 후보 추천
+        # 리더 후보 추천 (추천 사유/리스크 등 상세 결과는 선별된 후보만)
         candidates = recommend_leader_candidates(
             target_job=target_job,
-            all_employees=all_employees,
+            all_employees=[pool.dicts[row] for row in rows],
             min_evaluation_grade=min_evaluation_grade,
             min_growth_level=min_growth_level,
             top_n=top_n,
@@ -80,8 +77,9 @@ class LeaderRecommendationService:
         )
         
         # Django 모델과 연결
+        employees = {str(pool.employees[row].id): pool.employees[row] for row in rows}
         for candidate in candidates:
-            emp_obj = Employee.objects.get(id=candidate['employee_id'])
+            emp_obj = employees[candidate['employee_id']]
             candidate['employee_object'] = emp_obj
             candidate['photo_url'] = self._get_employee_photo_url(emp_obj)
             candidate['current_projects'] = self._get_current_projects(emp_obj)
@@ -195,21 +193,22 @@ class LeaderRecommendationService:
             {'name': '임원', 'positions': ['이사', '상무', '전무', '부사장']}
         ]
         
-        # 각 레벨별 인원 및 준비도 분석
+        # 각 레벨별 인원 및 준비도 분석 (재직 직원/최근 평가는 한 번에 조회)
+        pool = talent_pool_engine.load(self._convert_employee_to_dict)
         for level in leadership_levels:
-            level_employees = Employee.objects.filter(
-                employment_status='재직',
-                position__in=level['positions']
-            )
+            level_employees = [
+                (emp, emp_dict) for emp, emp_dict in zip(pool.employees, pool.dicts)
+                if emp.position in level['positions']
+            ]
             
             # 다음 레벨 준비자 수 계산
             next_level_ready = 0
             high_potentials = 0
             
-            for emp in level_employees:
+            for emp, emp_dict in level_employees:
                 # 최근 평가 확인
-                recent_eval = self._get_recent_evaluation(emp)
-                if recent_eval and recent_eval.final_grade in ['S', 'A+', 'A']:
+                recent_eval = emp_dict.get('recent_evaluation')
+                if recent_eval and recent_eval['overall_grade'] in ['S', 'A+', 'A']:
                     high_potentials += 1
                     
                     # 성장 레벨 확인 (간단한 로직)
@@ -217,10 +216,10 @@ class LeaderRecommendationService:
                         next_level_ready += 1
             
             pipeline_analysis['leadership_levels'][level['name']] = {
-                'total_count': level_employees.count(),
+                'total_count': len(level_employees),
                 'high_potentials': high_potentials,
                 'next_level_ready': next_level_ready,
-                'readiness_ratio': next_level_ready / max(level_employees.count(), 1)
+                'readiness_ratio': next_level_ready / max(len(level_employees), 1)
             }
         
         # 인재 흐름 분석
@@ -260,19 +259,14 @@ class LeaderRecommendationService:
                 job_role__job_type__category__name__in=job_categories
             )
         
-        job_profiles = list(job_profiles_query)
+        job_profiles = list(job_profiles_query.select_related('job_role__job_type__category'))
         
-        # 전체 직원 데이터
+        # 전체 직원 데이터 (직원/최근 평가 일괄 조회, 평가 기간별 메모)
         all_employees = Employee.objects.filter(
             employment_status='재직'
         )
-        
-        # 직원 데이터 변환
-        employee_dicts = []
-        for emp in all_employees:
-            emp_dict = self._convert_employee_to_dict(emp)
-            if emp_dict:
-                employee_dicts.append(emp_dict)
+        pool = talent_pool_engine.load(self._convert_employee_to_dict)
+        employee_dicts = pool.dicts
         
         # 직무 프로파일 변환
         job_profile_dicts = [
@@ -290,7 +284,7 @@ class LeaderRecommendationService:
         report = {
             'generated_at': datetime.now().isoformat(),
             'summary': {
-                'total_employees': len(all_employees),
+                'total_employees': all_employees.count(),
                 'total_departments': talent_pool['total_departments'],
                 'leadership_ready': talent_pool['organization_stats']['total_team_lead_candidates'],
                 'high_potentials': talent_pool['organization_stats']['total_high_potentials']
@@ -301,41 +295,43 @@ class LeaderRecommendationService:
         }
         
         # 부서별 상세 분석
+        tenures = defaultdict(list)
+        for emp_dict in employee_dicts:
+            tenures[emp_dict['department']].append(emp_dict['career_years'])
         for dept, details in talent_pool['department_details'].items():
-            dept_employees = all_employees.filter(department=dept)
-            
             report['department_analysis'][dept] = {
                 'total': details['total_employees'],
                 'leadership_candidates': len(details['team_lead_candidates']),
                 'high_potentials': len(details['high_potentials']),
-                'avg_tenure': dept_employees.aggregate(
-                    avg=Avg(F('employment_date'))
-                )['avg'],
+                'avg_tenure': sum(tenures[dept]) / len(tenures[dept]) if tenures[dept] else None,
                 'top_candidates': details['team_lead_candidates'][:3],
                 'critical_skills': details['top_skills'][:5]
             }
         
-        # 직무 카테고리별 분석
+        # 직무 카테고리별 분석 (전체 직원 x 전체 직무 점수 행렬 한 번)
         if job_categories:
+            scores = talent_pool_engine.score(
+                pool, [target_requirements(job) for job in job_profile_dicts]
+            )
+            qualified_counts = talent_pool_engine.eligible(
+                pool, scores, exclude_low_performers=True
+            ).sum(axis=0)
+            
             for category in job_categories:
-                category_profiles = [
-                    jp for jp in job_profiles 
+                category_columns = [
+                    i for i, jp in enumerate(job_profiles)
                     if jp.job_role.job_type.category.name == category
                 ]
                 
-                category_ready = 0
-                for profile in category_profiles:
-                    candidates = self.find_leader_candidates(
-                        target_job_profile=profile,
-                        top_n=100,  # 전체 적격자 수 파악
-                        exclude_low_performers=True
-                    )
-                    category_ready += len(candidates)
+                # 직무별 적격자 수 (직무당 최대 100명까지 집계)
+                category_ready = sum(
+                    min(int(qualified_counts[i]), 100) for i in category_columns
+                )
                 
                 report['job_category_analysis'][category] = {
-                    'total_positions': len(category_profiles),
+                    'total_positions': len(category_columns),
                     'qualified_candidates': category_ready,
-                    'fill_ratio': category_ready / max(len(category_profiles), 1)
+                    'fill_ratio': category_ready / max(len(category_columns), 1)
                 }
         
         # 종합 추천사항
@@ -365,8 +361,8 @@ class LeaderRecommendationService:
         
         return job_dict
     
-    def _convert_employee_to_dict(self, employee: Employee) -> Optional[dict]:
-        """Employee 모델을 딕셔너리로 변환"""
+    def _convert_employee_to_dict(self, employee: Employee, evaluations: Optional[list] = None) -> Optional[dict]:
+        """Employee 모델을 딕셔너리로 변환 (evaluations: 최근 종합평가 최신순, 없으면 조회)"""
         try:
             # 기본 정보
             emp_dict = {
@@ -383,26 +379,27 @@ class LeaderRecommendationService:
             emp_dict['level'] = self._estimate_growth_level(employee)
             
             # 평가 정보
-            recent_eval = self._get_recent_evaluation(employee)
-            if recent_eval:
+            if evaluations is None:
+                evaluations = list(ComprehensiveEvaluation.objects.filter(
+                    employee=employee
+                ).order_by('-created_at')[:talent_pool_engine.recent_evaluations])
+            
+            if evaluations:
+                recent_eval = evaluations[0]
                 emp_dict['recent_evaluation'] = {
                     'overall_grade': recent_eval.final_grade,
-                    'professionalism': recent_eval.expertise_grade,
+                    'professionalism': professionalism_grade(recent_eval),
                     'contribution': self._get_contribution_level(recent_eval),
                     'impact': self._get_impact_level(recent_eval)
                 }
                 
                 # 최근 평가 이력
-                recent_evals = ComprehensiveEvaluation.objects.filter(
-                    employee=employee
-                ).order_by('-created_at')[:4]
-                
                 emp_dict['recent_evaluations'] = [
                     {
                         'overall_grade': e.final_grade,
-                        'professionalism': e.expertise_grade
+                        'professionalism': professionalism_grade(e)
                     }
-                    for e in recent_evals
+                    for e in evaluations
                 ]
             
             # 리더십 경험 (position에서 추정)
@@ -424,10 +421,7 @@ class LeaderRecommendationService:
     
     def _calculate_career_years(self, employee: Employee) -> int:
         """경력 년수 계산"""
-        if employee.employment_date:
-            years = (datetime.now().date() - employee.employment_date).days / 365
-            return int(years)
-        return 0
+        return employee.get_service_years() or 0
     
     def _estimate_growth_level(self, employee: Employee) -> str:
         """직급 기반 성장 레벨 추정"""
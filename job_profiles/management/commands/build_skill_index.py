@@ -0,0 +1,19 @@
+"""
+Django 관리 명령어 - 스킬 벡터 인덱스 재구축
+전체 직무 프로파일로 TF-IDF 어휘/IDF 를 다시 학습하고 직무/직원 행렬을 새로 저장합니다.
+"""
+from django.core.management.base import BaseCommand
+
+from job_profiles.skill_index import skill_index
+
+
+class Command(BaseCommand):
+    help = '직무/직원 스킬 벡터 인덱스를 재구축합니다.'
+    
+    def handle(self, *args, **options):
+        payload = skill_index.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"스킬 인덱스 재구축 완료: 직무 {len(payload['job_ids'])}건, "
+            f"직원 {len(payload['employee_ids'])}명, 어휘 {len(payload['vectorizer'].vocabulary_)}개 "
+            f"({skill_index.path})"
+        ))
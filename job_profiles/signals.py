@@ -0,0 +1,32 @@
+"""
+직무 프로파일 시그널 - 직무/직원 변경 시 스킬 인덱스 행 갱신
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from employees.models import Employee
+from .models import JobProfile
+from .skill_index import employee_skills, job_skills, skill_index
+
+
+@receiver(post_save, sender=JobProfile)
+def job_profile_saved(sender, instance, **kwargs):
+    skills = job_skills(instance) if instance.is_active else None
+    transaction.on_commit(lambda: skill_index.update_job(str(instance.pk), skills))
+
+
+@receiver(post_delete, sender=JobProfile)
+def job_profile_deleted(sender, instance, **kwargs):
+    transaction.on_commit(lambda: skill_index.update_job(str(instance.pk), None))
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, **kwargs):
+    skills = employee_skills(instance) if instance.employment_status == '재직' else None
+    transaction.on_commit(lambda: skill_index.update_employee(instance.pk, skills))
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    transaction.on_commit(lambda: skill_index.update_employee(instance.pk, None))
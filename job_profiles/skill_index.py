@@ -0,0 +1,242 @@
+"""
+직무/직원 스킬 벡터 인덱스
+JobProfile 전체 스킬(기본/응용 기술, 관련 자격증)로 TF-IDF 어휘를 한 번 학습하고,
+모든 직무와 재직 직원의 스킬 벡터를 L2 정규화 희소 행렬로 저장합니다.
+
+- 조회: 질의 벡터(들) x 대상 행렬 전치 희소 곱 한 번으로 top-k (행이 L2 정규화되어 있어 내적 = 코사인)
+- 저장: 모델 레지스트리(joblib, 원자적 교체)로 저장해 다른 프로세스에도 반영
+- 갱신: JobProfile/Employee 저장 시그널이 해당 행만 다시 벡터화 (어휘에 없는 스킬이 생기면 다음 조회 시 재학습)
+- 전체 재구축: manage.py build_skill_index (야간 배치 권장, IDF 재계산)
+
+    matches = skill_index.top_jobs_for_employee(employee.id, k=5)     # [(job_id, 87.3), ...]
+    matches = skill_index.top_jobs_for_skills(['Python', 'SQL'], k=5)
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+from django.conf import settings
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from airiss.model_registry import model_registry
+
+logger = logging.getLogger(__name__)
+
+
+def skill_terms(skills: Iterable[str]) -> List[str]:
+    """스킬 목록 → 색인 단어 (정규화한 스킬 전체 + 여러 단어로 된 스킬의 각 단어)"""
+    terms = []
+    for skill in skills or []:
+        normalized = ' '.join(str(skill).lower().split())
+        if not normalized:
+            continue
+        terms.append(normalized)
+        words = normalized.split(' ')
+        if len(words) > 1:
+            terms.extend(words)
+    return terms
+
+
+def job_skills(job_profile) -> List[str]:
+    return (
+        list(job_profile.basic_skills or [])
+        + list(job_profile.applied_skills or [])
+        + list(job_profile.related_certifications or [])
+    )
+
+
+def employee_skills(employee) -> List[str]:
+    from .services import JobProfileService
+
+    profile = JobProfileService.get_employee_profile_dict(employee)
+    return profile['skills'] + profile['certifications']
+
+
+class SkillIndex:
+    """스킬 벡터 인덱스 (직무 행렬 + 직원 행렬, 공통 어휘)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or getattr(
+            settings, 'SKILL_INDEX_PATH',
+            os.path.join(settings.BASE_DIR, 'job_profiles', 'models', 'skill_index.joblib')
+        )
+        self._lock = threading.Lock()
+        self._positions: Tuple[Optional[object], Dict[str, Dict]] = (None, {})
+
+    # ------------------------------------------------------------------
+    # 구축
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _vectorizer() -> TfidfVectorizer:
+        return TfidfVectorizer(analyzer=skill_terms, sublinear_tf=True, norm='l2')
+
+    def build(self, jobs: Dict[str, Sequence[str]], employees: Dict[int, Sequence[str]]) -> Dict:
+        """직무 스킬로 어휘 학습 후 직무/직원 행렬 생성 및 저장"""
+        job_ids = list(jobs)
+        vectorizer = self._vectorizer()
+        if any(skill_terms(skills) for skills in jobs.values()):
+            job_matrix = vectorizer.fit_transform([jobs[job_id] for job_id in job_ids]).tocsr()
+        else:
+            vectorizer.fit([['-']])
+            job_matrix = sp.csr_matrix((len(job_ids), len(vectorizer.vocabulary_)))
+
+        employee_ids = list(employees)
+        payload = {
+            'vectorizer': vectorizer,
+            'job_ids': job_ids,
+            'jobs': job_matrix.astype(np.float32),
+            'employee_ids': employee_ids,
+            'employees': self._transform(vectorizer, [employees[e] for e in employee_ids]),
+            'built_at': time.time(),
+        }
+        model_registry.save(self.path, payload)
+        logger.info(f"스킬 인덱스 구축: 직무 {len(job_ids)}건, 직원 {len(employee_ids)}명, 어휘 {len(vectorizer.vocabulary_)}개")
+        return payload
+
+    def rebuild(self) -> Dict:
+        """DB 전체로 재구축"""
+        from employees.models import Employee
+        from .models import JobProfile
+
+        profiles = JobProfile.objects.filter(is_active=True).only(
+            'id', 'basic_skills', 'applied_skills', 'related_certifications'
+        )
+        jobs = {str(profile.id): job_skills(profile) for profile in profiles}
+        employees = {
+            employee.id: employee_skills(employee)
+            for employee in Employee.objects.filter(employment_status='재직').only('id', 'name', 'department', 'position')
+        }
+        with self._lock:
+            return self.build(jobs, employees)
+
+    @staticmethod
+    def _transform(vectorizer: TfidfVectorizer, documents: List[Sequence[str]]) -> sp.csr_matrix:
+        if not documents:
+            return sp.csr_matrix((0, len(vectorizer.vocabulary_)), dtype=np.float32)
+        return vectorizer.transform(documents).tocsr().astype(np.float32)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def load(self, build: bool = True) -> Optional[Dict]:
+        """현재 인덱스 (없으면 DB 로 구축)"""
+        entry = model_registry.get(self.path)
+        if not build:
+            return entry.payload if entry is not None else None
+        if entry is None or entry.payload.get('stale'):
+            return self.rebuild()
+        return entry.payload
+
+    def _position(self, payload: Dict, kind: str, key) -> Optional[int]:
+        """ID → 행 번호 (인덱스 버전마다 한 번만 계산)"""
+        cached_payload, positions = self._positions
+        if cached_payload is not payload:
+            positions = {
+                'job': {job_id: i for i, job_id in enumerate(payload['job_ids'])},
+                'employee': {employee_id: i for i, employee_id in enumerate(payload['employee_ids'])},
+            }
+            self._positions = (payload, positions)
+        return positions[kind].get(key)
+
+    def vectorize(self, skills: Sequence[str]) -> sp.csr_matrix:
+        payload = self.load()
+        return self._transform(payload['vectorizer'], [list(skills)])
+
+    @staticmethod
+    def top_k(queries: sp.csr_matrix, targets: sp.csr_matrix, ids: Sequence, k: int = 5,
+              exclude: Iterable = ()) -> List[List[Tuple[object, float]]]:
+        """질의 행마다 유사도 상위 k개 (희소 행렬 곱 한 번, 점수는 0-100)"""
+        if targets.shape[0] == 0:
+            return [[] for _ in range(queries.shape[0])]
+        scores = (queries @ targets.T).toarray()
+        exclude = set(exclude)
+        if exclude:
+            scores[:, [i for i, target_id in enumerate(ids) if target_id in exclude]] = -1.0
+        k = min(k, scores.shape[1])
+        results = []
+        for row in scores:
+            top = np.argpartition(-row, k - 1)[:k]
+            top = top[np.argsort(-row[top], kind='stable')]
+            results.append([(ids[i], round(float(row[i]) * 100, 2)) for i in top if row[i] > 0])
+        return results
+
+    def top_jobs_for_skills(self, skills: Sequence[str], k: int = 5, exclude: Iterable = ()) -> List[Tuple[str, float]]:
+        payload = self.load()
+        query = self._transform(payload['vectorizer'], [list(skills)])
+        return self.top_k(query, payload['jobs'], payload['job_ids'], k, exclude)[0]
+
+    def top_jobs_for_employee(self, employee_id: int, k: int = 5, exclude: Iterable = ()) -> List[Tuple[str, float]]:
+        payload = self.load()
+        row = self._position(payload, 'employee', employee_id)
+        if row is None:
+            return []
+        return self.top_k(payload['employees'][row], payload['jobs'], payload['job_ids'], k, exclude)[0]
+
+    def top_employees_for_job(self, job_id: str, k: int = 10, exclude: Iterable = ()) -> List[Tuple[int, float]]:
+        payload = self.load()
+        row = self._position(payload, 'job', str(job_id))
+        if row is None:
+            return []
+        return self.top_k(payload['jobs'][row], payload['employees'], payload['employee_ids'], k, exclude)[0]
+
+    def similarity(self, skills_a: Sequence[str], skills_b: Sequence[str]) -> float:
+        """두 스킬 목록의 코사인 유사도 (0-100)"""
+        payload = self.load()
+        vectors = self._transform(payload['vectorizer'], [list(skills_a), list(skills_b)])
+        return round(float(vectors[0].multiply(vectors[1]).sum()) * 100, 2)
+
+    # ------------------------------------------------------------------
+    # 증분 갱신
+    # ------------------------------------------------------------------
+    def _replace_row(self, payload: Dict, kind: str, key, vector: Optional[sp.csr_matrix]) -> Dict:
+        ids_key, matrix_key = f'{kind}_ids', f'{kind}s'
+        ids = list(payload[ids_key])
+        matrix = payload[matrix_key]
+        row = self._position(payload, kind, key)
+        if row is not None:
+            keep = [i for i in range(len(ids)) if i != row]
+            ids.pop(row)
+            matrix = matrix[keep]
+        if vector is not None:
+            ids.append(key)
+            matrix = sp.vstack([matrix, vector], format='csr')
+        payload = dict(payload, **{ids_key: ids, matrix_key: sp.csr_matrix(matrix, dtype=np.float32, copy=True)})
+        return payload
+
+    def update_job(self, job_id: str, skills: Optional[Sequence[str]]):
+        """직무 행 갱신 (skills 가 None 이면 삭제)
+
+        어휘에 없는 스킬이 생기면 stale 로 표시하고 다음 조회 시 한 번만 전체 재구축
+        (직무 일괄 등록 중 매번 재학습하지 않도록).
+        """
+        with self._lock:
+            payload = self.load(build=False)
+            if payload is None or payload.get('stale'):
+                return
+            vocabulary = payload['vectorizer'].vocabulary_
+            if skills is not None and any(term not in vocabulary for term in skill_terms(skills)):
+                model_registry.save(self.path, dict(payload, stale=True))
+                return
+            vector = None if skills is None else self._transform(payload['vectorizer'], [list(skills)])
+            model_registry.save(self.path, self._replace_row(payload, 'job', str(job_id), vector))
+
+    def update_employee(self, employee_id: int, skills: Optional[Sequence[str]]):
+        """직원 행 갱신 (skills 가 None 이면 삭제, 어휘에 없는 스킬은 직무와 겹치지 않으므로 무시)"""
+        with self._lock:
+            payload = self.load(build=False)
+            if payload is None or payload.get('stale'):
+                return
+            vector = None if skills is None else self._transform(payload['vectorizer'], [list(skills)])
+            row = self._position(payload, 'employee', employee_id)
+            if row is None and vector is None:
+                return
+            if row is not None and vector is not None and (payload['employees'][row] != vector).nnz == 0:
+                return      # 스킬 변화 없음 (부서/직급 외 필드 수정)
+            model_registry.save(self.path, self._replace_row(payload, 'employee', employee_id, vector))
+
+
+skill_index = SkillIndex()
@@ -0,0 +1,270 @@
+"""
+인재 풀 일괄 평가 엔진
+재직 직원과 직원별 최근 종합평가를 한 번에 조회해 리더 추천용 직원 정보를 만들고,
+모든 직원 x 대상 직무의 리더십 준비도 점수를 행렬 연산으로 계산합니다.
+
+- 조회: 직원 1회 + 최근 평가 N건(직원별 윈도 함수) 1회 (직원/후보마다 다시 조회하지 않음)
+- 점수: 평가/성장 레벨/스킬/경력 요건을 직원 벡터 x 직무 벡터로 비교
+  (LeaderRecommender.evaluate_leadership_readiness 와 같은 점수/적격 판정)
+- 메모: 평가 기간과 직원/평가 변경 시각이 같으면 직원 정보와 직무별 점수 열을 재사용
+- 추천 사유/리스크 등 상세 결과는 상위 후보에 대해서만 기존 recommend_leader_candidates 로 생성
+
+    pool = talent_pool_engine.load(service._convert_employee_to_dict)
+    scores = talent_pool_engine.score(pool, job_dicts)       # TalentScores (직원 x 직무)
+    rows = talent_pool_engine.top_rows(pool, scores, 0, top_n=10)
+"""
+import threading
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.db.models import Count, F, Max, Window
+from django.db.models.functions import RowNumber
+
+from .leader_recommender import GrowthLevel, LeaderRecommender
+
+GRADE_VALUES = {'S': 5.0, 'A+': 4.5, 'A': 4.0, 'B+': 3.5, 'B': 3.0, 'C': 2.0, 'D': 1.0}
+LEVELS = list(GrowthLevel)
+LOW_PERFORMER_GRADES = ('C', 'D')
+LEADERSHIP_KEYWORDS = ('팀장', '리더', '매니저', 'lead', 'manager')
+
+
+def professionalism_grade(evaluation) -> Optional[str]:
+    """전문성 등급 (종합평가에 전문성 등급 필드가 없으면 None)"""
+    return getattr(evaluation, 'expertise_grade', None)
+
+
+def target_requirements(job: dict, min_evaluation_grade: str = "B+", min_growth_level: str = "Lv.3") -> dict:
+    """직무 요건 기본값 (recommend_leader_candidates 와 같이 지정되지 않은 요건만 채움)"""
+    job = dict(job)
+    job.setdefault('evaluation_standard', {'overall': min_evaluation_grade})
+    job.setdefault('min_required_level', min_growth_level)
+    return job
+
+
+def grade_bucket(average: float) -> float:
+    """평균 점수 → 해당 등급 점수 (평균 이하인 가장 높은 등급)"""
+    for value in sorted(GRADE_VALUES.values(), reverse=True):
+        if average >= value:
+            return value
+    return np.nan
+
+
+@dataclass
+class TalentPool:
+    """재직 직원 정보 + 점수 계산용 직원 특성 벡터"""
+    key: Tuple
+    employees: List
+    dicts: List[dict]
+    features: Dict[str, np.ndarray]
+    columns: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = field(default_factory=dict)
+
+
+@dataclass
+class TalentScores:
+    """직원 x 직무 준비도 점수와 적격 여부"""
+    jobs: List[dict]
+    scores: np.ndarray
+    qualified: np.ndarray
+
+
+class TalentPoolEngine:
+    """리더 후보 일괄 평가 (평가 기간별 메모)"""
+
+    def __init__(self, recent_evaluations: int = 4):
+        self.recent_evaluations = recent_evaluations
+        self.recommender = LeaderRecommender()
+        self._lock = threading.Lock()
+        self._pool: Optional[TalentPool] = None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def period_key() -> Tuple:
+        """활성 평가 기간 + 재직 직원/종합평가 변경 시각 (날짜 포함, 경력 년수가 날짜에 따라 바뀜)"""
+        from employees.models import Employee
+        from evaluations.models import ComprehensiveEvaluation, EvaluationPeriod
+
+        period = EvaluationPeriod.objects.filter(is_active=True).order_by('-id').values_list('id', flat=True).first()
+        employees = Employee.objects.filter(employment_status='재직').aggregate(updated=Max('updated_at'), count=Count('id'))
+        evaluations = ComprehensiveEvaluation.objects.aggregate(updated=Max('updated_at'), count=Count('id'))
+        return (
+            period, date.today(),
+            employees['updated'], employees['count'],
+            evaluations['updated'], evaluations['count'],
+        )
+
+    def recent_evaluations_by_employee(self, employee_ids: Sequence[int]) -> Dict[int, List]:
+        """직원별 최근 종합평가 N건 (최신순, 쿼리 한 번)"""
+        from evaluations.models import ComprehensiveEvaluation
+
+        evaluations = ComprehensiveEvaluation.objects.filter(employee_id__in=employee_ids).annotate(
+            position=Window(RowNumber(), partition_by=[F('employee_id')], order_by=[F('created_at').desc(), F('id').desc()])
+        ).filter(position__lte=self.recent_evaluations).order_by('employee_id', 'position')
+
+        by_employee: Dict[int, List] = {}
+        for evaluation in evaluations:
+            by_employee.setdefault(evaluation.employee_id, []).append(evaluation)
+        return by_employee
+
+    def load(self, converter: Callable) -> TalentPool:
+        """재직 직원 정보 (converter(employee, evaluations) → 추천용 dict, 평가 기간별 메모)"""
+        from employees.models import Employee
+
+        key = self.period_key()
+        pool = self._pool
+        if pool is not None and pool.key == key:
+            return pool
+
+        with self._lock:
+            if self._pool is not None and self._pool.key == key:
+                return self._pool
+            employees = list(Employee.objects.filter(employment_status='재직').order_by('id'))
+            evaluations = self.recent_evaluations_by_employee([employee.id for employee in employees])
+
+            kept, dicts = [], []
+            for employee in employees:
+                emp_dict = converter(employee, evaluations.get(employee.id, []))
+                if emp_dict:
+                    kept.append(employee)
+                    dicts.append(emp_dict)
+            self._pool = TalentPool(key, kept, dicts, self.employee_features(dicts))
+            return self._pool
+
+    # ------------------------------------------------------------------
+    # 점수
+    # ------------------------------------------------------------------
+    @staticmethod
+    def employee_features(dicts: List[dict]) -> Dict[str, np.ndarray]:
+        """직원 특성 벡터 (평가 등급, 전문성, 성장 레벨, 경력, 리더십 경험, 저성과 여부)"""
+        evaluation, professionalism = [], []
+        for employee in dicts:
+            evaluations = [e for e in employee.get('recent_evaluations', [])[:2] if e and 'overall_grade' in e]
+            if evaluations:
+                average = sum(GRADE_VALUES.get(e['overall_grade'], 3.0) for e in evaluations) / len(evaluations)
+                evaluation.append(grade_bucket(average))
+            else:
+                evaluation.append(np.nan)
+            latest = (employee.get('recent_evaluations') or [None])[0]
+            # 최근 평가가 없으면 전문성 요건은 보지 않음 (평가 요건에서 이미 불충족)
+            professionalism.append(GRADE_VALUES.get(latest.get('professionalism', 'N/A'), 0) if latest else np.inf)
+
+        return {
+            'evaluation': np.array(evaluation, dtype=float),
+            'professionalism': np.array(professionalism, dtype=float),
+            'level': np.array([LEVELS.index(GrowthLevel.from_string(e.get('level', 'Lv.1'))) for e in dicts], dtype=int),
+            'career': np.array([e.get('career_years', 0) for e in dicts], dtype=float),
+            'leadership': np.array([
+                (e.get('leadership_experience') or {}).get('years', 0) > 0
+                or any(keyword in e.get('current_position', '').lower() for keyword in LEADERSHIP_KEYWORDS)
+                for e in dicts
+            ], dtype=bool),
+            'low_performer': np.array([
+                (e.get('recent_evaluation') or {}).get('overall_grade') in LOW_PERFORMER_GRADES for e in dicts
+            ], dtype=bool),
+            'department': np.array([e.get('department') for e in dicts], dtype=object),
+            'skills': [frozenset(skill.lower() for skill in e.get('skills', [])) for e in dicts],
+        }
+
+    def job_key(self, job: dict) -> Tuple:
+        """직무 요건 (점수 계산에 쓰이는 값만)"""
+        standard = job.get('evaluation_standard', {})
+        name = job.get('name', '')
+        return (
+            GRADE_VALUES.get(standard.get('overall', 'B+'), 3.5),
+            'professionalism' in standard,
+            GRADE_VALUES.get(standard.get('professionalism'), 4.0),
+            LEVELS.index(GrowthLevel.from_string(job.get('min_required_level', 'Lv.3'))),
+            self.recommender._extract_min_years_from_job(job),
+            '팀장' in name or 'lead' in name.lower(),
+            tuple(job.get('required_skills', [])),
+        )
+
+    @staticmethod
+    def skill_match_rates(skills: List[frozenset], required: List[Tuple[str, ...]]) -> np.ndarray:
+        """직원 x 직무 필수 스킬 충족률 (스킬 조합별 매칭 행렬 x 직무별 요구 횟수)"""
+        vocabulary = sorted({skill.lower() for job_skills in required for skill in job_skills})
+        position = {skill: i for i, skill in enumerate(vocabulary)}
+        demand = np.zeros((len(vocabulary), len(required)))
+        for j, job_skills in enumerate(required):
+            for skill in job_skills:
+                demand[position[skill.lower()], j] += 1
+        counts = demand.sum(axis=0)
+
+        combos = {combo: i for i, combo in enumerate(dict.fromkeys(skills))}
+        matched = np.zeros((len(combos), len(vocabulary)))
+        for combo, row in combos.items():
+            for skill, col in position.items():
+                matched[row, col] = (
+                    skill in combo
+                    or any(skill in own for own in combo)
+                    or any(own in skill for own in combo)
+                )
+        rates = (matched @ demand)[[combos[combo] for combo in skills]] if skills else np.zeros((0, len(required)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(counts > 0, rates / np.where(counts > 0, counts, 1), 1.0)
+
+    def score_columns(self, pool: TalentPool, keys: List[Tuple]) -> Tuple[np.ndarray, np.ndarray]:
+        """직무 요건 열들의 점수/적격 행렬 (점수 합산 순서는 LeaderRecommender 와 동일)"""
+        f = pool.features
+        req_overall, has_prof, req_prof, req_level, min_years, lead_required = (
+            np.array(values) for values in list(zip(*keys))[:6]
+        )
+        rates = self.skill_match_rates(f['skills'], [key[6] for key in keys])
+
+        evaluation = f['evaluation'][:, None]
+        with np.errstate(invalid='ignore'):
+            eval_ok = (evaluation >= req_overall) & (~has_prof | (f['professionalism'][:, None] >= req_prof))
+        level_ok = f['level'][:, None] >= req_level
+        leadership = f['leadership'][:, None]
+        exp_ok = ((min_years <= 0) | (f['career'][:, None] >= min_years)) & (~lead_required | leadership)
+
+        scores = np.zeros(eval_ok.shape)
+        scores += np.where(eval_ok, np.where(evaluation >= 4.5, 35, 30), 0)
+        scores += rates * 30
+        scores += np.where(level_ok, 20, 0)
+        scores += np.where(exp_ok, np.where(leadership, 25, 20), 0)
+        qualified = eval_ok & level_ok & (rates >= 0.7) & exp_ok
+        return np.minimum(scores, 100), qualified
+
+    def score(self, pool: TalentPool, jobs: List[dict]) -> TalentScores:
+        """전체 직원 x 직무 점수 (직무 요건별 열은 메모, 새 요건만 계산)"""
+        keys = [self.job_key(job) for job in jobs]
+        missing = list(dict.fromkeys(key for key in keys if key not in pool.columns))
+        if missing and pool.dicts:
+            scores, qualified = self.score_columns(pool, missing)
+            for j, key in enumerate(missing):
+                pool.columns[key] = (scores[:, j], qualified[:, j])
+
+        n = len(pool.dicts)
+        if not keys or not n:
+            return TalentScores(jobs, np.zeros((n, len(keys))), np.zeros((n, len(keys)), dtype=bool))
+        return TalentScores(
+            jobs,
+            np.column_stack([pool.columns[key][0] for key in keys]),
+            np.column_stack([pool.columns[key][1] for key in keys]),
+        )
+
+    @staticmethod
+    def eligible(pool: TalentPool, scores: TalentScores, department: Optional[str] = None,
+                 exclude_low_performers: bool = True) -> np.ndarray:
+        """적격 행렬 (부서 제한, 저성과자 제외 반영)"""
+        mask = scores.qualified.copy()
+        if exclude_low_performers:
+            mask &= ~pool.features['low_performer'][:, None]
+        if department:
+            mask &= (pool.features['department'] == department)[:, None]
+        return mask
+
+    def top_rows(self, pool: TalentPool, scores: TalentScores, job_index: int, top_n: int,
+                 department: Optional[str] = None, exclude_low_performers: bool = True) -> List[int]:
+        """직무 열의 적격 직원 상위 top_n 행 번호 (점수 내림차순, 동점은 직원 순서)"""
+        mask = self.eligible(pool, scores, department, exclude_low_performers)[:, job_index]
+        rows = np.flatnonzero(mask)
+        order = np.argsort(-scores.scores[rows, job_index], kind='stable')
+        return rows[order][:top_n].tolist()
+
+
+talent_pool_engine = TalentPoolEngine()
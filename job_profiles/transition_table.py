@@ -0,0 +1,146 @@
+"""
+직무 전환 최적 경로 테이블
+과거 직무 전환 이력으로 전환 그래프를 한 번 만들고, 모든 직무 쌍의 최고 전환 확률
+(경로상 전환 확률 곱의 최댓값)과 다음 경유 직무를 dense NumPy 행렬로 미리 계산합니다.
+
+- 구축: 직접 전환 확률 = 해당 전환 횟수 / 출발 직무 전환 횟수 (build_transition_graph 와 동일)
+  Floyd–Warshall (곱-최대, -log 가중치 최단 경로와 동치), 경유 직무 k 를 지나는 행/열만 갱신
+- 조회: 도달 확률은 행렬 원소 조회, 경로는 다음 경유 직무 행렬로 복원
+- 갱신: 재직 직원/직무 변경 시각이 바뀌면 전환 이력을 다시 추출하고, 전환 이력이 실제로 달라졌을 때만 재계산
+
+    table = transition_tables.load()
+    table.probability('주니어 개발자', '개발 팀장')      # 0.5
+    table.path('주니어 개발자', '개발 팀장')             # ['주니어 개발자', '시니어 개발자', '개발 팀장']
+"""
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.db.models import Count, Max
+
+
+class TransitionTable:
+    """직무 x 직무 직접 전환 확률 / 최고 경로 확률 / 다음 경유 직무"""
+
+    def __init__(self, transitions: Dict[str, List[str]]):
+        self.transitions = transitions
+        self.counts: Dict[Tuple[str, str], int] = {}
+        jobs: Dict[str, None] = {}
+        for from_job, to_jobs in transitions.items():
+            jobs.setdefault(from_job)
+            for to_job, count in Counter(to_jobs).items():
+                jobs.setdefault(to_job)
+                self.counts[(from_job, to_job)] = count
+
+        self.jobs = list(jobs)
+        self.index = {job: i for i, job in enumerate(self.jobs)}
+        n = len(self.jobs)
+        self.direct = np.zeros((n, n))
+        for (from_job, to_job), count in self.counts.items():
+            self.direct[self.index[from_job], self.index[to_job]] = count / len(transitions[from_job])
+        self.best, self.next_hop = self.best_paths(self.direct)
+        self._graph = None
+
+    @staticmethod
+    def best_paths(direct: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """모든 쌍 최고 확률 경로 (확률 곱 최대, 자기 자신은 1.0 / 도달 불가 0.0, 다음 경유 직무 -1)"""
+        n = len(direct)
+        best = direct.copy()
+        next_hop = np.where(direct > 0, np.arange(n)[None, :], -1)
+        np.fill_diagonal(best, 1.0)
+        np.fill_diagonal(next_hop, np.arange(n))
+
+        for k in range(n):
+            rows = np.flatnonzero(best[:, k])
+            cols = np.flatnonzero(best[k])
+            via = np.outer(best[rows, k], best[k, cols])
+            r, c = np.nonzero(via > best[np.ix_(rows, cols)])
+            if len(r):
+                best[rows[r], cols[c]] = via[r, c]
+                next_hop[rows[r], cols[c]] = next_hop[rows[r], k]
+        return best, next_hop
+
+    @property
+    def graph(self):
+        """networkx 전환 그래프 (처음 사용할 때 한 번 생성, 읽기 전용으로 공유)"""
+        if self._graph is None:
+            import networkx as nx
+
+            graph = nx.DiGraph()
+            for (from_job, to_job), count in self.counts.items():
+                graph.add_edge(
+                    from_job, to_job,
+                    weight=self.direct[self.index[from_job], self.index[to_job]],
+                    count=count
+                )
+            self._graph = graph
+        return self._graph
+
+    def probability(self, from_job: str, to_job: str) -> float:
+        """최고 경로 전환 확률 (그래프에 없는 직무는 0.0)"""
+        i, j = self.index.get(from_job), self.index.get(to_job)
+        if i is None or j is None:
+            return 0.0
+        return float(self.best[i, j])
+
+    def probabilities(self, from_job: str, to_jobs: Sequence[str]) -> np.ndarray:
+        """출발 직무 → 여러 목표 직무의 최고 경로 확률 (행 하나에서 조회)"""
+        i = self.index.get(from_job)
+        if i is None:
+            return np.zeros(len(to_jobs))
+        row = np.append(self.best[i], 0.0)
+        return row[[self.index.get(job, -1) for job in to_jobs]]
+
+    def path(self, from_job: str, to_job: str) -> Optional[List[str]]:
+        """최고 확률 경로 직무 목록 (도달 불가면 None)"""
+        i, j = self.index.get(from_job), self.index.get(to_job)
+        if i is None or j is None or self.next_hop[i, j] < 0:
+            return None
+        path = [i]
+        while i != j:
+            i = self.next_hop[i, j]
+            path.append(i)
+        return [self.jobs[k] for k in path]
+
+
+class TransitionTableCache:
+    """전환 테이블 (재직 직원/직무 변경 시각별 메모)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entry: Tuple[Optional[Tuple], Optional[TransitionTable]] = (None, None)
+
+    @staticmethod
+    def stamp() -> Tuple:
+        """전환 이력 추출에 쓰이는 데이터의 변경 시각/건수"""
+        from employees.models import Employee
+        from .models import JobRole
+
+        employees = Employee.objects.filter(employment_status='재직').aggregate(updated=Max('updated_at'), count=Count('id'))
+        roles = JobRole.objects.aggregate(updated=Max('updated_at'), count=Count('id'))
+        return employees['updated'], employees['count'], roles['updated'], roles['count']
+
+    def load(self) -> TransitionTable:
+        key = self.stamp()
+        stamp, table = self._entry
+        if table is not None and stamp == key:
+            return table
+
+        from .growth_services import CareerTransitionAnalyzer
+
+        with self._lock:
+            stamp, table = self._entry
+            if table is not None and stamp == key:
+                return table
+            transitions = CareerTransitionAnalyzer.extract_historical_transitions()
+            if table is None or table.transitions != transitions:
+                table = TransitionTable(transitions)
+            self._entry = (key, table)
+            return table
+
+    def invalidate(self):
+        self._entry = (None, None)
+
+
+transition_tables = TransitionTableCache()
@@ -6,6 +6,7 @@ from .models import (
     NotificationType, Notification, NotificationPreference,
     NotificationLog, AnnouncementBoard
 )
+from .realtime import UNREAD_STATUSES, UnreadCountCache
 
 
 @admin.register(NotificationType)
@@ -79,11 +80,10 @@ class NotificationAdmin(admin.ModelAdmin):
     actions = ['mark_as_read', 'mark_as_sent']
     
     def mark_as_read(self, request, queryset):
-        count = 0
-        for notification in queryset:
-            if notification.status in ['SENT', 'PENDING']:
-                notification.mark_as_read()
-                count += 1
+        unread = queryset.filter(status__in=UNREAD_STATUSES)
+        recipient_ids = list(unread.values_list('recipient_id', flat=True).distinct())
+        count = unread.update(status='read', read_at=timezone.now())
+        UnreadCountCache.invalidate_many(recipient_ids)
         self.message_user(request, f"{count}개의 알림을 읽음으로 표시했습니다.")
     mark_as_read.short_description = "선택한 알림을 읽음으로 표시"
     
@@ -0,0 +1,78 @@
+"""
+알림 WebSocket 컨슈머
+연결된 직원에게 새 알림과 미확인 건수를 실시간으로 전달합니다.
+"""
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from employees.models import Employee
+from .realtime import UnreadCountCache, employee_group_name
+
+
+class NotificationConsumer(AsyncJsonWebsocketConsumer):
+    """직원별 알림 푸시 컨슈머
+
+    클라이언트 메시지:
+        {"action": "mark_read", "ids": [...]}  선택 알림 읽음 처리
+        {"action": "unread_count"}             미확인 건수 재요청
+    """
+
+    async def connect(self):
+        user = self.scope.get('user')
+        if user is None or not user.is_authenticated:
+            await self.close()
+            return
+
+        self.employee_id = await self._get_employee_id(user)
+        if self.employee_id is None:
+            await self.close()
+            return
+
+        self.group_name = employee_group_name(self.employee_id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        await self.send_json({
+            'type': 'unread_count',
+            'unread_count': await self._get_unread_count(),
+        })
+
+    async def disconnect(self, code):
+        if getattr(self, 'group_name', None):
+            await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive_json(self, content, **kwargs):
+        action = content.get('action')
+        if action == 'mark_read':
+            await self._mark_read(content.get('ids') or [])
+        elif action == 'unread_count':
+            await self.send_json({
+                'type': 'unread_count',
+                'unread_count': await self._get_unread_count(),
+            })
+
+    # 그룹 이벤트 핸들러
+    async def notification_new(self, event):
+        await self.send_json({
+            'type': 'notification',
+            'notification': event['notification'],
+            'unread_count': event['unread_count'],
+        })
+
+    async def notification_unread_count(self, event):
+        await self.send_json({
+            'type': 'unread_count',
+            'unread_count': event['unread_count'],
+        })
+
+    @database_sync_to_async
+    def _get_employee_id(self, user):
+        return Employee.objects.filter(user=user).values_list('id', flat=True).first()
+
+    @database_sync_to_async
+    def _get_unread_count(self):
+        return UnreadCountCache.get(self.employee_id)
+
+    @database_sync_to_async
+    def _mark_read(self, notification_ids):
+        from .services import NotificationService
+        NotificationService.mark_notifications_as_read(self.employee_id, notification_ids)
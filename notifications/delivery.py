@@ -0,0 +1,582 @@
+"""
+알림 비동기 발송 모듈
+채널별 워커 풀, 재시도 큐, 배치 로그 기록을 담당합니다.
+"""
+import atexit
+import heapq
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import Notification, NotificationLog
+from .realtime import push_new_notification
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DELIVERY_SETTINGS = {
+    'ASYNC': True,
+    'WORKERS': {'PUSH': 2, 'EMAIL': 4, 'SMS': 2},
+    'QUEUE_SIZE': 5000,           # 채널별 대기열 상한 (가득 차면 발송 요청이 대기)
+    'SUBMIT_TIMEOUT': 2.0,        # 대기열이 가득 찼을 때 요청 스레드가 기다리는 최대 시간 (초)
+    'SHUTDOWN_TIMEOUT': 10.0,     # 종료 시 남은 작업을 발송하며 기다리는 최대 시간 (초)
+    'BATCH_SIZE': 50,             # 한 번에 묶어 보내는 메시지 수
+    'MAX_RETRIES': 3,
+    'RETRY_BACKOFF': 2.0,         # 초 단위, 재시도마다 2배씩 증가
+    'LOG_BATCH_SIZE': 200,
+    'LOG_FLUSH_INTERVAL': 1.0,
+    'SMS_GATEWAY_URL': '',
+    'SMS_TIMEOUT': 5,
+}
+
+
+def get_delivery_settings() -> Dict:
+    """기본값과 settings.NOTIFICATION_DELIVERY 를 병합한 발송 설정"""
+    config = dict(DEFAULT_DELIVERY_SETTINGS)
+    config.update(getattr(settings, 'NOTIFICATION_DELIVERY', {}) or {})
+    workers = dict(DEFAULT_DELIVERY_SETTINGS['WORKERS'])
+    workers.update(config.get('WORKERS') or {})
+    config['WORKERS'] = workers
+    return config
+
+
+class PermanentDeliveryError(Exception):
+    """재시도해도 성공할 수 없는 발송 오류 (수신 주소 없음 등)"""
+
+
+@dataclass
+class DeliveryJob:
+    """채널 하나에 대한 알림 발송 작업"""
+    notification: Notification
+    channel: str
+    attempts: int = 0
+
+
+# ---------------------------------------------------------------------------
+# 발송 채널
+# ---------------------------------------------------------------------------
+
+class BaseChannel:
+    """발송 채널 기본 클래스
+
+    send_batch 는 작업마다 None(성공) 또는 예외 객체(실패)를 담은 리스트를 반환합니다.
+    채널 인스턴스는 워커 스레드마다 하나씩 생성되어 연결을 재사용합니다.
+    """
+    name = ''
+
+    def __init__(self, config: Dict):
+        self.config = config
+
+    def send_batch(self, jobs: List[DeliveryJob]) -> List[Optional[Exception]]:
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class PushChannel(BaseChannel):
+    """푸시 알림 채널"""
+    name = 'PUSH'
+
+    def send_batch(self, jobs):
+        # 직원별 Channels 그룹으로 전송 (접속 중인 브라우저에 즉시 표시)
+        for job in jobs:
+            push_new_notification(job.notification)
+            logger.info(f"Push notification sent to {job.notification.recipient.name}")
+        return [None] * len(jobs)
+
+
+def build_email_message(notification: Notification, connection=None) -> EmailMultiAlternatives:
+    """알림 이메일 메시지 구성"""
+    subject = f"[OK Financial HRIS] {notification.title}"
+    message = notification.message
+
+    action_html = ''
+    if notification.action_url:
+        action_html = (
+            f'<p><a href="{notification.action_url}" style="background: #3b82f6; color: white; '
+            f'padding: 10px 20px; text-decoration: none; border-radius: 5px;">{notification.action_text}</a></p>'
+        )
+
+    html_message = f"""
+    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+        <h2 style="color: #3b82f6;">{notification.title}</h2>
+        <div style="background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
+            <p>{message}</p>
+        </div>
+        {action_html}
+        <hr style="margin: 30px 0;">
+        <p style="color: #64748b; font-size: 14px;">
+            OK Financial Group HRIS 시스템에서 발송된 알림입니다.
+        </p>
+    </div>
+    """
+
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', None),
+        to=[notification.recipient.email],
+        connection=connection,
+    )
+    email.attach_alternative(html_message, 'text/html')
+    return email
+
+
+class EmailChannel(BaseChannel):
+    """이메일 채널 - 워커당 하나의 메일 서버 연결을 열어두고 배치 단위로 발송"""
+    name = 'EMAIL'
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self.connection = None
+
+    def _get_connection(self):
+        if self.connection is None:
+            self.connection = get_connection(fail_silently=False)
+            self.connection.open()
+        return self.connection
+
+    def send_batch(self, jobs):
+        results = []
+        for job in jobs:
+            if not job.notification.recipient.email:
+                results.append(PermanentDeliveryError('수신자 이메일 주소가 없습니다'))
+                continue
+            try:
+                connection = self._get_connection()
+                # 연결이 열려 있으므로 send_messages 는 기존 연결을 그대로 사용
+                connection.send_messages([build_email_message(job.notification, connection)])
+                results.append(None)
+            except Exception as e:
+                # 연결 오류일 수 있으므로 다음 메시지는 새 연결로 발송
+                self.close()
+                results.append(e)
+        return results
+
+    def close(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+
+
+class SmsChannel(BaseChannel):
+    """SMS 채널 - 게이트웨이에 배치 단위로 HTTP 요청 (keep-alive 세션 재사용)"""
+    name = 'SMS'
+
+    def __init__(self, config: Dict):
+        super().__init__(config)
+        self.session = None
+
+    def send_batch(self, jobs):
+        results: List[Optional[Exception]] = [None] * len(jobs)
+        payload = []
+        indexes = []
+        for index, job in enumerate(jobs):
+            if not job.notification.recipient.phone:
+                results[index] = PermanentDeliveryError('수신자 전화번호가 없습니다')
+                continue
+            payload.append({
+                'to': job.notification.recipient.phone,
+                'text': f"{job.notification.title}\n{job.notification.message}".strip(),
+            })
+            indexes.append(index)
+
+        if not payload:
+            return results
+
+        gateway_url = self.config.get('SMS_GATEWAY_URL')
+        if not gateway_url:
+            # 게이트웨이 미설정 시 로그만 기록
+            for item in payload:
+                logger.info(f"SMS sent to {item['to']}")
+            return results
+
+        try:
+            if self.session is None:
+                import requests
+                self.session = requests.Session()
+            response = self.session.post(
+                gateway_url,
+                json={'messages': payload},
+                timeout=self.config.get('SMS_TIMEOUT', 5),
+            )
+            response.raise_for_status()
+        except Exception as e:
+            for index in indexes:
+                results[index] = e
+        return results
+
+    def close(self):
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+
+CHANNEL_CLASSES = {
+    'PUSH': PushChannel,
+    'EMAIL': EmailChannel,
+    'SMS': SmsChannel,
+}
+
+
+# ---------------------------------------------------------------------------
+# 로그 기록
+# ---------------------------------------------------------------------------
+
+class NotificationLogWriter:
+    """발송 로그와 발송완료 상태를 모아서 일괄 저장"""
+
+    def __init__(self, batch_size: int = 200, flush_interval: float = 1.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._logs = []
+        self._sent_ids = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._running = False
+
+    def record(self, job: DeliveryJob, success: bool, error_message: str = ''):
+        with self._lock:
+            self._logs.append(NotificationLog(
+                notification_id=job.notification.pk,
+                channel=job.channel,
+                status='SUCCESS' if success else 'FAILED',
+                error_message=error_message,
+            ))
+            if len(self._logs) >= self.batch_size:
+                self._wakeup.set()
+
+    def mark_sent(self, notification_id):
+        with self._lock:
+            self._sent_ids.append(notification_id)
+
+    def flush(self):
+        with self._lock:
+            logs, self._logs = self._logs, []
+            sent_ids, self._sent_ids = self._sent_ids, []
+
+        if not logs and not sent_ids:
+            return
+        try:
+            if logs:
+                NotificationLog.objects.bulk_create(logs, batch_size=self.batch_size)
+            if sent_ids:
+                Notification.objects.filter(id__in=sent_ids, status='PENDING').update(
+                    status='SENT', sent_at=timezone.now()
+                )
+        except Exception as e:
+            logger.error(f"Failed to write notification logs: {str(e)}")
+        finally:
+            close_old_connections()
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='NotificationLogWriter', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _run(self):
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+# ---------------------------------------------------------------------------
+# 워커 풀
+# ---------------------------------------------------------------------------
+
+class ChannelWorkerPool:
+    """채널 하나를 담당하는 워커 풀 (제한된 대기열 + 재시도 큐)"""
+
+    def __init__(
+        self,
+        channel_class,
+        config: Dict,
+        on_result: Callable[[DeliveryJob, bool, str], None],
+        workers: int = 2,
+    ):
+        self.channel_class = channel_class
+        self.config = config
+        self.on_result = on_result
+        self.workers = max(1, workers)
+        self.batch_size = max(1, config['BATCH_SIZE'])
+        self.max_retries = config['MAX_RETRIES']
+        self.retry_backoff = config['RETRY_BACKOFF']
+
+        self.queue = queue.Queue(maxsize=config['QUEUE_SIZE'])
+        self._retry_heap = []
+        self._retry_lock = threading.Lock()
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._threads = []
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        for i in range(self.workers):
+            worker = threading.Thread(
+                target=self._worker, name=f"{self.channel_class.name}Worker-{i + 1}", daemon=True
+            )
+            worker.start()
+            self._threads.append(worker)
+        retry_thread = threading.Thread(
+            target=self._retry_loop, name=f"{self.channel_class.name}Retry", daemon=True
+        )
+        retry_thread.start()
+        self._threads.append(retry_thread)
+
+    def stop(self, timeout: float = 5):
+        """대기열과 재시도 큐를 timeout 동안 발송한 뒤 종료, 남은 작업은 실패로 기록 (알림은 PENDING 유지)"""
+        if self._running:
+            self.wait_idle(timeout)
+        self._running = False
+        for thread in self._threads:
+            thread.join(timeout=5)
+        self._threads = []
+
+        leftover = []
+        while True:
+            try:
+                leftover.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        with self._retry_lock:
+            leftover.extend(job for _, _, job in self._retry_heap)
+            self._retry_heap = []
+        for job in leftover:
+            self._finish(job, False, '종료 시 발송되지 않았습니다')
+        if leftover:
+            logger.warning(f"{self.channel_class.name} 발송 {len(leftover)}건이 종료 시 미발송으로 남았습니다")
+
+    def submit(self, job: DeliveryJob, timeout: Optional[float] = None):
+        """작업 등록 - 대기열이 가득 차면 timeout 동안 대기, 그래도 가득 차 있으면 실패 기록 후 queue.Full"""
+        with self._idle:
+            self._pending += 1
+        try:
+            self.queue.put(job, timeout=timeout)
+        except queue.Full:
+            self._finish(job, False, '발송 대기열이 가득 찼습니다')
+            raise
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """모든 작업(재시도 포함)이 끝날 때까지 대기"""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def _finish(self, job: DeliveryJob, success: bool, error_message: str):
+        try:
+            self.on_result(job, success, error_message)
+        finally:
+            with self._idle:
+                self._pending -= 1
+                if self._pending == 0:
+                    self._idle.notify_all()
+
+    def _next_batch(self) -> List[DeliveryJob]:
+        try:
+            batch = [self.queue.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker(self):
+        channel = self.channel_class(self.config)
+        try:
+            while self._running:
+                batch = self._next_batch()
+                if not batch:
+                    continue
+                try:
+                    errors = channel.send_batch(batch)
+                except Exception as e:
+                    errors = [e] * len(batch)
+
+                for job, error in zip(batch, errors):
+                    job.attempts += 1
+                    if error is None:
+                        self._finish(job, True, '')
+                    elif isinstance(error, PermanentDeliveryError) or job.attempts > self.max_retries:
+                        logger.error(f"Failed to send {job.channel} notification {job.notification.pk}: {str(error)}")
+                        self._finish(job, False, str(error))
+                    else:
+                        self._schedule_retry(job)
+                    self.queue.task_done()
+        finally:
+            channel.close()
+            close_old_connections()
+
+    def _schedule_retry(self, job: DeliveryJob):
+        delay = self.retry_backoff * (2 ** (job.attempts - 1))
+        with self._retry_lock:
+            heapq.heappush(self._retry_heap, (time.monotonic() + delay, id(job), job))
+
+    def _retry_loop(self):
+        while self._running:
+            now = time.monotonic()
+            due = []
+            with self._retry_lock:
+                while self._retry_heap and self._retry_heap[0][0] <= now:
+                    due.append(heapq.heappop(self._retry_heap)[2])
+            for job in due:
+                try:
+                    self.queue.put_nowait(job)
+                except queue.Full:
+                    with self._retry_lock:
+                        heapq.heappush(self._retry_heap, (now + self.retry_backoff, id(job), job))
+            time.sleep(0.05)
+
+
+# ---------------------------------------------------------------------------
+# 디스패처
+# ---------------------------------------------------------------------------
+
+class NotificationDispatcher:
+    """채널별 워커 풀로 알림을 분배하고 채널 결과를 모아 발송완료 처리"""
+
+    def __init__(self, config: Optional[Dict] = None, log_writer=None, channel_classes=None):
+        self.config = config or get_delivery_settings()
+        self.log_writer = log_writer or NotificationLogWriter(
+            batch_size=self.config['LOG_BATCH_SIZE'],
+            flush_interval=self.config['LOG_FLUSH_INTERVAL'],
+        )
+        channel_classes = channel_classes or CHANNEL_CLASSES
+        self.pools = {
+            name: ChannelWorkerPool(
+                channel_class,
+                self.config,
+                on_result=self._on_result,
+                workers=self.config['WORKERS'].get(name, 1),
+            )
+            for name, channel_class in channel_classes.items()
+        }
+        # notification_id -> [남은 채널 수, 전체 성공 여부]
+        self._outstanding = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        if self._started:
+            return
+        self.log_writer.start()
+        for pool in self.pools.values():
+            pool.start()
+        self._started = True
+
+    def stop(self):
+        for pool in self.pools.values():
+            pool.stop(timeout=self.config['SHUTDOWN_TIMEOUT'])
+        self.log_writer.stop()
+        self._started = False
+
+    def dispatch(self, notification: Notification, channels: List[str]):
+        """알림을 채널별 대기열에 등록 (가득 찬 채널은 SUBMIT_TIMEOUT 후 실패로 기록)"""
+        if not channels:
+            return
+        with self._lock:
+            self._outstanding[notification.pk] = [len(channels), True]
+        for channel in channels:
+            try:
+                self.pools[channel].submit(
+                    DeliveryJob(notification=notification, channel=channel),
+                    timeout=self.config['SUBMIT_TIMEOUT'],
+                )
+            except queue.Full:
+                logger.error(f"{channel} 발송 대기열이 가득 차 알림 {notification.pk} 등록 실패")
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for pool in self.pools.values():
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            if not pool.wait_idle(remaining):
+                return False
+        self.log_writer.flush()
+        return True
+
+    def _on_result(self, job: DeliveryJob, success: bool, error_message: str):
+        self.log_writer.record(job, success, error_message)
+        notification_id = job.notification.pk
+        with self._lock:
+            state = self._outstanding.get(notification_id)
+            if state is None:
+                return
+            state[0] -= 1
+            state[1] = state[1] and success
+            if state[0] > 0:
+                return
+            del self._outstanding[notification_id]
+            all_succeeded = state[1]
+        if all_succeeded:
+            self.log_writer.mark_sent(notification_id)
+
+
+def deliver_now(notification: Notification, channels: List[str], config: Optional[Dict] = None) -> bool:
+    """동기 발송 - 채널별로 즉시 발송하고 로그를 한 번에 저장"""
+    config = config or get_delivery_settings()
+    logs = []
+    success = True
+    for channel_name in channels:
+        channel = CHANNEL_CLASSES[channel_name](config)
+        try:
+            error = channel.send_batch([DeliveryJob(notification=notification, channel=channel_name)])[0]
+        except Exception as e:
+            error = e
+        finally:
+            channel.close()
+        logs.append(NotificationLog(
+            notification=notification,
+            channel=channel_name,
+            status='SUCCESS' if error is None else 'FAILED',
+            error_message='' if error is None else str(error),
+        ))
+        success &= error is None
+
+    NotificationLog.objects.bulk_create(logs)
+    if success:
+        notification.mark_as_sent()
+    return success
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> NotificationDispatcher:
+    """프로세스 공용 디스패처 (최초 사용 시 워커 시작)"""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                dispatcher = NotificationDispatcher()
+                dispatcher.start()
+                atexit.register(dispatcher.stop)
+                _dispatcher = dispatcher
+    return _dispatcher
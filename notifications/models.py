@@ -172,6 +172,9 @@ class Notification(models.Model):
             self.status = 'read'
             self.read_at = timezone.now()
             self.save()
+            
+            from .realtime import UnreadCountCache
+            UnreadCountCache.refresh(self.recipient_id)
     
     def mark_as_sent(self):
         """알림을 발송완료로 표시"""
@@ -0,0 +1,118 @@
+"""
+실시간 알림 모듈
+직원별 Channels 그룹으로 새 알림/미확인 건수를 푸시하고,
+미확인 알림 건수를 캐시 카운터로 관리합니다.
+"""
+import logging
+from typing import Any, Dict, Iterable, Optional
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+UNREAD_STATUSES = ['SENT', 'PENDING']
+UNREAD_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def employee_group_name(employee_id) -> str:
+    """직원별 Channels 그룹 이름"""
+    return f"notifications_employee_{employee_id}"
+
+
+class UnreadCountCache:
+    """미확인 알림 건수 캐시 카운터 (워커 간 공유 default 캐시)
+
+    캐시에 값이 없을 때와 읽음 처리 후에는 COUNT 로 다시 채우고, 알림 생성 시에는 incr 로 갱신합니다.
+    캐시에 값이 없을 때의 증가는 건너뛰고 다음 조회에서 다시 계산하며,
+    읽음 처리마다 실제 건수로 덮어쓰므로 증감이 어긋나도 누적되지 않습니다.
+    """
+
+    @staticmethod
+    def _key(employee_id) -> str:
+        return f"notifications:unread:{employee_id}"
+
+    @staticmethod
+    def count(employee_id) -> int:
+        return Notification.objects.filter(
+            recipient_id=employee_id,
+            status__in=UNREAD_STATUSES
+        ).count()
+
+    @classmethod
+    def get(cls, employee_id) -> int:
+        key = cls._key(employee_id)
+        count = cache.get(key)
+        if count is None:
+            count = cls.count(employee_id)
+            cache.add(key, count, UNREAD_CACHE_TIMEOUT)
+        return count
+
+    @classmethod
+    def refresh(cls, employee_id) -> int:
+        """실제 미확인 건수로 다시 채움"""
+        count = cls.count(employee_id)
+        cache.set(cls._key(employee_id), count, UNREAD_CACHE_TIMEOUT)
+        return count
+
+    @classmethod
+    def increment(cls, employee_id, delta: int = 1) -> Optional[int]:
+        try:
+            return cache.incr(cls._key(employee_id), delta)
+        except ValueError:
+            return None
+
+    @classmethod
+    def invalidate(cls, employee_id):
+        cache.delete(cls._key(employee_id))
+
+    @classmethod
+    def invalidate_many(cls, employee_ids: Iterable):
+        cache.delete_many([cls._key(employee_id) for employee_id in set(employee_ids)])
+
+
+def serialize_notification(notification: Notification) -> Dict[str, Any]:
+    """WebSocket 전송용 알림 데이터"""
+    return {
+        'id': str(notification.id),
+        'title': notification.title,
+        'message': notification.message,
+        'category': notification.notification_type.category,
+        'priority': notification.notification_type.priority,
+        'action_url': notification.action_url,
+        'action_text': notification.action_text,
+        'created_at': notification.created_at.isoformat() if notification.created_at else None,
+    }
+
+
+def push_to_employee(employee_id, event: Dict[str, Any]) -> bool:
+    """직원 그룹으로 이벤트 전송 (채널 레이어가 없으면 무시)"""
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return False
+    try:
+        async_to_sync(channel_layer.group_send)(employee_group_name(employee_id), event)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to push notification event to employee {employee_id}: {str(e)}")
+        return False
+
+
+def push_new_notification(notification: Notification) -> bool:
+    """새 알림과 갱신된 미확인 건수 푸시"""
+    return push_to_employee(notification.recipient_id, {
+        'type': 'notification.new',
+        'notification': serialize_notification(notification),
+        'unread_count': UnreadCountCache.get(notification.recipient_id),
+    })
+
+
+def push_unread_count(employee_id) -> bool:
+    """미확인 건수만 푸시"""
+    return push_to_employee(employee_id, {
+        'type': 'notification.unread_count',
+        'unread_count': UnreadCountCache.get(employee_id),
+    })
@@ -1,10 +1,9 @@
 """
 알림 시스템 서비스 모듈
 """
+from django.db import transaction
 from django.utils import timezone
 from django.template import Template, Context
-from django.core.mail import send_mail
-from django.conf import settings
 from typing import List, Dict, Any, Optional
 import logging
 
@@ -12,6 +11,8 @@ from .models import (
     NotificationType, Notification, NotificationPreference,
     NotificationLog, AnnouncementBoard
 )
+from .realtime import UNREAD_STATUSES, UnreadCountCache, push_unread_count
+from .delivery import deliver_now, get_delivery_settings, get_dispatcher
 from employees.models import Employee
 
 logger = logging.getLogger(__name__)
@@ -82,152 +83,77 @@ class NotificationService:
             scheduled_at=scheduled_at,
             expires_at=expires_at
         )
+        UnreadCountCache.increment(recipient.pk)
         
         # 즉시 발송 또는 예약
         if scheduled_at is None or scheduled_at <= timezone.now():
-            NotificationService.send_notification(notification)
+            NotificationService.send_notification(notification, preference)
         
         return notification
     
     @staticmethod
-    def send_notification(notification: Notification) -> bool:
+    def send_notification(
+        notification: Notification,
+        preference: Optional[NotificationPreference] = None
+    ) -> bool:
         """
         알림 발송
         
+        NOTIFICATION_DELIVERY['ASYNC'] 가 켜져 있으면 현재 트랜잭션이 커밋된 뒤 채널별 워커 풀에
+        등록만 하고 즉시 반환합니다. 발송완료 처리와 로그 기록은 워커가 일괄로 수행합니다.
+        
         Args:
             notification: 발송할 알림
+            preference: 수신자 알림 설정 (이미 조회한 경우 재사용)
             
         Returns:
-            발송 성공 여부
+            발송 성공 여부 (비동기 모드에서는 등록 성공 여부)
         """
         try:
-            preference = NotificationService.get_or_create_preference(
-                notification.recipient
-            )
-            
-            success = True
-            
-            # 푸시 알림 발송
-            if notification.notification_type.send_push and preference.enable_push:
-                success &= NotificationService._send_push_notification(notification)
-            
-            # 이메일 발송
-            if notification.notification_type.send_email and preference.enable_email:
-                success &= NotificationService._send_email_notification(notification)
+            if preference is None:
+                preference = NotificationService.get_or_create_preference(
+                    notification.recipient
+                )
             
-            # SMS 발송
-            if notification.notification_type.send_sms and preference.enable_sms:
-                success &= NotificationService._send_sms_notification(notification)
+            channels = NotificationService.get_delivery_channels(notification, preference)
             
-            if success:
+            if not channels:
                 notification.mark_as_sent()
+                return True
             
-            return success
-            
-        except Exception as e:
-            logger.error(f"Failed to send notification {notification.id}: {str(e)}")
-            return False
-    
-    @staticmethod
-    def _send_push_notification(notification: Notification) -> bool:
-        """푸시 알림 발송"""
-        try:
-            # 실제 구현에서는 WebSocket이나 Firebase 등을 사용
-            # 여기서는 로그만 기록
-            logger.info(f"Push notification sent to {notification.recipient.name}")
+            if get_delivery_settings()['ASYNC']:
+                # 알림 생성 트랜잭션이 커밋된 뒤에 등록 (롤백된 알림에 로그/발송완료가 기록되지 않도록)
+                transaction.on_commit(lambda: get_dispatcher().dispatch(notification, channels), robust=True)
+                return True
             
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='PUSH',
-                status='SUCCESS'
-            )
-            return True
+            return deliver_now(notification, channels)
             
         except Exception as e:
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='PUSH',
-                status='FAILED',
-                error_message=str(e)
-            )
-            return False
-    
-    @staticmethod
-    def _send_email_notification(notification: Notification) -> bool:
-        """이메일 알림 발송"""
-        try:
-            if not notification.recipient.email:
-                return False
-            
-            subject = f"[OK Financial HRIS] {notification.title}"
-            message = notification.message
-            
-            # HTML 메시지 구성
-            html_message = f"""
-            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <h2 style="color: #3b82f6;">{notification.title}</h2>
-                <div style="background: #f8fafc; padding: 20px; border-radius: 8px; margin: 20px 0;">
-                    <p>{message}</p>
-                </div>
-                {f'<p><a href="{notification.action_url}" style="background: #3b82f6; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">{notification.action_text}</a></p>' if notification.action_url else ''}
-                <hr style="margin: 30px 0;">
-                <p style="color: #64748b; font-size: 14px;">
-                    OK Financial Group HRIS 시스템에서 발송된 알림입니다.
-                </p>
-            </div>
-            """
-            
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[notification.recipient.email],
-                html_message=html_message,
-                fail_silently=False
-            )
-            
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='EMAIL',
-                status='SUCCESS'
-            )
-            return True
-            
-        except Exception as e:
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='EMAIL',
-                status='FAILED',
-                error_message=str(e)
-            )
+            logger.error(f"Failed to send notification {notification.id}: {str(e)}")
             return False
     
     @staticmethod
-    def _send_sms_notification(notification: Notification) -> bool:
-        """SMS 알림 발송"""
-        try:
-            if not notification.recipient.phone:
-                return False
-            
-            # 실제 구현에서는 SMS 게이트웨이 API 사용
-            # 여기서는 로그만 기록
-            logger.info(f"SMS sent to {notification.recipient.phone}")
-            
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='SMS',
-                status='SUCCESS'
-            )
-            return True
-            
-        except Exception as e:
-            NotificationLog.objects.create(
-                notification=notification,
-                channel='SMS',
-                status='FAILED',
-                error_message=str(e)
-            )
-            return False
+    def get_delivery_channels(
+        notification: Notification,
+        preference: NotificationPreference
+    ) -> List[str]:
+        """알림 유형과 수신자 설정에 따른 발송 채널 목록"""
+        notification_type = notification.notification_type
+        channels = []
+        
+        # 푸시 알림
+        if notification_type.send_push and preference.enable_push:
+            channels.append('PUSH')
+        
+        # 이메일
+        if notification_type.send_email and preference.enable_email:
+            channels.append('EMAIL')
+        
+        # SMS
+        if notification_type.send_sms and preference.enable_sms:
+            channels.append('SMS')
+        
+        return channels
     
     @staticmethod
     def get_or_create_preference(employee: Employee) -> NotificationPreference:
@@ -238,24 +164,25 @@ class NotificationService:
         return preference
     
     @staticmethod
-    def mark_notifications_as_read(recipient: Employee, notification_ids: List[str]):
-        """다중 알림을 읽음으로 표시"""
-        notifications = Notification.objects.filter(
+    def mark_notifications_as_read(recipient: Employee, notification_ids: List[str]) -> int:
+        """다중 알림을 읽음으로 표시 (단일 UPDATE)"""
+        recipient_id = getattr(recipient, 'pk', recipient)
+        updated = Notification.objects.filter(
             id__in=notification_ids,
-            recipient=recipient,
-            status__in=['SENT', 'PENDING']
-        )
+            recipient_id=recipient_id,
+            status__in=UNREAD_STATUSES
+        ).update(status='read', read_at=timezone.now())
+        
+        if updated:
+            UnreadCountCache.refresh(recipient_id)
+            push_unread_count(recipient_id)
         
-        for notification in notifications:
-            notification.mark_as_read()
+        return updated
     
     @staticmethod
     def get_unread_count(recipient: Employee) -> int:
-        """읽지 않은 알림 수 조회"""
-        return Notification.objects.filter(
-            recipient=recipient,
-            status__in=['SENT', 'PENDING']
-        ).count()
+        """읽지 않은 알림 수 조회 (캐시 카운터)"""
+        return UnreadCountCache.get(getattr(recipient, 'pk', recipient))
     
     @staticmethod
     def process_scheduled_notifications():
@@ -263,7 +190,7 @@ class NotificationService:
         scheduled_notifications = Notification.objects.filter(
             status='PENDING',
             scheduled_at__lte=timezone.now()
-        )
+        ).select_related('notification_type', 'recipient')
         
         for notification in scheduled_notifications:
             NotificationService.send_notification(notification)
@@ -273,10 +200,14 @@ class NotificationService:
         """만료된 알림 처리 (cron job으로 실행)"""
         expired_notifications = Notification.objects.filter(
             expires_at__lte=timezone.now(),
-            status__in=['SENT', 'PENDING']
+            status__in=UNREAD_STATUSES
+        )
+        recipient_ids = list(
+            expired_notifications.values_list('recipient_id', flat=True).distinct()
         )
         
         expired_notifications.update(status='EXPIRED')
+        UnreadCountCache.invalidate_many(recipient_ids)
 
 
 class AnnouncementService:
@@ -0,0 +1,156 @@
+"""
+알림 발송 테스트용 로컬 스텁 서버
+실제 메일 서버/SMS 게이트웨이 없이 발송 경로 전체를 검증할 때 사용합니다.
+
+    with StubSMTPServer() as smtp, StubSMSServer() as sms:
+        settings.EMAIL_HOST, settings.EMAIL_PORT = smtp.host, smtp.port
+        settings.NOTIFICATION_DELIVERY['SMS_GATEWAY_URL'] = sms.url
+"""
+import json
+import socketserver
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """최소한의 SMTP 프로토콜 처리 (EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT)"""
+
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        stub = self.server.stub
+        with stub.lock:
+            stub.connection_count += 1
+
+        self._reply('220 stub ESMTP ready')
+        mail_from, recipients = None, []
+        while True:
+            raw = self.rfile.readline()
+            if not raw:
+                break
+            command = raw.decode('utf-8', 'replace').strip()
+            verb = command[:4].upper()
+
+            if verb in ('EHLO', 'HELO'):
+                self._reply('250 stub')
+            elif verb == 'MAIL':
+                mail_from, recipients = command[10:].strip(), []
+                self._reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command[8:].strip())
+                self._reply('250 OK')
+            elif verb == 'DATA':
+                self._reply('354 End data with <CR><LF>.<CR><LF>')
+                lines = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(line)
+                with stub.lock:
+                    stub.messages.append({
+                        'from': mail_from,
+                        'to': recipients,
+                        'data': b''.join(lines).decode('utf-8', 'replace'),
+                    })
+                self._reply('250 OK queued')
+            elif verb in ('RSET', 'NOOP'):
+                self._reply('250 OK')
+            elif verb == 'QUIT':
+                self._reply('221 Bye')
+                break
+            else:
+                self._reply('502 Command not implemented')
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubSMTPServer:
+    """받은 메일을 메모리에 저장하는 로컬 SMTP 서버"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0):
+        self.server = _ThreadingTCPServer((host, port), _SMTPHandler)
+        self.server.stub = self
+        self.host, self.port = self.server.server_address
+        self.messages = []
+        self.connection_count = 0
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _SMSHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+
+        with stub.lock:
+            stub.request_count += 1
+            failing = stub.fail_next > 0
+            if failing:
+                stub.fail_next -= 1
+            else:
+                stub.messages.extend(body.get('messages', []))
+
+        status = 503 if failing else 200
+        payload = json.dumps({'success': not failing}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StubSMSServer:
+    """SMS 게이트웨이 스텁 - fail_next 만큼 503 을 반환해 재시도 경로를 검증"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, fail_next: int = 0):
+        self.server = ThreadingHTTPServer((host, port), _SMSHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.host, self.port = self.server.server_address
+        self.url = f"http://{self.host}:{self.port}/send"
+        self.messages = []
+        self.request_count = 0
+        self.fail_next = fail_next
+        self.lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -1,15 +1,36 @@
 """
 Django Admin Configuration for Enhanced Organization Models
 """
+from django import forms
 from django.contrib import admin
 from django.utils.html import format_html
 from django.db.models import Count, Sum
+from .hierarchy import HierarchyValidator, find_violations
 from .models_enhanced import OrgUnit, OrgScenario, OrgSnapshot, OrgChangeLog
 
 
+class OrgUnitAdminForm(forms.ModelForm):
+    """상위 조직 변경 시 순환/깊이를 폼 오류로 표시"""
+    
+    class Meta:
+        model = OrgUnit
+        fields = '__all__'
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        reports_to = cleaned_data.get('reports_to')
+        if reports_to:
+            try:
+                HierarchyValidator.from_db().check(cleaned_data.get('id') or self.instance.id, reports_to.id)
+            except ValueError as e:
+                self.add_error('reports_to', str(e))
+        return cleaned_data
+
+
 @admin.register(OrgUnit)
 class OrgUnitAdmin(admin.ModelAdmin):
     """조직 단위 관리"""
+    form = OrgUnitAdminForm
     list_display = [
         'id', 'company_badge', 'name', 'function',
         'reports_to_link', 'leader_info', 'headcount_badge',
@@ -113,6 +134,25 @@ class OrgUnitAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         qs = super().get_queryset(request)
         return qs.select_related('reports_to', 'created_by')
+    
+    def save_model(self, request, obj, form, change):
+        # 폼에서 이미 검증
+        obj.save(check_hierarchy=False)
+    
+    actions = ['validate_hierarchy']
+    
+    def validate_hierarchy(self, request, queryset):
+        """전체 조직 계층 검증 (선택과 무관하게 전체 맵을 메모리에서 한 번에)"""
+        parents = dict(OrgUnit.objects.values_list('id', 'reports_to_id'))
+        errors = find_violations(parents)
+        if not errors:
+            self.message_user(request, f'{len(parents)}개 조직의 계층에 문제가 없습니다.')
+            return
+        for unit_id, message in list(errors.items())[:20]:
+            self.message_user(request, f'{unit_id}: {message}', level='ERROR')
+        if len(errors) > 20:
+            self.message_user(request, f'... 외 {len(errors) - 20}개', level='ERROR')
+    validate_hierarchy.short_description = '조직 계층 검증'
 
 
 @admin.register(OrgScenario)
@@ -125,14 +165,15 @@ class OrgScenarioAdmin(admin.ModelAdmin):
     list_filter = ['is_active', 'created_at', 'author']
     search_fields = ['name', 'description', 'tags']
     readonly_fields = ['scenario_id', 'created_at', 'updated_at', 'preview_scenario']
-    raw_id_fields = ['author']
+    raw_id_fields = ['author', 'base_snapshot']
+    list_select_related = ['author', 'base_snapshot']
     
     fieldsets = (
         ('시나리오 정보', {
             'fields': ('name', 'description', 'tags', 'is_active')
         }),
         ('시나리오 데이터', {
-            'fields': ('payload', 'preview_scenario')
+            'fields': ('base_snapshot', 'changes', 'payload', 'preview_scenario')
         }),
         ('메타데이터', {
             'fields': ('scenario_id', 'author', 'created_at', 'updated_at'),
@@ -153,20 +194,21 @@ class OrgScenarioAdmin(admin.ModelAdmin):
     is_active_badge.short_description = '상태'
     
     def units_count(self, obj):
-        return len(obj.payload)
+        return len(obj.get_units())
     units_count.short_description = '조직 수'
     
     def preview_scenario(self, obj):
         """시나리오 미리보기"""
-        if not obj.payload:
+        units = list(obj.get_units().values())
+        if not units:
             return '데이터 없음'
         
         preview = []
-        for unit in obj.payload[:5]:  # Show first 5 units
+        for unit in units[:5]:  # Show first 5 units
             preview.append(f"• {unit.get('company', '')} - {unit.get('name', '')}")
         
-        if len(obj.payload) > 5:
-            preview.append(f"... 외 {len(obj.payload) - 5}개")
+        if len(units) > 5:
+            preview.append(f"... 외 {len(units) - 5}개")
         
         return format_html('<br>'.join(preview))
     preview_scenario.short_description = '시나리오 미리보기'
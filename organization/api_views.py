@@ -16,6 +16,12 @@ import hashlib
 from io import BytesIO
 
 from .models_enhanced import OrgUnit, OrgScenario, OrgSnapshot, OrgChangeLog
+from .org_chart import (
+    ALL_COMPANIES, bump_org_version, etag_matches, get_org_chart_settings, load_matrix, load_subtree,
+    not_modified_response, org_etag, with_etag
+)
+from .hierarchy import HierarchyValidator
+from .scenarios import base_snapshot, compute_delta
 from .serializers import (
     OrgUnitSerializer, OrgTreeSerializer, OrgMatrixSerializer,
     OrgScenarioSerializer, OrgSnapshotSerializer, WhatIfReassignSerializer,
@@ -75,9 +81,14 @@ class OrgUnitViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def tree(self, request):
-        """조직 트리 구조 조회"""
+        """조직 트리 구조 조회 (조직 변경이 없으면 304)"""
         company = request.query_params.get('company', None)
         
+        # 하위 조직은 회사와 무관하게 포함되므로 전체 버전 기준
+        etag = org_etag(ALL_COMPANIES, 'tree', company)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        
         # Get root units (no parent)
         roots = OrgUnit.objects.filter(reports_to__isnull=True)
         if company and company != 'ALL':
@@ -88,68 +99,54 @@ class OrgUnitViewSet(viewsets.ModelViewSet):
         for root in roots:
             tree_data.append(root.get_tree_data())
         
-        return Response(tree_data)
+        return with_etag(Response(tree_data), etag)
+    
+    @action(detail=False, methods=['get'])
+    def subtree(self, request):
+        """조직 하위 트리 지연 로딩
+        
+        GET units/subtree/?company=&node=<조직 ID>&depth=1&limit=50&cursor=<nextCursor>
+        node 가 없으면 최상위 조직부터 depth 단계까지, 노드별 자식은 limit 개씩 커서 페이지.
+        회사별 조직 버전으로 ETag 를 만들어 If-None-Match 가 같으면 DB 조회 없이 304.
+        """
+        config = get_org_chart_settings()
+        company = request.query_params.get('company') or ALL_COMPANIES
+        node_id = request.query_params.get('node') or None
+        cursor = request.query_params.get('cursor') or None
+        try:
+            depth = min(max(int(request.query_params.get('depth', 1)), 1), config['MAX_DEPTH'])
+            limit = min(max(int(request.query_params.get('limit', config['PAGE_SIZE'])), 1), config['MAX_PAGE_SIZE'])
+        except ValueError:
+            return Response({
+                'error': 'depth, limit 는 숫자여야 합니다.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        etag = org_etag(company, 'subtree', node_id, depth, limit, cursor)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        
+        try:
+            data = load_subtree(company, node_id, depth=depth, limit=limit, cursor=cursor)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return with_etag(Response(data), etag)
     
     @action(detail=False, methods=['get'], url_path='group/matrix')
     def matrix(self, request):
-        """기능 x 리더 매트릭스 조회"""
+        """기능 x 리더 매트릭스 조회
+
+        그룹 집계 결과를 조직 버전별로 캐시하고 열 형식으로 반환합니다.
+        rows 는 값이 있는 칸만 [functions 번호, headers 번호, 인원, 조직 ID 목록] 으로 담습니다.
+        """
         company = request.query_params.get('company', None)
         
-        # Get all units
-        units = OrgUnit.objects.all()
-        if company and company != 'ALL':
-            units = units.filter(company=company)
-        
-        # Group by function and leader
-        matrix_data = {}
-        leaders = set()
+        etag = org_etag(company, 'matrix')
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
         
-        for unit in units:
-            function = unit.function or '기타'
-            leader_key = f"{unit.leader_rank} {unit.leader_name}" if unit.leader_name else '미정'
-            
-            if function not in matrix_data:
-                matrix_data[function] = {}
-            
-            if leader_key not in matrix_data[function]:
-                matrix_data[function][leader_key] = {
-                    'headcount': 0,
-                    'units': []
-                }
-            
-            matrix_data[function][leader_key]['headcount'] += unit.headcount
-            matrix_data[function][leader_key]['units'].append(unit.id)
-            leaders.add(leader_key)
-        
-        # Format response
-        headers = sorted(list(leaders))
-        rows = []
-        
-        for function, leader_data in sorted(matrix_data.items()):
-            cells = []
-            for leader in headers:
-                if leader in leader_data:
-                    cells.append({
-                        'leader': leader,
-                        'headcount': leader_data[leader]['headcount'],
-                        'units': leader_data[leader]['units']
-                    })
-                else:
-                    cells.append({
-                        'leader': leader,
-                        'headcount': 0,
-                        'units': []
-                    })
-            
-            rows.append({
-                'function': function,
-                'cells': cells
-            })
-        
-        return Response({
-            'headers': headers,
-            'rows': rows
-        })
+        serializer = OrgMatrixSerializer(load_matrix(company))
+        return with_etag(Response(serializer.data), etag)
     
     def create(self, request, *args, **kwargs):
         """조직 단위 생성 with 로깅"""
@@ -240,7 +237,7 @@ class OrgScenarioViewSet(viewsets.ModelViewSet):
         queryset = super().get_queryset()
         
         # Filter by author if not admin
-        if not request.user.is_staff:
+        if not self.request.user.is_staff:
             queryset = queryset.filter(author=self.request.user)
         
         return queryset
@@ -321,26 +318,18 @@ class WhatIfAnalysisViewSet(viewsets.ViewSet):
     
     @action(detail=False, methods=['post'], url_path='reassign')
     def reassign(self, request):
-        """조직 재배치 시뮬레이션"""
+        """조직 재배치 시뮬레이션 (메모리에서 계산, 이전 응답의 changes 를 함께 보내면 이어서 적용)"""
         serializer = WhatIfReassignSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         unit_id = serializer.validated_data['unitId']
         new_reports_to = serializer.validated_data.get('newReportsTo')
+        version = serializer.validated_data['version']
+        base = serializer.validated_data['base']
+        units = serializer.validated_data['units']
         
-        # Create snapshot of current state
-        current_snapshot = OrgSnapshot.create_from_current(
-            name=f"What-if: {unit_id} reassignment",
-            user=request.user,
-            snapshot_type='WHATIF'
-        )
-        
-        # Apply change to snapshot data
-        snapshot_data = current_snapshot.data.copy()
-        for unit_data in snapshot_data:
-            if unit_data['id'] == unit_id:
-                unit_data['reportsTo'] = new_reports_to
-                break
+        # 현재 조직 버전의 기준 스냅샷 (버전마다 한 번만 저장)
+        snapshot = base_snapshot(version, base, request.user)
         
         # Log the what-if analysis
         OrgChangeLog.objects.create(
@@ -348,7 +337,7 @@ class WhatIfAnalysisViewSet(viewsets.ViewSet):
             org_unit_id=unit_id,
             changes={
                 'unit_id': unit_id,
-                'old_reports_to': OrgUnit.objects.get(id=unit_id).reports_to_id,
+                'old_reports_to': base[unit_id]['reportsTo'] if unit_id in base else None,
                 'new_reports_to': new_reports_to
             },
             user=request.user,
@@ -357,8 +346,10 @@ class WhatIfAnalysisViewSet(viewsets.ViewSet):
         )
         
         return Response({
-            'snapshot_id': str(current_snapshot.snapshot_id),
-            'data': snapshot_data
+            'snapshot_id': str(snapshot.snapshot_id),
+            'version': version,
+            'data': list(units.values()),
+            'changes': compute_delta(base, units)
         })
     
     def get_client_ip(self, request):
@@ -371,6 +362,12 @@ class WhatIfAnalysisViewSet(viewsets.ViewSet):
         return ip
 
 
+EXCEL_IMPORT_FIELDS = [
+    'company', 'name', 'function', 'headcount', 'leader_title', 'leader_rank',
+    'leader_name', 'leader_age', 'members', 'reports_to', 'updated_at',
+]
+
+
 class ExcelIOViewSet(viewsets.ViewSet):
     """
     엑셀 Import/Export ViewSet
@@ -403,6 +400,7 @@ class ExcelIOViewSet(viewsets.ViewSet):
                 updated_count = 0
                 errors = []
                 
+                rows = []
                 for index, row in df.iterrows():
                     try:
                         # Parse members JSON if exists
@@ -431,20 +429,48 @@ class ExcelIOViewSet(viewsets.ViewSet):
                         if pd.notna(row.get('reports_to')):
                             unit_data['reports_to_id'] = str(row['reports_to'])
                         
-                        # Create or update
-                        unit, created = OrgUnit.objects.update_or_create(
-                            id=unit_data['id'],
-                            defaults=unit_data
-                        )
-                        
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
+                        rows.append((index, unit_data))
                     
                     except Exception as e:
                         errors.append(f"Row {index + 2}: {str(e)}")
                 
+                # 계층 검증 (전체 행을 메모리에서 한 번에, 위반 행만 제외)
+                existing = OrgUnit.objects.in_bulk([unit_data['id'] for _, unit_data in rows])
+                validator = HierarchyValidator.from_db()
+                hierarchy_errors = validator.assign_many(
+                    (unit_data['id'], unit_data.get('reports_to_id', validator.parents.get(unit_data['id'])))
+                    for _, unit_data in rows
+                )
+                
+                # 같은 조직이 여러 행이면 뒤쪽 행 기준 (행 단위 update_or_create 와 동일한 결과)
+                created_units, updated_units = {}, {}
+                for position, (index, unit_data) in enumerate(rows):
+                    if position in hierarchy_errors:
+                        errors.append(f"Row {index + 2}: {hierarchy_errors[position]}")
+                        continue
+                    try:
+                        unit_id = unit_data['id']
+                        unit = existing.get(unit_id) or created_units.get(unit_id) or OrgUnit()
+                        for field, value in unit_data.items():
+                            setattr(unit, field, value)
+                        unit.clean_fields(exclude=['reports_to', 'created_by'])
+                    except Exception as e:
+                        errors.append(f"Row {index + 2}: {str(e)}")
+                        continue
+                    
+                    if unit_id in existing:
+                        unit.updated_at = timezone.now()
+                        updated_units[unit_id] = unit
+                        updated_count += 1
+                    else:
+                        created_units[unit_id] = unit
+                        created_count += 1
+                
+                OrgUnit.objects.bulk_create(created_units.values(), batch_size=500)
+                OrgUnit.objects.bulk_update(updated_units.values(), EXCEL_IMPORT_FIELDS, batch_size=500)
+                companies = {unit.company for unit in [*created_units.values(), *updated_units.values()]}
+                transaction.on_commit(lambda: bump_org_version(*companies))
+                
                 # Log the import
                 OrgChangeLog.objects.create(
                     action='IMPORT',
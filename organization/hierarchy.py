@@ -0,0 +1,141 @@
+"""
+조직 계층 무결성 검증
+상위 조직 맵(id → 상위 id)을 한 번에 메모리로 올려 순환 참조와 최대 깊이를 검증합니다.
+(저장마다 reports_to 를 단계별로 조회하지 않음)
+
+- 전체 검증: find_violations() - DFS 색칠, 노드마다 한 번 방문 (시나리오/일괄 적용)
+- 변경 검증: HierarchyValidator.assign() - 유효한 맵을 유지하며 상위 경로 + 하위 높이만 확인
+  (일괄 수정/업로드는 행 순서대로 반영하고 위반 행만 거부)
+
+    validator = HierarchyValidator.from_db()
+    errors = validator.assign_many([('T1', 'H2'), ('T2', None)])    # {변경 순번: 오류 메시지}
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+MAX_DEPTH = 8
+CYCLE_MESSAGE = "순환 참조가 감지되었습니다."
+DEPTH_MESSAGE = f"조직 깊이는 최대 {MAX_DEPTH}단계까지만 허용됩니다."
+
+Parents = Dict[str, Optional[str]]
+
+
+def find_violations(parents: Parents, max_depth: int = MAX_DEPTH) -> Dict[str, str]:
+    """상위 조직 맵 전체 검증 {id: 오류 메시지}
+
+    최상위 조직 깊이는 0, 맵에 없는 상위 조직은 최상위로 간주합니다.
+    순환에 속하거나 순환 아래에 있는 조직은 순환 오류, 깊이가 max_depth 를 넘는 조직은 깊이 오류.
+    """
+    depths: Dict[str, int] = {}
+    errors: Dict[str, str] = {}
+    for start in parents:
+        if start in depths or start in errors:
+            continue
+
+        # 방문 중(경로 위) 노드를 다시 만나면 순환
+        path, on_path = [], set()
+        node = start
+        while node in parents and node not in depths and node not in errors and node not in on_path:
+            path.append(node)
+            on_path.add(node)
+            node = parents[node]
+
+        if node in on_path or (node in errors and node not in depths):
+            for member in path:
+                errors[member] = CYCLE_MESSAGE
+            continue
+
+        depth = depths.get(node, -1)
+        for member in reversed(path):
+            depth += 1
+            depths[member] = depth
+            if depth > max_depth:
+                errors[member] = DEPTH_MESSAGE
+    return errors
+
+
+def validate_parents(parents: Parents, max_depth: int = MAX_DEPTH):
+    """전체 검증, 위반이 있으면 ValueError"""
+    errors = find_violations(parents, max_depth)
+    if errors:
+        raise ValueError(next(iter(errors.values())))
+
+
+class HierarchyValidator:
+    """유효한 상위 조직 맵을 유지하며 재배치를 하나씩 검증"""
+
+    def __init__(self, parents: Parents, max_depth: int = MAX_DEPTH):
+        self.parents = dict(parents)
+        self.max_depth = max_depth
+        self.children: Dict[str, Set[str]] = defaultdict(set)
+        for unit_id, parent_id in self.parents.items():
+            if parent_id:
+                self.children[parent_id].add(unit_id)
+
+    @classmethod
+    def from_db(cls, max_depth: int = MAX_DEPTH) -> 'HierarchyValidator':
+        """OrgUnit 상위 조직 맵 (쿼리 한 번)"""
+        from .models_enhanced import OrgUnit
+
+        return cls(dict(OrgUnit.objects.values_list('id', 'reports_to_id')), max_depth)
+
+    def depth(self, unit_id: Optional[str]) -> int:
+        """조직 깊이 (최상위 0, 조직 없음 -1)"""
+        depth, seen = -1, set()
+        while unit_id and unit_id not in seen:
+            seen.add(unit_id)
+            depth += 1
+            unit_id = self.parents.get(unit_id)
+        return depth
+
+    def height(self, unit_id: str) -> int:
+        """하위 조직 단계 수 (하위 조직이 없으면 0)"""
+        height, level, seen = 0, self.children.get(unit_id, set()), {unit_id}
+        while level:
+            level = level - seen
+            if not level:
+                break
+            height += 1
+            seen |= level
+            level = {child for node in level for child in self.children.get(node, ())}
+        return height
+
+    def check(self, unit_id: str, parent_id: Optional[str]):
+        """unit_id 를 parent_id 아래로 옮길 수 있는지 검증 (ValueError)"""
+        if not parent_id:
+            return
+        node, seen = parent_id, set()
+        while node and node not in seen:
+            if node == unit_id:
+                raise ValueError(CYCLE_MESSAGE)
+            seen.add(node)
+            node = self.parents.get(node)
+        if self.depth(parent_id) + 1 + self.height(unit_id) > self.max_depth:
+            raise ValueError(DEPTH_MESSAGE)
+
+    def assign(self, unit_id: str, parent_id: Optional[str]):
+        """검증 후 맵에 반영 (새 조직이면 추가)"""
+        parent_id = parent_id or None
+        self.check(unit_id, parent_id)
+        previous = self.parents.get(unit_id)
+        if previous:
+            self.children[previous].discard(unit_id)
+        if parent_id:
+            self.children[parent_id].add(unit_id)
+        self.parents[unit_id] = parent_id
+
+    def assign_many(self, changes: Iterable[Tuple[str, Optional[str]]]) -> Dict[int, str]:
+        """순서대로 반영하고 거부된 변경만 {변경 순번: 오류 메시지}로 반환
+
+        같은 배치에서 새로 만드는 조직을 먼저 등록하므로 뒤쪽 행의 조직도 상위 조직으로 지정 가능.
+        """
+        changes = list(changes)
+        for unit_id, _ in changes:
+            self.parents.setdefault(unit_id, None)
+        errors = {}
+        for position, (unit_id, parent_id) in enumerate(changes):
+            try:
+                self.assign(unit_id, parent_id)
+            except ValueError as e:
+                errors[position] = str(e)
+        return errors
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0003_rename_organizatio_created_4e2b1c_idx_organizatio_created_88e0ed_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orgsnapshot',
+            name='version',
+            field=models.BigIntegerField(blank=True, db_index=True, help_text='시나리오 기준 스냅샷의 조직 버전 (버전마다 하나를 공유)', null=True, verbose_name='조직 버전'),
+        ),
+        migrations.AddField(
+            model_name='orgscenario',
+            name='base_snapshot',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='based_scenarios', to='organization.orgsnapshot', verbose_name='기준 스냅샷'),
+        ),
+        migrations.AddField(
+            model_name='orgscenario',
+            name='changes',
+            field=models.JSONField(blank=True, default=dict, help_text="기준 스냅샷 대비 {'companies': [...], 'upsert': {id: 단위}, 'delete': [id]}", verbose_name='변경분'),
+        ),
+        migrations.AlterField(
+            model_name='orgscenario',
+            name='payload',
+            field=models.JSONField(default=list, help_text='조직 단위 배열 (기준 스냅샷이 없는 이전 시나리오)', verbose_name='시나리오 데이터'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0004_orgscenario_base_snapshot_changes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrgChartVersion',
+            fields=[
+                ('company', models.CharField(max_length=50, primary_key=True, serialize=False, verbose_name='회사')),
+                ('version', models.BigIntegerField(verbose_name='버전')),
+            ],
+            options={
+                'verbose_name': '조직도 버전',
+                'verbose_name_plural': '조직도 버전',
+            },
+        ),
+    ]
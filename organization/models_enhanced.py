@@ -9,6 +9,8 @@ from django.db import transaction
 import uuid
 import json
 
+from .hierarchy import CYCLE_MESSAGE, HierarchyValidator
+
 # Django 3.1+ has JSONField for all databases
 try:
     from django.db.models import JSONField
@@ -114,25 +116,29 @@ class OrgUnit(models.Model):
     def __str__(self):
         return f"{self.company} - {self.name}"
     
+    def get_node_data(self):
+        """조직도 노드 데이터"""
+        return {
+            'id': self.id,
+            'company': self.company,
+            'name': self.name,
+            'function': self.function,
+            'reportsTo': self.reports_to_id,
+            'headcount': self.headcount,
+            'leader': {
+                'title': self.leader_title,
+                'rank': self.leader_rank,
+                'name': self.leader_name,
+                'age': self.leader_age
+            } if self.leader_name else None,
+            'members': self.members
+        }
+    
     def get_tree_data(self):
         """트리 구조 데이터 생성"""
         data = {
             'id': self.id,
-            'data': {
-                'id': self.id,
-                'company': self.company,
-                'name': self.name,
-                'function': self.function,
-                'reportsTo': self.reports_to_id,
-                'headcount': self.headcount,
-                'leader': {
-                    'title': self.leader_title,
-                    'rank': self.leader_rank,
-                    'name': self.leader_name,
-                    'age': self.leader_age
-                } if self.leader_name else None,
-                'members': self.members
-            },
+            'data': self.get_node_data(),
             'children': []
         }
         
@@ -156,38 +162,29 @@ class OrgUnit(models.Model):
             total += sub.get_total_headcount()
         return total
     
-    def validate_hierarchy(self):
+    def validate_hierarchy(self, validator=None):
         """순환 참조 방지 검증"""
-        if not self.reports_to:
-            return True
-        
-        parent = self.reports_to
-        visited = {self.id}
-        
-        while parent:
-            if parent.id in visited:
-                return False  # Circular reference detected
-            visited.add(parent.id)
-            parent = parent.reports_to
-        
+        validator = validator or HierarchyValidator.from_db()
+        try:
+            validator.check(self.id, self.reports_to_id)
+        except ValueError as e:
+            return str(e) != CYCLE_MESSAGE
         return True
     
-    def get_depth(self):
+    def get_depth(self, validator=None):
         """조직 깊이 계산"""
-        depth = 0
-        parent = self.reports_to
-        while parent and depth < 10:  # Max depth safety
-            depth += 1
-            parent = parent.reports_to
-        return depth
-    
-    def save(self, *args, **kwargs):
-        """저장 시 검증"""
-        if not self.validate_hierarchy():
-            raise ValueError("순환 참조가 감지되었습니다.")
-        
-        if self.get_depth() > 8:
-            raise ValueError("조직 깊이는 최대 8단계까지만 허용됩니다.")
+        if not self.reports_to_id:
+            return 0
+        validator = validator or HierarchyValidator.from_db()
+        return validator.depth(self.reports_to_id) + 1
+    
+    def save(self, *args, check_hierarchy=True, **kwargs):
+        """저장 시 검증 (상위 조직 맵을 한 번 조회해 메모리에서 순환/깊이 확인)
+
+        일괄 반영은 HierarchyValidator 로 먼저 검증하고 check_hierarchy=False 로 저장합니다.
+        """
+        if check_hierarchy and self.reports_to_id:
+            HierarchyValidator.from_db().check(self.id, self.reports_to_id)
         
         super().save(*args, **kwargs)
 
@@ -214,7 +211,21 @@ class OrgScenario(models.Model):
     payload = models.JSONField(
         default=list,
         verbose_name="시나리오 데이터",
-        help_text="조직 단위 배열"
+        help_text="조직 단위 배열 (기준 스냅샷이 없는 이전 시나리오)"
+    )
+    base_snapshot = models.ForeignKey(
+        'OrgSnapshot',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='based_scenarios',
+        verbose_name="기준 스냅샷"
+    )
+    changes = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="변경분",
+        help_text="기준 스냅샷 대비 {'companies': [...], 'upsert': {id: 단위}, 'delete': [id]}"
     )
     
     # Metadata
@@ -237,112 +248,62 @@ class OrgScenario(models.Model):
     def __str__(self):
         return f"{self.name} - {self.author.username if self.author else 'Anonymous'}"
     
+    def get_units(self):
+        """시나리오 조직 단위 {id: 단위} (기준 스냅샷 + 변경분)"""
+        from .scenarios import apply_delta, restrict, to_units
+
+        if self.base_snapshot_id:
+            base = restrict(to_units(self.base_snapshot.data), self.changes.get('companies', []))
+            return apply_delta(base, self.changes)
+        return to_units(self.payload)
+
+    def set_units(self, units, user=None):
+        """조직 단위 배열을 현재 조직 대비 변경분으로 저장 (save 는 호출하지 않음)"""
+        from .scenarios import compute_delta, current_units, restrict, to_units
+
+        units = to_units(units)
+        companies = sorted({unit.get('company') for unit in units.values()})
+        version, base = current_units()
+        delta = compute_delta(restrict(base, companies), units)
+        self.set_changes(dict(delta, companies=companies), user)
+
+    def set_changes(self, changes, user=None):
+        """현재 조직 스냅샷 기준 변경분 지정 (What-if 결과를 그대로 시나리오로 저장)"""
+        from .scenarios import base_snapshot, current_units
+
+        version, base = current_units()
+        self.base_snapshot = base_snapshot(version, base, user)
+        self.changes = {
+            'companies': changes['companies'] if 'companies' in changes else sorted({
+                unit.get('company') for unit in [*base.values(), *changes.get('upsert', {}).values()]
+            }),
+            'upsert': changes.get('upsert', {}),
+            'delete': changes.get('delete', []),
+        }
+        self.payload = []
+
     def apply_scenario(self):
-        """시나리오를 실제 조직에 적용"""
+        """시나리오를 실제 조직에 적용 (바뀐 조직 단위만 반영)"""
+        from .scenarios import apply_units
+
+        units = self.get_units()
+        companies = {unit.get('company') for unit in units.values()} | set(self.changes.get('companies', []))
         with transaction.atomic():
-            # Clear existing org units for the companies in scenario
-            companies = set()
-            for unit_data in self.payload:
-                companies.add(unit_data.get('company'))
-            
             if companies:
-                OrgUnit.objects.filter(company__in=companies).delete()
-            
-            # Create new org units from scenario
-            units_map = {}
-            
-            # First pass: Create all units without hierarchy
-            for unit_data in self.payload:
-                unit = OrgUnit(
-                    id=unit_data['id'],
-                    company=unit_data['company'],
-                    name=unit_data['name'],
-                    function=unit_data.get('function', ''),
-                    headcount=unit_data.get('headcount', 0),
-                    leader_title=unit_data.get('leader', {}).get('title', ''),
-                    leader_rank=unit_data.get('leader', {}).get('rank', ''),
-                    leader_name=unit_data.get('leader', {}).get('name', ''),
-                    leader_age=unit_data.get('leader', {}).get('age'),
-                    members=unit_data.get('members', []),
-                    created_by=self.author
-                )
-                unit.save()
-                units_map[unit.id] = unit
-            
-            # Second pass: Set up hierarchy
-            for unit_data in self.payload:
-                if unit_data.get('reportsTo'):
-                    unit = units_map[unit_data['id']]
-                    unit.reports_to = units_map.get(unit_data['reportsTo'])
-                    unit.save()
-            
+                apply_units(units, companies, created_by=self.author)
+
             # Mark this scenario as active
             OrgScenario.objects.filter(is_active=True).update(is_active=False)
             self.is_active = True
             self.save()
-            
+
             return True
-    
+
     def get_diff(self, other_scenario):
-        """두 시나리오 간 차이점 분석"""
-        diffs = []
-        
-        # Convert to dict for easier comparison
-        current_units = {u['id']: u for u in self.payload}
-        other_units = {u['id']: u for u in other_scenario.payload}
-        
-        # Check for new units
-        for uid, unit in other_units.items():
-            if uid not in current_units:
-                diffs.append({
-                    'type': 'new',
-                    'message': f"{unit['name']}: (신규)",
-                    'unit': unit
-                })
-        
-        # Check for deleted units
-        for uid, unit in current_units.items():
-            if uid not in other_units:
-                diffs.append({
-                    'type': 'deleted',
-                    'message': f"{unit['name']}: (삭제)",
-                    'unit': unit
-                })
-        
-        # Check for changes
-        for uid, unit in current_units.items():
-            if uid in other_units:
-                other_unit = other_units[uid]
-                
-                # Check reporting structure
-                if unit.get('reportsTo') != other_unit.get('reportsTo'):
-                    old_parent = unit.get('reportsTo', '(최상위)')
-                    new_parent = other_unit.get('reportsTo', '(최상위)')
-                    diffs.append({
-                        'type': 'hierarchy',
-                        'message': f"{unit['name']} 보고체계 변경: {old_parent} → {new_parent}",
-                        'unit': unit
-                    })
-                
-                # Check headcount
-                if unit.get('headcount') != other_unit.get('headcount'):
-                    diffs.append({
-                        'type': 'headcount',
-                        'message': f"{unit['name']} 인원: {unit.get('headcount')} → {other_unit.get('headcount')}",
-                        'unit': unit
-                    })
-                
-                # Check leader change
-                old_leader = unit.get('leader', {}).get('name', '')
-                new_leader = other_unit.get('leader', {}).get('name', '')
-                if old_leader != new_leader:
-                    diffs.append({
-                        'type': 'leader',
-                        'message': f"{unit['name']} 리더: {old_leader or '(없음)'} → {new_leader or '(없음)'}",
-                        'unit': unit
-                    })
-        
-        return diffs
+        """두 시나리오 간 차이점 분석 (id 기준 병합 비교)"""
+        from .scenarios import diff_units
+
+        return diff_units(self.get_units(), other_scenario.get_units())
 
 
 class OrgSnapshot(models.Model):
@@ -384,6 +345,13 @@ class OrgSnapshot(models.Model):
         related_name='snapshots',
         verbose_name="관련 시나리오"
     )
+    version = models.BigIntegerField(
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name="조직 버전",
+        help_text="시나리오 기준 스냅샷의 조직 버전 (버전마다 하나를 공유)"
+    )
     
     # Metadata
     created_by = models.ForeignKey(
@@ -500,4 +468,19 @@ class OrgChangeLog(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.get_action_display()} - {self.user.username if self.user else 'System'} - {self.created_at}"
\ No newline at end of file
+        return f"{self.get_action_display()} - {self.user.username if self.user else 'System'} - {self.created_at}"
+
+class OrgChartVersion(models.Model):
+    """
+    회사별 조직도 버전 - ETag / 매트릭스 / 시나리오 스냅샷 캐시 키에 사용
+    (모든 워커가 같은 값을 보도록 DB 행에서 F() 로 증가)
+    """
+    company = models.CharField(max_length=50, primary_key=True, verbose_name="회사")
+    version = models.BigIntegerField(verbose_name="버전")
+    
+    class Meta:
+        verbose_name = '조직도 버전'
+        verbose_name_plural = '조직도 버전'
+    
+    def __str__(self):
+        return f"{self.company} v{self.version}"
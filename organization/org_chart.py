@@ -0,0 +1,250 @@
+"""
+조직도 지연 로딩 / 조건부 조회
+조직도를 한 번에 내려주지 않고 노드의 하위 조직을 depth 단계까지, 노드별 자식은 커서 페이지로 내려줍니다.
+
+- 버전: 회사별 조직 버전 카운터 (OrgChartVersion 행, 조직 단위 저장/삭제 시그널이 커밋 후 F() 로 증가)
+  프로세스별 캐시가 아니라 DB 에 두므로 모든 워커가 같은 버전/ETag/매트릭스 캐시 키를 사용
+- ETag: 버전 + 요청 파라미터로 계산, If-None-Match 가 같으면 버전 행 조회 한 번으로 304
+- 버전 행이 없으면 현재 시각(ms)으로 시작하므로 이전 ETag 와 겹치지 않음
+
+    etag = org_etag(company, 'subtree', node_id, depth)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+    data = load_subtree(company, node_id, depth=2, limit=50)
+    matrix = load_matrix(company)     # 기능 x 리더 (그룹 집계 쿼리, 조직 버전별 캐시)
+"""
+import base64
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, Window
+from django.db.models.functions import Coalesce, RowNumber
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models_enhanced import OrgChartVersion, OrgUnit
+
+ALL_COMPANIES = 'ALL'
+
+DEFAULT_ORG_CHART_SETTINGS = {
+    'PAGE_SIZE': 50,          # 노드별 자식 페이지 크기 기본값
+    'MAX_PAGE_SIZE': 200,
+    'MAX_DEPTH': 3,           # 한 번에 펼치는 최대 단계
+    'MATRIX_TIMEOUT': 3600,   # 매트릭스 캐시 (조직 버전이 바뀌면 키가 바뀜)
+}
+
+MATRIX_COLUMNS = ['function', 'leader', 'headcount', 'units']
+
+
+def get_org_chart_settings() -> Dict[str, Any]:
+    """settings.ORG_CHART 를 기본값과 병합"""
+    config = dict(DEFAULT_ORG_CHART_SETTINGS)
+    config.update(getattr(settings, 'ORG_CHART', {}))
+    return config
+
+
+# ----------------------------------------------------------------------
+# 버전 / ETag
+# ----------------------------------------------------------------------
+def _version_company(company: Optional[str]) -> str:
+    return company or ALL_COMPANIES
+
+
+def get_org_version(company: Optional[str] = None) -> int:
+    company = _version_company(company)
+    version = OrgChartVersion.objects.filter(company=company).values_list('version', flat=True).first()
+    if version is not None:
+        return version
+    try:
+        with transaction.atomic():
+            return OrgChartVersion.objects.create(company=company, version=int(time.time() * 1000)).version
+    except IntegrityError:
+        # 다른 워커가 먼저 행을 만든 경우
+        return OrgChartVersion.objects.filter(company=company).values_list('version', flat=True).get()
+
+
+def bump_org_version(*companies: Optional[str]):
+    """변경된 회사와 전체('ALL') 버전 증가"""
+    for company in {company for company in companies if company} | {ALL_COMPANIES}:
+        if OrgChartVersion.objects.filter(company=company).update(version=F('version') + 1):
+            continue
+        try:
+            with transaction.atomic():
+                OrgChartVersion.objects.create(company=company, version=int(time.time() * 1000))
+        except IntegrityError:
+            OrgChartVersion.objects.filter(company=company).update(version=F('version') + 1)
+
+
+def org_etag(company: Optional[str], *parts) -> str:
+    """회사 조직 버전 + 요청 파라미터로 강한 ETag 계산"""
+    raw = json.dumps([company or ALL_COMPANIES, get_org_version(company), *parts], default=str)
+    return quote_etag(hashlib.sha1(raw.encode()).hexdigest())
+
+
+def etag_matches(request, etag: str) -> bool:
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    return '*' in etags or etag in etags
+
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    return with_etag(response, etag)
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+# ----------------------------------------------------------------------
+# 하위 트리
+# ----------------------------------------------------------------------
+def encode_cursor(unit: OrgUnit) -> str:
+    return base64.urlsafe_b64encode(json.dumps([unit.name, unit.id]).encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    """커서 → (조직명, 조직 ID), 잘못된 커서는 ValueError"""
+    try:
+        name, unit_id = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    return name, unit_id
+
+
+def unit_node(unit: OrgUnit) -> Dict[str, Any]:
+    return {
+        'id': unit.id,
+        'data': unit.get_node_data(),
+        'childCount': unit.child_count,
+        'hasChildren': unit.child_count > 0,
+        'children': [],
+        'nextCursor': None,
+    }
+
+
+def _units(company: Optional[str]):
+    """조직 단위 + 자식 수 (상관 서브쿼리), 회사 지정 시 해당 회사만"""
+    children = OrgUnit.objects.filter(reports_to=OuterRef('pk'))
+    units = OrgUnit.objects.all()
+    if company and company != ALL_COMPANIES:
+        children = children.filter(company=company)
+        units = units.filter(company=company)
+    child_count = children.order_by().values('reports_to').annotate(count=Count('id')).values('count')
+    return units.annotate(child_count=Coalesce(Subquery(child_count), Value(0), output_field=IntegerField()))
+
+
+def load_subtree(company: Optional[str], node_id: Optional[str] = None, depth: int = 1,
+                 limit: int = 50, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """노드의 하위 조직 depth 단계 (단계마다 쿼리 한 번, 노드별 자식은 limit 개씩)
+
+    첫 단계는 cursor 이후부터, 아래 단계는 각 노드의 첫 페이지만 담고 nextCursor 로 이어서 조회.
+    company 를 지정하면 모든 단계에서 해당 회사 조직만 포함합니다.
+    """
+    units = _units(company)
+    first = units.filter(reports_to_id=node_id) if node_id else units.filter(reports_to__isnull=True)
+    if cursor:
+        name, unit_id = decode_cursor(cursor)
+        first = first.filter(Q(name__gt=name) | Q(name=name, id__gt=unit_id))
+    page = list(first.order_by('name', 'id')[:limit + 1])
+    has_more = len(page) > limit
+    items = [unit_node(unit) for unit in page[:limit]]
+
+    level = items
+    for _ in range(depth - 1):
+        expandable = {node['id']: node for node in level if node['hasChildren']}
+        if not expandable:
+            break
+        children = units.filter(reports_to_id__in=list(expandable)).annotate(
+            position=Window(RowNumber(), partition_by=[F('reports_to')], order_by=[F('name').asc(), F('id').asc()])
+        ).filter(position__lte=limit + 1).order_by('reports_to', 'name', 'id')
+
+        level, last_child = [], {}
+        for unit in children:
+            parent = expandable[unit.reports_to_id]
+            if len(parent['children']) == limit:
+                parent['nextCursor'] = encode_cursor(last_child[unit.reports_to_id])
+                continue
+            node = unit_node(unit)
+            parent['children'].append(node)
+            last_child[unit.reports_to_id] = unit
+            level.append(node)
+
+    return {
+        'node': node_id,
+        'items': items,
+        'nextCursor': encode_cursor(page[limit - 1]) if has_more else None,
+        'hasMore': has_more,
+    }
+
+
+# ----------------------------------------------------------------------
+# 기능 x 리더 매트릭스
+# ----------------------------------------------------------------------
+def matrix_groups(company: Optional[str]):
+    """(기능, 직급, 리더) 그룹별 인원 합계와 조직 ID 목록 (DB 그룹 집계)"""
+    units = OrgUnit.objects.all()
+    if company and company != ALL_COMPANIES:
+        units = units.filter(company=company)
+    groups = units.order_by().values('function', 'leader_rank', 'leader_name')
+
+    if connection.vendor == 'postgresql':
+        from django.contrib.postgres.aggregates import ArrayAgg
+
+        return list(groups.annotate(total=Sum('headcount'), unit_ids=ArrayAgg('id', ordering='id')))
+
+    # ArrayAgg 가 없는 DB: 합계는 그룹 쿼리, 조직 ID 는 정렬된 ID 목록 한 번으로 묶음
+    rows = list(groups.annotate(total=Sum('headcount')))
+    unit_ids = {}
+    for function, rank, name, unit_id in units.order_by('id').values_list(
+            'function', 'leader_rank', 'leader_name', 'id'):
+        unit_ids.setdefault((function, rank, name), []).append(unit_id)
+    for row in rows:
+        row['unit_ids'] = unit_ids.get((row['function'], row['leader_rank'], row['leader_name']), [])
+    return rows
+
+
+def build_matrix(groups) -> Dict[str, Any]:
+    """그룹 집계 → 열 형식 (행/열 이름 목록 + 값이 있는 칸만 [기능 번호, 리더 번호, 인원, 조직 ID])"""
+    cells: Dict[tuple, Dict[str, Any]] = {}
+    for group in groups:
+        function = group['function'] or '기타'
+        leader = f"{group['leader_rank']} {group['leader_name']}" if group['leader_name'] else '미정'
+        cell = cells.setdefault((function, leader), {'headcount': 0, 'units': []})
+        cell['headcount'] += group['total'] or 0
+        cell['units'].extend(group['unit_ids'])
+
+    functions = sorted({function for function, _ in cells})
+    headers = sorted({leader for _, leader in cells})
+    function_index = {function: i for i, function in enumerate(functions)}
+    leader_index = {leader: i for i, leader in enumerate(headers)}
+    rows = sorted(
+        [function_index[function], leader_index[leader], cell['headcount'], sorted(cell['units'])]
+        for (function, leader), cell in cells.items()
+    )
+    return {'functions': functions, 'headers': headers, 'columns': MATRIX_COLUMNS, 'rows': rows}
+
+
+def load_matrix(company: Optional[str]) -> Dict[str, Any]:
+    """기능 x 리더 매트릭스 (회사 조직 버전 키로 캐시)
+
+    버전은 모든 워커가 공유하는 DB 카운터라 조직이 바뀌면 어느 워커에서든 키가 바뀌고,
+    이전 버전의 항목은 MATRIX_TIMEOUT 후 만료됩니다.
+    """
+    version = get_org_version(company)
+    key = f"org:matrix:{company or ALL_COMPANIES}:{version}"
+    matrix = cache.get(key)
+    if matrix is None:
+        matrix = dict(build_matrix(matrix_groups(company)), version=version)
+        cache.set(key, matrix, get_org_chart_settings()['MATRIX_TIMEOUT'])
+    return matrix
@@ -0,0 +1,229 @@
+"""
+조직 개편 시나리오 엔진
+시나리오를 기준 스냅샷(조직 버전별 공유) + 변경분(delta)으로 저장하고, 메모리에서 비교/적용합니다.
+
+- 조직 단위는 {id: 단위 dict} 로 다루며 변경 시 dict 를 새로 만들어 교체 (copy-on-write, 원본 공유)
+- 현재 조직 스냅샷은 조직 버전별로 캐시 (What-if 는 DB 조회 없이 메모리에서 반복)
+  버전은 DB 공유 카운터(OrgChartVersion)라 다른 워커에서 바뀐 조직도 다음 조회에 반영
+- 비교는 id 기준 keyed merge, 적용은 바뀐 단위만 bulk_create / bulk_update
+
+    version, base = current_units()
+    units = reassign_unit(apply_delta(base, changes), 'TEAM01', 'HQ02')
+    changes = compute_delta(base, units)
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+from .hierarchy import HierarchyValidator, validate_parents
+from .models_enhanced import OrgUnit
+from .org_chart import bump_org_version, get_org_version
+
+SNAPSHOT_TIMEOUT = 3600
+
+UNIT_UPDATE_FIELDS = [
+    'company', 'name', 'function', 'reports_to', 'headcount',
+    'leader_title', 'leader_rank', 'leader_name', 'leader_age', 'members', 'updated_at',
+]
+
+Units = Dict[str, Dict[str, Any]]
+
+_snapshot: Tuple[Optional[int], Units] = (None, {})
+
+
+# ----------------------------------------------------------------------
+# 스냅샷
+# ----------------------------------------------------------------------
+def current_units() -> Tuple[int, Units]:
+    """현재 조직 {id: 단위 dict} (조직 버전별 캐시, 반환값은 수정하지 말 것)"""
+    global _snapshot
+    version = get_org_version()
+    if _snapshot[0] == version:
+        return _snapshot
+
+    key = f"org:snapshot:{version}"
+    units = cache.get(key)
+    if units is None:
+        units = {unit.id: unit.get_node_data() for unit in OrgUnit.objects.all()}
+        cache.set(key, units, SNAPSHOT_TIMEOUT)
+    _snapshot = (version, units)
+    return _snapshot
+
+
+def base_snapshot(version: int, units: Units, user=None):
+    """조직 버전의 기준 스냅샷 (버전마다 한 번만 저장, 시나리오끼리 공유)"""
+    from .models_enhanced import OrgSnapshot
+
+    snapshot = OrgSnapshot.objects.filter(snapshot_type='CURRENT', version=version).first()
+    if snapshot is None:
+        snapshot = OrgSnapshot.objects.create(
+            name=f"조직 현황 v{version}",
+            snapshot_type='CURRENT',
+            data=list(units.values()),
+            version=version,
+            created_by=user,
+        )
+    return snapshot
+
+
+# ----------------------------------------------------------------------
+# 변경분
+# ----------------------------------------------------------------------
+def to_units(units: Iterable[Dict[str, Any]]) -> Units:
+    return {str(unit['id']): unit for unit in units}
+
+
+def compute_delta(base: Units, target: Units) -> Dict[str, Any]:
+    """base → target 변경분 (바뀐/추가된 단위 전체 + 삭제된 id)"""
+    return {
+        'upsert': {
+            unit_id: unit for unit_id, unit in target.items()
+            if base.get(unit_id) is not unit and base.get(unit_id) != unit
+        },
+        'delete': [unit_id for unit_id in base if unit_id not in target],
+    }
+
+
+def apply_delta(base: Units, delta: Optional[Dict[str, Any]]) -> Units:
+    """변경분 적용 (base 는 그대로, 바뀐 단위만 교체한 새 매핑)"""
+    if not delta:
+        return base
+    units = dict(base)
+    for unit_id in delta.get('delete', []):
+        units.pop(unit_id, None)
+    units.update(delta.get('upsert', {}))
+    return units
+
+
+def restrict(units: Units, companies: Iterable[str]) -> Units:
+    companies = set(companies)
+    return {unit_id: unit for unit_id, unit in units.items() if unit.get('company') in companies}
+
+
+# ----------------------------------------------------------------------
+# 검증 / What-if
+# ----------------------------------------------------------------------
+def check_hierarchy(units: Units):
+    """순환 참조와 최대 깊이 검증 (ValueError)"""
+    validate_parents({unit_id: unit.get('reportsTo') for unit_id, unit in units.items()})
+
+
+def reassign_unit(units: Units, unit_id: str, new_reports_to: Optional[str]) -> Units:
+    """조직 재배치 (검증 후 새 매핑 반환)"""
+    if unit_id not in units:
+        raise ValueError(f"조직 단위 {unit_id}를 찾을 수 없습니다.")
+    if new_reports_to and new_reports_to not in units:
+        raise ValueError(f"상위 조직 {new_reports_to}를 찾을 수 없습니다.")
+    validator = HierarchyValidator({uid: unit.get('reportsTo') for uid, unit in units.items()})
+    validator.check(unit_id, new_reports_to)
+    result = dict(units)
+    result[unit_id] = dict(units[unit_id], reportsTo=new_reports_to or None)
+    return result
+
+
+def diff_units(current: Units, other: Units) -> List[Dict[str, Any]]:
+    """두 조직 구성 비교 (신규 → 삭제 → 변경 순)"""
+    diffs = []
+    for unit_id, unit in other.items():
+        if unit_id not in current:
+            diffs.append({'type': 'new', 'message': f"{unit['name']}: (신규)", 'unit': unit})
+
+    for unit_id, unit in current.items():
+        if unit_id not in other:
+            diffs.append({'type': 'deleted', 'message': f"{unit['name']}: (삭제)", 'unit': unit})
+
+    for unit_id, unit in current.items():
+        other_unit = other.get(unit_id)
+        if other_unit is None or other_unit is unit:
+            continue
+
+        if unit.get('reportsTo') != other_unit.get('reportsTo'):
+            old_parent = unit.get('reportsTo', '(최상위)')
+            new_parent = other_unit.get('reportsTo', '(최상위)')
+            diffs.append({
+                'type': 'hierarchy',
+                'message': f"{unit['name']} 보고체계 변경: {old_parent} → {new_parent}",
+                'unit': unit
+            })
+
+        if unit.get('headcount') != other_unit.get('headcount'):
+            diffs.append({
+                'type': 'headcount',
+                'message': f"{unit['name']} 인원: {unit.get('headcount')} → {other_unit.get('headcount')}",
+                'unit': unit
+            })
+
+        old_leader = (unit.get('leader') or {}).get('name', '')
+        new_leader = (other_unit.get('leader') or {}).get('name', '')
+        if old_leader != new_leader:
+            diffs.append({
+                'type': 'leader',
+                'message': f"{unit['name']} 리더: {old_leader or '(없음)'} → {new_leader or '(없음)'}",
+                'unit': unit
+            })
+    return diffs
+
+
+# ----------------------------------------------------------------------
+# 적용
+# ----------------------------------------------------------------------
+def unit_fields(unit: Dict[str, Any], units: Units) -> Dict[str, Any]:
+    """단위 dict → OrgUnit 필드 (시나리오 밖의 상위 조직은 최상위로)"""
+    leader = unit.get('leader') or {}
+    reports_to = unit.get('reportsTo')
+    return {
+        'company': unit['company'],
+        'name': unit['name'],
+        'function': unit.get('function') or '',
+        'reports_to_id': reports_to if reports_to in units else None,
+        'headcount': unit.get('headcount') or 0,
+        'leader_title': leader.get('title') or '',
+        'leader_rank': leader.get('rank') or '',
+        'leader_name': leader.get('name') or '',
+        'leader_age': leader.get('age'),
+        'members': unit.get('members') or [],
+    }
+
+
+def apply_units(units: Units, companies: Iterable[str], created_by=None) -> Dict[str, int]:
+    """시나리오 조직을 실제 OrgUnit 에 반영 (대상 회사의 나머지 단위는 삭제)
+
+    바뀐 단위만 bulk_update, 새 단위는 bulk_create (한 트랜잭션, 커밋 후 조직 버전 증가).
+    """
+    companies = set(companies)
+    changed_companies = set(companies)
+    check_hierarchy(units)
+    with transaction.atomic():
+        existing = {unit.id: unit for unit in OrgUnit.objects.filter(company__in=companies)}
+        moved = [unit_id for unit_id in units if unit_id not in existing]
+        if moved:
+            # 다른 회사에서 옮겨오는 단위 (id 가 PK 이므로 새로 만들지 않고 수정)
+            existing.update({unit.id: unit for unit in OrgUnit.objects.filter(id__in=moved)})
+
+        created, updated = [], []
+        now = timezone.now()
+        for unit_id, data in units.items():
+            fields = unit_fields(data, units)
+            unit = existing.get(unit_id)
+            if unit is None:
+                created.append(OrgUnit(id=unit_id, created_by=created_by, **fields))
+            elif any(getattr(unit, field) != value for field, value in fields.items()):
+                changed_companies.add(unit.company)
+                for field, value in fields.items():
+                    setattr(unit, field, value)
+                unit.updated_at = now
+                updated.append(unit)
+
+        deleted = [
+            unit_id for unit_id, unit in existing.items()
+            if unit_id not in units and unit.company in companies
+        ]
+        if deleted:
+            OrgUnit.objects.filter(id__in=deleted).delete()
+        OrgUnit.objects.bulk_create(created, batch_size=500)
+        OrgUnit.objects.bulk_update(updated, UNIT_UPDATE_FIELDS, batch_size=500)
+        transaction.on_commit(lambda: bump_org_version(*changed_companies))
+
+    return {'created': len(created), 'updated': len(updated), 'deleted': len(deleted)}
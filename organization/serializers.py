@@ -3,6 +3,7 @@ Serializers for Organization API
 """
 from rest_framework import serializers
 from .models_enhanced import OrgUnit, OrgScenario, OrgSnapshot, OrgChangeLog
+from .scenarios import apply_delta, current_units, reassign_unit
 from django.contrib.auth.models import User
 
 
@@ -98,45 +99,60 @@ class OrgTreeSerializer(serializers.Serializer):
     )
 
 
-class OrgMatrixCellSerializer(serializers.Serializer):
-    """매트릭스 셀 시리얼라이저"""
-    leader = serializers.CharField()
-    headcount = serializers.IntegerField()
-    units = serializers.ListField(
-        child=serializers.CharField(),
-        required=False
-    )
-
-
-class OrgMatrixRowSerializer(serializers.Serializer):
-    """매트릭스 행 시리얼라이저"""
-    function = serializers.CharField()
-    cells = OrgMatrixCellSerializer(many=True)
-
-
 class OrgMatrixSerializer(serializers.Serializer):
-    """조직 매트릭스 시리얼라이저"""
+    """조직 매트릭스 시리얼라이저 (열 형식)"""
+    version = serializers.IntegerField()
+    functions = serializers.ListField(child=serializers.CharField())
     headers = serializers.ListField(child=serializers.CharField())
-    rows = OrgMatrixRowSerializer(many=True)
+    columns = serializers.ListField(child=serializers.CharField())
+    rows = serializers.ListField(child=serializers.ListField())
 
 
 class OrgScenarioSerializer(serializers.ModelSerializer):
-    """조직 시나리오 시리얼라이저"""
+    """조직 시나리오 시리얼라이저
+
+    payload(조직 단위 배열) 또는 changes(What-if 변경분)로 저장하고, 조회 시 payload 로 펼쳐서 반환합니다.
+    """
     author_name = serializers.CharField(source='author.username', read_only=True)
+    payload = serializers.ListField(child=serializers.DictField(), required=False)
+    changes = serializers.DictField(required=False)
     
     class Meta:
         model = OrgScenario
         fields = [
             'scenario_id', 'name', 'author', 'author_name',
-            'payload', 'description', 'tags', 'is_active',
+            'payload', 'changes', 'base_snapshot', 'description', 'tags', 'is_active',
             'created_at', 'updated_at'
         ]
-        read_only_fields = ['scenario_id', 'created_at', 'updated_at']
+        read_only_fields = ['scenario_id', 'base_snapshot', 'created_at', 'updated_at']
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data['payload'] = list(instance.get_units().values())
+        return data
+    
+    def _set_units(self, instance, payload, changes):
+        user = self.context['request'].user
+        if payload is not None:
+            instance.set_units(payload, user)
+        elif changes is not None:
+            instance.set_changes(changes, user)
     
     def create(self, validated_data):
         """시나리오 생성"""
         validated_data['author'] = self.context['request'].user
-        return super().create(validated_data)
+        payload = validated_data.pop('payload', None)
+        changes = validated_data.pop('changes', None)
+        scenario = OrgScenario(**validated_data)
+        self._set_units(scenario, payload, changes)
+        scenario.save()
+        return scenario
+    
+    def update(self, instance, validated_data):
+        payload = validated_data.pop('payload', None)
+        changes = validated_data.pop('changes', None)
+        self._set_units(instance, payload, changes)
+        return super().update(instance, validated_data)
 
 
 class OrgSnapshotSerializer(serializers.ModelSerializer):
@@ -153,72 +169,27 @@ class OrgSnapshotSerializer(serializers.ModelSerializer):
 
 
 class WhatIfReassignSerializer(serializers.Serializer):
-    """What-if 재배치 시리얼라이저"""
+    """What-if 재배치 시리얼라이저 (캐시된 현재 조직 + 이전 변경분으로 메모리에서 검증)"""
     unitId = serializers.CharField()
     newReportsTo = serializers.CharField(required=False, allow_null=True)
+    changes = serializers.DictField(required=False)
+    
+    def validate_changes(self, value):
+        if not isinstance(value.get('upsert', {}), dict) or not isinstance(value.get('delete', []), list):
+            raise serializers.ValidationError("변경분 형식이 올바르지 않습니다.")
+        return value
     
     def validate(self, attrs):
         """순환 참조 및 제약 검증"""
-        unit_id = attrs['unitId']
-        new_reports_to = attrs.get('newReportsTo')
-        
-        # Check if unit exists
+        version, base = current_units()
+        units = apply_delta(base, attrs.get('changes'))
         try:
-            unit = OrgUnit.objects.get(id=unit_id)
-        except OrgUnit.DoesNotExist:
-            raise serializers.ValidationError(f"조직 단위 {unit_id}를 찾을 수 없습니다.")
-        
-        # Check if new parent exists (if provided)
-        if new_reports_to:
-            try:
-                parent = OrgUnit.objects.get(id=new_reports_to)
-            except OrgUnit.DoesNotExist:
-                raise serializers.ValidationError(f"상위 조직 {new_reports_to}를 찾을 수 없습니다.")
-            
-            # Check for circular reference
-            if self._would_create_cycle(unit, parent):
-                raise serializers.ValidationError("순환 참조가 발생합니다.")
-            
-            # Check depth limit
-            if self._get_new_depth(unit, parent) > 8:
-                raise serializers.ValidationError("조직 깊이는 최대 8단계까지만 허용됩니다.")
+            units = reassign_unit(units, attrs['unitId'], attrs.get('newReportsTo'))
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
         
+        attrs.update(version=version, base=base, units=units)
         return attrs
-    
-    def _would_create_cycle(self, unit, new_parent):
-        """순환 참조 체크"""
-        current = new_parent
-        while current:
-            if current.id == unit.id:
-                return True
-            current = current.reports_to
-        return False
-    
-    def _get_new_depth(self, unit, new_parent):
-        """새로운 깊이 계산"""
-        # Calculate parent depth
-        parent_depth = 0
-        current = new_parent
-        while current and parent_depth < 10:
-            parent_depth += 1
-            current = current.reports_to
-        
-        # Calculate unit's max child depth
-        max_child_depth = self._get_max_child_depth(unit)
-        
-        return parent_depth + max_child_depth + 1
-    
-    def _get_max_child_depth(self, unit):
-        """최대 하위 깊이 계산"""
-        if not unit.subordinates.exists():
-            return 0
-        
-        max_depth = 0
-        for child in unit.subordinates.all():
-            child_depth = 1 + self._get_max_child_depth(child)
-            max_depth = max(max_depth, child_depth)
-        
-        return max_depth
 
 
 class DiffItemSerializer(serializers.Serializer):
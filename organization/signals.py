@@ -0,0 +1,29 @@
+"""
+조직 시그널 - 조직 단위 변경 시 회사별 조직도 버전 증가 (ETag 무효화)
+"""
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models_enhanced import OrgUnit
+from .org_chart import bump_org_version
+
+
+@receiver(pre_save, sender=OrgUnit)
+def org_unit_pre_save(sender, instance, raw=False, **kwargs):
+    # 회사가 바뀌면 이전 회사 조직도도 변경
+    instance._previous_company = None if raw else (
+        OrgUnit.objects.filter(pk=instance.pk).values_list('company', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=OrgUnit)
+def org_unit_saved(sender, instance, **kwargs):
+    companies = (instance.company, getattr(instance, '_previous_company', None))
+    transaction.on_commit(lambda: bump_org_version(*companies))
+
+
+@receiver(post_delete, sender=OrgUnit)
+def org_unit_deleted(sender, instance, **kwargs):
+    company = instance.company
+    transaction.on_commit(lambda: bump_org_version(company))
@@ -13,13 +13,13 @@ from django.core.cache import cache
 from django.db.models import Q, Count, Avg
 from django.utils import timezone
 from django.template.loader import render_to_string
-import openai
 import json
 import re
+import time
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple, Generator
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
 from enum import Enum
 import asyncio
 from collections import defaultdict
@@ -29,6 +29,12 @@ import requests
 
 # Import existing modules
 from employees.models import Employee, Department
+from ai_services.llm_gateway import get_gateway
+from ai_services.streaming import sse_event, sse_response, stream_completion
+from ai_services.intent_classifier import get_intent_classifier
+from ai_services.conversation_store import ConversationSnapshot, get_conversation_store
+from ai_services.chatbot_data import collect_user_data
+from asgiref.sync import sync_to_async
 from certifications.models import GrowthLevelCertification, CertificationCheckLog
 from trainings.models import TrainingCourse, TrainingEnrollment
 from evaluations.models import Evaluation
@@ -114,6 +120,35 @@ class ConversationState:
     pending_actions: List[Dict[str, Any]] = field(default_factory=list)
     clarification_needed: Optional[Dict[str, Any]] = None
     last_activity: datetime = field(default_factory=datetime.now)
+    conversation: Optional[ConversationSnapshot] = None  # 최근 턴 + 이전 대화 요약
+    user_data: Optional[Dict[str, Any]] = None           # 턴 간 재사용하는 사용자 데이터 (직렬화 제외)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """대화 저장소(msgpack) 직렬화용 상태"""
+        return {
+            'profile': asdict(self.user_profile),
+            'intent': self.current_intent.value if self.current_intent else None,
+            'context': self.context.value,
+            'context_data': self.context_data,
+            'pending_actions': self.pending_actions,
+            'clarification_needed': self.clarification_needed,
+            'last_activity': self.last_activity.timestamp(),
+        }
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: ConversationSnapshot) -> 'ConversationState':
+        data = snapshot.state
+        return cls(
+            session_id=snapshot.session_id,
+            user_profile=UserProfile(**data['profile']),
+            current_intent=ConversationIntent(data['intent']) if data.get('intent') else None,
+            context=ConversationContext(data['context']),
+            context_data=data.get('context_data', {}),
+            pending_actions=data.get('pending_actions', []),
+            clarification_needed=data.get('clarification_needed'),
+            last_activity=datetime.fromtimestamp(data['last_activity']),
+            conversation=snapshot,
+        )
 
 
 @dataclass
@@ -137,7 +172,7 @@ class EHRGPTChatbot:
     
     def __init__(self):
         self.openai_api_key = settings.OPENAI_API_KEY
-        openai.api_key = self.openai_api_key
+        self.llm = get_gateway(api_key=self.openai_api_key)
         
         # GPT 설정
         self.model = "gpt-4"
@@ -153,6 +188,8 @@ class EHRGPTChatbot:
         # 대화 상태 관리
         self.conversation_states = {}
         self.session_timeout = 3600  # 1시간
+        self.user_data_ttl = 300  # 사용자 데이터 재조회 주기 (5분)
+        self.conversation_store = get_conversation_store('ehr_gpt_chatbot')
         
         # 시스템 프롬프트
         self.system_prompt = """
@@ -188,8 +225,11 @@ class EHRGPTChatbot:
         Use emojis sparingly but appropriately to enhance friendliness.
         """
         
-        # 의도 패턴
+        # 의도 패턴 (한 번에 컴파일된 매처 + 로그 학습 모델)
         self.intent_patterns = self._initialize_intent_patterns()
+        self.intent_classifier = get_intent_classifier('ehr_gpt_chatbot', {
+            intent.name: patterns for intent, patterns in self.intent_patterns.items()
+        })
         
     def _initialize_intent_patterns(self) -> Dict[ConversationIntent, List[str]]:
         """의도 인식 패턴 초기화"""
@@ -250,14 +290,14 @@ class EHRGPTChatbot:
             session_id = str(uuid.uuid4())
         
         # 대화 상태 로드 또는 생성
-        state = self._get_or_create_conversation_state(user_id, session_id)
+        state = await self._get_or_create_conversation_state(user_id, session_id)
         
         # 멀티모달 입력 처리
         if attachments:
             message = await self._process_multimodal_input(message, attachments)
         
         # 의도 분석
-        intent, confidence = self._analyze_intent(message, state)
+        intent, confidence = await sync_to_async(self._analyze_intent)(message, state)
         state.current_intent = intent
         
         # 컨텍스트 업데이트
@@ -270,32 +310,91 @@ class EHRGPTChatbot:
         self._save_conversation_turn(state, message, response)
         
         # 상태 저장
-        self._save_conversation_state(session_id, state)
+        await self._save_conversation_state(session_id, state)
         
         return response
     
-    def _get_or_create_conversation_state(self, user_id: str, 
-                                        session_id: str) -> ConversationState:
+    async def process_message_stream(self, user_id: str, message: str,
+                                     attachments: List[Dict[str, Any]] = None,
+                                     session_id: Optional[str] = None):
+        """메시지 처리 (SSE 이벤트 스트림)
+        
+        일반 대화는 LLM 토큰을 바로 전달하고, 나머지 의도는 완성된 응답을 done 이벤트로 보낸다.
+        대화 기록/상태는 응답이 끝난 뒤 저장한다.
+        """
+        if not session_id:
+            session_id = str(uuid.uuid4())
+        
+        state = await self._get_or_create_conversation_state(user_id, session_id)
+        
+        if attachments:
+            message = await self._process_multimodal_input(message, attachments)
+        
+        intent, confidence = await sync_to_async(self._analyze_intent)(message, state)
+        state.current_intent = intent
+        self._update_context(state, message, intent)
+        
+        yield sse_event({
+            'session_id': session_id,
+            'intent': intent.value,
+            'confidence': confidence
+        }, 'meta')
+        
+        if intent != ConversationIntent.CHITCHAT:
+            response = await self._generate_response(state, message, intent, confidence)
+            self._save_conversation_turn(state, message, response)
+            await self._save_conversation_state(session_id, state)
+            yield sse_event(serialize_chatbot_response(response), 'done')
+            return
+        
+        user_data = await self._collect_user_data(state)
+        
+        async def finish(content, meta):
+            response = ChatbotResponse(
+                message=content,
+                intent=ConversationIntent.CHITCHAT,
+                confidence=0.7 if meta['streamed'] else 0.5,
+                mode=ResponseMode.SIMPLE,
+                suggestions=self._generate_contextual_suggestions(message, user_data) if meta['streamed'] else []
+            )
+            self._save_conversation_turn(state, message, response)
+            await self._save_conversation_state(session_id, state)
+            return serialize_chatbot_response(response)
+        
+        async for event in stream_completion(
+            self.llm,
+            self._general_conversation_messages(state, message, user_data),
+            on_complete=finish,
+            fallback=lambda: "죄송합니다. 잠시 후 다시 시도해주세요.",
+            model=self.model,
+            max_tokens=500,
+            temperature=self.temperature,
+            feature='ehr_gpt_chatbot',
+            user_id=state.user_profile.employee_id
+        ):
+            yield event
+    
+    async def _get_or_create_conversation_state(self, user_id: str,
+                                              session_id: str) -> ConversationState:
         """대화 상태 조회 또는 생성"""
-        # 캐시에서 조회
-        cache_key = f"chatbot_session_{session_id}"
-        state = cache.get(cache_key)
+        # 대화 저장소에서 조회
+        snapshot = await self.conversation_store.aload(session_id)
         
-        if state:
-            return state
+        if snapshot and snapshot.state.get('profile'):
+            return ConversationState.from_snapshot(snapshot)
         
         # 새 상태 생성
         try:
-            employee = Employee.objects.get(id=user_id)
+            employee = await Employee.objects.select_related('user').aget(id=user_id)
             user_profile = UserProfile(
                 employee_id=str(employee.id),
                 name=employee.name,
                 position=employee.position,
-                department=employee.department.name if employee.department else "",
-                role=self._determine_user_role(employee),
+                department=employee.department or "",
+                role=await self._determine_user_role(employee),
                 preferences=self._load_user_preferences(employee)
             )
-        except Employee.DoesNotExist:
+        except (Employee.DoesNotExist, ValueError):
             # 기본 프로필
             user_profile = UserProfile(
                 employee_id=user_id,
@@ -307,21 +406,23 @@ class EHRGPTChatbot:
         
         state = ConversationState(
             session_id=session_id,
-            user_profile=user_profile
+            user_profile=user_profile,
+            conversation=self.conversation_store.create(session_id)
         )
         
         return state
     
-    def _determine_user_role(self, employee: Employee) -> str:
+    async def _determine_user_role(self, employee: Employee) -> str:
         """사용자 역할 결정"""
-        if employee.user.groups.filter(name='Executive').exists():
-            return 'executive'
-        elif employee.user.groups.filter(name='HR').exists():
-            return 'hr'
-        elif Employee.objects.filter(manager=employee).exists():
+        if employee.user_id:
+            groups = {name async for name in employee.user.groups.values_list('name', flat=True)}
+            if 'Executive' in groups:
+                return 'executive'
+            if 'HR' in groups:
+                return 'hr'
+        if await Employee.objects.filter(manager=employee).aexists():
             return 'manager'
-        else:
-            return 'employee'
+        return 'employee'
     
     def _load_user_preferences(self, employee: Employee) -> Dict[str, Any]:
         """사용자 선호 설정 로드"""
@@ -334,20 +435,22 @@ class EHRGPTChatbot:
         }
     
     def _analyze_intent(self, message: str, state: ConversationState) -> Tuple[ConversationIntent, float]:
-        """의도 분석"""
-        message_lower = message.lower()
+        """의도 분석 - 패턴 → 로컬 모델 → (신뢰도 부족 시) GPT"""
+        prediction = self.intent_classifier.classify(message)
         
         # 패턴 매칭
-        for intent, patterns in self.intent_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, message_lower):
-                    return intent, 0.9
+        if prediction.source == 'pattern':
+            self.intent_classifier.log_example(message, prediction.label, 'pattern')
+            return ConversationIntent[prediction.label], prediction.confidence
         
-        # GPT 기반 의도 분류
         if state.context == ConversationContext.FOLLOWUP:
             # 후속 대화인 경우 이전 의도 참고
             return state.current_intent, 0.8
         
+        # 로그로 학습한 로컬 모델
+        if self.intent_classifier.is_confident(prediction):
+            return ConversationIntent[prediction.label], prediction.confidence
+        
         # GPT로 의도 분류
         intent_prompt = f"""
         Classify the user's intent from this message: "{message}"
@@ -370,34 +473,39 @@ class EHRGPTChatbot:
         """
         
         try:
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[
+            response = self.llm.chat(
+                [
                     {"role": "system", "content": "You are an intent classifier."},
                     {"role": "user", "content": intent_prompt}
                 ],
+                model="gpt-3.5-turbo",
                 max_tokens=50,
-                temperature=0.3
+                temperature=0.3,
+                cache_scope='chatbot_intent',
+                user_id=state.user_profile.employee_id
             )
             
-            intent_str = response.choices[0].message.content.strip().upper()
+            intent_str = response.content.strip().upper()
             intent = ConversationIntent[intent_str]
+            self.intent_classifier.log_example(message, intent.name, 'llm')
             return intent, 0.85
             
         except:
-            # 기본값
+            # 로컬 모델 결과가 있으면 사용, 없으면 기본값
+            if prediction.label is not None:
+                return ConversationIntent[prediction.label], prediction.confidence
             return ConversationIntent.CHITCHAT, 0.5
     
     def _update_context(self, state: ConversationState, message: str, 
                        intent: ConversationIntent):
         """대화 컨텍스트 업데이트"""
         # 이전 대화와의 관련성 확인
-        if state.conversation_history:
-            last_turn = state.conversation_history[-1]
-            time_diff = (datetime.now() - last_turn['timestamp']).total_seconds()
+        last_turn = state.conversation.last_turn
+        if last_turn:
+            time_diff = time.time() - last_turn.ts
             
             if time_diff < 300:  # 5분 이내
-                if last_turn.get('requires_followup'):
+                if last_turn.meta.get('requires_followup'):
                     state.context = ConversationContext.FOLLOWUP
                 elif '?' in message and len(message.split()) < 5:
                     state.context = ConversationContext.CLARIFICATION
@@ -416,7 +524,7 @@ class EHRGPTChatbot:
                                intent: ConversationIntent, confidence: float) -> ChatbotResponse:
         """응답 생성"""
         # 사용자 데이터 수집
-        user_data = self._collect_user_data(state.user_profile)
+        user_data = await self._collect_user_data(state)
         
         # 의도별 처리
         if intent == ConversationIntent.GREETING:
@@ -456,52 +564,16 @@ class EHRGPTChatbot:
             # 일반 대화 처리
             return await self._handle_general_conversation(state, message, user_data)
     
-    def _collect_user_data(self, profile: UserProfile) -> Dict[str, Any]:
-        """사용자 관련 데이터 수집"""
-        data = {
-            'profile': profile,
-            'current_date': timezone.now()
-        }
-        
-        try:
-            employee = Employee.objects.get(id=profile.employee_id)
-            
-            # 성장 레벨 정보
-            data['growth_level'] = {
-                'current': getattr(employee, 'growth_level', 'Lv.1'),
-                'certifications': GrowthLevelCertification.objects.filter(
-                    employee=employee,
-                    status='CERTIFIED'
-                ).order_by('-certified_date')
-            }
-            
-            # 최근 평가
-            data['latest_evaluation'] = Evaluation.objects.filter(
-                employee=employee
-            ).order_by('-evaluation_year', '-evaluation_quarter').first()
-            
-            # 교육 이력
-            data['training_history'] = TrainingEnrollment.objects.filter(
-                employee=employee
-            ).order_by('-enrolled_date')[:5]
-            
-            # 리더 추천
-            data['leader_recommendations'] = LeaderRecommendation.objects.filter(
-                employee=employee,
-                is_active=True
-            ).order_by('-recommendation_date')
-            
-            # 팀 정보 (매니저인 경우)
-            if profile.role in ['manager', 'executive']:
-                data['team_members'] = Employee.objects.filter(
-                    manager=employee,
-                    is_active=True
-                )
-                
-        except Employee.DoesNotExist:
-            pass
-        
-        return data
+    async def _collect_user_data(self, state: ConversationState) -> Dict[str, Any]:
+        """사용자 관련 데이터 수집 (세션별로 user_data_ttl 동안 캐시)"""
+        return await collect_user_data(state, self.user_data_ttl)
+    
+    def _require_employee(self, user_data: Dict[str, Any]) -> Employee:
+        """미리 조회한 직원 객체 (없으면 DoesNotExist)"""
+        employee = user_data.get('employee')
+        if employee is None:
+            raise Employee.DoesNotExist
+        return employee
     
     async def _handle_greeting(self, state: ConversationState, 
                              user_data: Dict[str, Any]) -> ChatbotResponse:
@@ -589,7 +661,7 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
             info_sections.append(eval_info)
         
         # 교육 이수
-        training_count = user_data.get('training_history', []).count()
+        training_count = len(user_data.get('training_history', []))
         if training_count > 0:
             training_info = f"""
 📚 **교육 현황**
@@ -666,9 +738,8 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         cert_service = CertificationService()
         
         try:
-            employee = Employee.objects.get(id=state.user_profile.employee_id)
-            cert_result = cert_service.check_growth_level_certification(
-                employee=employee,
+            cert_result = await sync_to_async(cert_service.check_growth_level_certification)(
+                employee=self._require_employee(user_data),
                 target_level=next_level
             )
             
@@ -780,9 +851,8 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         cert_service = CertificationService()
         
         try:
-            employee = Employee.objects.get(id=state.user_profile.employee_id)
-            cert_result = cert_service.check_growth_level_certification(
-                employee=employee,
+            cert_result = await sync_to_async(cert_service.check_growth_level_certification)(
+                employee=self._require_employee(user_data),
                 target_level=target_level
             )
             
@@ -907,11 +977,9 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         training_service = TrainingRecommendationService()
         
         try:
-            employee = Employee.objects.get(id=state.user_profile.employee_id)
-            
             # 맞춤형 추천
-            recommendations = training_service.get_employee_training_recommendations(
-                employee=employee,
+            recommendations = await sync_to_async(training_service.get_employee_training_recommendations)(
+                employee=self._require_employee(user_data),
                 max_recommendations=5
             )
             
@@ -1012,17 +1080,19 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         """
         
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
+            response = await self.llm.achat(
+                [
                     {"role": "system", "content": self.system_prompt},
                     {"role": "user", "content": advice_prompt}
                 ],
+                model=self.model,
                 max_tokens=self.max_tokens,
-                temperature=self.temperature
+                temperature=self.temperature,
+                feature='ehr_gpt_chatbot',
+                user_id=state.user_profile.employee_id
             )
             
-            advice_content = response.choices[0].message.content
+            advice_content = response.content
             
             # 구조화된 응답 생성
             message = f"""
@@ -1100,7 +1170,7 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         
         # 팀 KPI 계산
         team_stats = {
-            'total_members': team_members.count(),
+            'total_members': len(team_members),
             'avg_performance': 0,
             'training_participation': 0,
             'certification_progress': 0,
@@ -1108,26 +1178,36 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
             'development_needs': 0
         }
         
-        # 팀원별 데이터 집계
-        for member in team_members:
+        # 팀원별 데이터 집계 (팀 전체를 쿼리 두 번으로 조회)
+        member_ids = [member.id for member in team_members]
+        latest_grades = {}
+        recent_trainees = set()
+        
+        async def fetch_grades():
+            async for employee_id, grade in Evaluation.objects.filter(
+                employee_id__in=member_ids
+            ).order_by('employee_id', '-evaluation_year', '-evaluation_quarter').values_list('employee_id', 'grade'):
+                latest_grades.setdefault(employee_id, grade)
+        
+        async def fetch_trainees():
+            async for employee_id in TrainingEnrollment.objects.filter(
+                employee_id__in=member_ids,
+                enrolled_date__gte=timezone.now() - timedelta(days=90)
+            ).values_list('employee_id', flat=True).distinct():
+                recent_trainees.add(employee_id)
+        
+        await asyncio.gather(fetch_grades(), fetch_trainees())
+        
+        for member_id in member_ids:
             # 최근 평가
-            latest_eval = Evaluation.objects.filter(
-                employee=member
-            ).order_by('-evaluation_year', '-evaluation_quarter').first()
-            
-            if latest_eval:
-                if latest_eval.grade in ['A+', 'A']:
-                    team_stats['high_performers'] += 1
-                elif latest_eval.grade in ['C', 'D']:
-                    team_stats['development_needs'] += 1
+            grade = latest_grades.get(member_id)
+            if grade in ['A+', 'A']:
+                team_stats['high_performers'] += 1
+            elif grade in ['C', 'D']:
+                team_stats['development_needs'] += 1
             
             # 교육 참여
-            recent_training = TrainingEnrollment.objects.filter(
-                employee=member,
-                enrolled_date__gte=timezone.now() - timedelta(days=90)
-            ).exists()
-            
-            if recent_training:
+            if member_id in recent_trainees:
                 team_stats['training_participation'] += 1
         
         # 비율 계산
@@ -1202,11 +1282,10 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
             quick_replies=quick_replies
         )
     
-    async def _handle_general_conversation(self, state: ConversationState,
-                                         message: str,
-                                         user_data: Dict[str, Any]) -> ChatbotResponse:
-        """일반 대화 처리"""
-        # GPT로 자연스러운 응답 생성
+    def _general_conversation_messages(self, state: ConversationState,
+                                       message: str,
+                                       user_data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """일반 대화 LLM 메시지 구성"""
         conversation_context = self._build_conversation_context(state, user_data)
         
         chat_prompt = f"""
@@ -1222,18 +1301,26 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         Language: Respond in the same language as the user's message.
         """
         
+        messages = state.conversation.to_messages(self.system_prompt)
+        messages.append({"role": "user", "content": chat_prompt})
+        return messages
+    
+    async def _handle_general_conversation(self, state: ConversationState,
+                                         message: str,
+                                         user_data: Dict[str, Any]) -> ChatbotResponse:
+        """일반 대화 처리"""
         try:
-            response = openai.ChatCompletion.create(
+            # GPT로 자연스러운 응답 생성
+            response = await self.llm.achat(
+                self._general_conversation_messages(state, message, user_data),
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": chat_prompt}
-                ],
                 max_tokens=500,
-                temperature=self.temperature
+                temperature=self.temperature,
+                feature='ehr_gpt_chatbot',
+                user_id=state.user_profile.employee_id
             )
             
-            response_text = response.choices[0].message.content
+            response_text = response.content
             
             # 관련 서비스 제안
             suggestions = self._generate_contextual_suggestions(message, user_data)
@@ -1275,9 +1362,8 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
     async def _analyze_image(self, image_data: str) -> str:
         """이미지 분석 (GPT-4 Vision)"""
         try:
-            response = openai.ChatCompletion.create(
-                model=self.vision_model,
-                messages=[
+            response = await self.llm.achat(
+                [
                     {
                         "role": "user",
                         "content": [
@@ -1294,10 +1380,11 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
                         ]
                     }
                 ],
+                model=self.vision_model,
                 max_tokens=200
             )
             
-            return response.choices[0].message.content
+            return response.content
             
         except Exception as e:
             return "이미지 분석 실패"
@@ -1305,26 +1392,20 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
     def _save_conversation_turn(self, state: ConversationState,
                                user_message: str,
                                response: ChatbotResponse):
-        """대화 턴 저장"""
-        turn = {
-            'timestamp': datetime.now(),
-            'user_message': user_message,
-            'bot_response': response.message,
-            'intent': response.intent.value,
-            'confidence': response.confidence,
-            'requires_followup': len(response.quick_replies) > 0
-        }
-        
-        state.conversation_history.append(turn)
-        
-        # 최대 20턴만 유지
-        if len(state.conversation_history) > 20:
-            state.conversation_history = state.conversation_history[-20:]
+        """대화 턴 저장 (최근 턴만 유지하고 오래된 턴은 요약으로 이동)"""
+        self.conversation_store.append(state.conversation, 'user', user_message)
+        self.conversation_store.append(
+            state.conversation, 'assistant', response.message,
+            intent=response.intent.value,
+            confidence=response.confidence,
+            requires_followup=len(response.quick_replies) > 0
+        )
+        state.last_activity = datetime.now()
     
-    def _save_conversation_state(self, session_id: str, state: ConversationState):
+    async def _save_conversation_state(self, session_id: str, state: ConversationState):
         """대화 상태 저장"""
-        cache_key = f"chatbot_session_{session_id}"
-        cache.set(cache_key, state, self.session_timeout)
+        state.conversation.state = state.to_dict()
+        await self.conversation_store.asave(state.conversation)
     
     def _extract_keywords(self, message: str) -> List[str]:
         """키워드 추출"""
@@ -1383,7 +1464,9 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         return {
             'user_name': state.user_profile.name,
             'role': state.user_profile.role,
-            'recent_topics': [turn['intent'] for turn in state.conversation_history[-5:]],
+            'recent_topics': [
+                turn.meta['intent'] for turn in state.conversation.turns if 'intent' in turn.meta
+            ][-5:],
             'current_context': state.context.value,
             'pending_actions': state.pending_actions
         }
@@ -1533,11 +1616,9 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         ]
         
         # 평가 이력 추가
-        eval_history = Evaluation.objects.filter(
-            employee_id=state.user_profile.employee_id
-        ).order_by('-evaluation_year', '-evaluation_quarter')[:4]
+        eval_history = user_data.get('evaluation_history', [])
         
-        if eval_history.count() > 1:
+        if len(eval_history) > 1:
             trend_data = {
                 'labels': [f"{e.evaluation_year}-Q{e.evaluation_quarter}" for e in reversed(eval_history)],
                 'values': [e.total_score for e in reversed(eval_history)]
@@ -1681,6 +1762,14 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
             }
         )
     
+    def _calculate_kpis(self, dept_id: Optional[str]) -> Tuple[Dict, Dict, Dict]:
+        """KPI 요약 계산 (동기 분석 모듈, 스레드에서 실행)"""
+        return (
+            self.kpi_analytics.calculate_leader_pipeline_kpis(dept_id),
+            self.kpi_analytics.calculate_certification_progress_kpis(dept_id),
+            self.kpi_analytics.calculate_training_effectiveness_kpis(dept_id),
+        )
+    
     async def _handle_kpi_dashboard(self, state: ConversationState,
                                   user_data: Dict[str, Any],
                                   message: str) -> ChatbotResponse:
@@ -1698,16 +1787,11 @@ eHR 챗봇 서비스에 오신 것을 환영합니다.
         dept_id = None
         if state.user_profile.role == 'manager':
             # 매니저는 자기 부서만
-            try:
-                employee = Employee.objects.get(id=state.user_profile.employee_id)
-                dept_id = str(employee.department.id) if employee.department else None
-            except:
-                pass
+            employee = user_data.get('employee')
+            dept_id = employee.department if employee and employee.department else None
         
         # KPI 요약
-        kpis = self.kpi_analytics.calculate_leader_pipeline_kpis(dept_id)
-        cert_kpis = self.kpi_analytics.calculate_certification_progress_kpis(dept_id)
-        training_kpis = self.kpi_analytics.calculate_training_effectiveness_kpis(dept_id)
+        kpis, cert_kpis, training_kpis = await sync_to_async(self._calculate_kpis)(dept_id)
         
         message = f"""
 📊 **리더십 KPI 대시보드**
@@ -1857,6 +1941,24 @@ class ChatbotWebSocketHandler:
         await websocket.send(json.dumps(response_data, ensure_ascii=False))
 
 
+def serialize_chatbot_response(response: ChatbotResponse) -> Dict[str, Any]:
+    """응답 직렬화"""
+    return {
+        'message': response.message,
+        'intent': response.intent.value,
+        'confidence': response.confidence,
+        'mode': response.mode.value,
+        'suggestions': response.suggestions,
+        'actions': response.actions,
+        'visualizations': response.visualizations,
+        'attachments': response.attachments,
+        'quick_replies': response.quick_replies,
+        'bookmarkable': response.bookmarkable,
+        'bookmark_data': response.bookmark_data,
+        'timestamp': timezone.now().isoformat()
+    }
+
+
 class ChatbotView(TemplateView):
     """챗봇 인터페이스 뷰"""
     template_name = 'chatbot/ehr_chatbot.html'
@@ -1915,28 +2017,38 @@ class ChatbotAPIView(View):
                 session_id=data.get('session_id')
             )
             
-            # 응답 직렬화
-            response_data = {
-                'message': response.message,
-                'intent': response.intent.value,
-                'confidence': response.confidence,
-                'mode': response.mode.value,
-                'suggestions': response.suggestions,
-                'actions': response.actions,
-                'visualizations': response.visualizations,
-                'attachments': response.attachments,
-                'quick_replies': response.quick_replies,
-                'bookmarkable': response.bookmarkable,
-                'bookmark_data': response.bookmark_data,
-                'timestamp': timezone.now().isoformat()
-            }
-            
-            return JsonResponse(response_data)
+            return JsonResponse(serialize_chatbot_response(response))
             
         except Exception as e:
             return JsonResponse({'error': str(e)}, status=500)
 
 
+class ChatbotStreamAPIView(View):
+    """챗봇 스트리밍 API (SSE)"""
+    
+    def __init__(self):
+        super().__init__()
+        self.chatbot = EHRGPTChatbot()
+    
+    async def post(self, request):
+        """메시지 처리 - 토큰 단위 응답"""
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse({'error': '로그인이 필요합니다.'}, status=401)
+        
+        try:
+            data = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+        
+        return sse_response(self.chatbot.process_message_stream(
+            user_id=str(user.id),
+            message=data.get('message', ''),
+            attachments=data.get('attachments', []),
+            session_id=data.get('session_id')
+        ))
+
+
 class ChatbotBookmarkView(View):
     """북마크 관리"""
     
@@ -1972,6 +2084,7 @@ urlpatterns = [
     
     # API 엔드포인트
     path('api/chatbot/message/', ChatbotAPIView.as_view(), name='chatbot_message'),
+    path('api/chatbot/message/stream/', ChatbotStreamAPIView.as_view(), name='chatbot_message_stream'),
     path('api/chatbot/bookmarks/', ChatbotBookmarkView.as_view(), name='chatbot_bookmarks'),
 ]
 
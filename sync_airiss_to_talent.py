@@ -23,9 +23,25 @@ except Exception as e:
     sys.exit(1)
 
 from django.db import connection, transaction
+from django.utils import timezone
 from airiss.models import AIAnalysisResult
 from employees.models import Employee
-from employees.models_talent import TalentCategory, TalentPool, PromotionCandidate, RetentionRisk
+from employees.models_talent import TalentCategory, TalentPool, PromotionCandidate, RetentionRisk, TalentSummary
+
+# 일괄 수정 필드 (bulk_update 는 auto_now 를 채우지 않으므로 updated_at 포함)
+TALENT_POOL_FIELDS = [
+    'category', 'ai_analysis_result', 'ai_score', 'confidence_level', 'strengths',
+    'development_areas', 'recommendations', 'status', 'added_at', 'updated_at',
+]
+PROMOTION_FIELDS = [
+    'current_position', 'target_position', 'readiness_level', 'performance_score', 'potential_score',
+    'ai_recommendation_score', 'expected_promotion_date', 'development_plan', 'review_notes',
+    'is_active', 'updated_at',
+]
+RETENTION_FIELDS = [
+    'risk_level', 'risk_score', 'risk_factors', 'retention_strategy', 'action_items',
+    'action_status', 'updated_at',
+]
 
 
 def check_airiss_data():
@@ -66,58 +82,70 @@ def check_airiss_data():
         return 0
 
 
+CATEGORY_DEFAULTS = {
+    'CORE_TALENT': ('핵심인재', '조직의 핵심 성과를 이끄는 인재'),
+    'HIGH_POTENTIAL': ('고잠재인력', '성장 잠재력이 높은 인재'),
+    'SPECIALIST': ('전문가그룹', '직무 전문성을 갖춘 인재'),
+    'NEEDS_ATTENTION': ('관리필요인력', '성과 개선 관리가 필요한 인력'),
+}
+
+
+def load_categories():
+    """동기화에 쓰는 카테고리 조회 (없는 카테고리는 한 번에 생성)"""
+    categories = {c.category_code: c for c in TalentCategory.objects.filter(category_code__in=CATEGORY_DEFAULTS)}
+    missing = [
+        TalentCategory(category_code=code, name=name, description=description)
+        for code, (name, description) in CATEGORY_DEFAULTS.items()
+        if code not in categories
+    ]
+    if missing:
+        TalentCategory.objects.bulk_create(missing)
+        categories.update({c.category_code: c for c in TalentCategory.objects.filter(category_code__in=CATEGORY_DEFAULTS)})
+        print(f"[OK] 카테고리 생성: {', '.join(c.name for c in missing)}")
+    return categories
+
+
+def extract_score(result_data):
+    """result_data 에서 AI 점수/신뢰도 추출 (없으면 기본값 75점 / 0.8)"""
+    ai_score = 75.0
+    confidence = 0.8
+    
+    if result_data:
+        # 다양한 키에서 점수 추출 시도
+        for key in ('score', 'ai_score', 'overall_score', 'performance_score'):
+            if key in result_data:
+                ai_score = float(result_data.get(key, 75))
+                break
+        for key in ('confidence', 'confidence_level'):
+            if key in result_data:
+                confidence = float(result_data.get(key, 0.8))
+                break
+    
+    return ai_score, confidence
+
+
 def sync_talent_pool():
-    """AIAnalysisResult를 TalentPool로 동기화"""
+    """AIAnalysisResult를 TalentPool로 동기화 (직원별 최신 결과, 일괄 생성/수정)"""
     print("\n2. 인재풀 동기화")
     print("-" * 40)
     
     try:
-        # 카테고리 확인
-        categories = {
-            'CORE_TALENT': TalentCategory.objects.filter(category_code='CORE_TALENT').first(),
-            'HIGH_POTENTIAL': TalentCategory.objects.filter(category_code='HIGH_POTENTIAL').first(),
-            'NEEDS_ATTENTION': TalentCategory.objects.filter(category_code='NEEDS_ATTENTION').first(),
-            'SPECIALIST': TalentCategory.objects.filter(category_code='SPECIALIST').first(),
-        }
-        
-        # 기본 카테고리 생성 (없는 경우)
-        if not categories['CORE_TALENT']:
-            categories['CORE_TALENT'] = TalentCategory.objects.create(
-                category_code='CORE_TALENT',
-                name='핵심인재',
-                description='조직의 핵심 성과를 이끄는 인재'
-            )
-            print("[OK] 핵심인재 카테고리 생성")
+        categories = load_categories()
         
-        # AIAnalysisResult 조회 (최근 100개)
-        results = AIAnalysisResult.objects.select_related('employee', 'analysis_type').order_by('-analyzed_at')[:100]
+        # AIAnalysisResult 조회 (최근 100개, 직원별 최신 1건)
+        latest = {}
+        for result in AIAnalysisResult.objects.filter(employee__isnull=False).order_by('-analyzed_at')[:100]:
+            latest.setdefault(result.employee_id, result)
         
-        created_count = 0
-        updated_count = 0
+        # 기존 인재풀 (직원별, 같은 카테고리 행 우선)
+        existing = {}
+        for tp in TalentPool.objects.filter(employee_id__in=latest):
+            existing.setdefault(tp.employee_id, []).append(tp)
         
-        for result in results:
-            if not result.employee:
-                continue
-            
-            # AI 점수 계산 (result_data에서 추출)
-            ai_score = 75.0  # 기본값
-            confidence = 0.8  # 기본값
-            
-            if result.result_data:
-                # 다양한 키에서 점수 추출 시도
-                if 'score' in result.result_data:
-                    ai_score = float(result.result_data.get('score', 75))
-                elif 'ai_score' in result.result_data:
-                    ai_score = float(result.result_data.get('ai_score', 75))
-                elif 'overall_score' in result.result_data:
-                    ai_score = float(result.result_data.get('overall_score', 75))
-                elif 'performance_score' in result.result_data:
-                    ai_score = float(result.result_data.get('performance_score', 75))
-                
-                if 'confidence' in result.result_data:
-                    confidence = float(result.result_data.get('confidence', 0.8))
-                elif 'confidence_level' in result.result_data:
-                    confidence = float(result.result_data.get('confidence_level', 0.8))
+        now = timezone.now()
+        to_create, to_update = [], []
+        for employee_id, result in latest.items():
+            ai_score, confidence = extract_score(result.result_data)
             
             # 카테고리 결정 (점수 기반)
             if ai_score >= 85:
@@ -129,37 +157,38 @@ def sync_talent_pool():
             else:
                 category = categories['NEEDS_ATTENTION']
             
-            # TalentPool 생성 또는 업데이트
-            talent_pool, created = TalentPool.objects.update_or_create(
-                employee=result.employee,
-                defaults={
-                    'category': category,
-                    'ai_analysis_result_id': result.id,
-                    'ai_score': ai_score,
-                    'confidence_level': confidence,
-                    'strengths': result.result_data.get('strengths', []) if result.result_data else [],
-                    'development_areas': result.result_data.get('development_areas', []) if result.result_data else [],
-                    'recommendations': result.result_data.get('recommendations', []) if result.result_data else [],
-                    'status': 'ACTIVE',
-                    'added_at': result.analyzed_at,
-                    'updated_at': datetime.now()
-                }
-            )
-            
-            if created:
-                created_count += 1
+            rows = existing.get(employee_id, [])
+            talent_pool = next((tp for tp in rows if tp.category_id == category.id), rows[0] if rows else None)
+            if talent_pool is None:
+                talent_pool = TalentPool(employee_id=employee_id)
+                to_create.append(talent_pool)
             else:
-                updated_count += 1
+                to_update.append(talent_pool)
+            
+            result_data = result.result_data or {}
+            talent_pool.category = category
+            talent_pool.ai_analysis_result_id = result.id
+            talent_pool.ai_score = ai_score
+            talent_pool.confidence_level = confidence
+            talent_pool.strengths = result_data.get('strengths', [])
+            talent_pool.development_areas = result_data.get('development_areas', [])
+            talent_pool.recommendations = result_data.get('recommendations', [])
+            talent_pool.status = 'ACTIVE'
+            talent_pool.added_at = result.analyzed_at
+            talent_pool.updated_at = now
+        
+        TalentPool.objects.bulk_create(to_create, batch_size=500)
+        TalentPool.objects.bulk_update(to_update, TALENT_POOL_FIELDS, batch_size=500)
         
-        print(f"[OK] 인재풀 동기화 완료: {created_count}개 생성, {updated_count}개 업데이트")
+        print(f"[OK] 인재풀 동기화 완료: {len(to_create)}개 생성, {len(to_update)}개 업데이트")
         
-        return created_count + updated_count
+        return set(latest)
         
     except Exception as e:
         print(f"[ERROR] 인재풀 동기화 실패: {e}")
         import traceback
         traceback.print_exc()
-        return 0
+        return set()
 
 
 def sync_promotion_candidates():
@@ -174,55 +203,60 @@ def sync_promotion_candidates():
             status='ACTIVE'
         ).select_related('employee')[:20]
         
-        created_count = 0
+        # 목표 직급 설정 (간단한 매핑)
+        position_map = {
+            '사원': '대리',
+            '대리': '과장',
+            '과장': '차장',
+            '차장': '부장',
+            '부장': '이사',
+            '팀장': '본부장',
+        }
         
+        candidates = {}
         for tp in high_performers:
-            if not tp.employee:
-                continue
-            
+            candidates.setdefault(tp.employee_id, tp)
+        existing = {}
+        for candidate in PromotionCandidate.objects.filter(employee_id__in=candidates):
+            existing.setdefault(candidate.employee_id, candidate)
+        
+        now = timezone.now()
+        to_create, to_update = [], []
+        for employee_id, tp in candidates.items():
             # 현재 직급 확인
             current_position = tp.employee.position or '사원'
             
-            # 목표 직급 설정 (간단한 매핑)
-            position_map = {
-                '사원': '대리',
-                '대리': '과장',
-                '과장': '차장',
-                '차장': '부장',
-                '부장': '이사',
-                '팀장': '본부장',
-            }
-            target_position = position_map.get(current_position, '차상위직급')
-            
-            # 승진 후보자 생성
-            candidate, created = PromotionCandidate.objects.update_or_create(
-                employee=tp.employee,
-                defaults={
-                    'current_position': current_position,
-                    'target_position': target_position,
-                    'readiness_level': 'READY' if tp.ai_score >= 85 else 'DEVELOPING',
-                    'performance_score': tp.ai_score,
-                    'potential_score': tp.ai_score * 0.9,  # 잠재력 점수는 성과의 90%
-                    'ai_recommendation_score': tp.ai_score,
-                    'expected_promotion_date': datetime.now().date() + timedelta(days=180),
-                    'development_plan': {
-                        'summary': '리더십 및 전문성 개발 프로그램',
-                        'programs': ['리더십 교육', 'MBA 과정', '멘토링']
-                    },
-                    'recommendation_reason': f'AI 평가 점수 {tp.ai_score:.1f}점으로 우수 성과 달성',
-                    'is_active': True
-                }
-            )
+            candidate = existing.get(employee_id)
+            if candidate is None:
+                candidate = PromotionCandidate(employee_id=employee_id)
+                to_create.append(candidate)
+            else:
+                to_update.append(candidate)
             
-            if created:
-                created_count += 1
+            candidate.current_position = current_position
+            candidate.target_position = position_map.get(current_position, '차상위직급')
+            candidate.readiness_level = 'READY' if tp.ai_score >= 85 else 'DEVELOPING'
+            candidate.performance_score = tp.ai_score
+            candidate.potential_score = tp.ai_score * 0.9  # 잠재력 점수는 성과의 90%
+            candidate.ai_recommendation_score = tp.ai_score
+            candidate.expected_promotion_date = now.date() + timedelta(days=180)
+            candidate.development_plan = {
+                'summary': '리더십 및 전문성 개발 프로그램',
+                'programs': ['리더십 교육', 'MBA 과정', '멘토링']
+            }
+            candidate.review_notes = f'AI 평가 점수 {tp.ai_score:.1f}점으로 우수 성과 달성'
+            candidate.is_active = True
+            candidate.updated_at = now
+        
+        PromotionCandidate.objects.bulk_create(to_create, batch_size=500)
+        PromotionCandidate.objects.bulk_update(to_update, PROMOTION_FIELDS, batch_size=500)
         
-        print(f"[OK] 승진 후보자 {created_count}명 생성")
-        return created_count
+        print(f"[OK] 승진 후보자 {len(to_create)}명 생성, {len(to_update)}명 업데이트")
+        return set(candidates)
         
     except Exception as e:
         print(f"[ERROR] 승진 후보자 동기화 실패: {e}")
-        return 0
+        return set()
 
 
 def sync_retention_risks():
@@ -232,17 +266,16 @@ def sync_retention_risks():
     
     try:
         # 저성과자 또는 관리필요 인력 선별
-        at_risk = TalentPool.objects.filter(
-            ai_score__lt=70,
-            status='ACTIVE'
-        ).select_related('employee')[:15]
+        at_risk = {}
+        for tp in TalentPool.objects.filter(ai_score__lt=70, status='ACTIVE')[:15]:
+            at_risk.setdefault(tp.employee_id, tp)
+        existing = {}
+        for risk in RetentionRisk.objects.filter(employee_id__in=at_risk):
+            existing.setdefault(risk.employee_id, risk)
         
-        created_count = 0
-        
-        for tp in at_risk:
-            if not tp.employee:
-                continue
-            
+        now = timezone.now()
+        to_create, to_update = [], []
+        for employee_id, tp in at_risk.items():
             # 위험도 계산
             if tp.ai_score < 50:
                 risk_level = 'CRITICAL'
@@ -254,34 +287,35 @@ def sync_retention_risks():
                 risk_level = 'MEDIUM'
                 risk_score = 60
             
-            # 이직 위험 생성
-            risk, created = RetentionRisk.objects.update_or_create(
-                employee=tp.employee,
-                defaults={
-                    'risk_level': risk_level,
-                    'risk_score': risk_score,
-                    'risk_factors': ['성과 부진', '경력 정체', '보상 불만족'],
-                    'retention_strategy': '개인 면담 및 경력 개발 계획 수립, 보상 체계 재검토',
-                    'action_items': [
-                        '1:1 면담 실시',
-                        '경력 개발 계획 수립',
-                        '멘토링 프로그램 연결',
-                        '보상 수준 재검토'
-                    ],
-                    'action_status': 'PENDING',
-                    'next_review_date': datetime.now().date() + timedelta(days=30)
-                }
-            )
+            risk = existing.get(employee_id)
+            if risk is None:
+                risk = RetentionRisk(employee_id=employee_id)
+                to_create.append(risk)
+            else:
+                to_update.append(risk)
             
-            if created:
-                created_count += 1
+            risk.risk_level = risk_level
+            risk.risk_score = risk_score
+            risk.risk_factors = ['성과 부진', '경력 정체', '보상 불만족']
+            risk.retention_strategy = '개인 면담 및 경력 개발 계획 수립, 보상 체계 재검토'
+            risk.action_items = [
+                '1:1 면담 실시',
+                '경력 개발 계획 수립',
+                '멘토링 프로그램 연결',
+                '보상 수준 재검토'
+            ]
+            risk.action_status = 'PENDING'
+            risk.updated_at = now
+        
+        RetentionRisk.objects.bulk_create(to_create, batch_size=500)
+        RetentionRisk.objects.bulk_update(to_update, RETENTION_FIELDS, batch_size=500)
         
-        print(f"[OK] 이직 위험군 {created_count}명 생성")
-        return created_count
+        print(f"[OK] 이직 위험군 {len(to_create)}명 생성, {len(to_update)}명 업데이트")
+        return set(at_risk)
         
     except Exception as e:
         print(f"[ERROR] 이직 위험군 동기화 실패: {e}")
-        return 0
+        return set()
 
 
 def verify_sync():
@@ -329,13 +363,17 @@ def main():
     
     # 2. 인재풀 동기화
     with transaction.atomic():
-        talent_count = sync_talent_pool()
+        touched = sync_talent_pool()
         
         # 3. 승진 후보자 동기화
-        promotion_count = sync_promotion_candidates()
+        touched |= sync_promotion_candidates()
         
         # 4. 이직 위험군 동기화
-        retention_count = sync_retention_risks()
+        touched |= sync_retention_risks()
+        
+        # 일괄 생성/수정은 시그널을 거치지 않으므로 변경된 직원의 인재 현황 요약만 재계산
+        summary_count = TalentSummary.refresh(touched)
+        print(f"\n[OK] 인재 현황 요약 {summary_count}명 갱신")
     
     # 5. 검증
     verify_sync()
@@ -0,0 +1,145 @@
+"""
+Test cases for the GPT chatbot per-session user data collection
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from ai_services import chatbot_data
+from employees.models import Employee
+
+
+class FakeQuerySet:
+    """filter/order_by/select_related/슬라이싱 후 async for 로 읽히는 쿼리셋"""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+
+    def order_by(self, *fields):
+        return self
+
+    def select_related(self, *fields):
+        return self
+
+    def __getitem__(self, item):
+        return FakeQuerySet(self.rows[item])
+
+    def __aiter__(self):
+        async def iterate():
+            for row in self.rows:
+                yield row
+        return iterate()
+
+
+def model_returning(rows):
+    model = mock.MagicMock()
+    model.objects.filter.return_value = FakeQuerySet(rows)
+    return model
+
+
+def make_profile(role='employee'):
+    return SimpleNamespace(employee_id='1', name='김팀장', position='팀장', department='IT', role=role)
+
+
+class CollectUserDataTestCase(SimpleTestCase):
+    """Test cases for the per-session user data cache"""
+
+    def setUp(self):
+        self.fetch = mock.AsyncMock(side_effect=lambda profile: {'profile': profile, 'training_history': []})
+        session_cache = LocMemCache('chatbot-user-data-test', {})
+        session_cache.clear()
+        for name, value in (('fetch_user_data', self.fetch), ('cache', session_cache)):
+            patcher = mock.patch.object(chatbot_data, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def make_state(self, session_id):
+        return SimpleNamespace(session_id=session_id, user_profile=make_profile(), user_data=None)
+
+    def test_second_turn_reuses_state_data(self):
+        state = self.make_state('s1')
+        first = asyncio.run(chatbot_data.collect_user_data(state, 300))
+        second = asyncio.run(chatbot_data.collect_user_data(state, 300))
+
+        self.fetch.assert_awaited_once_with(state.user_profile)
+        self.assertEqual(first['training_history'], second['training_history'])
+        self.assertIn('current_date', second)
+        self.assertNotIn('current_date', state.user_data)
+
+    def test_restored_state_reads_session_cache(self):
+        asyncio.run(chatbot_data.collect_user_data(self.make_state('s1'), 300))
+        asyncio.run(chatbot_data.collect_user_data(self.make_state('s1'), 300))
+        self.assertEqual(self.fetch.await_count, 1)
+
+        asyncio.run(chatbot_data.collect_user_data(self.make_state('s2'), 300))
+        self.assertEqual(self.fetch.await_count, 2)
+
+
+class FetchUserDataTestCase(SimpleTestCase):
+    """Test cases for the concurrent user data fetch"""
+
+    def setUp(self):
+        self.employee = Employee(id=1, name='김팀장', growth_level=3)
+        self.member = Employee(id=2, name='이팀원')
+
+        employee_model = mock.MagicMock()
+        employee_model.DoesNotExist = Employee.DoesNotExist
+        employee_model.objects.aget = mock.AsyncMock(return_value=self.employee)
+        employee_model.objects.filter.return_value = FakeQuerySet([self.member])
+        self.employee_model = employee_model
+
+        self.models = {
+            'Employee': employee_model,
+            'GrowthLevelCertification': model_returning(['cert-2', 'cert-1']),
+            'Evaluation': model_returning(['2025Q4', '2025Q3', '2025Q2', '2025Q1', '2024Q4']),
+            'TrainingEnrollment': model_returning(['training']),
+            'LeaderRecommendation': model_returning([]),
+        }
+        for name, model in self.models.items():
+            patcher = mock.patch.object(chatbot_data, name, model)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_gather_result_shape(self):
+        profile = make_profile('manager')
+        data = asyncio.run(chatbot_data.fetch_user_data(profile))
+
+        self.assertEqual(set(data), {
+            'profile', 'employee', 'growth_level', 'latest_evaluation', 'evaluation_history',
+            'training_history', 'leader_recommendations', 'team_members',
+        })
+        self.assertIs(data['profile'], profile)
+        self.assertIs(data['employee'], self.employee)
+        self.assertEqual(data['growth_level'], {'current': 3, 'certifications': ['cert-2', 'cert-1']})
+        self.assertEqual(data['evaluation_history'], ['2025Q4', '2025Q3', '2025Q2', '2025Q1'])
+        self.assertEqual(data['latest_evaluation'], '2025Q4')
+        self.assertEqual(data['training_history'], ['training'])
+        self.assertEqual(data['leader_recommendations'], [])
+        self.assertEqual(data['team_members'], [self.member])
+        for value in data.values():
+            self.assertNotIsInstance(value, FakeQuerySet)
+
+    def test_team_is_skipped_for_employees(self):
+        data = asyncio.run(chatbot_data.fetch_user_data(make_profile('employee')))
+        self.assertEqual(data['team_members'], [])
+        self.employee_model.objects.filter.assert_not_called()
+
+    def test_missing_models_leave_defaults(self):
+        """Deployments without the quarterly evaluation or leader recommendation models still answer"""
+        with mock.patch.object(chatbot_data, 'Evaluation', None), \
+                mock.patch.object(chatbot_data, 'LeaderRecommendation', None):
+            data = asyncio.run(chatbot_data.fetch_user_data(make_profile('employee')))
+        self.assertIsNone(data['latest_evaluation'])
+        self.assertEqual(data['evaluation_history'], [])
+        self.assertEqual(data['leader_recommendations'], [])
+        self.assertEqual(data['training_history'], ['training'])
+
+    def test_unknown_employee_returns_defaults(self):
+        self.employee_model.objects.aget.side_effect = Employee.DoesNotExist
+        data = asyncio.run(chatbot_data.fetch_user_data(make_profile('employee')))
+        self.assertIsNone(data['employee'])
+        self.assertEqual(data['growth_level'], {'current': 'Lv.1', 'certifications': []})
+        self.models['Evaluation'].objects.filter.assert_not_called()
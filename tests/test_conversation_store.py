@@ -0,0 +1,85 @@
+"""
+Test cases for the rolling-window chatbot conversation store
+"""
+import json
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from ai_services.conversation_store import ConversationSnapshot, ConversationStore, ConversationTurn, summarize_turn
+
+
+class ConversationSnapshotTestCase(SimpleTestCase):
+    """Test cases for snapshot serialization"""
+
+    def test_pack_round_trip(self):
+        """Turns, summary and caller state survive msgpack serialization"""
+        snapshot = ConversationSnapshot(
+            session_id='s1',
+            turns=[ConversationTurn('user', '연차 신청 방법', 1.5, {'intent': 'help'})],
+            summary='- 사용자: 안녕하세요',
+            total_turns=3,
+            state={'context': 'initial', 'context_data': {'requires_level': True}},
+        )
+        restored = ConversationSnapshot.unpack(snapshot.pack())
+        self.assertEqual(restored, snapshot)
+
+    def test_messages_include_summary_before_recent_turns(self):
+        snapshot = ConversationSnapshot('s1', [ConversationTurn('user', 'hi', 0.0)], summary='- 사용자: 예전 질문')
+        messages = snapshot.to_messages('system prompt')
+        self.assertEqual([m['role'] for m in messages], ['system', 'system', 'user'])
+        self.assertIn('예전 질문', messages[1]['content'])
+
+
+class ConversationStoreTestCase(SimpleTestCase):
+    """Test cases for the rolling window and running summary"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.store = ConversationStore('test', window=4, summary_max_chars=60, log_dir=self.tmpdir.name)
+
+    def tearDown(self):
+        self.store.delete('s1')
+        self.tmpdir.cleanup()
+
+    def test_window_is_bounded(self):
+        """Older turns move into the summary and the snapshot size stays flat"""
+        snapshot = self.store.create('s1')
+        sizes = []
+        for i in range(30):
+            self.store.append(snapshot, 'user', f'질문 {i}번입니다. 추가 설명')
+            sizes.append(len(snapshot.pack()))
+
+        self.assertEqual(len(snapshot.turns), 4)
+        self.assertEqual(snapshot.total_turns, 30)
+        self.assertEqual(snapshot.turns[0].content, '질문 26번입니다. 추가 설명')
+        self.assertLessEqual(len(snapshot.summary), 60)
+        self.assertIn('질문 25번입니다.', snapshot.summary)
+        self.assertNotIn('질문 0번', snapshot.summary)
+        self.assertLessEqual(max(sizes[10:]) - min(sizes[10:]), 10)
+
+    def test_save_and_load(self):
+        snapshot = self.store.create('s1', state={'intent': 'greeting'})
+        self.store.append(snapshot, 'assistant', '안녕하세요', requires_followup=True)
+        self.store.save(snapshot)
+
+        loaded = self.store.load('s1')
+        self.assertEqual(loaded.state, {'intent': 'greeting'})
+        self.assertTrue(loaded.last_turn.meta['requires_followup'])
+        self.assertIsNone(self.store.load('missing'))
+
+    def test_every_turn_is_logged(self):
+        """The full transcript is appended to the log even after compaction"""
+        snapshot = self.store.create('s1')
+        for i in range(6):
+            self.store.append(snapshot, 'user', f'message {i}')
+
+        with open(self.store.log_path, encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r['content'] for r in records], [f'message {i}' for i in range(6)])
+        self.assertTrue(os.path.basename(self.store.log_path).startswith('conversation_test'))
+
+    def test_summary_uses_first_sentence(self):
+        turn = ConversationTurn('assistant', '휴가는 HR 포털에서 신청합니다. 잔여 연차는 마이페이지에서 확인하세요.', 0.0)
+        self.assertEqual(summarize_turn('', turn), '- 어시스턴트: 휴가는 HR 포털에서 신청합니다.')
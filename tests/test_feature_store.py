@@ -0,0 +1,166 @@
+"""
+Test cases for the AIRISS employee feature store
+"""
+import datetime
+from unittest import mock
+
+import numpy as np
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from airiss import signals
+from airiss.feature_store import (
+    FEATURE_VERSION, NUMERIC_FEATURES, STORED_FIELDS, FeatureStore, evaluation_percent, feature_store,
+)
+from airiss.models import EmployeeFeature
+from employees.models import Employee
+
+
+def employee_rows():
+    today = datetime.date.today()
+    return [
+        {'id': 1, 'department': 'IT', 'position': '과장', 'growth_level': 3,
+         'birth_date': today - datetime.timedelta(days=int(40 * 365.25)),
+         'hire_date': today - datetime.timedelta(days=int(5 * 365.25))},
+        {'id': 2, 'department': None, 'position': None, 'growth_level': None,
+         'birth_date': None, 'hire_date': None},
+    ]
+
+
+class FeatureStoreComputeTestCase(SimpleTestCase):
+    """Test cases for feature computation without touching the database"""
+
+    def setUp(self):
+        self.store = FeatureStore()
+        queryset = mock.MagicMock()
+        queryset.filter.return_value.values.return_value = employee_rows()
+        patches = [
+            mock.patch.object(Employee.objects, 'all', return_value=queryset),
+            mock.patch.object(self.store, '_load_evaluations', return_value={1: [3.6, 3.2, 2.8]}),
+            mock.patch.object(self.store, '_load_compensations', return_value={1: (5000000.0, 6000000.0)}),
+            mock.patch.object(self.store, '_load_position_salary_averages', return_value={'과장': 4000000.0}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.queryset = queryset
+
+    def test_compute_derived_features(self):
+        first, second = self.store.compute([1, 2])
+        self.queryset.filter.assert_called_once_with(id__in=[1, 2])
+
+        self.assertEqual((first.employee_id, first.version, first.department), (1, FEATURE_VERSION, 'IT'))
+        self.assertAlmostEqual(first.age, 40, places=1)
+        self.assertAlmostEqual(first.tenure_years, 5, places=1)
+        self.assertEqual(first.evaluation_count, 3)
+        self.assertAlmostEqual(first.evaluation_avg_score, 3.2)
+        self.assertEqual(first.evaluation_last_score, 3.6)
+        self.assertAlmostEqual(first.evaluation_trend, 3.4 - 2.8)
+        self.assertEqual(first.compensation_ratio, 1.25)
+        self.assertFalse(first.is_stale)
+
+    def test_compute_missing_values(self):
+        second = self.store.compute([1, 2])[1]
+        self.assertIsNone(second.age)
+        self.assertEqual((second.tenure_years, second.tenure_months, second.growth_level), (0, 0, 1))
+        self.assertEqual((second.department, second.position), ('', ''))
+        self.assertEqual((second.evaluation_count, second.evaluation_trend), (0, 0.0))
+        self.assertIsNone(second.compensation_ratio)
+
+    def test_evaluation_percent(self):
+        self.assertEqual(evaluation_percent(None), 0.0)
+        self.assertEqual(evaluation_percent(3.0), 75.0)
+        self.assertEqual(evaluation_percent(5.0), 100.0)
+
+
+class FeatureStorePersistenceTestCase(SimpleTestCase):
+    """Test cases for refresh upserts, freshness checks and matrix reads"""
+
+    def setUp(self):
+        self.store = FeatureStore(batch_size=50)
+
+    def test_refresh_upserts_computed_rows(self):
+        features = [EmployeeFeature(employee_id=1), EmployeeFeature(employee_id=2)]
+        with mock.patch.object(self.store, 'compute', return_value=features), \
+                mock.patch.object(EmployeeFeature.objects, 'bulk_create') as bulk_create:
+            self.assertEqual(self.store.refresh([1, 2]), 2)
+
+        bulk_create.assert_called_once_with(
+            features, batch_size=50, update_conflicts=True,
+            unique_fields=['employee'], update_fields=STORED_FIELDS,
+        )
+
+    def test_refresh_without_rows(self):
+        with mock.patch.object(self.store, 'compute', return_value=[]), \
+                mock.patch.object(EmployeeFeature.objects, 'bulk_create') as bulk_create:
+            self.assertEqual(self.store.refresh(), 0)
+        bulk_create.assert_not_called()
+
+    def test_ensure_fresh_recomputes_missing_rows_only(self):
+        with mock.patch.object(EmployeeFeature.objects, 'filter') as filter_, \
+                mock.patch.object(self.store, 'refresh') as refresh:
+            filter_.return_value.values_list.return_value = [1, 3]
+            self.store._ensure_fresh([1, 2, 3, 4])
+        filter_.assert_called_once_with(employee_id__in=[1, 2, 3, 4], is_stale=False, version=FEATURE_VERSION)
+        refresh.assert_called_once_with([2, 4])
+
+    def test_get_matrix(self):
+        queryset = mock.MagicMock()
+        queryset.filter.return_value.values_list.return_value = [(1, 40.5, 5.0), (2, None, 0.0)]
+        with mock.patch.object(self.store, '_ensure_fresh') as ensure_fresh, \
+                mock.patch.object(EmployeeFeature.objects, 'order_by', return_value=queryset):
+            ids, matrix, columns = self.store.get_matrix([2, 1], ['age', 'tenure_years'])
+
+        ensure_fresh.assert_called_once_with([2, 1])
+        queryset.filter.return_value.values_list.assert_called_once_with('employee_id', 'age', 'tenure_years')
+        self.assertEqual(ids.tolist(), [1, 2])
+        self.assertEqual(columns, ['age', 'tenure_years'])
+        self.assertEqual(matrix.dtype, float)
+        self.assertEqual(matrix[0].tolist(), [40.5, 5.0])
+        self.assertTrue(np.isnan(matrix[1, 0]))
+
+    def test_get_matrix_empty(self):
+        queryset = mock.MagicMock()
+        queryset.values_list.return_value = []
+        with mock.patch.object(self.store, '_ensure_fresh'), \
+                mock.patch.object(EmployeeFeature.objects, 'order_by', return_value=queryset):
+            ids, matrix, columns = self.store.get_matrix()
+        self.assertEqual((ids.shape, matrix.shape, columns), ((0,), (0, len(NUMERIC_FEATURES)), NUMERIC_FEATURES))
+
+
+class FeatureStoreInvalidationTestCase(SimpleTestCase):
+    """Test cases for signal invalidation and the refresh_features command"""
+
+    def test_employee_save_marks_stale_after_commit(self):
+        callbacks = []
+        with mock.patch.object(signals.transaction, 'on_commit', side_effect=callbacks.append), \
+                mock.patch.object(feature_store, 'mark_stale') as mark_stale:
+            signals.employee_saved(Employee, Employee(id=5))
+            mark_stale.assert_not_called()
+            for callback in callbacks:
+                callback()
+        mark_stale.assert_called_once_with([5])
+
+    def test_related_change_marks_employee_stale(self):
+        if signals.ComprehensiveEvaluation is None:
+            self.skipTest('evaluations app not installed')
+        instance = signals.ComprehensiveEvaluation(employee_id=9)
+        with mock.patch.object(signals.transaction, 'on_commit', side_effect=lambda callback: callback()), \
+                mock.patch.object(feature_store, 'mark_stale') as mark_stale:
+            signals.evaluation_changed(signals.ComprehensiveEvaluation, instance)
+        mark_stale.assert_called_once_with([9])
+
+    def test_unsaved_instance_is_ignored(self):
+        with mock.patch.object(signals.transaction, 'on_commit') as on_commit:
+            signals.employee_saved(Employee, Employee())
+        on_commit.assert_not_called()
+
+    def test_refresh_features_command(self):
+        with mock.patch.object(feature_store, 'refresh', return_value=3) as refresh, \
+                mock.patch.object(feature_store, 'refresh_stale', return_value=1) as refresh_stale:
+            call_command('refresh_features', stdout=mock.MagicMock())
+            refresh.assert_called_once_with()
+            refresh_stale.assert_not_called()
+
+            call_command('refresh_features', '--stale-only', stdout=mock.MagicMock())
+            refresh_stale.assert_called_once_with()
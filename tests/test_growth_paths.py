@@ -0,0 +1,64 @@
+"""
+Test cases for growth-path recommendation against a shared transition table
+"""
+from django.test import SimpleTestCase
+
+from job_profiles.growth_path_recommender import GrowthPathRecommender, recommend_growth_path
+from job_profiles.growth_services import GrowthPathContext
+from job_profiles.transition_table import TransitionTable
+
+TRANSITIONS = {
+    '주니어 개발자': ['시니어 개발자', '시니어 개발자', '데이터 엔지니어', 'QA 엔지니어'],
+    '시니어 개발자': ['테크 리드', '테크 리드', '아키텍트'],
+}
+JOBS = [
+    {'job_id': 'uuid-1', 'job_name': '시니어 개발자', 'basic_skills': ['Python', 'SQL'], 'applied_skills': ['코드리뷰']},
+    {'job_id': 'uuid-2', 'job_name': '테크 리드', 'basic_skills': ['Python', '아키텍처설계'], 'applied_skills': ['팀관리']},
+    {'job_id': 'uuid-3', 'job_name': '인사 담당자', 'basic_skills': ['인사관리'], 'applied_skills': []},
+]
+EMPLOYEE = {'current_job': '주니어 개발자', 'career_years': 3, 'skills': ['Python', 'SQL'], 'certifications': []}
+
+
+class GrowthPathRecommenderTestCase(SimpleTestCase):
+    """Test cases for table-backed reachability and paths"""
+
+    def setUp(self):
+        self.table = TransitionTable(TRANSITIONS)
+        self.recommender = GrowthPathRecommender(self.table)
+        self.recommender.analyze_skill_progression(JOBS)
+
+    def test_reachable_by_job_name(self):
+        reachable = self.recommender.find_reachable_jobs(EMPLOYEE, JOBS, min_probability=0.2)
+        probabilities = {job['job_profile']['job_id']: job['probability'] for job in reachable}
+        self.assertEqual(set(probabilities), {'uuid-1', 'uuid-2'})
+        self.assertAlmostEqual(probabilities['uuid-2'], 0.5 * 2 / 3)
+
+    def test_simulated_path_follows_best_path(self):
+        growth_path = self.recommender.simulate_growth_path(EMPLOYEE, JOBS[1])
+        self.assertEqual([stage.job_id for stage in growth_path.stages], ['시니어 개발자', '테크 리드'])
+
+    def test_reverse_paths_memoized_per_target(self):
+        first = self.recommender.find_reverse_path(JOBS[1], JOBS)
+        self.assertIs(self.recommender.find_reverse_path(JOBS[1], JOBS), first)
+        self.assertEqual(first[0], ['주니어 개발자', '시니어 개발자', '테크 리드'])
+
+    def test_shared_table_matches_fresh_build(self):
+        shared = self.recommender.recommend(dict(EMPLOYEE), JOBS, top_n=2)
+        fresh = recommend_growth_path(dict(EMPLOYEE), JOBS, TRANSITIONS, top_n=2)
+        self.assertEqual(
+            [(path['target_job'], path['priority_score']) for path in shared],
+            [(path['target_job'], path['priority_score']) for path in fresh],
+        )
+
+
+class GrowthPathContextTestCase(SimpleTestCase):
+    """Test cases for per-role headcounts from one grouped query"""
+
+    def test_current_employees_substring_match(self):
+        context = GrowthPathContext(
+            recommender=None, job_profile_dicts=[], job_profiles_by_name={},
+            headcounts=[('시니어 개발자', 3), ('수석 시니어 개발자', 2), ('Tech Lead', 4), (None, 7)],
+        )
+        self.assertEqual(context.current_employees('시니어 개발자'), 5)
+        self.assertEqual(context.current_employees('tech lead'), 4)
+        self.assertEqual(context.current_employees('인사'), 0)
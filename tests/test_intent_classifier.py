@@ -0,0 +1,117 @@
+"""
+Test cases for the local chatbot intent classifier
+"""
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from ai_services.intent_classifier import IntentClassifier, IntentPatternMatcher
+
+PATTERNS = {
+    'GREETING': [r'안녕|hello|좋은\s*(아침|오후|저녁)'],
+    'TRAINING_INQUIRY': [r'교육|training|강의'],
+    'EVALUATION_STATUS': [r'평가|성과', r'평가.*결과'],
+}
+
+# EHRGPTChatbot._initialize_intent_patterns 에서 발췌 (선언 순서 유지)
+CHATBOT_PATTERNS = {
+    'GREETING': [
+        r'안녕|hello|hi|반가워|좋은\s*(아침|오후|저녁)',
+        r'처음\s*뵙겠습니다|nice to meet'
+    ],
+    'PERSONAL_INFO': [
+        r'내\s*(정보|프로필|인사.*정보)|my\s*(info|profile)',
+        r'직급|부서|입사일|personal\s*information'
+    ],
+    'TRAINING_INQUIRY': [
+        r'교육|training|course|강의|수업',
+        r'수강.*신청|교육.*추천|recommend.*training'
+    ],
+    'EVALUATION_STATUS': [
+        r'평가|evaluation|performance|성과',
+        r'평가.*결과|평가.*등급|performance.*rating'
+    ],
+    'TEAM_ANALYTICS': [
+        r'팀.*현황|team.*analytics|부서.*분석',
+        r'팀원.*성과|team.*performance'
+    ],
+}
+
+EXAMPLES = [
+    ('연차 휴가 며칠 남았어', 'LEAVE'),
+    ('휴가 신청하고 싶어요', 'LEAVE'),
+    ('다음주 휴가 쓸 수 있나요', 'LEAVE'),
+    ('반차 휴가 신청 방법', 'LEAVE'),
+    ('여름 휴가 일정 등록', 'LEAVE'),
+    ('이번달 급여 명세서 보여줘', 'PAYROLL'),
+    ('급여 언제 들어와요', 'PAYROLL'),
+    ('월급 명세서 확인', 'PAYROLL'),
+    ('급여 이체일이 언제야', 'PAYROLL'),
+    ('상여금 급여에 포함돼요', 'PAYROLL'),
+]
+
+
+class IntentPatternMatcherTestCase(SimpleTestCase):
+    """Test cases for the per-intent compiled patterns"""
+
+    def setUp(self):
+        self.matcher = IntentPatternMatcher(PATTERNS)
+
+    def test_single_intent(self):
+        self.assertEqual(self.matcher.match('좋은 아침입니다'), 'GREETING')
+        self.assertEqual(self.matcher.match('지난 분기 평가 결과'), 'EVALUATION_STATUS')
+
+    def test_earlier_intent_wins(self):
+        """Declaration order decides between several matching intents"""
+        self.assertEqual(self.matcher.match('성과 관련 교육 추천'), 'TRAINING_INQUIRY')
+        self.assertEqual(self.matcher.match('교육 평가 hello'), 'GREETING')
+
+    def test_no_match(self):
+        self.assertIsNone(self.matcher.match('점심 메뉴 추천'))
+
+    def test_later_match_does_not_hide_earlier_intent(self):
+        """A later intent spanning the whole message must not consume an earlier intent's match"""
+        matcher = IntentPatternMatcher(CHATBOT_PATTERNS)
+        self.assertEqual(matcher.match('팀 구성과 부서 현황'), 'PERSONAL_INFO')
+        self.assertEqual(matcher.match('팀원들 교육 현황'), 'TRAINING_INQUIRY')
+        self.assertEqual(matcher.match('팀 성과 현황 알려줘'), 'EVALUATION_STATUS')
+        self.assertEqual(matcher.match('팀 현황 알려줘'), 'TEAM_ANALYTICS')
+
+
+class IntentClassifierTestCase(SimpleTestCase):
+    """Test cases for pattern-first classification with a trained fallback model"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.classifier = IntentClassifier('test', PATTERNS, threshold=0.5, base_dir=self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_pattern_hit_skips_model(self):
+        prediction = self.classifier.classify('Training 일정 알려줘')
+        self.assertEqual((prediction.label, prediction.source), ('TRAINING_INQUIRY', 'pattern'))
+
+    def test_untrained_classifier_defers_to_caller(self):
+        prediction = self.classifier.classify('급여 명세서')
+        self.assertEqual(prediction.source, 'none')
+        self.assertFalse(self.classifier.is_confident(prediction))
+
+    def test_model_trained_from_logged_examples(self):
+        """Logged classifications train the model used for unmatched messages"""
+        for text, label in EXAMPLES:
+            self.classifier.log_example(text, label, 'llm')
+        self.assertTrue(os.path.exists(self.classifier.log_path))
+
+        result = self.classifier.train(min_examples=5)
+        self.assertTrue(result['trained'])
+        self.assertEqual(result['labels'], 2)
+
+        prediction = self.classifier.classify('급여 명세서 다시 보내주세요')
+        self.assertEqual((prediction.label, prediction.source), ('PAYROLL', 'model'))
+        self.assertTrue(self.classifier.is_confident(prediction))
+
+    def test_training_requires_enough_examples(self):
+        self.classifier.log_example('휴가 신청', 'LEAVE', 'llm')
+        self.assertFalse(self.classifier.train()['trained'])
@@ -0,0 +1,107 @@
+"""
+Test cases for the offline batch LLM pipeline
+"""
+import asyncio
+from types import SimpleNamespace
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from ai_services.batch import BatchRunner, get_batch_settings, get_handler
+from ai_services.llm_gateway import LLMGateway, get_gateway_settings
+from ai_services.testing import FakeLLMServer, make_meter
+from evaluations.ai_feedback import EvaluationFeedbackBatch, ai_feedback_generator
+
+REJECTED_FEEDBACK = "업무 성과는 좋으나 팀원을 차별하는 발언이 있었습니다."
+GOOD_FEEDBACK = (
+    "목표 달성률이 높고 협업 강점이 뚜렷합니다. 일정 관리에서 개선 기회가 있으며, "
+    "주간 회고와 멘토링으로 리더십을 발전시키면 성장 속도가 더 빨라질 것입니다."
+)
+
+
+class RecordingRunner(BatchRunner):
+    """Keeps checkpoints in memory instead of updating LLMBatchItem rows"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkpoints = {}
+
+    async def _checkpoint(self, item, status, attempts, result='', error=''):
+        self.checkpoints[item.item_key] = (status, attempts, result)
+
+
+def make_items(count):
+    return [
+        SimpleNamespace(pk=i, item_key=f"contribution:{i}", attempts=0, payload={
+            'messages': ai_feedback_generator.build_messages('contribution', {'employee_name': f"직원{i}"}),
+        })
+        for i in range(count)
+    ]
+
+
+class EvaluationFeedbackBatchTestCase(SimpleTestCase):
+    """Test cases for prompt building and result validation"""
+
+    def test_registered_handler(self):
+        self.assertIsInstance(get_handler('evaluation_feedback'), EvaluationFeedbackBatch)
+        with self.assertRaises(ValueError):
+            get_handler('unknown')
+
+    def test_messages_per_evaluation_type(self):
+        messages = ai_feedback_generator.build_messages('expertise', {'employee_name': '홍길동', 'expertise_score': 72})
+        self.assertEqual([m['role'] for m in messages], ['system', 'user'])
+        self.assertIn('홍길동', messages[1]['content'])
+        with self.assertRaises(ValueError):
+            ai_feedback_generator.build_messages('unknown', {})
+
+    def test_low_quality_feedback_is_rejected(self):
+        handler = EvaluationFeedbackBatch()
+        self.assertEqual(handler.apply('impact:1', {}, f"  {GOOD_FEEDBACK}\n"), GOOD_FEEDBACK)
+        with self.assertRaises(ValueError):
+            handler.apply('impact:1', {}, REJECTED_FEEDBACK)
+
+
+class BatchRunnerTestCase(SimpleTestCase):
+    """Test cases for bounded concurrent generation against a local fake provider"""
+
+    def setUp(self):
+        cache.clear()
+
+    def make_runner(self, server, meter=None, **overrides):
+        config = get_gateway_settings()
+        config.update({'BACKOFF_BASE': 0.01, 'TIMEOUT': 5.0, 'MAX_RETRIES': 0})
+        gateway = LLMGateway('test-key', base_url=server.base_url, default_model='gpt-3.5-turbo',
+                             config=config, usage=meter or make_meter())
+        batch_config = get_batch_settings()
+        batch_config.update(overrides)
+        return RecordingRunner(SimpleNamespace(pk=1), gateway=gateway, config=batch_config)
+
+    def test_items_checkpointed_with_bounded_concurrency(self):
+        with FakeLLMServer(reply=GOOD_FEEDBACK, delay=0.05) as server:
+            runner = self.make_runner(server, CONCURRENCY=2)
+            asyncio.run(runner.process_items(EvaluationFeedbackBatch(), make_items(6)))
+
+        self.assertEqual(server.request_count, 6)
+        self.assertLessEqual(server.max_active, 2)
+        self.assertEqual({status for status, _, _ in runner.checkpoints.values()}, {'done'})
+        self.assertEqual(runner.checkpoints['contribution:3'], ('done', 1, GOOD_FEEDBACK))
+
+    def test_rejected_results_fail_after_max_attempts(self):
+        with FakeLLMServer(reply=REJECTED_FEEDBACK) as server:
+            runner = self.make_runner(server, MAX_ATTEMPTS=2)
+            asyncio.run(runner.process_items(EvaluationFeedbackBatch(), make_items(1)))
+
+        self.assertEqual(server.request_count, 2)
+        self.assertEqual(runner.checkpoints['contribution:0'][:2], ('failed', 2))
+
+    def test_budget_breaker_pauses_remaining_items(self):
+        """Items stay pending when the budget breaker is open so a later run resumes them"""
+        meter = make_meter()
+        meter.open_breaker('test')
+        with FakeLLMServer(reply=GOOD_FEEDBACK) as server:
+            runner = self.make_runner(server, meter)
+            asyncio.run(runner.process_items(EvaluationFeedbackBatch(), make_items(3)))
+
+        self.assertEqual(server.request_count, 0)
+        self.assertEqual(runner.checkpoints, {})
+        self.assertTrue(runner._stopped)
@@ -0,0 +1,112 @@
+"""
+Test cases for the two-tier LLM response cache
+"""
+import threading
+from datetime import timedelta
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+
+from ai_services.llm_cache import SimilarityIndex, normalize_prompt, split_messages
+
+
+def user_message(text, system=None):
+    messages = [{'role': 'system', 'content': system}] if system else []
+    messages.append({'role': 'user', 'content': text})
+    return messages
+
+
+def make_entry(entry_id, prompt, context_hash, expires_in=3600):
+    return {
+        'id': entry_id,
+        'prompt': normalize_prompt(prompt),
+        'context_hash': context_hash,
+        'response': f'answer {entry_id}',
+        'model_used': 'fake-model',
+        'expires_at': timezone.now() + timedelta(seconds=expires_in),
+    }
+
+
+class PromptKeyTestCase(SimpleTestCase):
+    """Test cases for prompt normalization and cache keys"""
+
+    def test_normalization_ignores_case_spacing_and_punctuation(self):
+        """Cosmetic differences map to the same exact key"""
+        self.assertEqual(normalize_prompt('  연차   휴가는 몇일인가요?? '), '연차 휴가는 몇일인가요')
+        self.assertEqual(normalize_prompt('What is MY Leave Balance?'), normalize_prompt('what is my leave balance'))
+
+    def test_context_hash_depends_on_system_prompt_and_params(self):
+        """Same question under different instructions or models is a different context"""
+        params = {'model': 'gpt-3.5-turbo', 'temperature': 0.7}
+        _, base = split_messages(user_message('연차 규정', system='HR 도우미'), params)
+        _, other_system = split_messages(user_message('연차 규정', system='평가 도우미'), params)
+        _, other_model = split_messages(user_message('연차 규정', system='HR 도우미'), {**params, 'model': 'gpt-4'})
+        self.assertNotEqual(base, other_system)
+        self.assertNotEqual(base, other_model)
+
+    def test_non_text_messages_are_not_cached(self):
+        """Multimodal requests bypass the cache"""
+        messages = [{'role': 'user', 'content': [{'type': 'text', 'text': 'describe'}]}]
+        self.assertIsNone(split_messages(messages, {}))
+        self.assertIsNone(split_messages([{'role': 'assistant', 'content': 'hi'}], {}))
+
+
+class SimilarityIndexTestCase(SimpleTestCase):
+    """Test cases for the in-memory similarity tier"""
+
+    def setUp(self):
+        self.index = SimilarityIndex()
+        self.index.add(make_entry(1, '연차 휴가 신청은 어떻게 하나요?', 'ctx'))
+        self.index.add(make_entry(2, '성과 평가 일정이 언제인가요?', 'ctx'))
+
+    def test_paraphrase_above_threshold_is_served(self):
+        """A near-identical question returns the cached answer"""
+        match = self.index.search(normalize_prompt('연차 휴가 신청은 어떻게 하나요 알려주세요'), 'ctx', 0.8)
+        self.assertIsNotNone(match)
+        entry, score = match
+        self.assertEqual(entry['id'], 1)
+        self.assertGreaterEqual(score, 0.8)
+
+    def test_unrelated_question_misses(self):
+        """Different questions stay below the threshold"""
+        self.assertIsNone(self.index.search(normalize_prompt('급여 명세서는 어디서 보나요?'), 'ctx', 0.8))
+
+    def test_context_must_match(self):
+        """Entries from another context are never returned"""
+        self.assertIsNone(self.index.search(normalize_prompt('연차 휴가 신청은 어떻게 하나요?'), 'other', 0.5))
+
+    def test_expired_entries_are_skipped(self):
+        """Expired entries are ignored even when similar"""
+        index = SimilarityIndex()
+        index.add(make_entry(3, '교육 신청 방법', 'ctx', expires_in=-1))
+        self.assertIsNone(index.search(normalize_prompt('교육 신청 방법'), 'ctx', 0.5))
+
+    def test_entries_added_after_search_are_indexed(self):
+        """New rows are appended without rebuilding the matrix"""
+        self.index.search(normalize_prompt('아무 질문'), 'ctx', 0.99)
+        self.index.add(make_entry(4, '복지 포인트 사용처', 'ctx'))
+        entry, _ = self.index.search(normalize_prompt('복지 포인트 사용처'), 'ctx', 0.9)
+        self.assertEqual(entry['id'], 4)
+
+    def test_concurrent_add_keeps_rows_aligned(self):
+        """Rows added from several threads stay aligned with their entries"""
+        index = SimilarityIndex()
+        prompts = [f'직원 {n}번 질문 {n * 7919}' for n in range(200)]
+
+        def worker(offset):
+            for n in range(offset, len(prompts), 4):
+                index.add(make_entry(n, prompts[n], 'ctx'))
+                index.search(normalize_prompt(prompts[n]), 'ctx', 0.99)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        matrix, entries = index._snapshot()
+        self.assertEqual(matrix.shape[0], len(entries))
+        self.assertEqual(sorted(entry['id'] for entry in entries), list(range(len(prompts))))
+        for n in (0, 57, 123, 199):
+            entry, score = index.search(normalize_prompt(prompts[n]), 'ctx', 0.99)
+            self.assertEqual(entry['id'], n)
@@ -0,0 +1,119 @@
+"""
+Test cases for the shared LLM gateway
+"""
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from ai_services.llm_gateway import LLMError, LLMGateway, get_gateway_settings
+from ai_services.testing import FakeLLMServer
+
+
+def make_gateway(server, **overrides):
+    config = get_gateway_settings()
+    config.update({'BACKOFF_BASE': 0.01, 'BACKOFF_MAX': 0.05, 'TIMEOUT': 5.0})
+    config.update(overrides)
+    return LLMGateway('test-key', base_url=server.base_url, default_model='fake-model', config=config)
+
+
+def user_message(text):
+    return [{'role': 'user', 'content': text}]
+
+
+class LLMGatewayTestCase(SimpleTestCase):
+    """Test cases for LLMGateway against a local fake provider"""
+
+    def test_sync_client_reuses_connection(self):
+        """Sequential calls share one pooled keep-alive connection"""
+        with FakeLLMServer(reply=lambda prompt: prompt.upper()) as server:
+            gateway = make_gateway(server)
+            results = [gateway.chat(user_message(f'q{i}')) for i in range(5)]
+            gateway.close()
+
+        self.assertEqual([r.content for r in results], [f'Q{i}' for i in range(5)])
+        self.assertEqual(results[0].total_tokens, 15)
+        self.assertEqual(server.request_count, 5)
+        self.assertEqual(server.connection_count, 1)
+
+    def test_retry_after_server_error(self):
+        """5xx responses are retried with backoff"""
+        with FakeLLMServer(fail_next=2) as server:
+            gateway = make_gateway(server, MAX_RETRIES=2)
+            result = gateway.chat(user_message('hello'))
+
+        self.assertEqual(result.content, 'fake response')
+        self.assertEqual(result.attempts, 3)
+        self.assertEqual(server.request_count, 3)
+
+    def test_client_error_is_not_retried(self):
+        """4xx responses fail immediately"""
+        with FakeLLMServer(fail_next=1, fail_status=400) as server:
+            gateway = make_gateway(server, MAX_RETRIES=3)
+            with self.assertRaises(LLMError):
+                gateway.chat(user_message('hello'))
+
+        self.assertEqual(server.request_count, 1)
+
+    def test_timeout(self):
+        """Slow providers raise LLMError after the configured timeout"""
+        with FakeLLMServer(delay=0.5) as server:
+            gateway = make_gateway(server, TIMEOUT=0.1, MAX_RETRIES=0)
+            with self.assertRaises(LLMError):
+                gateway.chat(user_message('slow'))
+
+    def test_identical_inflight_requests_are_coalesced(self):
+        """Concurrent identical prompts produce a single upstream call"""
+        with FakeLLMServer(delay=0.3) as server:
+            gateway = make_gateway(server)
+            results = []
+            threads = [
+                threading.Thread(target=lambda: results.append(gateway.chat(user_message('same'))))
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(server.request_count, 1)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(sum(1 for r in results if r.coalesced), 4)
+
+    def test_sync_concurrency_limit(self):
+        """No more than MAX_CONCURRENCY requests reach the provider at once"""
+        with FakeLLMServer(delay=0.1) as server:
+            gateway = make_gateway(server, MAX_CONCURRENCY=2)
+            threads = [
+                threading.Thread(target=gateway.chat, args=(user_message(f'q{i}'),))
+                for i in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(server.request_count, 6)
+        self.assertLessEqual(server.max_active, 2)
+
+    def test_async_gather_with_coalescing_and_limit(self):
+        """achat honours the semaphore and merges identical prompts"""
+        with FakeLLMServer(delay=0.1) as server:
+            gateway = make_gateway(server, MAX_CONCURRENCY=3)
+
+            async def run():
+                prompts = [f'q{i}' for i in range(6)] + ['q0', 'q1']
+                return await asyncio.gather(*(gateway.achat(user_message(p)) for p in prompts))
+
+            results = asyncio.run(run())
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(server.request_count, 6)
+        self.assertLessEqual(server.max_active, 3)
+        self.assertEqual(sum(1 for r in results if r.coalesced), 2)
+
+    def test_missing_api_key(self):
+        """Unconfigured gateways fail without a network call"""
+        gateway = LLMGateway(None)
+        self.assertFalse(gateway.is_configured)
+        self.assertIsNone(gateway.complete(user_message('hello')))
@@ -0,0 +1,87 @@
+"""
+Test cases for streaming LLM responses over SSE
+"""
+import asyncio
+import json
+
+from django.test import SimpleTestCase
+
+from ai_services.llm_gateway import LLMGateway, get_gateway_settings
+from ai_services.streaming import sse_event, stream_completion
+from ai_services.testing import FakeLLMServer
+
+
+def make_gateway(server, **overrides):
+    config = get_gateway_settings()
+    config.update({'BACKOFF_BASE': 0.01, 'BACKOFF_MAX': 0.05, 'TIMEOUT': 5.0})
+    config.update(overrides)
+    return LLMGateway('test-key', base_url=server.base_url, default_model='fake-model', config=config)
+
+
+def parse_events(chunks):
+    """Split raw SSE text into (event, data) tuples"""
+    events = []
+    for block in ''.join(chunks).strip().split('\n\n'):
+        event, data = None, []
+        for line in block.split('\n'):
+            if line.startswith('event: '):
+                event = line[7:]
+            elif line.startswith('data: '):
+                data.append(line[6:])
+        events.append((event, json.loads('\n'.join(data))))
+    return events
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class SSEEventTestCase(SimpleTestCase):
+    """Test cases for SSE serialization"""
+
+    def test_event_format(self):
+        """Events carry a name and a single JSON data line"""
+        self.assertEqual(sse_event({'content': '안녕'}, 'token'), 'event: token\ndata: {"content": "안녕"}\n\n')
+
+
+class StreamCompletionTestCase(SimpleTestCase):
+    """Test cases for token streaming against a local fake provider"""
+
+    def test_tokens_arrive_before_completion(self):
+        """Tokens are forwarded one by one and the done event carries the saved result"""
+        saved = []
+
+        async def on_complete(content, meta):
+            saved.append((content, meta['streamed']))
+            return {'id': 'message-1'}
+
+        with FakeLLMServer(reply='연차는 HR 포털에서 신청합니다') as server:
+            gateway = make_gateway(server)
+            chunks = asyncio.run(collect(stream_completion(
+                gateway, [{'role': 'user', 'content': '연차 신청'}], on_complete=on_complete
+            )))
+
+        events = parse_events(chunks)
+        tokens = [data['content'] for event, data in events if event == 'token']
+        self.assertEqual(len(tokens), 4)
+        self.assertEqual(''.join(tokens), '연차는 HR 포털에서 신청합니다')
+        self.assertEqual(events[-1], ('done', {'id': 'message-1'}))
+        self.assertEqual(saved, [('연차는 HR 포털에서 신청합니다', True)])
+        self.assertTrue(server.requests[0]['stream'])
+
+    def test_retry_before_first_token(self):
+        """Failures before any token is sent are retried"""
+        with FakeLLMServer(reply='ok', fail_next=1) as server:
+            gateway = make_gateway(server)
+            tokens = asyncio.run(collect(gateway.astream([{'role': 'user', 'content': 'hi'}])))
+
+        self.assertEqual(tokens, ['ok'])
+        self.assertEqual(server.request_count, 2)
+
+    def test_fallback_without_gateway(self):
+        """Unconfigured gateways stream the fallback text in one event"""
+        chunks = asyncio.run(collect(stream_completion(
+            LLMGateway(None), [{'role': 'user', 'content': 'hi'}], fallback=lambda: '기본 응답'
+        )))
+        events = parse_events(chunks)
+        self.assertEqual(events, [('token', {'content': '기본 응답'}), ('done', {})])
@@ -0,0 +1,127 @@
+"""
+Test cases for LLM usage accounting, rate limits and the budget breaker
+"""
+import threading
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from ai_services.llm_gateway import LLMBudgetExceeded, LLMGateway, LLMRateLimited, get_gateway_settings
+from ai_services.testing import FakeLLMServer, make_meter
+from ai_services.usage import (
+    BUDGET_EXCEEDED, RATE_LIMITED_FEATURE, RATE_LIMITED_USER, DatabaseUsageStore,
+)
+
+
+class UsageMeterTestCase(SimpleTestCase):
+    """Test cases for limits and counters"""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_cost_uses_longest_model_prefix(self):
+        meter = make_meter()
+        self.assertAlmostEqual(meter.estimate_cost('gpt-4o-mini-2024-07-18', 1000, 1000), 0.00075)
+        self.assertAlmostEqual(meter.estimate_cost('gpt-4-0613', 1000, 0), 0.03)
+
+    def test_concurrent_records_are_not_lost(self):
+        """Increments from many threads all reach the counter"""
+        meter = make_meter()
+        threads = [
+            threading.Thread(target=lambda: [meter.record('chat', 7, 'openai', 'gpt-4', 10, 5) for _ in range(50)])
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        (row,) = meter.store.rows.values()
+        self.assertEqual(row['requests'], 400)
+        self.assertEqual(row['prompt_tokens'], 4000)
+
+    def test_user_and_feature_rate_limits(self):
+        meter = make_meter(RATE_LIMITS={'USER_PER_MINUTE': 2, 'FEATURE_PER_MINUTE': 3, 'FEATURES': {}})
+        self.assertEqual([meter.check('chat', 'u1') for _ in range(3)], [None, None, RATE_LIMITED_USER])
+        self.assertIsNone(meter.check('chat', 'u2'))
+        self.assertEqual(meter.check('chat', 'u3'), RATE_LIMITED_FEATURE)
+        self.assertIsNone(meter.check('other', 'u1'))
+
+    def test_breaker_opens_when_budget_is_spent(self):
+        """Spending past the monthly budget rejects calls until the breaker is reset"""
+        meter = make_meter(MONTHLY_BUDGET_USD=0.05)
+        self.assertIsNone(meter.check('chat'))
+        meter.record('chat', None, 'openai', 'gpt-4', 1000, 500)
+        self.assertEqual(meter.check('chat'), BUDGET_EXCEEDED)
+        self.assertTrue(meter.breaker_open())
+
+        meter.config['MONTHLY_BUDGET_USD'] = 100
+        self.assertEqual(meter.check('chat'), BUDGET_EXCEEDED)
+        meter.reset_breaker()
+        self.assertIsNone(meter.check('chat'))
+
+    def test_hourly_spend_spike_opens_breaker(self):
+        meter = make_meter(MONTHLY_BUDGET_USD=None, HOURLY_BUDGET_USD=0.01)
+        meter.record('chat', None, 'openai', 'gpt-4', 500, 0)
+        self.assertEqual(meter.check('chat'), BUDGET_EXCEEDED)
+
+
+class DatabaseRateCounterTestCase(TestCase):
+    """Test cases for the F()-based window counters shared by all workers"""
+
+    def test_hit_accumulates_per_key(self):
+        store = DatabaseUsageStore()
+        self.assertEqual([store.hit('rate:chat:1', 1, 120) for _ in range(3)], [1, 2, 3])
+        self.assertEqual(store.hit('hour:1', 250, 7200), 250)
+        self.assertEqual(store.counter('rate:chat:1'), 3)
+        self.assertEqual(store.counter('rate:chat:2'), 0)
+
+    def test_new_window_purges_expired_rows(self):
+        from ai_chatbot.models import LLMRateCounter
+
+        store = DatabaseUsageStore()
+        store.hit('rate:chat:1', 1, -1)
+        store.hit('rate:chat:2', 1, 120)
+        self.assertEqual(list(LLMRateCounter.objects.values_list('key', flat=True)), ['rate:chat:2'])
+
+    def test_meter_limits_use_database_counters(self):
+        meter = make_meter(RATE_LIMITS={'USER_PER_MINUTE': 1, 'FEATURE_PER_MINUTE': None, 'FEATURES': {}})
+        meter.store = DatabaseUsageStore()
+        self.assertEqual([meter.check('chat', 'u1') for _ in range(2)], [None, RATE_LIMITED_USER])
+
+
+class GatewayUsageTestCase(SimpleTestCase):
+    """Test cases for limits enforced by the gateway before calling the provider"""
+
+    def setUp(self):
+        cache.clear()
+
+    def make_gateway(self, server, meter):
+        config = get_gateway_settings()
+        config.update({'BACKOFF_BASE': 0.01, 'TIMEOUT': 5.0})
+        return LLMGateway('test-key', base_url=server.base_url, default_model='gpt-3.5-turbo',
+                          config=config, usage=meter)
+
+    def test_usage_recorded_per_feature_and_user(self):
+        meter = make_meter()
+        with FakeLLMServer() as server:
+            self.make_gateway(server, meter).chat([{'role': 'user', 'content': 'hi'}], feature='chat', user_id=3)
+
+        ((key, row),) = meter.store.rows.items()
+        self.assertEqual(key[1:3], ('chat', '3'))
+        self.assertEqual(row['prompt_tokens'] + row['completion_tokens'], 15)
+
+    def test_rejected_calls_never_reach_provider(self):
+        meter = make_meter(RATE_LIMITS={'USER_PER_MINUTE': 1, 'FEATURE_PER_MINUTE': None, 'FEATURES': {}})
+        with FakeLLMServer() as server:
+            gateway = self.make_gateway(server, meter)
+            gateway.chat([{'role': 'user', 'content': 'a'}], feature='chat', user_id=1)
+            with self.assertRaises(LLMRateLimited):
+                gateway.chat([{'role': 'user', 'content': 'b'}], feature='chat', user_id=1)
+
+            meter.open_breaker('test')
+            with self.assertRaises(LLMBudgetExceeded):
+                gateway.chat([{'role': 'user', 'content': 'c'}], feature='chat', user_id=2)
+
+        self.assertEqual(server.request_count, 1)
+        self.assertEqual(gateway.stats['rejected'], 2)
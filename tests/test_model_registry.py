@@ -0,0 +1,60 @@
+"""
+Test cases for the AIRISS model registry
+"""
+import os
+import tempfile
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from airiss.model_registry import ModelRegistry
+
+
+class ModelRegistryTestCase(SimpleTestCase):
+    """Test cases for ModelRegistry loading, hot reload and metrics"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'model.joblib')
+        self.registry = ModelRegistry(reload_interval=0)
+
+    def tearDown(self):
+        self.registry.invalidate()
+        self.tmpdir.cleanup()
+
+    def test_missing_file_returns_none(self):
+        """Unknown model paths are not loaded"""
+        self.assertIsNone(self.registry.get(self.path))
+
+    def test_model_is_loaded_once(self):
+        """Repeated lookups share the same payload"""
+        self.registry.save(self.path, {'weights': np.arange(10)})
+        first = self.registry.get(self.path)
+        second = self.registry.get(self.path)
+        self.assertIs(first, second)
+        self.assertEqual(int(first.payload['weights'].sum()), 45)
+
+    def test_large_arrays_are_memory_mapped(self):
+        """Numpy arrays are served from a read-only memory map"""
+        self.registry.save(self.path, {'weights': np.zeros(100000)})
+        entry = self.registry.get(self.path)
+        self.assertIsInstance(entry.payload['weights'], np.memmap)
+
+    def test_hot_reload_after_retrain(self):
+        """A new file written by another process is picked up"""
+        self.registry.save(self.path, {'version': 1})
+        other = ModelRegistry(reload_interval=0)
+        other.save(self.path, {'version': 2, 'padding': np.zeros(10)})
+
+        entry = self.registry.get(self.path)
+        self.assertEqual(entry.payload['version'], 2)
+        metrics = self.registry.get_metrics()['models']['model.joblib']
+        self.assertEqual(len(metrics['history']), 2)
+
+    def test_inference_metrics(self):
+        """Inference latency is recorded per model name"""
+        for _ in range(3):
+            with self.registry.track_inference('turnover_prediction'):
+                pass
+        stats = self.registry.get_metrics()['inference']['turnover_prediction']
+        self.assertEqual(stats['count'], 3)
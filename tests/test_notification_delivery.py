@@ -0,0 +1,222 @@
+"""
+Test cases for asynchronous notification delivery and realtime push
+"""
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from employees.models import Employee
+from notifications.delivery import (
+    ChannelWorkerPool,
+    DeliveryJob,
+    EmailChannel,
+    NotificationDispatcher,
+    SmsChannel,
+    get_delivery_settings,
+)
+from notifications.models import Notification, NotificationType
+from notifications.realtime import UnreadCountCache, employee_group_name, push_unread_count
+from notifications.testing import StubSMSServer, StubSMTPServer
+
+
+class RecordingLogWriter:
+    """In-memory log writer used instead of the DB-backed one"""
+
+    def __init__(self):
+        self.records = []
+        self.sent_ids = []
+
+    def record(self, job, success, error_message=''):
+        self.records.append((job.notification.pk, job.channel, success, error_message))
+
+    def mark_sent(self, notification_id):
+        self.sent_ids.append(notification_id)
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def flush(self):
+        pass
+
+
+def make_notification(index, email=True, phone=True):
+    notification_type = NotificationType(name='테스트', category='HR', template='{{ title }}')
+    recipient = Employee(
+        name=f'직원{index}',
+        email=f'user{index}@example.com' if email else '',
+        phone=f'010-0000-{index:04d}' if phone else '',
+    )
+    return Notification(
+        notification_type=notification_type,
+        recipient=recipient,
+        title=f'알림 {index}',
+        message='본문',
+    )
+
+
+def make_config(**overrides):
+    config = get_delivery_settings()
+    config.update({'WORKERS': {'PUSH': 1, 'EMAIL': 2, 'SMS': 1}, 'RETRY_BACKOFF': 0.01})
+    config.update(overrides)
+    return config
+
+
+class NotificationDispatcherTestCase(SimpleTestCase):
+    """Test cases for NotificationDispatcher against local stub servers"""
+
+    def test_email_batches_reuse_connection(self):
+        """Emails are sent over one connection per worker"""
+        with StubSMTPServer() as smtp:
+            with override_settings(
+                EMAIL_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+                EMAIL_HOST=smtp.host,
+                EMAIL_PORT=smtp.port,
+                DEFAULT_FROM_EMAIL='noreply@example.com',
+            ):
+                writer = RecordingLogWriter()
+                dispatcher = NotificationDispatcher(
+                    config=make_config(), log_writer=writer,
+                    channel_classes={'EMAIL': EmailChannel},
+                )
+                dispatcher.start()
+                notifications = [make_notification(i) for i in range(200)]
+                for notification in notifications:
+                    dispatcher.dispatch(notification, ['EMAIL'])
+                self.assertTrue(dispatcher.wait_idle(timeout=30))
+                dispatcher.stop()
+
+        self.assertEqual(len(smtp.messages), 200)
+        self.assertLessEqual(smtp.connection_count, 2)
+        self.assertEqual(len(writer.sent_ids), 200)
+        self.assertTrue(all(success for _, _, success, _ in writer.records))
+
+    def test_sms_retry_after_gateway_failure(self):
+        """Failed gateway requests are retried from the retry queue"""
+        with StubSMSServer(fail_next=2) as sms:
+            writer = RecordingLogWriter()
+            dispatcher = NotificationDispatcher(
+                config=make_config(SMS_GATEWAY_URL=sms.url), log_writer=writer,
+                channel_classes={'SMS': SmsChannel},
+            )
+            dispatcher.start()
+            dispatcher.dispatch(make_notification(1), ['SMS'])
+            self.assertTrue(dispatcher.wait_idle(timeout=10))
+            dispatcher.stop()
+
+        self.assertEqual(sms.request_count, 3)
+        self.assertEqual(len(sms.messages), 1)
+        self.assertEqual(len(writer.sent_ids), 1)
+
+    def test_missing_address_is_not_retried(self):
+        """Recipients without an address fail permanently"""
+        with StubSMSServer() as sms:
+            writer = RecordingLogWriter()
+            dispatcher = NotificationDispatcher(
+                config=make_config(SMS_GATEWAY_URL=sms.url), log_writer=writer,
+                channel_classes={'SMS': SmsChannel},
+            )
+            dispatcher.start()
+            dispatcher.dispatch(make_notification(1, phone=False), ['SMS'])
+            self.assertTrue(dispatcher.wait_idle(timeout=10))
+            dispatcher.stop()
+
+        self.assertEqual(sms.request_count, 0)
+        self.assertEqual(writer.sent_ids, [])
+        self.assertFalse(writer.records[0][2])
+
+    def test_channel_batch_results_align_with_jobs(self):
+        """Each job in a batch gets its own result"""
+        channel = SmsChannel(make_config())
+        jobs = [
+            DeliveryJob(make_notification(1), 'SMS'),
+            DeliveryJob(make_notification(2, phone=False), 'SMS'),
+        ]
+        results = channel.send_batch(jobs)
+        self.assertIsNone(results[0])
+        self.assertIsNotNone(results[1])
+
+
+class ChannelWorkerPoolTestCase(SimpleTestCase):
+    """Test cases for bounded submission and draining on shutdown"""
+
+    def test_full_queue_fails_after_timeout(self):
+        """A full queue records the job as failed instead of blocking the caller"""
+        writer = RecordingLogWriter()
+        dispatcher = NotificationDispatcher(
+            config=make_config(QUEUE_SIZE=1, SUBMIT_TIMEOUT=0.05), log_writer=writer,
+            channel_classes={'SMS': SmsChannel},
+        )
+        dispatcher.dispatch(make_notification(1), ['SMS'])
+        dispatcher.dispatch(make_notification(2), ['SMS'])
+        self.assertEqual(len(writer.records), 1)
+        self.assertFalse(writer.records[0][2])
+
+    def test_stop_drains_queued_jobs(self):
+        """Jobs still queued at shutdown are delivered before the workers exit"""
+        with StubSMSServer() as sms:
+            writer = RecordingLogWriter()
+            dispatcher = NotificationDispatcher(
+                config=make_config(SMS_GATEWAY_URL=sms.url), log_writer=writer,
+                channel_classes={'SMS': SmsChannel},
+            )
+            dispatcher.start()
+            for i in range(20):
+                dispatcher.dispatch(make_notification(i), ['SMS'])
+            dispatcher.stop()
+
+        self.assertEqual(len(sms.messages), 20)
+        self.assertEqual(len(writer.sent_ids), 20)
+
+    def test_stop_records_undelivered_jobs(self):
+        """Jobs left after the shutdown timeout are logged as failed"""
+        writer = RecordingLogWriter()
+        pool = ChannelWorkerPool(SmsChannel, make_config(), on_result=writer.record)
+        pool.submit(DeliveryJob(make_notification(1), 'SMS'))
+        pool.stop(timeout=0)
+        self.assertEqual(len(writer.records), 1)
+        self.assertFalse(writer.records[0][2])
+        self.assertTrue(pool.wait_idle(timeout=0))
+
+
+class UnreadCountCacheTestCase(SimpleTestCase):
+    """Test cases for the cached unread counter and group push"""
+
+    def setUp(self):
+        cache.set('notifications:unread:42', 5)
+
+    def tearDown(self):
+        UnreadCountCache.invalidate(42)
+
+    def test_increment(self):
+        """Counter is updated in place without a COUNT query"""
+        self.assertEqual(UnreadCountCache.increment(42), 6)
+        self.assertEqual(UnreadCountCache.get(42), 6)
+
+    def test_refresh_overwrites_drifted_counter(self):
+        """Read updates re-seed the counter from the real unread count"""
+        UnreadCountCache.increment(42, 10)
+        with mock.patch.object(UnreadCountCache, 'count', return_value=3):
+            self.assertEqual(UnreadCountCache.refresh(42), 3)
+        self.assertEqual(UnreadCountCache.get(42), 3)
+
+    def test_missing_counter_is_not_created_by_increment(self):
+        """Increments on a cold key are skipped"""
+        UnreadCountCache.invalidate(42)
+        self.assertIsNone(UnreadCountCache.increment(42))
+
+    def test_push_unread_count_to_employee_group(self):
+        """Unread count is sent to the employee's channel group"""
+        channel_layer = get_channel_layer()
+        channel_name = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(employee_group_name(42), channel_name)
+
+        self.assertTrue(push_unread_count(42))
+        message = async_to_sync(channel_layer.receive)(channel_name)
+        self.assertEqual(message['type'], 'notification.unread_count')
+        self.assertEqual(message['unread_count'], 5)
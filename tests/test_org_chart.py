@@ -0,0 +1,120 @@
+"""
+Test cases for org chart versioning, ETags and subtree cursors
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from organization.models_enhanced import OrgChartVersion, OrgUnit
+from organization.org_chart import (
+    build_matrix, bump_org_version, decode_cursor, encode_cursor, etag_matches, get_org_version, load_matrix,
+    org_etag,
+)
+
+
+class OrgVersionTestCase(TestCase):
+    """Test cases for the per-company org version counter"""
+
+    def test_missing_row_starts_from_timestamp(self):
+        version = get_org_version('OK저축은행')
+        self.assertGreater(version, 1_600_000_000_000)
+        self.assertEqual(get_org_version('OK저축은행'), version)
+        self.assertEqual(OrgChartVersion.objects.get(company='OK저축은행').version, version)
+
+    def test_bump_changes_company_and_all_only(self):
+        saving, capital, total = (get_org_version(c) for c in ('OK저축은행', 'OK캐피탈', 'ALL'))
+        bump_org_version('OK저축은행')
+        self.assertEqual(get_org_version('OK저축은행'), saving + 1)
+        self.assertEqual(get_org_version('ALL'), total + 1)
+        self.assertEqual(get_org_version('OK캐피탈'), capital)
+
+    def test_bump_creates_missing_rows(self):
+        bump_org_version('OK캐피탈', None)
+        self.assertEqual(set(OrgChartVersion.objects.values_list('company', flat=True)), {'OK캐피탈', 'ALL'})
+
+    def test_etag_changes_with_version(self):
+        etag = org_etag('OK캐피탈', 'subtree', 'R', 1)
+        bump_org_version('OK캐피탈')
+        self.assertNotEqual(etag, org_etag('OK캐피탈', 'subtree', 'R', 1))
+
+
+class OrgMatrixCacheTestCase(TestCase):
+    """Test cases for the version-keyed matrix cache"""
+
+    GROUPS = [{'function': 'IT', 'leader_rank': '부장', 'leader_name': '김철수', 'total': 12, 'unit_ids': ['T1']}]
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch('organization.org_chart.matrix_groups', return_value=self.GROUPS)
+        self.matrix_groups = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matrix_is_rebuilt_after_version_bump(self):
+        first = load_matrix('OK캐피탈')
+        self.assertEqual(load_matrix('OK캐피탈'), first)
+        self.assertEqual(self.matrix_groups.call_count, 1)
+
+        bump_org_version('OK저축은행')
+        load_matrix('OK캐피탈')
+        self.assertEqual(self.matrix_groups.call_count, 1)
+
+        bump_org_version('OK캐피탈')
+        second = load_matrix('OK캐피탈')
+        self.assertEqual(self.matrix_groups.call_count, 2)
+        self.assertEqual(second['version'], first['version'] + 1)
+
+
+class OrgEtagTestCase(SimpleTestCase):
+    """Test cases for ETag computation and If-None-Match"""
+
+    def setUp(self):
+        patcher = mock.patch('organization.org_chart.get_org_version', return_value=1700000000000)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_etag_changes_with_params(self):
+        etag = org_etag('OK캐피탈', 'subtree', 'R', 1)
+        self.assertEqual(etag, org_etag('OK캐피탈', 'subtree', 'R', 1))
+        self.assertNotEqual(etag, org_etag('OK캐피탈', 'subtree', 'R', 2))
+        self.assertNotEqual(etag, org_etag('OK저축은행', 'subtree', 'R', 1))
+
+    def test_if_none_match(self):
+        etag = org_etag('ALL', 'tree')
+        factory = RequestFactory()
+        self.assertTrue(etag_matches(factory.get('/', HTTP_IF_NONE_MATCH=f'"other", {etag}'), etag))
+        self.assertTrue(etag_matches(factory.get('/', HTTP_IF_NONE_MATCH='*'), etag))
+        self.assertFalse(etag_matches(factory.get('/'), etag))
+
+
+class SubtreeCursorTestCase(SimpleTestCase):
+    """Test cases for keyset cursors"""
+
+    def test_round_trip(self):
+        cursor = encode_cursor(OrgUnit(id='H1', name='디지털본부'))
+        self.assertEqual(decode_cursor(cursor), ('디지털본부', 'H1'))
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            decode_cursor('!!bad')
+
+
+class OrgMatrixTestCase(SimpleTestCase):
+    """Test cases for the columnar function x leader matrix"""
+
+    def test_groups_merge_into_dense_rows(self):
+        groups = [
+            {'function': 'IT', 'leader_rank': '부장', 'leader_name': '김철수', 'total': 12, 'unit_ids': ['T2', 'T1']},
+            {'function': '', 'leader_rank': '', 'leader_name': '', 'total': 3, 'unit_ids': ['T3']},
+            {'function': None, 'leader_rank': '차장', 'leader_name': '', 'total': None, 'unit_ids': ['T4']},
+            {'function': '영업', 'leader_rank': '부장', 'leader_name': '김철수', 'total': 5, 'unit_ids': ['T5']},
+        ]
+        matrix = build_matrix(groups)
+        self.assertEqual(matrix['functions'], ['IT', '기타', '영업'])
+        self.assertEqual(matrix['headers'], ['미정', '부장 김철수'])
+        self.assertEqual(matrix['columns'], ['function', 'leader', 'headcount', 'units'])
+        self.assertEqual(matrix['rows'], [
+            [0, 1, 12, ['T1', 'T2']],
+            [1, 0, 3, ['T3', 'T4']],
+            [2, 1, 5, ['T5']],
+        ])
@@ -0,0 +1,94 @@
+"""
+Test cases for the organization closure table helpers, headcount writes and in-memory tree assembly
+"""
+from django.test import SimpleTestCase, TestCase
+
+from employees.models_organization import OrganizationStructure, hierarchy_rollup
+from employees.signals import counted_organization
+from employees.views import build_org_tree
+
+
+def org(pk, code, level, parent_id=None, sort_order=0, headcount=0):
+    return OrganizationStructure(
+        id=pk, org_code=code, org_name=code, org_level=level, parent_id=parent_id,
+        sort_order=sort_order, headcount=headcount, full_path=code,
+    )
+
+
+class HierarchyRollupTestCase(SimpleTestCase):
+    """Test cases for closure paths and rolled-up headcounts"""
+
+    PARENTS = {1: None, 2: 1, 3: 1, 4: 2, 5: 4}
+
+    def test_closure_paths(self):
+        paths, _ = hierarchy_rollup(self.PARENTS, {})
+        self.assertEqual(len(paths), 1 + 2 + 2 + 3 + 4)
+        self.assertIn((1, 5, 3), paths)
+        self.assertIn((5, 5, 0), paths)
+        self.assertNotIn((3, 5, 2), paths)
+
+    def test_headcount_rolls_up_to_every_ancestor(self):
+        _, rollup = hierarchy_rollup(self.PARENTS, {5: 2, 4: 1, 3: 4})
+        self.assertEqual(rollup, {1: 7, 2: 3, 3: 4, 4: 3, 5: 2})
+
+    def test_cycle_does_not_loop(self):
+        paths, _ = hierarchy_rollup({1: 2, 2: 1}, {})
+        self.assertEqual(sorted(paths), [(1, 1, 0), (1, 2, 1), (2, 1, 1), (2, 2, 0)])
+
+    def test_counted_organization(self):
+        self.assertEqual(counted_organization(3, '재직'), 3)
+        self.assertIsNone(counted_organization(3, '휴직'))
+        self.assertIsNone(counted_organization(None, '재직'))
+
+
+class BuildOrgTreeTestCase(SimpleTestCase):
+    """Test cases for assembling the chart from a single org query"""
+
+    def setUp(self):
+        self.orgs = [
+            org(1, 'GRP', 1, headcount=5),
+            org(2, 'COM-B', 2, 1, sort_order=2, headcount=1),
+            org(3, 'COM-A', 2, 1, sort_order=1, headcount=4),
+            org(4, 'HQ', 3, 3, headcount=4),
+            org(5, 'TEAM', 5, 4, headcount=4),
+        ]
+
+    def test_tree_order_and_counts(self):
+        root = build_org_tree(self.orgs, None, 10)[0]
+        self.assertEqual(root['headcount'], 5)
+        self.assertEqual([child['code'] for child in root['children']], ['COM-A', 'COM-B'])
+        self.assertEqual(root['children'][0]['children'][0]['children'][0]['code'], 'TEAM')
+        self.assertEqual(root['children'][0]['parentId'], '1')
+
+    def test_depth_limit_keeps_children_count(self):
+        nodes = build_org_tree(self.orgs, 3, 1)
+        self.assertEqual([node['code'] for node in nodes], ['HQ'])
+        self.assertEqual(nodes[0]['children'], [])
+        self.assertEqual(nodes[0]['childrenCount'], 1)
+        self.assertTrue(nodes[0]['hasChildren'])
+
+
+class HeadcountSaveTestCase(TestCase):
+    """Test cases for headcount being written only through F() updates"""
+
+    def test_stale_instance_save_keeps_headcount(self):
+        root = OrganizationStructure.objects.create(org_code='HQ', org_name='본사', org_level=1)
+        team = OrganizationStructure.objects.create(org_code='T1', org_name='1팀', org_level=2, parent=root)
+        stale = OrganizationStructure.objects.get(pk=team.pk)
+
+        OrganizationStructure.adjust_headcount(team.pk, 3)
+        stale.org_name = '개발1팀'
+        stale.save()
+
+        team.refresh_from_db()
+        self.assertEqual((team.org_name, team.headcount), ('개발1팀', 3))
+        self.assertEqual(team.full_path, '본사 > 개발1팀')
+        root.refresh_from_db()
+        self.assertEqual(root.headcount, 3)
+
+    def test_explicit_headcount_update_field_is_ignored(self):
+        team = OrganizationStructure.objects.create(org_code='T1', org_name='1팀', org_level=2)
+        team.headcount = 99
+        team.save(update_fields=['headcount', 'org_name'])
+        team.refresh_from_db()
+        self.assertEqual(team.headcount, 0)
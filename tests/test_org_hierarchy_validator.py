@@ -0,0 +1,74 @@
+"""
+Test cases for the in-memory org hierarchy validator
+"""
+from django.test import SimpleTestCase
+
+from organization.hierarchy import (
+    CYCLE_MESSAGE, DEPTH_MESSAGE, HierarchyValidator, find_violations, validate_parents
+)
+
+
+def chain(length, prefix='L'):
+    """L0 <- L1 <- ... 깊이 length-1 의 일렬 조직"""
+    return {f'{prefix}{i}': (f'{prefix}{i - 1}' if i else None) for i in range(length)}
+
+
+class FindViolationsTestCase(SimpleTestCase):
+    """Test cases for whole-map validation"""
+
+    def test_valid_tree(self):
+        parents = {'R': None, 'A': 'R', 'B': 'R', 'C': 'A'}
+        self.assertEqual(find_violations(parents), {})
+        validate_parents(parents)
+
+    def test_cycle_and_descendants(self):
+        parents = {'R': None, 'A': 'B', 'B': 'C', 'C': 'A', 'D': 'C'}
+        errors = find_violations(parents)
+        self.assertEqual(set(errors), {'A', 'B', 'C', 'D'})
+        self.assertTrue(all(message == CYCLE_MESSAGE for message in errors.values()))
+
+    def test_depth(self):
+        parents = chain(10)
+        self.assertEqual(find_violations(parents), {'L9': DEPTH_MESSAGE})
+        with self.assertRaisesMessage(ValueError, DEPTH_MESSAGE):
+            validate_parents(parents)
+
+    def test_unknown_parent_is_root(self):
+        self.assertEqual(find_violations({'A': 'OUTSIDE', 'B': 'A'}), {})
+
+
+class HierarchyValidatorTestCase(SimpleTestCase):
+    """Test cases for incremental reassignment checks"""
+
+    def setUp(self):
+        self.validator = HierarchyValidator({'R': None, 'A': 'R', 'B': 'A', 'C': 'R'})
+
+    def test_depth_and_height(self):
+        self.assertEqual(self.validator.depth('B'), 2)
+        self.assertEqual(self.validator.depth(None), -1)
+        self.assertEqual(self.validator.height('R'), 2)
+        self.assertEqual(self.validator.height('B'), 0)
+
+    def test_cycle_rejected(self):
+        with self.assertRaisesMessage(ValueError, CYCLE_MESSAGE):
+            self.validator.check('A', 'B')
+        with self.assertRaisesMessage(ValueError, CYCLE_MESSAGE):
+            self.validator.check('A', 'A')
+
+    def test_subtree_depth_counts(self):
+        validator = HierarchyValidator({**chain(8), **chain(3, 'S')})
+        validator.check('S0', 'L5')
+        with self.assertRaisesMessage(ValueError, DEPTH_MESSAGE):
+            validator.check('S0', 'L6')
+
+    def test_assign_many_rejects_only_bad_rows(self):
+        errors = self.validator.assign_many([('C', 'B'), ('N', 'C'), ('A', 'N'), ('M', None)])
+        self.assertEqual(errors, {2: CYCLE_MESSAGE})
+        self.assertEqual(self.validator.parents['N'], 'C')
+        self.assertEqual(self.validator.parents['A'], 'R')
+        self.assertEqual(self.validator.height('A'), 3)
+
+    def test_assign_many_forward_reference(self):
+        errors = self.validator.assign_many([('X', 'Y'), ('Y', 'B')])
+        self.assertEqual(errors, {})
+        self.assertEqual(self.validator.depth('X'), 4)
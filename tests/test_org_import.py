@@ -0,0 +1,130 @@
+"""
+Test cases for the bulk organization structure upload
+"""
+import contextlib
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from employees import org_import
+from employees.models_organization import OrganizationStructure
+
+
+def existing(pk, code, name, level, parent=None):
+    org = OrganizationStructure(id=pk, org_code=code, org_name=name, org_level=level, parent=parent, status='active')
+    org.full_path = f'{parent.full_path} > {name}' if parent else name
+    for field in org_import.LEVEL_NAME_FIELDS.values():
+        setattr(org, field, getattr(parent, field) if parent else '')
+    setattr(org, org_import.LEVEL_NAME_FIELDS[level], name)
+    return org
+
+
+def row(code, name, level, parent='', **extra):
+    return {'조직코드': code, '조직명': name, '조직레벨': level, '상위조직코드': parent, **extra}
+
+
+class ImportOrganizationRowsTestCase(SimpleTestCase):
+    """Test cases for in-memory validation, parent resolution and layered writes"""
+
+    def setUp(self):
+        self.group = existing(1, 'GRP', 'OK금융그룹', 1)
+        self.company = existing(2, 'COM', 'OK저축은행', 2, parent=self.group)
+        self.existing = [self.group, self.company]
+        self.layers = []
+        self.updated = []
+        self.next_id = 100
+
+        def bulk_create(orgs, **kwargs):
+            # 상위 조직 pk 가 먼저 확보되었는지 확인하고 pk 부여
+            self.layers.append([(org.org_code, org.parent.org_code if org.parent else None) for org in orgs])
+            for org in orgs:
+                assert org.parent is None or org.parent.pk is not None, org.org_code
+                self.next_id += 1
+                org.pk = self.next_id
+            return orgs
+
+        objects = OrganizationStructure.objects
+        patches = [
+            mock.patch.object(org_import.transaction, 'atomic', contextlib.nullcontext),
+            mock.patch.object(objects, 'all', side_effect=lambda: list(self.existing)),
+            mock.patch.object(objects, 'bulk_create', side_effect=bulk_create),
+            mock.patch.object(objects, 'bulk_update', side_effect=lambda orgs, *args, **kwargs: self.updated.extend(orgs)),
+            mock.patch.object(OrganizationStructure, 'rebuild_hierarchy'),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_new_orgs_are_created_layer_by_layer(self):
+        result = org_import.import_organization_rows([
+            row('TEAM1', '개발1팀', 5, 'DEPT'),
+            row('HQ', '디지털본부', 3, 'COM'),
+            row('DEPT', 'IT개발부', 4, 'HQ'),
+            row('HQ2', '영업본부', 3, 'COM'),
+        ])
+
+        self.assertEqual(result, {'created': 4, 'updated': 0, 'errors': []})
+        self.assertEqual(self.layers, [
+            [('HQ', 'COM'), ('HQ2', 'COM')],
+            [('DEPT', 'HQ')],
+            [('TEAM1', 'DEPT')],
+        ])
+        team = OrganizationStructure.objects.bulk_create.call_args_list[2].args[0][0]
+        self.assertEqual(team.full_path, 'OK금융그룹 > OK저축은행 > 디지털본부 > IT개발부 > 개발1팀')
+        self.assertEqual((team.group_name, team.company_name, team.department_name, team.team_name),
+                         ('OK금융그룹', 'OK저축은행', 'IT개발부', '개발1팀'))
+        self.assertEqual(self.updated, [])
+
+    def test_forward_parent_reference_moves_existing_org(self):
+        result = org_import.import_organization_rows([
+            row('COM', 'OK저축은행', 2, 'GRP2'),
+            row('GRP2', '신규그룹', 1),
+        ])
+
+        self.assertEqual((result['created'], result['updated'], result['errors']), (1, 1, []))
+        self.assertEqual(self.layers, [[('GRP2', None)]])
+        self.assertEqual(self.updated, [self.company])
+        self.assertEqual(self.company.parent.org_code, 'GRP2')
+        self.assertEqual(self.company.full_path, '신규그룹 > OK저축은행')
+
+    def test_cycle_is_rejected(self):
+        result = org_import.import_organization_rows([
+            row('A', '조직A', 3, 'B'),
+            row('B', '조직B', 4, 'A'),
+            row('GRP', 'OK금융그룹', 1, 'COM'),
+        ])
+
+        self.assertEqual([error['row'] for error in result['errors']], [2, 3])
+        self.assertIn('하위 조직을 상위 조직으로 지정할 수 없습니다', result['errors'][0]['error'])
+        self.assertEqual(self.layers, [[('B', None)], [('A', 'B')]])
+        self.assertIsNone(self.group.parent)
+
+    def test_invalid_rows_are_reported_and_the_rest_applied(self):
+        result = org_import.import_organization_rows([
+            row('OK1', '정상조직', 3, 'COM'),
+            row('BAD1', '잘못된상태', 3, 'COM', 상태='x' * 30),
+            row('C' * 60, '긴코드', 3),
+            row('BAD3', '레벨오류', 9),
+            row('COM', 'OK저축은행 변경', 2, 상태='closed'),
+        ])
+
+        self.assertEqual([error['row'] for error in result['errors']], [2, 3, 4, 5])
+        self.assertEqual((result['created'], result['updated']), (1, 0))
+        self.assertEqual(self.layers, [[('OK1', 'COM')]])
+        # 검증에 실패한 수정 행은 기존 조직을 바꾸지 않음
+        self.assertEqual((self.company.org_name, self.company.status), ('OK저축은행', 'active'))
+
+    def test_too_long_full_path_skips_the_subtree(self):
+        long_name = '가' * 100
+        rows = [row('L1', long_name, 3, 'COM')]
+        for depth in range(2, 7):
+            rows.append(row(f'L{depth}', long_name, 4, f'L{depth - 1}'))
+        rows.append(row('OK1', '정상조직', 3, 'COM'))
+
+        result = org_import.import_organization_rows(rows)
+
+        self.assertEqual([error['row'] for error in result['errors']], [5, 6])
+        self.assertIn('전체경로', result['errors'][0]['error'])
+        created = [code for layer in self.layers for code, _ in layer]
+        self.assertEqual(created, ['L1', 'OK1', 'L2', 'L3', 'L4'])
+        self.assertEqual(result['created'], 5)
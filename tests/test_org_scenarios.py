@@ -0,0 +1,122 @@
+"""
+Test cases for org scenario deltas, keyed diffs and in-memory what-if
+"""
+from unittest import mock
+
+from django.core.cache import cache
+from django.db.models import F
+from django.test import SimpleTestCase, TestCase
+
+from organization import scenarios
+from organization.models_enhanced import OrgChartVersion, OrgUnit
+from organization.org_chart import ALL_COMPANIES
+from organization.scenarios import (
+    apply_delta, check_hierarchy, compute_delta, current_units, diff_units, reassign_unit, restrict, to_units
+)
+
+
+def unit(unit_id, reports_to=None, company='OK저축은행', headcount=10, leader=None):
+    return {
+        'id': unit_id, 'company': company, 'name': f'{unit_id}조직', 'function': '',
+        'reportsTo': reports_to, 'headcount': headcount,
+        'leader': {'title': '팀장', 'rank': '부장', 'name': leader, 'age': 45} if leader else None,
+        'members': [],
+    }
+
+
+class ScenarioDeltaTestCase(SimpleTestCase):
+    """Test cases for scenario deltas against a base snapshot"""
+
+    def setUp(self):
+        self.base = to_units([unit('R'), unit('A', 'R'), unit('B', 'R'), unit('C', 'A')])
+
+    def test_round_trip(self):
+        target = dict(self.base)
+        target['B'] = dict(self.base['B'], headcount=12)
+        target['D'] = unit('D', 'B')
+        del target['C']
+
+        delta = compute_delta(self.base, target)
+        self.assertEqual(set(delta['upsert']), {'B', 'D'})
+        self.assertEqual(delta['delete'], ['C'])
+        self.assertEqual(apply_delta(self.base, delta), target)
+
+    def test_apply_does_not_mutate_base(self):
+        delta = {'upsert': {'A': dict(self.base['A'], reportsTo='B')}, 'delete': ['C']}
+        units = apply_delta(self.base, delta)
+        self.assertEqual(self.base['A']['reportsTo'], 'R')
+        self.assertIn('C', self.base)
+        self.assertIs(units['B'], self.base['B'])
+
+    def test_restrict_by_company(self):
+        self.base['X'] = unit('X', company='OK캐피탈')
+        self.assertEqual(set(restrict(self.base, ['OK캐피탈'])), {'X'})
+
+
+class ScenarioDiffTestCase(SimpleTestCase):
+    """Test cases for the keyed scenario diff"""
+
+    def test_diff_order_and_messages(self):
+        current = to_units([unit('R'), unit('A', 'R', leader='김철수'), unit('B', 'R')])
+        other = to_units([unit('R'), unit('A', 'B', headcount=8), unit('N', 'R')])
+
+        diffs = diff_units(current, other)
+        self.assertEqual([d['type'] for d in diffs], ['new', 'deleted', 'hierarchy', 'headcount', 'leader'])
+        self.assertEqual(diffs[2]['message'], 'A조직 보고체계 변경: R → B')
+        self.assertEqual(diffs[4]['message'], 'A조직 리더: 김철수 → (없음)')
+
+
+class WhatIfReassignTestCase(SimpleTestCase):
+    """Test cases for in-memory reassignment"""
+
+    def setUp(self):
+        self.units = to_units([unit('R'), unit('A', 'R'), unit('B', 'A'), unit('C', 'R')])
+
+    def test_reassign(self):
+        result = reassign_unit(self.units, 'C', 'B')
+        self.assertEqual(result['C']['reportsTo'], 'B')
+        self.assertEqual(self.units['C']['reportsTo'], 'R')
+        self.assertEqual(set(compute_delta(self.units, result)['upsert']), {'C'})
+
+    def test_cycle_rejected(self):
+        with self.assertRaisesMessage(ValueError, '순환 참조'):
+            reassign_unit(self.units, 'A', 'B')
+
+    def test_depth_limit(self):
+        chain = to_units([unit('L0')] + [unit(f'L{i}', f'L{i - 1}') for i in range(1, 9)])
+        check_hierarchy(chain)
+        chain['L9'] = unit('L9')
+        with self.assertRaisesMessage(ValueError, '최대 8단계'):
+            reassign_unit(chain, 'L9', 'L8')
+
+    def test_unknown_parent(self):
+        with self.assertRaises(ValueError):
+            reassign_unit(self.units, 'C', 'NOPE')
+
+
+class CurrentUnitsTestCase(TestCase):
+    """Test cases for the version-keyed current org snapshot"""
+
+    def setUp(self):
+        cache.clear()
+        scenarios._snapshot = (None, {})
+        self.units = [OrgUnit(id='R', company='OK저축은행', name='R조직', headcount=10, members=[])]
+        patcher = mock.patch.object(OrgUnit.objects, 'all', side_effect=lambda: list(self.units))
+        self.all = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, scenarios, '_snapshot', (None, {}))
+
+    def test_snapshot_reused_until_another_worker_bumps_the_version(self):
+        version, units = current_units()
+        self.assertEqual(list(units), ['R'])
+        self.assertEqual(current_units(), (version, units))
+        self.assertEqual(self.all.call_count, 1)
+
+        # 다른 워커의 변경: 공유 버전 행만 증가
+        self.units.append(OrgUnit(id='A', company='OK저축은행', name='A조직', reports_to_id='R', members=[]))
+        OrgChartVersion.objects.filter(company=ALL_COMPANIES).update(version=F('version') + 1)
+
+        new_version, new_units = current_units()
+        self.assertEqual(new_version, version + 1)
+        self.assertEqual(sorted(new_units), ['A', 'R'])
+        self.assertEqual(self.all.call_count, 2)
@@ -0,0 +1,182 @@
+"""
+Test cases for vectorized AIRISS batch predictions
+"""
+import datetime
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from django.test import SimpleTestCase
+
+from airiss.ai_models import PromotionPredictionModel, TurnoverPredictionModel
+from airiss.feature_store import feature_store
+from airiss.models import AIAnalysisResult, AIAnalysisType
+from employees.models import Employee
+
+DEPARTMENTS = ['IT', '영업', '인사', '회계']
+POSITIONS = ['사원', '대리', '과장', '차장']
+
+
+def employee_frame(count=12):
+    """load_employee_frame 과 같은 모양의 직원 DataFrame"""
+    return pd.DataFrame({
+        'id': range(1, count + 1),
+        'birth_date': [datetime.date(1970 + i * 2, 1 + i % 12, 1) for i in range(count)],
+        'hire_date': [datetime.date(2005 + i % 15, 3, 1) if i % 5 else None for i in range(count)],
+        'growth_level': [1 + i % 6 for i in range(count)],
+        'department': [DEPARTMENTS[i % len(DEPARTMENTS)] for i in range(count)],
+        'new_position': [POSITIONS[i % len(POSITIONS)] for i in range(count)],
+        'gender': ['M' if i % 2 else 'F' for i in range(count)],
+    })
+
+
+def fit_on_synthetic(model, synthetic):
+    """합성 데이터로 학습 (저장/레지스트리 없이)"""
+    X, y = synthetic()
+    model.model.fit(model.scaler.fit_transform(X), y)
+    model.load_model = lambda: False
+
+
+class EncodeLabelsTestCase(SimpleTestCase):
+    """Test cases for categorical encoding at training and prediction time"""
+
+    def test_unseen_categories_map_to_minus_one(self):
+        model = TurnoverPredictionModel()
+        fitted = model.encode_labels('department', pd.Series(['IT', '영업', None]))
+        self.assertEqual(sorted(fitted.tolist()), [0, 1, 2])
+
+        encoded = model.encode_labels('department', pd.Series(['영업', '법무', None, 'IT']))
+        classes = list(model.label_encoders['department'].classes_)
+        self.assertEqual(
+            encoded.tolist(),
+            [classes.index('영업'), -1, classes.index('Unknown'), classes.index('IT')],
+        )
+        self.assertEqual(classes, ['IT', 'Unknown', '영업'])
+
+
+class PredictBatchTestCase(SimpleTestCase):
+    """Test cases for predict_batch against the per-employee prediction path"""
+
+    def setUp(self):
+        self.frame = employee_frame()
+
+    def test_turnover_batch_matches_single_predictions(self):
+        model = TurnoverPredictionModel()
+        fit_on_synthetic(model, model._generate_synthetic_data)
+        model.encode_labels('department', pd.Series(DEPARTMENTS[:3]))
+        model.encode_labels('position', pd.Series(POSITIONS))
+
+        with mock.patch.object(model, 'load_employee_frame', return_value=self.frame):
+            results = model.predict_batch(queryset=None, save=False)
+
+        self.assertEqual([r['employee_id'] for r in results], self.frame['id'].tolist())
+        for result, record in zip(results, self.frame.to_dict('records')):
+            if record['hire_date'] is None:
+                continue  # 배치에서는 중앙값으로 보정
+            single = model.predict_employee_turnover(Employee(
+                birth_date=record['birth_date'], hire_date=record['hire_date'],
+                growth_level=record['growth_level'], department=record['department'],
+                new_position=record['new_position'], gender=record['gender'],
+            ))
+            self.assertAlmostEqual(result['score'], single['risk_score'], msg=record['id'])
+            self.assertEqual(list(result['details']['factors']), model.feature_names)
+            self.assertEqual(list(result['details']['factors'].values()), list(single['factors'].values()))
+
+    def test_promotion_batch_matches_single_predictions(self):
+        model = PromotionPredictionModel()
+        fit_on_synthetic(model, model._generate_synthetic_promotion_data)
+
+        with mock.patch.object(model, 'load_employee_frame', return_value=self.frame):
+            results = model.predict_batch(queryset=None, save=False)
+
+        for result, record in zip(results, self.frame.to_dict('records')):
+            if record['hire_date'] is None:
+                continue
+            single = model.predict_promotion_potential(Employee(
+                birth_date=record['birth_date'], hire_date=record['hire_date'],
+                growth_level=record['growth_level'], department=record['department'],
+            ))
+            self.assertAlmostEqual(result['score'], single['promotion_score'], msg=record['id'])
+            self.assertAlmostEqual(result['confidence'], single['confidence'])
+            self.assertEqual(result['details']['readiness_factors'], single['readiness_factors'])
+
+    def test_missing_dates_are_filled(self):
+        model = PromotionPredictionModel()
+        fit_on_synthetic(model, model._generate_synthetic_promotion_data)
+        with mock.patch.object(model, 'load_employee_frame', return_value=self.frame):
+            results = model.predict_batch(queryset=None, save=False)
+        self.assertTrue(all(np.isfinite(r['score']) for r in results))
+
+    def test_unfitted_model_returns_defaults(self):
+        model = TurnoverPredictionModel()
+        model.load_model = lambda: False
+        with mock.patch.object(model, 'load_employee_frame', return_value=self.frame):
+            results = model.predict_batch(queryset=None, save=False)
+        self.assertEqual({(r['score'], r['confidence']) for r in results}, {(50.0, 0.5)})
+
+
+class LoadEmployeeFrameTestCase(SimpleTestCase):
+    """Test cases for merging feature store columns into the batch frame"""
+
+    def test_store_features_merged_by_employee_id(self):
+        model = TurnoverPredictionModel()
+        queryset = mock.MagicMock()
+        queryset.values.return_value = [
+            {'id': 2, 'department': '', 'new_position': '대리', 'gender': 'M'},
+            {'id': 1, 'department': 'IT', 'new_position': None, 'gender': 'F'},
+        ]
+        matrix = np.array([[41.0, 6.5, 3.0], [29.0, 1.5, 1.0]])
+        with mock.patch.object(feature_store, 'get_matrix', return_value=(
+            np.array([1, 2]), matrix, list(model.store_features)
+        )) as get_matrix:
+            frame = model.load_employee_frame(queryset)
+
+        queryset.values.assert_called_once_with('id', 'department', 'new_position', 'gender')
+        get_matrix.assert_called_once_with([2, 1], ['age', 'tenure_years', 'growth_level'])
+        self.assertEqual(frame['id'].tolist(), [2, 1])
+        self.assertEqual(frame['department'].tolist(), ['Unknown', 'IT'])
+        self.assertEqual(frame['new_position'].tolist(), ['대리', 'Unknown'])
+        self.assertEqual(frame['age'].tolist(), [29.0, 41.0])
+        self.assertEqual(frame['tenure_years'].tolist(), [1.5, 6.5])
+
+        features = model.extract_features(frame)
+        self.assertEqual(features['tenure_years'].tolist(), [1.5, 6.5])
+        self.assertEqual(features['age_at_hire'].tolist(), [27.5, 34.5])
+
+    def test_employee_missing_from_store_is_nan(self):
+        model = PromotionPredictionModel()
+        queryset = mock.MagicMock()
+        queryset.values.return_value = [{'id': 1, 'department': 'IT'}, {'id': 2, 'department': '인사'}]
+        with mock.patch.object(feature_store, 'get_matrix', return_value=(
+            np.array([1]), np.array([[41.0, 6.5, 3.0]]), list(model.store_features)
+        )):
+            frame = model.load_employee_frame(queryset)
+        self.assertTrue(np.isnan(frame.loc[1, 'age']))
+
+
+class SaveBatchResultsTestCase(SimpleTestCase):
+    """Test cases for the rows written by save_batch_results"""
+
+    def test_bulk_create_rows(self):
+        model = TurnoverPredictionModel()
+        analysis_type = AIAnalysisType(id=3, type_code='TURNOVER_RISK', name='퇴사 위험도 예측')
+        results = [
+            {'employee_id': 1, 'score': 80.0, 'confidence': 0.7, 'details': {'factors': {'age': 1.0}}},
+            {'employee_id': 2, 'score': 20.0, 'confidence': 0.7, 'details': {}},
+        ]
+        departments = {1: '디지털금융혁신본부 데이터플랫폼팀 운영파트', 2: ''}
+
+        with mock.patch.object(model, 'get_analysis_type', return_value=analysis_type), \
+                mock.patch.object(AIAnalysisResult.objects, 'bulk_create', side_effect=lambda rows, **kwargs: rows) as bulk_create:
+            rows = model.save_batch_results('TURNOVER_RISK', '퇴사 위험도 예측', results, departments, valid_days=2)
+
+        bulk_create.assert_called_once()
+        self.assertEqual(bulk_create.call_args.kwargs['batch_size'], 1000)
+        self.assertEqual([row.employee_id for row in rows], [1, 2])
+        self.assertEqual([row.score for row in rows], [80.0, 20.0])
+        self.assertEqual(rows[0].result_data, {'factors': {'age': 1.0}})
+        self.assertEqual(rows[0].department, departments[1][:20])
+        self.assertIsNone(rows[1].department)
+        self.assertIs(rows[0].analysis_type, analysis_type)
+        self.assertEqual(rows[0].valid_until, rows[1].valid_until)
+        self.assertGreater(rows[0].valid_until - datetime.datetime.now(datetime.timezone.utc), datetime.timedelta(days=1))
@@ -0,0 +1,105 @@
+"""
+Test cases for the job/employee skill-vector index
+"""
+import os
+import tempfile
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from job_profiles.embedding_matcher import SkillClusterAnalyzer
+from job_profiles.skill_index import SkillIndex, skill_terms
+
+JOBS = {
+    'data': ['Python', 'SQL', '통계분석', '머신러닝'],
+    'hr': ['인사관리', '조직문화', '노동법'],
+    'pm': ['프로젝트 관리', '리더십', 'SQL'],
+}
+EMPLOYEES = {
+    1: ['Python', '머신러닝'],
+    2: ['인사관리', '노동법', '리더십'],
+    3: ['요리'],
+}
+
+
+class SkillIndexTestCase(SimpleTestCase):
+    """Test cases for a vocabulary fitted once over the job corpus"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.index = SkillIndex(path=os.path.join(self.tmpdir.name, 'skill_index.joblib'))
+        self.index.build(JOBS, EMPLOYEES)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_terms_keep_whole_skill_and_words(self):
+        self.assertEqual(skill_terms(['프로젝트  관리', ' SQL ']), ['프로젝트 관리', '프로젝트', '관리', 'sql'])
+
+    def test_vectors_share_one_vocabulary(self):
+        """Vectors from separate calls live in the same space and rows are L2-normalized"""
+        first = self.index.vectorize(['Python'])
+        second = self.index.vectorize(['인사관리', '조직문화'])
+        self.assertEqual(first.shape, second.shape)
+        payload = self.index.load()
+        norms = payload['jobs'].multiply(payload['jobs']).sum(axis=1)
+        self.assertTrue(all(abs(float(n) - 1.0) < 1e-5 for n in norms))
+
+    def test_top_k_matches(self):
+        self.assertEqual([job for job, _ in self.index.top_jobs_for_employee(1, k=2)], ['data'])
+        self.assertEqual(self.index.top_jobs_for_employee(2, k=1)[0][0], 'hr')
+        self.assertEqual(self.index.top_jobs_for_employee(3), [])
+        self.assertEqual([e for e, _ in self.index.top_employees_for_job('hr', k=3)], [2])
+        self.assertEqual([j for j, _ in self.index.top_jobs_for_skills(['SQL'], k=3, exclude=['pm'])], ['data'])
+        self.assertEqual(self.index.similarity(['Python'], ['Python']), 100.0)
+
+    def test_batch_top_k_uses_one_product(self):
+        payload = self.index.load()
+        results = SkillIndex.top_k(payload['employees'], payload['jobs'], payload['job_ids'], k=1)
+        self.assertEqual([row[0][0] if row else None for row in results], ['data', 'hr', None])
+
+    def test_incremental_updates(self):
+        """Known skills update one row in place, unknown skills trigger a single rebuild on next read"""
+        index = self.index
+        index.update_employee(3, ['SQL', '리더십'])
+        self.assertEqual(index.top_jobs_for_employee(3, k=1)[0][0], 'pm')
+
+        index.update_job('hr', None)
+        self.assertNotIn('hr', index.load()['job_ids'])
+
+        index.update_job('design', ['Figma'])
+        self.assertTrue(index.load(build=False)['stale'])
+
+    def test_persisted_index_is_reloaded(self):
+        other = SkillIndex(path=self.index.path)
+        self.assertEqual(other.top_jobs_for_employee(2, k=1)[0][0], 'hr')
+
+
+class SkillClusterAnalyzerTestCase(SimpleTestCase):
+    """Test cases for clustering on a precomputed similarity matrix"""
+
+    PROFILES = [
+        {'basic_skills': ['Python', 'Python 프로그래밍', 'SQL'], 'applied_skills': ['머신러닝']},
+        {'basic_skills': ['인사관리', '인사 관리 실무'], 'applied_skills': ['노동법']},
+    ]
+
+    def setUp(self):
+        cache.clear()
+
+    def test_related_skills_grouped(self):
+        clusters = SkillClusterAnalyzer().analyze_skill_clusters(self.PROFILES)
+        groups = sorted(sorted(members) for members in clusters.values())
+        self.assertIn(['Python', 'Python 프로그래밍'], groups)
+        self.assertIn(['인사 관리 실무', '인사관리'], groups)
+        self.assertEqual(sum(len(members) for members in groups), 7)
+
+    def test_result_cached_per_corpus_version(self):
+        analyzer = SkillClusterAnalyzer()
+        first = analyzer.analyze_skill_clusters(self.PROFILES)
+        version = analyzer.corpus_version(analyzer._collect_skills(self.PROFILES))
+        self.assertEqual(version, analyzer.corpus_version(analyzer._collect_skills(self.PROFILES[::-1])))
+        self.assertEqual(analyzer.analyze_skill_clusters(self.PROFILES[::-1]), first)
+
+        changed = self.PROFILES + [{'basic_skills': ['재무분석']}]
+        self.assertNotEqual(analyzer.corpus_version(analyzer._collect_skills(changed)), version)
+        self.assertIn(['재무분석'], list(analyzer.analyze_skill_clusters(changed).values()))
@@ -0,0 +1,99 @@
+"""
+Test cases for the batch talent-pool scoring engine
+"""
+import itertools
+
+from django.test import SimpleTestCase
+
+from job_profiles.leader_recommender import LeaderRecommender, recommend_leader_candidates
+from job_profiles.talent_pool import TalentPool, TalentPoolEngine, target_requirements
+
+GRADES = ['S', 'A+', 'A', 'B+', 'B', 'C']
+LEVELS = ['Lv.1', 'Lv.2', 'Lv.3', 'Lv.4', 'Lv.5']
+SKILLS = ['조직 리더십', '성과관리', '전략 실행력', '커뮤니케이션', '데이터 분석', '리더십']
+
+JOBS = [
+    {
+        'name': '팀장',
+        'required_skills': ['조직 리더십', '성과관리', '전략 실행력', '커뮤니케이션'],
+        'min_required_level': 'Lv.3',
+        'evaluation_standard': {'overall': 'B+', 'professionalism': 'A'},
+        'qualification': '경력 7년 이상, 리더십 경험 필수',
+    },
+    {
+        'name': '데이터 분석가',
+        'required_skills': ['데이터 분석'],
+        'min_required_level': 'Lv.2',
+        'evaluation_standard': {'overall': 'B'},
+        'qualification': '3년 이상',
+    },
+    {'job_name': '인사담당', 'qualification': ''},
+]
+
+
+def sample_employees(count=60):
+    """등급/레벨/스킬/경력이 골고루 섞인 직원 dict"""
+    employees = []
+    for i in range(count):
+        grades = [GRADES[(i * 7 + k) % len(GRADES)] for k in range(2)]
+        employee = {
+            'employee_id': f'e{i:03d}',
+            'name': f'직원{i}',
+            'position': '과장',
+            'department': f'영업{i % 3}팀',
+            'level': LEVELS[i % len(LEVELS)],
+            'career_years': i % 15,
+            'skills': [SKILLS[(i + k) % len(SKILLS)] for k in range(i % 5)],
+            'certifications': [],
+        }
+        if i % 11:
+            employee['recent_evaluation'] = {'overall_grade': grades[0], 'professionalism': GRADES[i % 4]}
+            employee['recent_evaluations'] = [
+                {'overall_grade': grade, 'professionalism': GRADES[(i + k) % 4]} for k, grade in enumerate(grades)
+            ]
+        if i % 4 == 0:
+            employee['leadership_experience'] = {'years': 2, 'type': 'TF 리더'}
+        employees.append(employee)
+    return employees
+
+
+class TalentPoolScoreTestCase(SimpleTestCase):
+    """Batch scores agree with LeaderRecommender employee by employee"""
+
+    def setUp(self):
+        self.engine = TalentPoolEngine()
+        self.employees = sample_employees()
+        self.pool = TalentPool(
+            key=(), employees=list(range(len(self.employees))), dicts=self.employees,
+            features=self.engine.employee_features(self.employees),
+        )
+        self.jobs = [target_requirements(job) for job in JOBS]
+
+    def test_matrix_matches_recommender(self):
+        recommender = LeaderRecommender()
+        result = self.engine.score(self.pool, self.jobs)
+        self.assertEqual(result.scores.shape, (len(self.employees), len(self.jobs)))
+        for (i, employee), (j, job) in itertools.product(enumerate(self.employees), enumerate(self.jobs)):
+            readiness = recommender.evaluate_leadership_readiness(employee, job)
+            self.assertAlmostEqual(result.scores[i, j], readiness['total_score'], msg=(i, j))
+            self.assertEqual(bool(result.qualified[i, j]), readiness['is_qualified'], msg=(i, j))
+
+    def test_top_rows_match_recommend_candidates(self):
+        result = self.engine.score(self.pool, self.jobs)
+        for j, job in enumerate(self.jobs):
+            for department in (None, '영업1팀'):
+                employees = [e for e in self.employees if not department or e['department'] == department]
+                expected = recommend_leader_candidates(dict(job), employees, top_n=5)
+                rows = self.engine.top_rows(self.pool, result, j, 5, department=department)
+                self.assertEqual(
+                    [self.employees[row]['employee_id'] for row in rows],
+                    [candidate['employee_id'] for candidate in expected],
+                )
+
+    def test_columns_memoized_per_requirement(self):
+        self.engine.score(self.pool, self.jobs)
+        columns = dict(self.pool.columns)
+        renamed = dict(self.jobs[1], job_id='other')
+        self.engine.score(self.pool, [renamed])
+        self.assertEqual(self.pool.columns.keys(), columns.keys())
+        self.assertIs(self.pool.columns[self.engine.job_key(renamed)], columns[self.engine.job_key(self.jobs[1])])
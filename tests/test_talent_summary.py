@@ -0,0 +1,145 @@
+"""
+Test cases for the per-employee talent summary read model
+"""
+import datetime
+import importlib
+import json
+
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+
+from employees.api_talent import talent_pool_api
+from employees.models import Employee
+from employees.models_talent import (
+    PromotionCandidate, RetentionRisk, TalentCategory, TalentPool, TalentSummary, summarize_talent,
+)
+
+CORE = TalentCategory(id=1, category_code='CORE_TALENT', name='핵심인재')
+NEEDS_ATTENTION = TalentCategory(id=2, category_code='NEEDS_ATTENTION', name='관리필요인력')
+
+
+def pool(pk, category, ai_score, status='ACTIVE'):
+    return TalentPool(
+        id=pk, category=category, ai_score=ai_score, confidence_level=0.8, status=status,
+        added_at=datetime.datetime(2025, 1, pk, tzinfo=datetime.timezone.utc),
+    )
+
+
+def risk(pk, risk_level, risk_score, action_status='PENDING'):
+    return RetentionRisk(
+        id=pk, risk_level=risk_level, risk_score=risk_score, action_status=action_status,
+        identified_date=datetime.datetime(2025, 1, pk, tzinfo=datetime.timezone.utc),
+    )
+
+
+class TalentSummaryBuildTestCase(SimpleTestCase):
+    """Test cases for representative rows and dashboard flags"""
+
+    def setUp(self):
+        self.employee = Employee(id=7, name='김인재', department='IT', position='과장', hire_date=datetime.date(2018, 3, 2))
+
+    def test_no_sources(self):
+        self.assertIsNone(TalentSummary.build(self.employee, [], [], []))
+
+    def test_representative_talent_pool(self):
+        summary = TalentSummary.build(self.employee, [
+            pool(1, CORE, 95, status='PENDING'),
+            pool(2, NEEDS_ATTENTION, 60, status='MONITORING'),
+            pool(3, CORE, 80),
+        ], [], [])
+        self.assertEqual((summary.employee_id, summary.name, summary.department), (7, '김인재', 'IT'))
+        self.assertEqual(summary.talent_pool_id, 3)
+        self.assertEqual(summary.get_talent_category_display(), '핵심인재')
+        self.assertTrue(summary.in_talent_pool and summary.is_core_talent and summary.needs_attention)
+        self.assertFalse(summary.is_promotion_candidate or summary.is_high_risk)
+
+    def test_multi_category_employee_counts_in_every_category(self):
+        summary = TalentSummary.build(self.employee, [
+            pool(1, CORE, 95),
+            pool(2, NEEDS_ATTENTION, 60, status='MONITORING'),
+        ], [], [])
+        self.assertEqual(summary.talent_category, 'CORE_TALENT')
+        self.assertTrue(summary.is_core_talent and summary.needs_attention)
+
+    def test_low_risk_only_is_not_high_risk(self):
+        summary = TalentSummary.build(self.employee, [], [], [risk(1, 'MEDIUM', 90), risk(2, 'LOW', 95)])
+        self.assertEqual(summary.retention_id, 2)
+        self.assertFalse(summary.is_high_risk or summary.is_open_risk)
+
+    def test_inactive_pool_kept_for_detail(self):
+        summary = TalentSummary.build(self.employee, [pool(1, CORE, 95, status='EXCLUDED')], [], [])
+        self.assertEqual(summary.talent_pool_id, 1)
+        self.assertFalse(summary.in_talent_pool or summary.is_core_talent)
+
+    def test_promotion_and_risk(self):
+        promotions = [
+            PromotionCandidate(id=1, ai_recommendation_score=90, performance_score=80, potential_score=70, is_active=False),
+            PromotionCandidate(id=2, ai_recommendation_score=70, performance_score=85, potential_score=75, readiness_level='READY'),
+        ]
+        risks = [risk(1, 'MEDIUM', 90), risk(2, 'HIGH', 70, action_status='COMPLETED'), risk(3, 'CRITICAL', 60)]
+        summary = TalentSummary.build(self.employee, [], promotions, risks)
+        self.assertEqual((summary.promotion_id, summary.promotion_score), (2, 70))
+        self.assertTrue(summary.is_promotion_candidate)
+        # 점수가 더 높은 MEDIUM 행이 있어도 고위험 행 중 최고 점수가 대표
+        self.assertEqual((summary.retention_id, summary.risk_level, summary.assigned_to_name), (2, 'HIGH', ''))
+        self.assertTrue(summary.is_high_risk)
+        self.assertTrue(summary.is_open_risk)
+        self.assertFalse(summary.in_talent_pool)
+        self.assertIsNone(summary.talent_pool_id)
+
+
+class TalentSummaryMigrationTestCase(SimpleTestCase):
+    """Test cases for the backfill logic frozen into the migrations"""
+
+    def test_latest_backfill_matches_current_summary(self):
+        migration = importlib.import_module('employees.migrations.0008_talentsummary_multi_category')
+        employee = Employee(id=7, name='김인재', department=None, position='과장', hire_date=datetime.date(2018, 3, 2))
+        sources = (
+            [pool(1, CORE, 95, status='PENDING'), pool(2, NEEDS_ATTENTION, 60, status='MONITORING')],
+            [PromotionCandidate(id=1, ai_recommendation_score=70, performance_score=85, potential_score=75)],
+            [risk(1, 'MEDIUM', 90), risk(2, 'HIGH', 70)],
+        )
+        self.assertEqual(migration.summarize(employee, *sources), summarize_talent(employee, *sources))
+        self.assertIsNone(migration.summarize(employee, [], [], []))
+
+
+class TalentPoolCategoryFilterTestCase(SimpleTestCase):
+    """Test cases for the category filter of the talent pool API"""
+
+    def setUp(self):
+        self.employee = Employee(id=7, name='김인재', department='IT', position='과장')
+        self.core = pool(1, CORE, 95)
+        self.attention = pool(2, NEEDS_ATTENTION, 60, status='MONITORING')
+        for entry in (self.core, self.attention):
+            entry.employee = self.employee
+
+        summaries = mock.MagicMock()
+        summaries.aggregate.return_value = {'core_talent': 1, 'promotion_candidate': 0, 'retention_risk': 0, 'needs_attention': 1}
+        summaries.filter.return_value.order_by.return_value = []
+        self.pools = mock.MagicMock()
+        self.pools.select_related.return_value.filter.return_value.order_by.return_value = [self.attention]
+        patches = [
+            mock.patch('employees.api_talent.TalentSummary.objects', summaries),
+            mock.patch('employees.api_talent.TalentPool.objects', self.pools),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.summaries = summaries
+
+    def test_secondary_category_lists_the_employee(self):
+        response = talent_pool_api(RequestFactory().get('/', {'category': 'NEEDS_ATTENTION'}))
+
+        self.pools.select_related.return_value.filter.assert_called_once_with(
+            status__in=TalentSummary.TALENT_STATUSES, category__category_code='NEEDS_ATTENTION'
+        )
+        data = json.loads(response.content)
+        self.assertEqual([(entry['id'], entry['name'], entry['category']) for entry in data['talent_pool']],
+                         [(2, '김인재', '관리필요인력')])
+        self.assertEqual(data['statistics']['needs_attention'], 1)
+
+    def test_without_category_reads_summaries(self):
+        talent_pool_api(RequestFactory().get('/'))
+        self.pools.select_related.assert_not_called()
+        self.summaries.filter.assert_any_call(in_talent_pool=True)
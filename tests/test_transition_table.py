@@ -0,0 +1,75 @@
+"""
+Test cases for the all-pairs best-path job transition table
+"""
+import random
+
+from django.test import SimpleTestCase
+
+from job_profiles.transition_table import TransitionTable
+
+
+def brute_force(table, start, end):
+    """단순 경로 전체 탐색으로 구한 최고 확률"""
+    best = 0.0
+    stack = [(start, 1.0, {start})]
+    while stack:
+        job, probability, seen = stack.pop()
+        if job == end:
+            best = max(best, probability)
+            continue
+        for (from_job, to_job), _ in table.counts.items():
+            if from_job == job and to_job not in seen:
+                weight = table.direct[table.index[from_job], table.index[to_job]]
+                stack.append((to_job, probability * weight, seen | {to_job}))
+    return best
+
+
+class TransitionTableTestCase(SimpleTestCase):
+    """Test cases for max-product path probabilities"""
+
+    def setUp(self):
+        self.table = TransitionTable({
+            '사원': ['대리', '전문가', '전문가', '전문가', '팀장'],
+            '전문가': ['수석'],
+            '수석': ['팀장'],
+            '대리': ['과장'],
+        })
+
+    def test_direct_probability(self):
+        self.assertAlmostEqual(self.table.direct[self.table.index['사원'], self.table.index['전문가']], 0.6)
+
+    def test_best_path_beats_shortest_path(self):
+        self.assertAlmostEqual(self.table.probability('사원', '팀장'), 0.6)
+        self.assertEqual(self.table.path('사원', '팀장'), ['사원', '전문가', '수석', '팀장'])
+
+    def test_unreachable_and_unknown(self):
+        self.assertEqual(self.table.probability('팀장', '사원'), 0.0)
+        self.assertIsNone(self.table.path('팀장', '사원'))
+        self.assertEqual(self.table.probability('사원', '임원'), 0.0)
+        self.assertEqual(self.table.probability('사원', '사원'), 1.0)
+        self.assertEqual(self.table.path('사원', '사원'), ['사원'])
+
+    def test_probabilities_row_lookup(self):
+        self.assertEqual(
+            self.table.probabilities('사원', ['과장', '임원', '수석']).round(3).tolist(),
+            [0.2, 0.0, 0.6],
+        )
+        self.assertEqual(self.table.probabilities('임원', ['과장']).tolist(), [0.0])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        jobs = [f'J{i}' for i in range(8)]
+        transitions = {job: [rng.choice(jobs) for _ in range(rng.randint(1, 4))] for job in jobs[:6]}
+        table = TransitionTable(transitions)
+        for start in table.jobs:
+            for end in table.jobs:
+                expected = 1.0 if start == end else brute_force(table, start, end)
+                self.assertAlmostEqual(table.probability(start, end), expected, msg=(start, end))
+                path = table.path(start, end)
+                if expected and path:
+                    product = 1.0
+                    for from_job, to_job in zip(path, path[1:]):
+                        product *= table.direct[table.index[from_job], table.index[to_job]]
+                    self.assertAlmostEqual(product, expected)
+                else:
+                    self.assertEqual(expected == 0.0, path is None)